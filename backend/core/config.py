@@ -25,10 +25,50 @@ class Settings(BaseModel):
     # Redis instance is available via REDIS_URL.
     REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379")
     REDIS_ENABLED: bool = os.getenv("REDIS_ENABLED", "False").lower() == "true"
+    # Async client pool: callers wait up to REDIS_POOL_TIMEOUT for a free connection
+    REDIS_MAX_CONNECTIONS: int = int(os.getenv("REDIS_MAX_CONNECTIONS", "20"))
+    REDIS_POOL_TIMEOUT: float = float(os.getenv("REDIS_POOL_TIMEOUT", "2.0"))
+    # In-process near cache for hot reads (tickers, peak prices)
+    NEAR_CACHE_MAX_ENTRIES: int = int(os.getenv("NEAR_CACHE_MAX_ENTRIES", "1024"))
+    NEAR_CACHE_TTL_SECONDS: float = float(os.getenv("NEAR_CACHE_TTL_SECONDS", "1.0"))
+    # Value format written to Redis ("json" or "binary"). Every reader decodes
+    # both, so upgrade all nodes before switching writers to "binary".
+    CACHE_CODEC: str = os.getenv("CACHE_CODEC", "json")
+    # Trade history streams: approximate entries kept per stream, and age limit (0 = no limit)
+    TRADE_STREAM_MAXLEN: int = int(os.getenv("TRADE_STREAM_MAXLEN", "10000"))
+    TRADE_STREAM_RETENTION_HOURS: float = float(os.getenv("TRADE_STREAM_RETENTION_HOURS", "168"))
+    # Embedded Redis-compatible store used when Redis is disabled or unreachable at startup.
+    # Set MEMORY_CACHE_SNAPSHOT_PATH to persist its keyspace across restarts.
+    MEMORY_CACHE_ENABLED: bool = os.getenv("MEMORY_CACHE_ENABLED", "True").lower() == "true"
+    MEMORY_CACHE_SNAPSHOT_PATH: str = os.getenv("MEMORY_CACHE_SNAPSHOT_PATH", "")
+    MEMORY_CACHE_SNAPSHOT_SECONDS: float = float(os.getenv("MEMORY_CACHE_SNAPSHOT_SECONDS", "60"))
     
     # RISK MANAGEMENT
     MAX_ORDER_NOTIONAL: float = float(os.getenv("MAX_ORDER_NOTIONAL", "50.0"))
+    # Pre-trade checks price from the local ticker table if it is this fresh
+    PRICE_MAX_AGE_SECONDS: float = float(os.getenv("PRICE_MAX_AGE_SECONDS", "5.0"))
+    # Seconds between fetch_tickers polls feeding that table (keep below the max age)
+    PRICE_FEED_INTERVAL: float = float(os.getenv("PRICE_FEED_INTERVAL", "2.0"))
+    # Orders the OMS pipeline may have awaiting an exchange ack at once
+    MAX_ORDERS_IN_FLIGHT: int = int(os.getenv("MAX_ORDERS_IN_FLIGHT", "10"))
     MIN_SLOT_SIZE: float = 8.0
+    # T.I.A. rolling risk window: snapshots kept, and slots counted as full utilisation
+    TIA_WINDOW_SIZE: int = int(os.getenv("TIA_WINDOW_SIZE", "3600"))
+    TIA_SLOT_CAPACITY: int = int(os.getenv("TIA_SLOT_CAPACITY", "12"))
+    # Bulk AEGIS ingest: max snapshots per JSON batch, NDJSON lines validated per chunk,
+    # and the longest NDJSON line accepted
+    TIA_INGEST_MAX_BATCH: int = int(os.getenv("TIA_INGEST_MAX_BATCH", "5000"))
+    TIA_INGEST_CHUNK: int = int(os.getenv("TIA_INGEST_CHUNK", "500"))
+    TIA_INGEST_MAX_LINE_BYTES: int = int(os.getenv("TIA_INGEST_MAX_LINE_BYTES", "65536"))
+    # Cockpit push feed: seconds between samples of T.I.A./authorization/garage/vortex state
+    COCKPIT_FEED_INTERVAL: float = float(os.getenv("COCKPIT_FEED_INTERVAL", "1.0"))
+
+    # PAPER MATCHING ENGINE (simulated fills against the live order book)
+    PAPER_STARTING_USDT: float = float(os.getenv("PAPER_STARTING_USDT", "1000.0"))
+    PAPER_TAKER_FEE: float = float(os.getenv("PAPER_TAKER_FEE", "0.0005"))
+    PAPER_MAKER_FEE: float = float(os.getenv("PAPER_MAKER_FEE", "0.0"))
+    PAPER_LATENCY_MS: float = float(os.getenv("PAPER_LATENCY_MS", "0"))
+    PAPER_BOOK_POLL_SECONDS: float = float(os.getenv("PAPER_BOOK_POLL_SECONDS", "2.0"))
     
     # SYSTEM CONFIG
     PORT: int = int(os.getenv("PORT", "7860"))
@@ -13,6 +13,12 @@ from backend.core.config import settings
 from backend.core.security import get_current_admin
 from backend.services.agent_audit import agent_audit
 from backend.services.vortex import VortexOmega
+from backend.services.async_redis_cache import async_redis_cache
+from backend.services.cockpit_feed import cockpit_feed
+from backend.services.memory_redis import memory_redis
+from backend.services.shared_state import shared_state
+from backend.services.redis_cache import redis_cache
+from backend.services.redis_write_behind import redis_write_behind
 
 
 # --- Lifespan: initialise app.state services so trade/strategy routers work
@@ -46,7 +52,15 @@ async def lifespan(app: FastAPI):
                 pass
             raise
         app.state.exchange_service = exchange_service
+        await exchange_service.start_user_stream()
+        # Keep the pre-trade price table warm from one shared ticker poll
+        exchange_service.start_price_feed()
+        if exchange_service.mode == "PAPER":
+            exchange_service.paper.start()  # fills resting limit orders from polled books
         app.state.oms = OMS(exchange_service)
+        if exchange_service.mode == "LIVE":
+            # Server-placed fills patch the account balance /ready and sizing read
+            exchange_service.orders.add_listener(vortex.balances.on_order_update)
         agent_audit.record(
             action="exchange_service.initialise",
             payload={"mode": exchange_service.mode},
@@ -61,9 +75,30 @@ async def lifespan(app: FastAPI):
     except Exception as exc:  # pragma: no cover - optional dep failure
         print(f"WARN: StrategyLogic not initialised: {exc}")
 
+    # Keep the cached balance warm so /ready and sizing skip fetch_balance
+    vortex.balances.start()
+    # Track Redis up/down in the background (callers never PING)
+    redis_cache.health.start()
+    redis_cache.invalidator.start()
+    # Catch up on T.I.A./authorization/garage state, then follow other workers
+    shared_state.start()
+    if redis_cache.memory is not None:
+        memory_redis.start()  # expiry sweeps + periodic snapshots
+    # Cockpit push feed: one sampler for every SSE/WebSocket subscriber
+    cockpit_feed.register("vortex", vortex.get_balance_status)
+    cockpit_feed.start()
+
     try:
         yield
     finally:
+        await vortex.balances.stop()
+        await cockpit_feed.stop()
+        await redis_cache.health.stop()
+        redis_cache.invalidator.stop()
+        shared_state.stop()
+        await redis_write_behind.stop()
+        await async_redis_cache.close()
+        await memory_redis.stop()
         if app.state.exchange_service is not None:
             try:
                 await app.state.exchange_service.shutdown()
@@ -166,8 +201,11 @@ else:
 
 # --- Health & readiness ---------------------------------------------------
 # /health is a cheap process-liveness probe (no external calls). /ready is
-# the deep probe that touches the exchange so orchestrators can distinguish
-# "process up" from "ready to serve trades".
+# the deep probe that checks the exchange balance so orchestrators can
+# distinguish "process up" from "ready to serve trades". It reads the cached
+# balance and only hits the exchange when that is older than READY_MAX_AGE.
+READY_MAX_AGE = 60.0
+
 @app.get("/health")
 async def health():
     return {"status": "ONLINE"}
@@ -176,7 +214,7 @@ async def health():
 @app.get("/ready")
 async def ready():
     try:
-        balance = await vortex.get_balance()
+        balance = await vortex.get_balance(max_age=READY_MAX_AGE)
     except Exception as exc:  # pragma: no cover - exchange failure path
         raise HTTPException(status_code=503, detail=f"exchange unavailable: {exc}")
     usdt = 0
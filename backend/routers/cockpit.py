@@ -5,14 +5,20 @@
 # Connects T.I.A., Admiral, and Vortex for unified control
 # ================================================================
 
-from fastapi import APIRouter, Request, HTTPException
-from typing import Optional
-from pydantic import BaseModel
-
+import asyncio
+import json
+from fastapi import APIRouter, Request, HTTPException, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import Response, StreamingResponse
+from typing import Any, Dict, List, Optional, Tuple
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+
+from backend.core.config import settings
 from backend.services.tia_agent import tia_agent
 from backend.services.admiral_engine import admiral_engine
 from backend.services.tia_admiral_bridge import tia_admiral_bridge
 from backend.services.garage_manager import garage_manager, GarageBay
+from backend.services.cockpit_feed import cockpit_feed
+from backend.services.status_snapshot import CompositeStatus, etag_matches
 
 router = APIRouter(prefix="/cockpit", tags=["cockpit"])
 
@@ -37,6 +43,49 @@ class AegisSnapshot(BaseModel):
     total_equity: float
     active_slots: int
     starting_capital: float = 94.50
+    timestamp: Optional[str] = None  # set when replaying history
+
+
+class AegisBatch(BaseModel):
+    """Many snapshots validated in one pass"""
+    snapshots: List[AegisSnapshot] = Field(..., min_length=1, max_length=settings.TIA_INGEST_MAX_BATCH)
+
+
+# ═══════════════════════════════════════════════════════════
+# PUSH FEED SOURCES (sampled once per tick for all subscribers)
+# ═══════════════════════════════════════════════════════════
+
+def _garage_feed_state() -> Dict[str, Any]:
+    # Light view: get_garage_status() also probes the filesystem per bay
+    return {
+        "current_bay": garage_manager.current_bay.value if garage_manager.current_bay else None,
+        "engines_cached": len(garage_manager.engines_cache),
+    }
+
+
+cockpit_feed.register("tia", tia_agent.get_status)  # published snapshot: no assessment side effects
+cockpit_feed.register("authorization", tia_admiral_bridge.get_authorization_status)
+cockpit_feed.register("garage", _garage_feed_state)
+
+
+# /cockpit/status body, re-joined only when a component snapshot changes
+_cockpit_status = CompositeStatus()
+
+_SNAPSHOT_LIST = TypeAdapter(List[AegisSnapshot])
+MAX_REPORTED_ERRORS = 20
+
+
+def _validate_snapshots(items: List[Any]) -> Tuple[List[Dict[str, Any]], Dict[int, str]]:
+    """Validate a chunk in one pass; returns (valid snapshots, {index: error})"""
+    try:
+        return [s.model_dump() for s in _SNAPSHOT_LIST.validate_python(items)], {}
+    except ValidationError as e:
+        errors: Dict[int, str] = {}
+        for err in e.errors():
+            index = err["loc"][0]
+            errors.setdefault(index, f"{'.'.join(map(str, err['loc'][1:]))}: {err['msg']}")
+    valid = [item for i, item in enumerate(items) if i not in errors]
+    return [s.model_dump() for s in _SNAPSHOT_LIST.validate_python(valid)], errors
 
 
 # ═══════════════════════════════════════════════════════════
@@ -47,14 +96,14 @@ class AegisSnapshot(BaseModel):
 async def get_cockpit_status(request: Request):
     """Get full cockpit status (T.I.A. + Admiral + Vortex)
     
+    The body is stitched from the components' pre-serialized status
+    snapshots and re-joined only when one of them changes. Clients
+    that send the last ``ETag`` back in ``If-None-Match`` get a 304.
+    
     Returns:
         Complete system status for the cockpit dashboard
     """
-    # Get T.I.A. status
-    tia_status = tia_agent.get_status()
-    
-    # Get Admiral status
-    admiral_status = admiral_engine.get_status()
+    tia_status = tia_agent.status_publisher.snapshot
     
     # Get Vortex status from app state (if available)
     vortex_status = {}
@@ -68,17 +117,18 @@ async def get_cockpit_status(request: Request):
             "is_slot_guarded": vortex.is_slot_guarded
         }
     
-    # Get bridge authorization status
-    auth_status = tia_admiral_bridge.get_authorization_status()
-    
-    return {
+    body, etag = _cockpit_status.render({
         "status": "ACTIVE",
-        "timestamp": tia_status["last_assessment"],
+        "timestamp": tia_status.data["last_assessment"],
         "tia": tia_status,
-        "admiral": admiral_status,
+        "admiral": admiral_engine.status_publisher.snapshot,
         "vortex": vortex_status,
-        "authorization": auth_status
-    }
+        "authorization": tia_admiral_bridge.authorization_snapshot(),
+    })
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.post("/authorize")
@@ -153,6 +203,144 @@ async def consume_aegis_snapshot(snapshot: AegisSnapshot):
     }
 
 
+@router.post("/tia/consume/batch")
+async def consume_aegis_batch(batch: AegisBatch):
+    """Feed many snapshots to T.I.A. at once (all-or-nothing validation)
+    
+    Returns:
+        Number consumed and the resulting buffer size
+    """
+    consumed = tia_agent.consume_aegis_batch(s.model_dump() for s in batch.snapshots)
+    return {
+        "success": True,
+        "consumed": consumed,
+        "snapshots_in_buffer": len(tia_agent.aegis_snapshots)
+    }
+
+
+@router.post("/tia/consume/stream")
+async def consume_aegis_stream(request: Request):
+    """Stream NDJSON snapshots (one JSON object per line) to T.I.A.
+    
+    The body is read incrementally and consumed in chunks of
+    ``TIA_INGEST_CHUNK`` lines: the next bytes are only pulled once
+    the previous chunk is in, so long uploads are throttled to the
+    ingest rate instead of being buffered whole. Bad lines are
+    skipped and reported by line number.
+    """
+    max_line = settings.TIA_INGEST_MAX_LINE_BYTES
+    chunk_size = max(1, settings.TIA_INGEST_CHUNK)
+    consumed = 0
+    errors: List[Dict[str, Any]] = []
+    rejected = 0
+    pending: List[Tuple[int, Any]] = []
+    line_no = 0
+    buffer = b""
+
+    def reject(line: int, message: str):
+        nonlocal rejected
+        rejected += 1
+        if len(errors) < MAX_REPORTED_ERRORS:
+            errors.append({"line": line, "error": message})
+
+    def flush():
+        nonlocal consumed
+        valid, bad = _validate_snapshots([item for _, item in pending])
+        for index, message in bad.items():
+            reject(pending[index][0], message)
+        consumed += tia_agent.consume_aegis_batch(valid)
+        pending.clear()
+
+    def take(raw: bytes):
+        nonlocal line_no
+        line_no += 1
+        if not raw.strip():
+            return
+        if len(raw) > max_line:
+            reject(line_no, f"line exceeds {max_line} bytes")
+            return
+        try:
+            pending.append((line_no, json.loads(raw)))
+        except ValueError as e:
+            reject(line_no, f"invalid JSON: {e}")
+
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        if len(buffer) > max_line:
+            raise HTTPException(status_code=413, detail=f"NDJSON line {line_no + len(lines) + 1} exceeds {max_line} bytes")
+        for raw in lines:
+            take(raw)
+            if len(pending) >= chunk_size:
+                flush()
+                await asyncio.sleep(0)  # let other requests run between chunks
+    take(buffer)
+    if pending:
+        flush()
+
+    return {
+        "success": rejected == 0,
+        "consumed": consumed,
+        "rejected": rejected,
+        "errors": errors,
+        "snapshots_in_buffer": len(tia_agent.aegis_snapshots)
+    }
+
+
+def _topics(topics: Optional[str]) -> Optional[List[str]]:
+    return [t.strip() for t in topics.split(",") if t.strip()] if topics else None
+
+
+def _sse(message: Dict[str, Any]) -> str:
+    return f"id: {message['id']}\nevent: {message['type']}\ndata: {json.dumps(message, default=str)}\n\n"
+
+
+@router.get("/stream")
+async def stream_cockpit(request: Request, topics: Optional[str] = Query(None)):
+    """Server-Sent Events feed of cockpit changes
+    
+    Sends a ``snapshot`` event, then ``delta`` (changed fields of
+    tia / authorization / garage / vortex) and ``event`` messages.
+    Reconnecting clients send ``Last-Event-ID`` and receive only what
+    they missed (or a fresh snapshot if it is no longer buffered).
+    ``?topics=tia,vortex`` limits the feed.
+    """
+    last_id = request.headers.get("last-event-id")
+    sub = await cockpit_feed.subscribe(
+        _topics(topics), int(last_id) if last_id and last_id.isdigit() else None
+    )
+
+    async def events():
+        async for message in cockpit_feed.messages(sub):
+            if await request.is_disconnected():
+                break
+            yield ": keep-alive\n\n" if message is None else _sse(message)
+
+    return StreamingResponse(events(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+@router.websocket("/ws")
+async def cockpit_socket(websocket: WebSocket, topics: Optional[str] = Query(None)):
+    """WebSocket variant of ``/cockpit/stream`` (same JSON messages)"""
+    await websocket.accept()
+    sub = await cockpit_feed.subscribe(_topics(topics))
+
+    async def pump():
+        async for message in cockpit_feed.messages(sub):
+            await websocket.send_text(json.dumps(message or {"type": "heartbeat"}, default=str))
+
+    sender = asyncio.create_task(pump())
+    try:
+        while True:
+            await websocket.receive_text()  # only watched for the disconnect
+    except WebSocketDisconnect:
+        pass
+    finally:
+        sender.cancel()
+        sub.close()
+
+
 @router.get("/events")
 async def get_authorization_events(limit: int = 20):
     """Get authorization event history
@@ -1,6 +1,9 @@
 from fastapi import APIRouter, Depends
 from backend.core.security import get_current_user
 from backend.core.config import settings
+from backend.services.redis_cache import redis_cache
+from backend.services.cockpit_feed import cockpit_feed
+from backend.services.shared_state import shared_state
 
 router = APIRouter(prefix="/telemetry", tags=["telemetry"])
 
@@ -16,3 +19,27 @@ async def system_status():
         "mode": settings.EXECUTION_MODE,
         "risk_clamp": settings.MAX_ORDER_NOTIONAL
     }
+
+@router.get("/cache", dependencies=[Depends(get_current_user)])
+async def cache_stats():
+    """Near-cache hit/miss/eviction counters and Redis health (for sizing)"""
+    return {
+        "near_cache": redis_cache.near.get_stats(),
+        "invalidation": {
+            "listening": redis_cache.invalidator.running,
+            "published": redis_cache.invalidator.published,
+            "received": redis_cache.invalidator.received,
+        },
+        "redis": redis_cache.health.get_stats(),
+        "memory_store": redis_cache.memory.get_stats() if redis_cache.memory else None,
+    }
+
+@router.get("/feed", dependencies=[Depends(get_current_user)])
+async def feed_stats():
+    """Cockpit push-feed subscribers, samples and resync drops"""
+    return cockpit_feed.get_stats()
+
+@router.get("/state", dependencies=[Depends(get_current_user)])
+async def shared_state_stats():
+    """Cross-worker state sync: listener, keys and message counters"""
+    return shared_state.get_stats()
@@ -1,7 +1,11 @@
-from fastapi import APIRouter, Depends, Request, HTTPException
+from fastapi import APIRouter, Depends, Request, HTTPException, Query
 from backend.core.security import get_current_user
 from backend.services.oms import OMS
+from backend.services.redis_cache import redis_cache
 from pydantic import BaseModel, Field, field_validator
+from typing import List, Optional
+from datetime import datetime, timedelta, timezone
+import asyncio
 import math
 
 router = APIRouter(prefix="/trade", tags=["trade"])
@@ -35,3 +39,45 @@ async def place_order(order: OrderRequest, request: Request):
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+class BatchOrderRequest(BaseModel):
+    orders: List[OrderRequest] = Field(..., min_length=1, max_length=50)
+
+@router.post("/orders", dependencies=[Depends(get_current_user)])
+async def place_orders(batch: BatchOrderRequest, request: Request):
+    """Submit a batch concurrently (e.g. flatten/rebalance the fleet in one round trip)"""
+    oms: OMS = request.app.state.oms
+    results = await oms.place_orders([o.model_dump() for o in batch.orders])
+    return {
+        "status": "success",
+        "orders": [
+            {"status": "error", "detail": str(r)} if isinstance(r, Exception) else {"status": "success", "order": r}
+            for r in results
+        ],
+    }
+
+
+@router.post("/flatten", dependencies=[Depends(get_current_user)])
+async def flatten_all(
+    request: Request,
+    whole_account: bool = Query(False, description="Also sell holdings the bot did not buy"),
+):
+    """EMERGENCY STOP: cancel all open orders and exit every bot position concurrently"""
+    oms: OMS = request.app.state.oms
+    try:
+        return {"status": "success", "report": await oms.flatten_all(whole_account=whole_account)}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/history", dependencies=[Depends(get_current_user)])
+async def trade_history(
+    symbol: Optional[str] = Query(None, pattern=r'^[A-Z0-9]+/USDT$'),
+    hours: float = Query(24.0, gt=0, le=24 * 30),
+    limit: int = Query(500, ge=1, le=5000),
+):
+    """Trades from the last ``hours`` (optionally one symbol), oldest first"""
+    since = datetime.now(timezone.utc) - timedelta(hours=hours)
+    trades = await asyncio.to_thread(redis_cache.get_trades, since, None, symbol, limit)
+    return {"symbol": symbol, "hours": hours, "count": len(trades), "trades": trades}
@@ -3,12 +3,15 @@
 # ================================================================
 # Manages base and premium capabilities for the trading system
 # Premium access granted by T.I.A. through the bridge
+# Enabled capabilities are one integer bitmask: checks are a single
+# AND, and grant/revoke swap the whole mask in one assignment
 # ================================================================
 
 from enum import Enum
-from typing import List, Dict, Any
+from typing import Iterable, List, Dict, Any, Optional, Tuple
 from datetime import datetime, timezone
 from backend.core.logging_config import setup_logging
+from backend.services.status_snapshot import StatusPublisher
 
 logger = setup_logging("admiral_engine")
 
@@ -20,12 +23,31 @@ class CapabilityType(str, Enum):
 
 
 class Capability:
-    """Trading capability definition"""
-    def __init__(self, name: str, description: str, capability_type: CapabilityType):
+    """Trading capability definition
+    
+    ``enabled`` reads the owning engine's mask, so it can never
+    disagree with ``has_capability``.
+    """
+    def __init__(self, name: str, description: str, capability_type: CapabilityType,
+                 bit: int = 0, owner: Optional["AdmiralEngine"] = None):
         self.name = name
         self.description = description
         self.type = capability_type
-        self.enabled = capability_type == CapabilityType.BASE  # Base always enabled
+        self.bit = bit
+        self._owner = owner
+    
+    @property
+    def enabled(self) -> bool:
+        if self._owner is None:
+            return self.type == CapabilityType.BASE  # Base always enabled
+        return bool(self._owner.mask & self.bit)
+
+
+def _mask_of(bits: Dict[str, int], entries: Iterable[Tuple[str, str]]) -> int:
+    mask = 0
+    for name, _ in entries:
+        mask |= bits[name]
+    return mask
 
 
 class AdmiralEngine:
@@ -53,22 +75,51 @@ class AdmiralEngine:
         ("airgapped_sync", "HuggingFace Space synchronization"),
     ]
     
+    # One bit per capability, in declaration order
+    CAPABILITY_BITS = {name: 1 << i for i, (name, _) in enumerate(BASE_CAPABILITIES + PREMIUM_CAPABILITIES)}
+    BASE_MASK = _mask_of(CAPABILITY_BITS, BASE_CAPABILITIES)
+    PREMIUM_MASK = _mask_of(CAPABILITY_BITS, PREMIUM_CAPABILITIES)
+    FULL_MASK = BASE_MASK | PREMIUM_MASK
+    
     def __init__(self):
         self.capabilities: Dict[str, Capability] = {}
-        self.premium_authorized = False
+        self.mask = self.BASE_MASK
         self.authorization_timestamp = None
         self.authorized_by = None
+        # Enabled-name lists per mask value (there are only a few)
+        self._names_by_mask: Dict[int, Tuple[str, ...]] = {}
+        # Cockpit status, rebuilt only after grant/revoke bumps it
+        self.status_publisher = StatusPublisher(self._build_status)
         
         # Initialize base capabilities
         for name, desc in self.BASE_CAPABILITIES:
-            self.capabilities[name] = Capability(name, desc, CapabilityType.BASE)
+            self.capabilities[name] = Capability(name, desc, CapabilityType.BASE, self.CAPABILITY_BITS[name], self)
         
         # Initialize premium capabilities (disabled by default)
         for name, desc in self.PREMIUM_CAPABILITIES:
-            self.capabilities[name] = Capability(name, desc, CapabilityType.PREMIUM)
+            self.capabilities[name] = Capability(name, desc, CapabilityType.PREMIUM, self.CAPABILITY_BITS[name], self)
         
         logger.info(f"⚔️ ADMIRAL ENGINE: Initialized with {len(self.BASE_CAPABILITIES)} base capabilities")
     
+    @classmethod
+    def mask_for(cls, *names: str) -> int:
+        """Precompute the mask for a set of capabilities (e.g. once per order route)
+        
+        Raises:
+            ValueError: If a name is not a known capability
+        """
+        mask = 0
+        for name in names:
+            bit = cls.CAPABILITY_BITS.get(name)
+            if bit is None:
+                raise ValueError(f"Unknown capability: {name}")
+            mask |= bit
+        return mask
+    
+    @property
+    def premium_authorized(self) -> bool:
+        return self.mask & self.PREMIUM_MASK == self.PREMIUM_MASK
+    
     def grant_premium_access(self, authorized_by: str = "T.I.A.") -> bool:
         """Grant premium capabilities to Admiral
         
@@ -82,18 +133,21 @@ class AdmiralEngine:
             logger.info("⚔️ ADMIRAL: Premium access already granted")
             return False
         
-        self.premium_authorized = True
-        self.authorization_timestamp = datetime.now(timezone.utc).isoformat()
-        self.authorized_by = authorized_by
-        
-        # Enable all premium capabilities
-        for cap in self.capabilities.values():
-            if cap.type == CapabilityType.PREMIUM:
-                cap.enabled = True
+        self._set_premium(authorized_by, datetime.now(timezone.utc).isoformat())
         
         logger.info(f"✅ ADMIRAL: Premium access GRANTED by {authorized_by}")
         return True
     
+    def restore_premium_access(self, authorized_by: str, timestamp: Optional[str]) -> None:
+        """Re-apply a persisted grant (keeps its original timestamp)"""
+        self._set_premium(authorized_by, timestamp)
+    
+    def _set_premium(self, authorized_by: str, timestamp: Optional[str]) -> None:
+        self.authorization_timestamp = timestamp
+        self.authorized_by = authorized_by
+        self.mask = self.FULL_MASK  # single swap: readers see all or nothing
+        self.status_publisher.bump()
+    
     def revoke_premium_access(self) -> bool:
         """Revoke premium capabilities from Admiral
         
@@ -104,14 +158,10 @@ class AdmiralEngine:
             logger.info("⚔️ ADMIRAL: Premium access already revoked")
             return False
         
-        self.premium_authorized = False
+        self.mask = self.BASE_MASK
         self.authorization_timestamp = None
         self.authorized_by = None
-        
-        # Disable all premium capabilities
-        for cap in self.capabilities.values():
-            if cap.type == CapabilityType.PREMIUM:
-                cap.enabled = False
+        self.status_publisher.bump()
         
         logger.info("🔒 ADMIRAL: Premium access REVOKED")
         return True
@@ -125,8 +175,11 @@ class AdmiralEngine:
         Returns:
             True if capability exists and is enabled
         """
-        cap = self.capabilities.get(capability_name)
-        return cap.enabled if cap else False
+        return bool(self.mask & self.CAPABILITY_BITS.get(capability_name, 0))
+    
+    def has_all(self, mask: int) -> bool:
+        """True if every capability in ``mask`` (see ``mask_for``) is enabled"""
+        return self.mask & mask == mask
     
     def get_enabled_capabilities(self) -> List[str]:
         """Get list of currently enabled capabilities
@@ -134,10 +187,13 @@ class AdmiralEngine:
         Returns:
             List of enabled capability names
         """
-        return [
-            name for name, cap in self.capabilities.items()
-            if cap.enabled
-        ]
+        mask = self.mask
+        names = self._names_by_mask.get(mask)
+        if names is None:
+            names = self._names_by_mask[mask] = tuple(
+                name for name, bit in self.CAPABILITY_BITS.items() if mask & bit
+            )
+        return list(names)
     
     def get_premium_capabilities(self) -> List[str]:
         """Get list of premium capabilities (regardless of enabled state)
@@ -145,43 +201,39 @@ class AdmiralEngine:
         Returns:
             List of premium capability names
         """
-        return [
-            name for name, cap in self.capabilities.items()
-            if cap.type == CapabilityType.PREMIUM
-        ]
+        return [name for name, _ in self.PREMIUM_CAPABILITIES]
     
     def get_status(self) -> Dict[str, Any]:
         """Get Admiral Engine status for cockpit display
         
+        Served from the published snapshot; it is rebuilt only after
+        the authorization state changes.
+        
         Returns:
             Status dict with capabilities and authorization info
         """
-        enabled_caps = self.get_enabled_capabilities()
-        premium_caps = self.get_premium_capabilities()
+        return self.status_publisher.snapshot.copy()
+    
+    def _build_status(self) -> Dict[str, Any]:
+        groups = {CapabilityType.BASE: [], CapabilityType.PREMIUM: []}
+        enabled = 0
+        for name, cap in self.capabilities.items():
+            groups[cap.type].append({"name": name, "description": cap.description, "enabled": cap.enabled})
+            enabled += cap.enabled
         
-        status = {
+        return {
             "status": "ACTIVE",
             "premium_authorized": self.premium_authorized,
             "authorization_timestamp": self.authorization_timestamp,
             "authorized_by": self.authorized_by,
             "total_capabilities": len(self.capabilities),
-            "enabled_capabilities": len(enabled_caps),
-            "premium_capabilities": len(premium_caps),
+            "enabled_capabilities": enabled,
+            "premium_capabilities": len(groups[CapabilityType.PREMIUM]),
             "capabilities": {
-                "base": [
-                    {"name": name, "description": cap.description, "enabled": cap.enabled}
-                    for name, cap in self.capabilities.items()
-                    if cap.type == CapabilityType.BASE
-                ],
-                "premium": [
-                    {"name": name, "description": cap.description, "enabled": cap.enabled}
-                    for name, cap in self.capabilities.items()
-                    if cap.type == CapabilityType.PREMIUM
-                ]
+                "base": groups[CapabilityType.BASE],
+                "premium": groups[CapabilityType.PREMIUM],
             }
         }
-        
-        return status
     
     def get_capability_summary(self) -> Dict[str, Any]:
         """Get summary of capabilities for quick display
@@ -0,0 +1,376 @@
+# ================================================================
+# 🔴 ASYNC REDIS CACHE - Non-Blocking State Persistence
+# ================================================================
+# Same API as RedisCache, awaited on redis.asyncio with a bounded
+# connection pool, so Redis round trips overlap with other
+# requests instead of freezing the event loop. Sync callers can
+# hand writes off with spawn() and return immediately.
+# ================================================================
+import os
+import asyncio
+from typing import Any, Awaitable, Dict, List, Optional, Set
+from datetime import datetime, timezone
+
+import redis.asyncio as aioredis
+
+from backend.core.config import settings
+from backend.core.logging_config import setup_logging
+from backend.services.cache_codec import decode, decode_value, get_codec
+from backend.services.memory_redis import AsyncMemoryRedis, memory_redis
+from backend.services.redis_cache import redis_cache
+from backend.services.trade_stream import LEGACY_TRADE_LIST, TRADE_STREAM, TradeStream
+
+logger = setup_logging("async_redis_cache")
+
+
+def _text(value) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+class AsyncRedisCache:
+    """asyncio counterpart of ``RedisCache``
+
+    The pool is created lazily inside the running loop (asyncio
+    connections cannot be shared across loops) and is bounded by
+    ``REDIS_MAX_CONNECTIONS``; when every connection is busy,
+    callers wait up to ``REDIS_POOL_TIMEOUT`` for one to free up.
+    Responses are not decoded since values may be binary codec
+    blobs; readers decode keys and values themselves.
+
+    Args:
+        health: Shared ``RedisHealth`` answering ``is_connected``
+            (without one, every check is a PING)
+        embedded: Serve from the embedded store; the singleton follows
+            ``RedisCache``'s choice (only when Redis is disabled)
+    """
+
+    def __init__(self, max_connections: Optional[int] = None, pool_timeout: Optional[float] = None,
+                 health=None, embedded: Optional[bool] = None):
+        self.redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
+        self.enabled = os.getenv("REDIS_ENABLED", "True").lower() == "true"
+        self.max_connections = max_connections or settings.REDIS_MAX_CONNECTIONS
+        self.pool_timeout = settings.REDIS_POOL_TIMEOUT if pool_timeout is None else pool_timeout
+        # Redis off: serve from the embedded store shared with RedisCache
+        if embedded is None:
+            embedded = not self.enabled and settings.MEMORY_CACHE_ENABLED
+        self.use_memory = embedded
+        self.client: Optional[aioredis.Redis] = None
+        self.codec = get_codec(settings.CACHE_CODEC)
+        self.trades = TradeStream()
+        self.health = health
+        self._client_loop = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    def _redis(self) -> Optional[aioredis.Redis]:
+        """Client bound to the running loop (created on first use)"""
+        if self.use_memory:
+            if self.client is None:
+                self.client = AsyncMemoryRedis(memory_redis)
+            return self.client
+        if not self.enabled:
+            return None
+        loop = asyncio.get_running_loop()
+        if self.client is None or (self._client_loop is not None and self._client_loop is not loop):
+            if self.client is not None:
+                self.spawn(self._release(self.client))
+            pool = aioredis.BlockingConnectionPool.from_url(
+                self.redis_url,
+                max_connections=self.max_connections,
+                timeout=self.pool_timeout,
+                socket_connect_timeout=5,
+            )
+            self.client = aioredis.Redis(connection_pool=pool)
+            self._client_loop = loop
+        return self.client
+
+    @staticmethod
+    async def _release(client) -> None:
+        """Close a client left behind by a previous event loop"""
+        try:
+            await client.aclose()
+        except Exception:
+            pass  # its loop may be gone; the sockets die with it
+
+    async def is_connected(self) -> bool:
+        """Check if Redis is available (shared health state, no PING)"""
+        client = self._redis()
+        if not client:
+            return False
+        if self.use_memory:
+            return True
+        if self.health is not None:
+            return self.health.is_up
+        try:
+            await client.ping()
+            return True
+        except Exception:
+            return False
+
+    async def close(self):
+        """Drain background writes and release the pool"""
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+        if self.client is not None:
+            try:
+                await self.client.aclose()
+            except Exception:
+                pass
+        self.client = None
+        self._client_loop = None
+
+    def spawn(self, operation: Awaitable[Any]) -> bool:
+        """Run ``operation`` in the background from sync code
+
+        Returns False (and closes the coroutine) when Redis is disabled
+        or no event loop is running, so the caller can fall back.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is None or not (self.enabled or self.use_memory):
+            if asyncio.iscoroutine(operation):
+                operation.close()
+            return False
+        task = loop.create_task(operation)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+
+    # ═══════════════════════════════════════════════════════════
+    # 🧱 GENERIC STATE WRITES
+    # ═══════════════════════════════════════════════════════════
+
+    async def save_hash(self, key: str, mapping: Dict[str, str], ttl: Optional[int] = None) -> bool:
+        """``hset`` + ``expire`` in one round trip"""
+        client = self._redis()
+        if not client:
+            return False
+        try:
+            pipe = client.pipeline(transaction=False)
+            pipe.hset(key, mapping=mapping)
+            if ttl:
+                pipe.expire(key, ttl)
+            await pipe.execute()
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ REDIS: Failed to save {key} - {e}")
+            return False
+
+    async def push_capped(self, key: str, value: str, max_length: int = 100) -> bool:
+        """``lpush`` + ``ltrim`` in one round trip"""
+        client = self._redis()
+        if not client:
+            return False
+        try:
+            pipe = client.pipeline(transaction=False)
+            pipe.lpush(key, value)
+            pipe.ltrim(key, 0, max_length - 1)
+            await pipe.execute()
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ REDIS: Failed to append to {key} - {e}")
+            return False
+
+    # ═══════════════════════════════════════════════════════════
+    # 💰 PORTFOLIO STATE
+    # ═══════════════════════════════════════════════════════════
+
+    async def save_portfolio_state(self, state: Dict[str, Any]):
+        """Persist portfolio state to Redis"""
+        state['last_updated'] = datetime.now(timezone.utc).isoformat()
+        return await self.save_hash("vortex:portfolio", {
+            k: self.codec.encode_value(v) for k, v in state.items()
+        }, ttl=3600)  # 1 hour TTL
+
+    async def get_portfolio_state(self) -> Optional[Dict[str, Any]]:
+        """Retrieve portfolio state from Redis"""
+        client = self._redis()
+        if not client:
+            return None
+        try:
+            data = await client.hgetall("vortex:portfolio")
+            if not data:
+                return None
+            return {_text(k): decode_value(v) for k, v in data.items()}
+        except Exception as e:
+            logger.warning(f"⚠️ REDIS: Failed to get portfolio - {e}")
+            return None
+
+    # ═══════════════════════════════════════════════════════════
+    # 📈 PEAK PRICE TRACKING (For Trailing Take Profit)
+    # ═══════════════════════════════════════════════════════════
+
+    async def set_peak_price(self, symbol: str, price: float):
+        """Store peak price for trailing stop logic"""
+        client = self._redis()
+        if not client:
+            return
+        try:
+            await client.hset("vortex:peaks", symbol, str(price))
+        except Exception as e:
+            logger.warning(f"⚠️ REDIS: Failed to set peak price - {e}")
+
+    async def set_peak_prices(self, peaks: Dict[str, float], cleared: Optional[List[str]] = None) -> bool:
+        """Store many peak prices (and drop closed symbols) in one round trip"""
+        client = self._redis()
+        if not client or (not peaks and not cleared):
+            return False
+        try:
+            pipe = client.pipeline(transaction=False)
+            if peaks:
+                pipe.hset("vortex:peaks", mapping={k: str(v) for k, v in peaks.items()})
+            if cleared:
+                pipe.hdel("vortex:peaks", *cleared)
+            await pipe.execute()
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ REDIS: Failed to batch-save peak prices - {e}")
+            return False
+
+    async def get_peak_price(self, symbol: str) -> Optional[float]:
+        """Get stored peak price"""
+        client = self._redis()
+        if not client:
+            return None
+        try:
+            val = await client.hget("vortex:peaks", symbol)
+            return float(val) if val else None
+        except Exception:
+            return None
+
+    async def get_all_peaks(self) -> Dict[str, float]:
+        """Get all peak prices"""
+        client = self._redis()
+        if not client:
+            return {}
+        try:
+            data = await client.hgetall("vortex:peaks")
+            return {_text(k): float(v) for k, v in data.items()}
+        except Exception:
+            return {}
+
+    async def clear_peak(self, symbol: str):
+        """Clear peak price after sell"""
+        client = self._redis()
+        if not client:
+            return
+        try:
+            await client.hdel("vortex:peaks", symbol)
+        except Exception as e:
+            logger.warning(f"⚠️ REDIS: Failed to clear peak - {e}")
+
+    # ═══════════════════════════════════════════════════════════
+    # 📝 TRADE HISTORY
+    # ═══════════════════════════════════════════════════════════
+
+    async def log_trade(self, trade: Dict[str, Any]):
+        """Append trade to the fleet and per-symbol history streams"""
+        client = self._redis()
+        if not client:
+            return
+        try:
+            now = datetime.now(timezone.utc)
+            trade['timestamp'] = now.isoformat()
+            pipe = client.pipeline(transaction=False)
+            self.trades.append(pipe, [self.trades.entry(trade, self.codec)], int(now.timestamp() * 1000))
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"⚠️ REDIS: Failed to log trade - {e}")
+
+    async def get_trade_history(self, limit: int = 20) -> list:
+        """Get recent trade history (newest first)"""
+        client = self._redis()
+        if not client:
+            return []
+        try:
+            trades = TradeStream.parse(await client.xrevrange(TRADE_STREAM, count=limit))
+            if trades:
+                return trades
+            return [decode(t) for t in await client.lrange(LEGACY_TRADE_LIST, 0, limit - 1)]
+        except Exception:
+            return []
+
+    async def get_trades(self, start=None, end=None, symbol: Optional[str] = None,
+                         limit: Optional[int] = None) -> list:
+        """Trades between ``start`` and ``end`` (oldest first), optionally for one symbol
+
+        With ``limit`` the most recent ``limit`` trades in the range are returned.
+        """
+        client = self._redis()
+        if not client:
+            return []
+        try:
+            key, low, high = self.trades.range_args(start, end, symbol)
+            if limit:
+                return TradeStream.parse(reversed(await client.xrevrange(key, high, low, count=limit)))
+            return TradeStream.parse(await client.xrange(key, low, high))
+        except Exception:
+            return []
+
+    async def create_trade_group(self, group: str, start_id: str = "$") -> bool:
+        """Create a consumer group on the fleet stream (idempotent)"""
+        client = self._redis()
+        if not client:
+            return False
+        try:
+            await client.xgroup_create(TRADE_STREAM, group, id=start_id, mkstream=True)
+            return True
+        except Exception as e:
+            if TradeStream.is_busy_group(e):
+                return True
+            logger.warning(f"⚠️ REDIS: Failed to create trade group {group} - {e}")
+            return False
+
+    async def read_trade_group(self, group: str, consumer: str, count: int = 10,
+                               block_ms: Optional[int] = None) -> list:
+        """Next undelivered trades for ``consumer``; XACK them when processed"""
+        client = self._redis()
+        if not client:
+            return []
+        try:
+            response = await client.xreadgroup(
+                group, consumer, {TRADE_STREAM: ">"}, count=count, block=block_ms
+            )
+            return TradeStream.parse_read(response)
+        except Exception:
+            return []
+
+    async def ack_trades(self, group: str, *stream_ids: str) -> int:
+        """Mark delivered trades as processed by ``group``"""
+        client = self._redis()
+        if not client or not stream_ids:
+            return 0
+        try:
+            return await client.xack(TRADE_STREAM, group, *stream_ids)
+        except Exception:
+            return 0
+
+    # ═══════════════════════════════════════════════════════════
+    # 🎯 TICKER CACHE (Reduce API calls)
+    # ═══════════════════════════════════════════════════════════
+
+    async def cache_ticker(self, symbol: str, data: Dict[str, Any], ttl: int = 10):
+        """Cache ticker data with short TTL"""
+        client = self._redis()
+        if not client:
+            return
+        try:
+            await client.setex(f"ticker:{symbol}", ttl, self.codec.encode_ticker(data))
+        except Exception as e:
+            logger.warning(f"⚠️ REDIS: Failed to cache ticker - {e}")
+
+    async def get_cached_ticker(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Get cached ticker if available"""
+        client = self._redis()
+        if not client:
+            return None
+        try:
+            data = await client.get(f"ticker:{symbol}")
+            return decode(data) if data else None
+        except Exception:
+            return None
+
+
+# Singleton instance
+async_redis_cache = AsyncRedisCache(health=redis_cache.health, embedded=redis_cache.memory is not None)
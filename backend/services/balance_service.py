@@ -0,0 +1,202 @@
+# ================================================================
+# 💳 BALANCE SERVICE - Cached Account State for Sizing & Readiness
+# ================================================================
+# Holds the last exchange balance in memory, refreshes it on a
+# timer, and patches it immediately from our own fills so the 4%
+# sizing rule and /ready read a fresh-enough value without a
+# fetch_balance round trip on every call.
+# ================================================================
+
+import asyncio
+import inspect
+import time
+from typing import Any, Callable, Dict, Optional
+
+from backend.core.logging_config import setup_logging
+
+logger = setup_logging("balance_service")
+
+
+class BalanceService:
+    """In-memory ccxt-shaped balance with timed refresh and fill patching
+
+    Args:
+        fetch: Zero-arg callable returning a ccxt balance dict (or an
+            awaitable of one), e.g. ``lambda: exchange.fetch_balance()``
+        refresh_interval: Seconds between background refreshes
+        max_age: Default staleness bound for ``get()``
+    """
+
+    def __init__(self, fetch: Callable[[], Any], refresh_interval: float = 30.0,
+                 max_age: float = 60.0):
+        self._fetch = fetch
+        self.refresh_interval = refresh_interval
+        self.max_age = max_age
+        self.balance: Optional[Dict[str, Any]] = None
+        self.updated_at = 0.0
+        self.refreshes = 0
+        self._inflight: Optional[asyncio.Future] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._filled: Dict[str, float] = {}  # open tracked order -> filled already applied
+
+    # ═══════════════════════════════════════════════════════════
+    # READS
+    # ═══════════════════════════════════════════════════════════
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.updated_at if self.balance is not None else float("inf")
+
+    def is_fresh(self, max_age: Optional[float] = None) -> bool:
+        return self.age <= (self.max_age if max_age is None else max_age)
+
+    async def _fetch_once(self) -> Dict[str, Any]:
+        result = self._fetch()
+        if inspect.isawaitable(result):
+            result = await result
+        self.balance = result if isinstance(result, dict) else {}
+        self.updated_at = time.time()
+        self.refreshes += 1
+        return self.balance
+
+    async def refresh(self) -> Dict[str, Any]:
+        """Fetch from the exchange; concurrent callers share one request"""
+        task = self._inflight
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = self._inflight = asyncio.ensure_future(self._fetch_once())
+        return await asyncio.shield(task)
+
+    async def get(self, max_age: Optional[float] = None) -> Dict[str, Any]:
+        """Cached balance, refreshed first if older than ``max_age``
+
+        Raises whatever the exchange raised if a refresh is needed and fails.
+        """
+        if self.is_fresh(max_age):
+            return self.balance
+        return await self.refresh()
+
+    async def equity(self, currency: str = "USDT", max_age: Optional[float] = None) -> Optional[float]:
+        """Total ``currency`` balance, or None if the balance is unavailable"""
+        try:
+            balance = await self.get(max_age)
+        except Exception as e:
+            logger.warning(f"⚠️ BALANCE: Refresh failed - {e}")
+            return None
+        return float((balance.get("total") or {}).get(currency, 0) or 0)
+
+    def free(self, currency: str) -> float:
+        if self.balance is None:
+            return 0.0
+        return float((self.balance.get("free") or {}).get(currency, 0) or 0)
+
+    # ═══════════════════════════════════════════════════════════
+    # WRITES
+    # ═══════════════════════════════════════════════════════════
+
+    def invalidate(self) -> None:
+        """Force the next read to go to the exchange"""
+        self.updated_at = 0.0
+
+    def _adjust(self, currency: str, delta: float) -> None:
+        for bucket in ("free", "total"):
+            side = self.balance.setdefault(bucket, {})
+            side[currency] = float(side.get(currency, 0) or 0) + delta
+        per_currency = self.balance.get(currency)
+        if isinstance(per_currency, dict):
+            for bucket in ("free", "total"):
+                per_currency[bucket] = float(per_currency.get(bucket, 0) or 0) + delta
+
+    def apply_fill(self, symbol: str, side: str, amount: float, price: float,
+                   fee: Optional[Dict[str, Any]] = None) -> None:
+        """Patch the cached balance with one of our own fills
+
+        The patch keeps sizing accurate until the next refresh, which
+        is pulled forward so the exchange's view replaces it soon.
+        """
+        if self.balance is None or not amount or not price:
+            return
+        base, _, quote = symbol.replace("_", "/").partition("/")
+        cost = float(amount) * float(price)
+        sign = 1.0 if side == "buy" else -1.0
+        self._adjust(base, sign * float(amount))
+        self._adjust(quote, -sign * cost)
+        if fee and fee.get("cost") and fee.get("currency"):
+            self._adjust(fee["currency"], -float(fee["cost"]))
+        if self._wake is not None:
+            self._wake.set()
+
+    def apply_order(self, order: Any, symbol: str, side: str,
+                    amount: float, price: float) -> None:
+        """apply_fill using a ccxt order's fill fields when it has them
+
+        If neither the order nor the caller knows the fill price, the
+        cache is invalidated and refreshed instead of left stale.
+        """
+        fee = None
+        if isinstance(order, dict):
+            filled = order.get("filled")
+            if filled is not None:
+                if float(filled) <= 0:
+                    # Open, cancelled or rejected without a fill: nothing to patch,
+                    # but pull the refresh forward in case it fills meanwhile
+                    if self._wake is not None:
+                        self._wake.set()
+                    return
+                amount = filled
+            price = order.get("average") or order.get("price") or price
+            if not price and filled and order.get("cost"):
+                price = float(order["cost"]) / float(filled)
+            fee = order.get("fee")
+        if not price:
+            self.invalidate()
+            if self._wake is not None:
+                self._wake.set()
+            return
+        self.apply_fill(symbol, side, amount, price, fee)
+
+    def on_order_update(self, order: Any, previous: Optional[str] = None) -> None:
+        """``OrderTracker`` listener: patch the cache with each new fill increment"""
+        key = order.key
+        filled = float(order.filled or 0)
+        delta = filled - self._filled.get(key, 0.0)
+        if order.is_open:
+            self._filled[key] = filled
+        else:
+            self._filled.pop(key, None)
+        if delta <= 0 or order.side not in ("buy", "sell"):
+            return
+        price = order.average or (order.raw or {}).get("price")
+        self.apply_order(None, order.symbol, order.side, delta, price)
+
+    # ═══════════════════════════════════════════════════════════
+    # BACKGROUND REFRESH
+    # ═══════════════════════════════════════════════════════════
+
+    async def run(self) -> None:
+        """Refresh every interval, or soon after a fill patched the cache"""
+        self._wake = asyncio.Event()
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.refresh_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning(f"⚠️ BALANCE: Refresh failed - {e}")
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self._wake = None
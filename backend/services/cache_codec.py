@@ -0,0 +1,314 @@
+# ================================================================
+# 📦 CACHE CODEC - Versioned Binary Encoding for Redis Values
+# ================================================================
+# Binary values start with a 0x00 magic byte (never the first byte
+# of JSON text), a format version and a schema id:
+#   TICKER  fixed-layout struct (presence bitmap + 16 doubles)
+#   TRADE   schema-tagged record: known fields packed positionally
+#   RECORD  generic tagged record
+#   VALUE   one tagged value (portfolio hash fields)
+# decode() reads both formats, so readers are upgraded first and
+# writers flipped to CACHE_CODEC=binary afterwards.
+# ================================================================
+
+import json
+import math
+import struct
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple, Union
+
+MAGIC = 0x00
+VERSION = 1
+
+TICKER = 1
+RECORD = 2
+TRADE = 3
+VALUE = 4
+
+_HEADER = struct.Struct("!BBB")
+_DOUBLE = struct.Struct("!d")
+_INT64 = struct.Struct("!q")
+
+TICKER_FIELDS = (
+    "timestamp", "high", "low", "bid", "bidVolume", "ask", "askVolume", "vwap",
+    "open", "close", "last", "previousClose", "change", "percentage", "average",
+    "baseVolume", "quoteVolume",
+)
+_TICKER = struct.Struct("!I" + "d" * len(TICKER_FIELDS))
+_TICKER_INDEX = {name: i for i, name in enumerate(TICKER_FIELDS)}
+# Regenerated from timestamp / dropped (raw exchange payload) on encode
+_TICKER_DERIVED = frozenset(("symbol", "datetime", "info"))
+_DATETIME_FLAG = 1 << 31
+
+SCHEMAS: Dict[int, Tuple[str, ...]] = {
+    TRADE: ("symbol", "side", "amount", "price", "cost", "order_id", "timestamp", "reason", "pnl"),
+    RECORD: (),
+}
+
+Blob = Union[bytes, str]
+
+
+# ═══════════════════════════════════════════════════════════
+# TAGGED VALUES
+# ═══════════════════════════════════════════════════════════
+
+def _write_varint(out: bytearray, n: int) -> None:
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    shift = n = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        n |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return n, pos
+        shift += 7
+
+
+def _write_str(out: bytearray, s: str) -> None:
+    raw = s.encode("utf-8")
+    _write_varint(out, len(raw))
+    out += raw
+
+
+def _read_str(data: bytes, pos: int) -> Tuple[str, int]:
+    size, pos = _read_varint(data, pos)
+    return data[pos:pos + size].decode("utf-8"), pos + size
+
+
+def _pack(out: bytearray, value: Any) -> None:
+    if value is None:
+        out += b"N"
+    elif value is True:
+        out += b"T"
+    elif value is False:
+        out += b"F"
+    elif isinstance(value, int) and -(1 << 63) <= value < (1 << 63):
+        out += b"i"
+        out += _INT64.pack(value)
+    elif isinstance(value, float):
+        out += b"d"
+        out += _DOUBLE.pack(value)
+    elif isinstance(value, str):
+        out += b"s"
+        _write_str(out, value)
+    elif isinstance(value, (bytes, bytearray)):
+        out += b"b"
+        _write_varint(out, len(value))
+        out += value
+    elif isinstance(value, (list, tuple)):
+        out += b"l"
+        _write_varint(out, len(value))
+        for item in value:
+            _pack(out, item)
+    elif isinstance(value, dict):
+        out += b"m"
+        _write_varint(out, len(value))
+        for key, item in value.items():
+            _write_str(out, str(key))
+            _pack(out, item)
+    else:
+        out += b"s"
+        _write_str(out, str(value))
+
+
+def _unpack(data: bytes, pos: int) -> Tuple[Any, int]:
+    tag = data[pos:pos + 1]
+    pos += 1
+    if tag == b"N":
+        return None, pos
+    if tag == b"T":
+        return True, pos
+    if tag == b"F":
+        return False, pos
+    if tag == b"i":
+        return _INT64.unpack_from(data, pos)[0], pos + 8
+    if tag == b"d":
+        return _DOUBLE.unpack_from(data, pos)[0], pos + 8
+    if tag == b"s":
+        return _read_str(data, pos)
+    if tag == b"b":
+        size, pos = _read_varint(data, pos)
+        return bytes(data[pos:pos + size]), pos + size
+    if tag == b"l":
+        size, pos = _read_varint(data, pos)
+        items = []
+        for _ in range(size):
+            item, pos = _unpack(data, pos)
+            items.append(item)
+        return items, pos
+    if tag == b"m":
+        size, pos = _read_varint(data, pos)
+        mapping = {}
+        for _ in range(size):
+            key, pos = _read_str(data, pos)
+            mapping[key], pos = _unpack(data, pos)
+        return mapping, pos
+    raise ValueError(f"Unknown value tag {tag!r}")
+
+
+# ═══════════════════════════════════════════════════════════
+# SCHEMAS
+# ═══════════════════════════════════════════════════════════
+
+def _ticker_packable(data: Dict[str, Any]) -> bool:
+    for key, value in data.items():
+        if key in _TICKER_DERIVED or value is None:
+            continue
+        if key not in _TICKER_INDEX or isinstance(value, bool) or not isinstance(value, (int, float)):
+            return False
+    return True
+
+
+def _encode_ticker(data: Dict[str, Any]) -> bytes:
+    present = 0
+    values = []
+    for i, name in enumerate(TICKER_FIELDS):
+        value = data.get(name)
+        if value is None:
+            values.append(math.nan)
+        else:
+            present |= 1 << i
+            values.append(float(value))
+    if data.get("datetime") is not None:
+        present |= _DATETIME_FLAG
+    out = bytearray(_HEADER.pack(MAGIC, VERSION, TICKER))
+    out += _TICKER.pack(present, *values)
+    _write_str(out, str(data.get("symbol") or ""))
+    return bytes(out)
+
+
+def _decode_ticker(data: bytes, pos: int) -> Dict[str, Any]:
+    present, *values = _TICKER.unpack_from(data, pos)
+    symbol, _ = _read_str(data, pos + _TICKER.size)
+    ticker: Dict[str, Any] = {"symbol": symbol or None}
+    for i, name in enumerate(TICKER_FIELDS):
+        ticker[name] = values[i] if present & (1 << i) else None
+    if ticker["timestamp"] is not None:
+        ticker["timestamp"] = int(ticker["timestamp"])
+    if present & _DATETIME_FLAG and ticker["timestamp"] is not None:
+        ticker["datetime"] = datetime.fromtimestamp(
+            ticker["timestamp"] / 1000, tz=timezone.utc
+        ).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+    return ticker
+
+
+def _encode_record(record: Dict[str, Any], schema: int) -> bytes:
+    fields = SCHEMAS[schema]
+    out = bytearray(_HEADER.pack(MAGIC, VERSION, schema))
+    present = 0
+    for i, name in enumerate(fields):
+        if name in record:
+            present |= 1 << i
+    _write_varint(out, present)
+    for i, name in enumerate(fields):
+        if present & (1 << i):
+            _pack(out, record[name])
+    extras = {k: v for k, v in record.items() if k not in fields}
+    _write_varint(out, len(extras))
+    for key, value in extras.items():
+        _write_str(out, str(key))
+        _pack(out, value)
+    return bytes(out)
+
+
+def _decode_record(data: bytes, pos: int, schema: int) -> Dict[str, Any]:
+    fields = SCHEMAS[schema]
+    present, pos = _read_varint(data, pos)
+    record: Dict[str, Any] = {}
+    for i, name in enumerate(fields):
+        if present & (1 << i):
+            record[name], pos = _unpack(data, pos)
+    extras, pos = _read_varint(data, pos)
+    for _ in range(extras):
+        key, pos = _read_str(data, pos)
+        record[key], pos = _unpack(data, pos)
+    return record
+
+
+# ═══════════════════════════════════════════════════════════
+# CODECS
+# ═══════════════════════════════════════════════════════════
+
+def is_binary(blob: Blob) -> bool:
+    return isinstance(blob, (bytes, bytearray)) and len(blob) >= _HEADER.size and blob[0] == MAGIC
+
+
+def decode(blob: Optional[Blob]) -> Any:
+    """Decode a stored value written by any codec version"""
+    if blob is None:
+        return None
+    if not is_binary(blob):
+        return json.loads(blob)
+    _, version, schema = _HEADER.unpack_from(blob, 0)
+    if version > VERSION:
+        raise ValueError(f"Cache value format v{version} is newer than this reader (v{VERSION})")
+    pos = _HEADER.size
+    if schema == TICKER:
+        return _decode_ticker(blob, pos)
+    if schema == VALUE:
+        return _unpack(blob, pos)[0]
+    if schema in SCHEMAS:
+        return _decode_record(blob, pos, schema)
+    raise ValueError(f"Unknown cache schema {schema}")
+
+
+def decode_value(blob: Blob) -> Any:
+    """Decode a portfolio hash field (legacy fields may be plain strings)"""
+    if is_binary(blob):
+        return decode(blob)
+    if isinstance(blob, (bytes, bytearray)):
+        blob = blob.decode("utf-8")
+    try:
+        return json.loads(blob)
+    except (json.JSONDecodeError, ValueError):
+        return blob
+
+
+class JsonCodec:
+    """Text format (v0): what every node understands"""
+
+    name = "json"
+
+    def encode_ticker(self, data: Dict[str, Any]) -> str:
+        return json.dumps(data)
+
+    def encode_record(self, record: Dict[str, Any], schema: int = RECORD) -> str:
+        return json.dumps(record)
+
+    def encode_value(self, value: Any) -> str:
+        return json.dumps(value) if isinstance(value, (dict, list)) else str(value)
+
+
+class BinaryCodec:
+    """Compact format (v1): struct tickers and schema-tagged records"""
+
+    name = "binary"
+
+    def encode_ticker(self, data: Dict[str, Any]) -> bytes:
+        if _ticker_packable(data):
+            return _encode_ticker(data)
+        return _encode_record(data, RECORD)  # non-standard fields: stay lossless
+
+    def encode_record(self, record: Dict[str, Any], schema: int = RECORD) -> bytes:
+        return _encode_record(record, schema if schema in SCHEMAS else RECORD)
+
+    def encode_value(self, value: Any) -> bytes:
+        out = bytearray(_HEADER.pack(MAGIC, VERSION, VALUE))
+        _pack(out, value)
+        return bytes(out)
+
+
+CODECS = {"json": JsonCodec, "binary": BinaryCodec}
+
+
+def get_codec(name: str = "json"):
+    try:
+        return CODECS[name.lower()]()
+    except KeyError:
+        raise ValueError(f"Unknown cache codec '{name}' (expected one of {sorted(CODECS)})")
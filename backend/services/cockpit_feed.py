@@ -0,0 +1,248 @@
+# ================================================================
+# 📡 COCKPIT FEED - Server-Pushed Cockpit Deltas
+# ================================================================
+# One sampler per process reads each registered cockpit source
+# (T.I.A., authorization, garage, vortex balance) once per tick and
+# publishes only the fields that changed; discrete events (e.g.
+# authorization grants) are pushed the moment they happen. Every
+# subscriber (SSE or WebSocket) reads from its own bounded queue,
+# so N dashboards cost N queue puts, not N status rebuilds.
+# ================================================================
+
+import asyncio
+import inspect
+import itertools
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Iterable, Optional, Set
+
+from backend.core.config import settings
+from backend.core.logging_config import setup_logging
+
+logger = setup_logging("cockpit_feed")
+
+_REMOVED = None  # value sent for a field that disappeared
+
+
+def diff(old: Optional[Dict[str, Any]], new: Dict[str, Any]) -> Dict[str, Any]:
+    """Top-level fields of ``new`` that differ from ``old`` (removed ones as None)"""
+    if old is None:
+        return dict(new)
+    changes = {k: v for k, v in new.items() if old.get(k, _REMOVED) != v or k not in old}
+    for key in old.keys() - new.keys():
+        changes[key] = _REMOVED
+    return changes
+
+
+class Subscription:
+    """One client's view of the feed
+
+    When the client falls ``max_queue`` messages behind, its backlog is
+    dropped and the next message is a full snapshot instead.
+    """
+
+    def __init__(self, feed: "CockpitFeed", topics: Optional[Set[str]], max_queue: int):
+        self.feed = feed
+        self.topics = topics
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.resync = False
+        self.dropped = 0
+
+    def wants(self, topic: str) -> bool:
+        return self.topics is None or topic in self.topics
+
+    def offer(self, message: Dict[str, Any]) -> None:
+        if self.resync:
+            return
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.dropped += self.queue.qsize()
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.resync = True
+            self.queue.put_nowait(None)  # wake the reader
+
+    async def next(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Next message, a resync snapshot, or None on timeout (heartbeat)"""
+        try:
+            message = await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        if message is None or self.resync:
+            self.resync = False
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            return self.feed.snapshot(self.topics)
+        return message
+
+    def close(self) -> None:
+        self.feed._subscribers.discard(self)
+
+
+class CockpitFeed:
+    """Delta fan-out hub for cockpit dashboards
+
+    Args:
+        interval: Seconds between samples of the registered sources
+        max_queue: Messages buffered per subscriber before it is resynced
+        history: Recent messages kept for ``Last-Event-ID`` resume
+    """
+
+    def __init__(self, interval: float = 1.0, max_queue: int = 256, history: int = 512):
+        self.interval = interval
+        self.max_queue = max_queue
+        self._sources: Dict[str, Callable[[], Any]] = {}
+        self._state: Dict[str, Dict[str, Any]] = {}
+        self._subscribers: Set[Subscription] = set()
+        self._history: Deque[Dict[str, Any]] = deque(maxlen=history)
+        self._ids = itertools.count(1)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self.samples = 0
+        self.published = 0
+
+    @property
+    def last_id(self) -> int:
+        return self._history[-1]["id"] if self._history else 0
+
+    def register(self, topic: str, source: Callable[[], Any]) -> None:
+        """Sample ``source()`` (sync or async, returns a dict) every tick"""
+        self._sources[topic] = source
+
+    # ═══════════════════════════════════════════════════════════
+    # PUBLISHING
+    # ═══════════════════════════════════════════════════════════
+
+    def _emit(self, message: Dict[str, Any]) -> None:
+        message["id"] = next(self._ids)
+        self._history.append(message)
+        self.published += 1
+        for sub in list(self._subscribers):
+            if sub.wants(message["topic"]):
+                sub.offer(message)
+
+    def _dispatch(self, message: Dict[str, Any]) -> None:
+        """Run ``_emit`` on the feed's loop (publishers may be on other threads)"""
+        loop = self._loop
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if loop is not None and running is not loop and not loop.is_closed():
+            loop.call_soon_threadsafe(self._emit, message)
+        else:
+            self._emit(message)
+
+    def update(self, topic: str, state: Dict[str, Any]) -> bool:
+        """Record ``topic``'s latest state; publishes the changed fields"""
+        changes = diff(self._state.get(topic), state)
+        if not changes:
+            return False
+        self._state[topic] = dict(state)
+        self._dispatch({"type": "delta", "topic": topic, "changes": changes, "ts": time.time()})
+        return True
+
+    def publish(self, topic: str, event: Dict[str, Any]) -> None:
+        """Push a discrete event (not part of the diffed state)"""
+        self._dispatch({"type": "event", "topic": topic, "event": event, "ts": time.time()})
+
+    async def sample(self) -> int:
+        """Read every source once; returns topics that changed"""
+        changed = 0
+        for topic, source in list(self._sources.items()):
+            try:
+                state = source()
+                if inspect.isawaitable(state):
+                    state = await state
+            except Exception as e:
+                logger.warning(f"⚠️ COCKPIT FEED: Source {topic} failed - {e}")
+                continue
+            if isinstance(state, dict) and self.update(topic, state):
+                changed += 1
+        self.samples += 1
+        return changed
+
+    # ═══════════════════════════════════════════════════════════
+    # SUBSCRIBING
+    # ═══════════════════════════════════════════════════════════
+
+    def snapshot(self, topics: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        topics = set(topics) if topics is not None else None
+        return {
+            "type": "snapshot",
+            "id": self.last_id,
+            "state": {k: v for k, v in self._state.items() if topics is None or k in topics},
+            "ts": time.time(),
+        }
+
+    async def subscribe(self, topics: Optional[Iterable[str]] = None,
+                        last_id: Optional[int] = None) -> Subscription:
+        """Register a client; it first receives a snapshot (or the missed messages)"""
+        self._loop = asyncio.get_running_loop()
+        if not self._subscribers and self._sources:
+            await self.sample()  # idle feed: bring the state up to date first
+        sub = Subscription(self, set(topics) if topics else None, self.max_queue)
+        missed = self.replay(last_id)
+        if missed is None:
+            sub.offer(self.snapshot(sub.topics))
+        else:
+            for message in missed:
+                if sub.wants(message["topic"]):
+                    sub.offer(message)
+        self._subscribers.add(sub)
+        return sub
+
+    def replay(self, last_id: Optional[int]) -> Optional[list]:
+        """Messages after ``last_id``, or None if they are no longer buffered"""
+        if last_id is None or not self._history:
+            return None
+        if last_id < self._history[0]["id"] - 1 or last_id > self.last_id:
+            return None
+        return [m for m in self._history if m["id"] > last_id]
+
+    async def messages(self, sub: Subscription, heartbeat: float = 15.0) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """Yield messages for ``sub`` (None = heartbeat due) until cancelled"""
+        try:
+            while True:
+                yield await sub.next(heartbeat)
+        finally:
+            sub.close()
+
+    # ═══════════════════════════════════════════════════════════
+    # LIFECYCLE
+    # ═══════════════════════════════════════════════════════════
+
+    async def run(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.interval)
+            if self._subscribers:  # nobody watching: no sampling work
+                await self.sample()
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "subscribers": len(self._subscribers),
+            "topics": sorted(self._sources),
+            "samples": self.samples,
+            "published": self.published,
+            "last_id": self.last_id,
+            "dropped": sum(s.dropped for s in self._subscribers),
+        }
+
+
+# Singleton instance
+cockpit_feed = CockpitFeed(interval=settings.COCKPIT_FEED_INTERVAL)
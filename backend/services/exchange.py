@@ -1,10 +1,17 @@
 # ================================================================
 # 🔌 EXCHANGE SERVICE - MEXC MIGRATION
 # ================================================================
+import asyncio
+import inspect
+
 import ccxt.async_support as ccxt
 import pandas as pd
 from backend.core.config import settings
 from backend.core.logging_config import setup_logging
+from backend.services.market_feed import MarketFeed, PriceTable
+from backend.services.order_pipeline import new_client_order_id
+from backend.services.order_tracker import OrderTracker, UserDataStream
+from backend.services.paper_engine import PaperMatchingEngine
 
 logger = setup_logging("exchange")
 
@@ -12,6 +19,15 @@ class ExchangeService:
     def __init__(self):
         self.exchange = None
         self.mode: str = "PAPER"  # resolved inside initialize()
+        self.prices = PriceTable()  # last prices seen via tickers / feed
+        self.price_feed = None
+        self._price_feed_task = None
+        # PAPER fills are simulated against the exchange's live order book
+        self.paper = PaperMatchingEngine(book_source=self._fetch_paper_book, price_source=self.prices.get)
+        # Order lifecycle, fed by the user-data stream (LIVE) or the paper engine
+        self.orders = OrderTracker()
+        self.paper.add_listener(self.orders.apply_update)
+        self.user_stream = None
 
     async def initialize(self):
         """Initialize MEXC exchange connection"""
@@ -61,7 +77,46 @@ class ExchangeService:
         logger.info(f"Exchange initialized in {self.mode} mode")
         logger.info(f"✅ MEXC Markets loaded: {len(self.exchange.markets)} pairs available")
 
+    async def start_user_stream(self):
+        """Stream private order updates into ``self.orders`` (LIVE mode only)"""
+        if self.mode != "LIVE" or self.user_stream is not None:
+            return
+        import ccxt.pro as ccxtpro
+        ws_exchange = ccxtpro.mexc({
+            'apiKey': settings.MEXC_API_KEY,
+            'secret': settings.MEXC_SECRET,
+            'options': {'defaultType': 'spot'}
+        })
+        self.user_stream = UserDataStream(self.orders, ws_exchange, self.exchange)
+        self.user_stream.start()
+        logger.info("📋 User-data stream started (order lifecycle tracking)")
+
+    def start_price_feed(self, interval: float = None):
+        """Poll fetch_tickers into ``self.prices`` so pre-trade checks skip REST"""
+        if not self.exchange or self._price_feed_task is not None:
+            return
+        self.price_feed = MarketFeed(self.exchange, interval=interval or settings.PRICE_FEED_INTERVAL)
+        self.price_feed.add_listener(self.prices.update_tickers)
+        self._price_feed_task = asyncio.create_task(self.price_feed.run())
+        logger.info("📡 Price feed started (pre-trade price table)")
+
+    async def stop_price_feed(self):
+        if self._price_feed_task is None:
+            return
+        self.price_feed.stop()
+        self._price_feed_task.cancel()
+        try:
+            await self._price_feed_task
+        except asyncio.CancelledError:
+            pass
+        self._price_feed_task = None
+
     async def shutdown(self):
+        await self.stop_price_feed()
+        await self.paper.stop()
+        if self.user_stream is not None:
+            await self.user_stream.stop()
+            self.user_stream = None
         if self.exchange:
             await self.exchange.close()
 
@@ -77,61 +132,84 @@ class ExchangeService:
     async def fetch_ticker(self, symbol: str):
         if not self.exchange:
             raise Exception("Exchange not initialized")
-        return await self.exchange.fetch_ticker(symbol)
+        ticker = await self.exchange.fetch_ticker(symbol)
+        if isinstance(ticker, dict):
+            self.prices.update(symbol, ticker.get("last"))
+        return ticker
+
+    async def _fetch_paper_book(self, symbol: str):
+        book = self.exchange.fetch_order_book(symbol, 20)
+        return await book if inspect.isawaitable(book) else book
 
     async def fetch_balance(self):
         if not self.exchange:
             raise Exception("Exchange not initialized")
         return await self.exchange.fetch_balance()
 
-    async def create_order(self, symbol: str, type: str, side: str, amount: float, price: float = None):
+    async def fetch_trading_balance(self):
+        """Balance that orders settle against (the paper ledger in PAPER mode)"""
+        if self.mode == "PAPER":
+            return self.paper.ledger.to_balance()
+        return await self.fetch_balance()
+
+    async def create_order(self, symbol: str, type: str, side: str, amount: float, price: float = None,
+                           client_order_id: str = None):
         if not self.exchange:
             raise Exception("Exchange not initialized")
+        client_order_id = client_order_id or new_client_order_id()
         
         if self.mode == "PAPER":
-            return {
-                "id": f"paper_{symbol}_{side}",
-                "symbol": symbol,
-                "type": type,
-                "side": side,
-                "amount": amount,
-                "price": price,
-                "status": "closed",
-                "info": "Paper Trade - No real execution"
-            }
+            # Market buys are sized in USDT (quoteOrderQty), as in LIVE mode
+            quote_buy = type == 'market' and side == 'buy'
+            order = await self.paper.create_order(
+                symbol, type, side,
+                amount=None if quote_buy else amount,
+                price=price,
+                quote_amount=amount if quote_buy else None,
+                client_order_id=client_order_id,
+            )
+        else:
+            params = {'clientOrderId': client_order_id}
+            if type == 'market' and side == 'buy':
+                order = await self.exchange.create_order(
+                    symbol=symbol,
+                    type='market',
+                    side='buy',
+                    amount=None,
+                    params={'quoteOrderQty': amount, **params}
+                )
+            else:
+                order = await self.exchange.create_order(symbol, type, side, amount, price, params)
+        self.orders.track(order)
+        return order
+
+    async def create_market_buy(self, symbol: str, usdt_amount: float, client_order_id: str = None):
+        """Create a market buy order using USDT amount"""
+        if not self.exchange:
+            raise Exception("Exchange not initialized")
+        client_order_id = client_order_id or new_client_order_id()
         
-        if type == 'market' and side == 'buy':
-            return await self.exchange.create_order(
+        if self.mode == "PAPER":
+            order = await self.paper.create_order(
+                symbol, "market", "buy", quote_amount=usdt_amount, client_order_id=client_order_id
+            )
+        else:
+            order = await self.exchange.create_order(
                 symbol=symbol,
                 type='market',
                 side='buy',
                 amount=None,
-                params={'quoteOrderQty': amount}
+                params={'quoteOrderQty': usdt_amount, 'clientOrderId': client_order_id}
             )
-        else:
-            return await self.exchange.create_order(symbol, type, side, amount, price)
+        self.orders.track(order)
+        return order
 
-    async def create_market_buy(self, symbol: str, usdt_amount: float):
-        """Create a market buy order using USDT amount"""
+    async def cancel_order(self, order_id: str, symbol: str):
         if not self.exchange:
             raise Exception("Exchange not initialized")
-        
         if self.mode == "PAPER":
-            return {
-                "id": f"paper_{symbol}_buy",
-                "symbol": symbol,
-                "type": "market",
-                "side": "buy",
-                "amount": usdt_amount,
-                "price": None,
-                "status": "closed",
-                "info": "Paper Trade - No real execution"
-            }
-        
-        return await self.exchange.create_order(
-            symbol=symbol,
-            type='market',
-            side='buy',
-            amount=None,
-            params={'quoteOrderQty': usdt_amount}
-        )
+            order = self.paper.cancel_order(order_id)
+        else:
+            order = await self.exchange.cancel_order(order_id, symbol)
+        self.orders.track(order)
+        return order
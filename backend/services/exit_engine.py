@@ -0,0 +1,223 @@
+# ================================================================
+# 🎯 EXIT ENGINE - Vectorized Take-Profit / Trailing / Stop Checks
+# ================================================================
+# Evaluates every open position in one array pass per tick:
+# Harvester trailing (trail_start / trail_distance / pullback_exit)
+# and per-wing target / stop-loss. Peak prices are persisted to
+# Redis write-behind in batches, off the tick path.
+# ================================================================
+
+import asyncio
+from typing import Any, Dict, List, NamedTuple, Optional, Set
+
+import numpy as np
+
+from backend.core.logging_config import setup_logging
+from backend.services.position_table import PositionTable
+
+logger = setup_logging("exit_engine")
+
+# Reason codes produced by ExitEngine.evaluate_arrays
+HOLD = 0
+TRAIL_EXIT = 1
+PULLBACK_EXIT = 2
+TARGET_HIT = 3
+STOP_LOSS = 4
+
+
+class ExitSignal(NamedTuple):
+    symbol: str
+    reason: str
+    pnl: float
+
+
+class ExitEngine:
+    """Per-tick exit evaluation across all open positions
+
+    Wing params are compiled into lookup arrays indexed by the
+    position table's wing codes, so the per-tick work is a handful
+    of NumPy comparisons regardless of how many slots are open.
+    """
+
+    TRAILING_WINGS = ("harvester",)
+
+    def __init__(self, wings: Dict[str, Dict[str, Any]], default_stop_loss: float = 0.015):
+        self.default_stop_loss = default_stop_loss
+        self.params: Dict[str, Dict[str, Any]] = {
+            name: dict(spec.get("params") or {}) for name, spec in wings.items()
+        }
+        self._compiled_for: List[str] = []
+        self._lookup: Dict[str, np.ndarray] = {}
+
+    def _compile(self, wing_names: List[str]) -> Dict[str, np.ndarray]:
+        """Build per-wing-code param arrays (cached until new wings appear)"""
+        if wing_names == self._compiled_for:
+            return self._lookup
+        trailing, target, stop, trail_start, trail_distance = [], [], [], [], []
+        for name in wing_names:
+            params = self.params.get(name, {})
+            is_trailing = name in self.TRAILING_WINGS
+            trailing.append(is_trailing)
+            if is_trailing:
+                target.append(np.nan)
+                stop.append(params.get("pullback_exit", self.default_stop_loss))
+            else:
+                target.append(params.get("target", params.get("range_pct", np.nan)))
+                stop.append(params.get("stop_loss", self.default_stop_loss))
+            trail_start.append(params.get("trail_start", np.nan))
+            trail_distance.append(params.get("trail_distance", np.nan))
+        self._lookup = {
+            "trailing": np.array(trailing, dtype=bool),
+            "target": np.array(target, dtype=np.float64),
+            "stop": np.array(stop, dtype=np.float64),
+            "trail_start": np.array(trail_start, dtype=np.float64),
+            "trail_distance": np.array(trail_distance, dtype=np.float64),
+        }
+        self._compiled_for = list(wing_names)
+        return self._lookup
+
+    def evaluate_arrays(self, wing_codes: np.ndarray, wing_names: List[str],
+                        pnl: np.ndarray, peak_profit: np.ndarray) -> np.ndarray:
+        """Return a reason code per row (HOLD where no exit fires)"""
+        lookup = self._compile(wing_names)
+        trailing = lookup["trailing"][wing_codes]
+        target = lookup["target"][wing_codes]
+        stop = lookup["stop"][wing_codes]
+
+        with np.errstate(invalid="ignore"):
+            armed = trailing & (peak_profit >= lookup["trail_start"][wing_codes])
+            # Trailing stop sits trail_distance below the peak price
+            trail_floor = (1.0 + peak_profit) * (1.0 - lookup["trail_distance"][wing_codes])
+            trail_hit = armed & ((1.0 + pnl) <= trail_floor)
+            pullback_hit = trailing & ~armed & (pnl <= -stop)
+            target_hit = ~trailing & (pnl >= target)
+            stop_hit = ~trailing & (pnl <= -stop)
+
+        return np.select(
+            [trail_hit, pullback_hit, target_hit, stop_hit],
+            [TRAIL_EXIT, PULLBACK_EXIT, TARGET_HIT, STOP_LOSS],
+            default=HOLD,
+        )
+
+    def describe(self, wing: str, code: int, pnl: float, peak_profit: float) -> str:
+        if code == TRAIL_EXIT:
+            return f"Harvester trail exit (peak {peak_profit:+.2%}, now {pnl:+.2%})"
+        if code == PULLBACK_EXIT:
+            return f"Harvester pullback exit ({pnl:+.2%})"
+        if code == TARGET_HIT:
+            return f"{wing.capitalize()} target hit ({pnl:+.2%})"
+        return f"{wing.capitalize()} stop loss ({pnl:+.2%})"
+
+    def evaluate(self, table: PositionTable, pnl: np.ndarray,
+                 eligible: Optional[np.ndarray] = None) -> List[ExitSignal]:
+        """Exit signals for all eligible rows of ``table``
+
+        Args:
+            table: Open positions (already marked to market)
+            pnl: Fractional PnL per row, as returned by mark_to_market
+            eligible: Optional row mask (e.g. post-buy cooldown elapsed)
+        """
+        if len(table) == 0:
+            return []
+        peak_profit = table.column("peak_profit")
+        codes = self.evaluate_arrays(table.wing_codes(), table.wing_names, pnl, peak_profit)
+        fire = codes != HOLD
+        if eligible is not None:
+            fire &= eligible
+        names = table.wing_names
+        wing_codes = table.wing_codes()
+        return [
+            ExitSignal(
+                table.symbols[row],
+                self.describe(names[wing_codes[row]], int(codes[row]), float(pnl[row]), float(peak_profit[row])),
+                float(pnl[row]),
+            )
+            for row in np.flatnonzero(fire)
+        ]
+
+    def check_one(self, wing: str, pnl: float, peak_profit: float) -> Optional[str]:
+        """Scalar helper using the same rules as the array pass"""
+        code = int(self.evaluate_arrays(
+            np.zeros(1, dtype=np.int16), [wing], np.array([pnl]), np.array([peak_profit])
+        )[0])
+        return None if code == HOLD else self.describe(wing, code, pnl, peak_profit)
+
+
+class PeakWriteBehind:
+    """Batches peak-price persistence to Redis off the tick path
+
+    The tick loop only drains dirty flags from the position table into
+    an in-memory dict; a background task flushes that dict (plus
+    cleared symbols) as one pipelined Redis round trip per interval.
+    """
+
+    def __init__(self, cache=None, interval: float = 5.0):
+        self._cache = cache
+        self.interval = interval
+        self._pending: Dict[str, float] = {}
+        self._cleared: Set[str] = set()
+        self._task: Optional[asyncio.Task] = None
+        self.flushes = 0
+
+    @property
+    def cache(self):
+        if self._cache is None:
+            from backend.services.redis_cache import redis_cache
+            self._cache = redis_cache
+        return self._cache
+
+    def collect(self, table: PositionTable) -> None:
+        """Queue every peak raised since the last collect (cheap, in-memory)"""
+        for symbol, peak in table.drain_dirty_peaks().items():
+            self._pending[symbol] = peak
+            self._cleared.discard(symbol)
+
+    def discard(self, symbol: str) -> None:
+        """Forget a closed position's peak (deleted on the next flush)"""
+        self._pending.pop(symbol, None)
+        self._cleared.add(symbol)
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending) + len(self._cleared)
+
+    async def flush(self) -> None:
+        if not self._pending and not self._cleared:
+            return
+        peaks, self._pending = self._pending, {}
+        cleared, self._cleared = list(self._cleared), set()
+        try:
+            saved = await asyncio.to_thread(self.cache.set_peak_prices, peaks, cleared)
+        except Exception as e:
+            logger.warning(f"⚠️ EXIT ENGINE: Peak flush failed - {e}")
+            saved = False
+        if saved:
+            self.flushes += 1
+        elif getattr(self.cache, "client", None) is not None:
+            # Redis is configured but the write failed: retry next flush
+            # without clobbering anything queued in the meantime.
+            for symbol, peak in peaks.items():
+                self._pending.setdefault(symbol, peak)
+            self._cleared.update(s for s in cleared if s not in self._pending)
+
+    async def run(self) -> None:
+        try:
+            while True:
+                await asyncio.sleep(self.interval)
+                await self.flush()
+        except asyncio.CancelledError:
+            await self.flush()
+            raise
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -0,0 +1,170 @@
+# ================================================================
+# 🛑 FLATTEN ALL - Concurrent Emergency Exit
+# ================================================================
+# Cancels every open order and market-sells every position the
+# bot's own fills opened (or, on explicit request, every holding in
+# the account), one task per symbol, all in flight together. Requests share the
+# exchange instance's ccxt throttle (enableRateLimit) and a
+# bounded in-flight window. MEXC sync errors are handled in-line:
+# 30005 re-reads the free balance and retries once, 10007 marks
+# the symbol as unsupported.
+# ================================================================
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional
+
+from backend.core.config import settings
+from backend.core.logging_config import setup_logging
+
+logger = setup_logging("flatten")
+
+OVERSOLD = "30005"
+UNSUPPORTED = "10007"
+
+
+def _has_error_code(error: Exception, code: str) -> bool:
+    return code in str(error)
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+class Flattener:
+    """Flatten-all for the EMERGENCY STOP
+
+    Args:
+        exchange_service: ``ExchangeService`` (orders, markets, balance)
+        quote: Quote currency holdings are sold into
+        max_in_flight: Maximum concurrent exchange requests
+    """
+
+    def __init__(self, exchange_service, quote: str = "USDT", max_in_flight: Optional[int] = None):
+        self.exchange_service = exchange_service
+        self.quote = quote
+        self.max_in_flight = max(1, max_in_flight or settings.MAX_ORDERS_IN_FLIGHT)
+        self.last_report: Optional[Dict[str, Any]] = None
+
+    def _markets(self) -> Dict[str, Any]:
+        markets = getattr(getattr(self.exchange_service, "exchange", None), "markets", None)
+        return markets if isinstance(markets, dict) else {}
+
+    def holdings(self, balance: Dict[str, Any], whole_account: bool = False) -> Dict[str, float]:
+        """``symbol -> amount to sell`` for every tradable non-quote asset
+
+        By default only positions opened by the bot's own fills (as
+        netted by the order tracker) are sold, capped at the free
+        balance; ``whole_account`` sells every free holding.
+        """
+        markets = self._markets()
+        tracker = self.exchange_service.orders
+        holdings = {}
+        for currency, amount in (balance.get("free") or {}).items():
+            if currency == self.quote or not amount or amount <= 0:
+                continue
+            symbol = f"{currency}/{self.quote}"
+            if markets and symbol not in markets:
+                continue
+            if not whole_account:
+                amount = min(amount, tracker.position(symbol))
+                if amount <= 0:
+                    continue
+            min_amount = (((markets.get(symbol) or {}).get("limits") or {}).get("amount") or {}).get("min")
+            if min_amount and amount < min_amount:
+                continue  # dust: below the exchange minimum
+            holdings[symbol] = float(amount)
+        return holdings
+
+    async def _free(self, symbol: str) -> float:
+        balance = await self.exchange_service.fetch_trading_balance()
+        return float((balance.get("free") or {}).get(symbol.split("/")[0]) or 0.0)
+
+    # ═══════════════════════════════════════════════════════════
+    # PER-SYMBOL TASKS
+    # ═══════════════════════════════════════════════════════════
+
+    async def _cancel(self, order, window: asyncio.Semaphore) -> bool:
+        async with window:
+            try:
+                result = await self.exchange_service.cancel_order(order.order_id, order.symbol)
+            except Exception as e:
+                logger.warning(f"⚠️ FLATTEN: Cancel {order.order_id} ({order.symbol}) failed - {e}")
+                return False
+            if result is None:
+                # PAPER answers None for ids it does not know
+                logger.warning(f"⚠️ FLATTEN: Cancel {order.order_id} ({order.symbol}) not acknowledged")
+                return False
+            return True
+
+    async def _exit(self, symbol: str, amount: float, window: asyncio.Semaphore,
+                    started: float) -> Dict[str, Any]:
+        result: Dict[str, Any] = {"symbol": symbol, "amount": amount}
+        async with window:
+            try:
+                result["order"] = await self.exchange_service.create_order(symbol, "market", "sell", amount)
+                result["status"] = "closed"
+            except Exception as e:
+                if _has_error_code(e, OVERSOLD):
+                    # Sync-Guard: sell what the exchange says we actually hold
+                    try:
+                        free = await self._free(symbol)
+                        if free > 0:
+                            result["amount"] = free
+                            result["order"] = await self.exchange_service.create_order(symbol, "market", "sell", free)
+                            result["status"] = "closed"
+                        else:
+                            result["status"] = "empty"
+                    except Exception as retry_error:
+                        result["status"] = "failed"
+                        result["detail"] = str(retry_error)
+                elif _has_error_code(e, UNSUPPORTED):
+                    result["status"] = "unsupported"
+                    result["detail"] = str(e)
+                else:
+                    result["status"] = "failed"
+                    result["detail"] = str(e)
+        result["latency_ms"] = _ms(time.perf_counter() - started)
+        return result
+
+    # ═══════════════════════════════════════════════════════════
+    # FLATTEN
+    # ═══════════════════════════════════════════════════════════
+
+    async def flatten_all(self, reason: str = "EMERGENCY STOP", whole_account: bool = False) -> Dict[str, Any]:
+        """Cancel all open orders, then exit every bot position concurrently
+
+        ``whole_account`` also sells holdings the bot did not buy.
+        """
+        started = time.perf_counter()
+        window = asyncio.Semaphore(self.max_in_flight)
+        scope = "every holding" if whole_account else "all bot positions"
+        logger.warning(f"🛑 FLATTEN: {reason} - cancelling orders and exiting {scope}")
+
+        open_orders = [o for o in self.exchange_service.orders.open_orders() if o.order_id]
+        cancels: List[bool] = list(await asyncio.gather(*(self._cancel(o, window) for o in open_orders)))
+        cancel_ms = _ms(time.perf_counter() - started)
+
+        balance = await self.exchange_service.fetch_trading_balance()
+        exits = await asyncio.gather(*(
+            self._exit(symbol, amount, window, started)
+            for symbol, amount in self.holdings(balance, whole_account).items()
+        ))
+
+        report = {
+            "reason": reason,
+            "whole_account": whole_account,
+            "canceled": sum(cancels),
+            "cancel_failed": len(cancels) - sum(cancels),
+            "positions": list(exits),
+            "closed": sum(1 for r in exits if r["status"] == "closed"),
+            "failed": sum(1 for r in exits if r["status"] == "failed"),
+            "cancel_latency_ms": cancel_ms,
+            "latency_ms": _ms(time.perf_counter() - started),
+        }
+        self.last_report = report
+        logger.warning(
+            f"🛑 FLATTEN: {report['closed']}/{len(exits)} positions closed, "
+            f"{report['canceled']} orders cancelled in {report['latency_ms']}ms"
+        )
+        return report
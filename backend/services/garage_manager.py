@@ -7,11 +7,13 @@
 
 import sys
 import importlib.util
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Any, Optional
 from enum import Enum
 
 from backend.services.tia_agent import tia_agent, RiskLevel
+from backend.services.shared_state import shared_state
 from backend.core.logging_config import setup_logging
 
 logger = setup_logging("garage_manager")
@@ -128,6 +130,7 @@ class GarageManager:
         if engine:
             self.current_bay = selected_bay
             self.current_engine = engine
+            self._share_bay()
             logger.info(f"🏎️ GARAGE: {selected_bay.value} Ferrari ACTIVE")
         else:
             logger.warning(f"⚠️ GARAGE: Failed to activate {selected_bay.value} Ferrari")
@@ -212,8 +215,29 @@ class GarageManager:
         self.engines_cache.clear()
         self.current_engine = None
         self.current_bay = None
+        self._share_bay()
         logger.info("✅ GARAGE: Cache cleared. Engines will reload on next selection.")
     
+    def _share_bay(self):
+        """Publish the active bay so every worker drives the same Ferrari"""
+        shared_state.write("garage:state", {
+            "current_bay": self.current_bay.value if self.current_bay else "",
+            "updated_at": datetime.now(timezone.utc).isoformat()
+        })
+    
+    def apply_shared_state(self, state: Dict[str, str]):
+        """Switch to the bay another worker selected (loads it if needed)"""
+        value = state.get("current_bay") or None
+        bay = GarageBay(value) if value else None
+        if bay == self.current_bay:
+            return
+        engine = self._load_engine(bay) if bay else None
+        if bay and engine is None:
+            return  # keep the current Ferrari rather than run none
+        self.current_bay = bay
+        self.current_engine = engine
+        logger.info(f"🔗 GARAGE: Following shared bay {value}")
+    
     def get_bay_for_risk(self, risk_level: RiskLevel) -> GarageBay:
         """
         Get the recommended bay for a given risk level
@@ -229,3 +253,4 @@ class GarageManager:
 
 # Singleton instance
 garage_manager = GarageManager()
+shared_state.register("garage:state", garage_manager.apply_shared_state)
@@ -0,0 +1,156 @@
+# ================================================================
+# 📡 MARKET FEED - Shared Ticker Stream
+# ================================================================
+# One fetch_tickers call per tick fans out to every subscriber.
+# Slots never poll the exchange themselves, so adding slots does
+# not add exchange round trips.
+# ================================================================
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from backend.core.logging_config import setup_logging
+
+logger = setup_logging("market_feed")
+
+Tickers = Dict[str, Dict[str, Any]]
+
+
+class PriceTable:
+    """Last traded price per symbol with the time it was observed
+
+    Fed from MarketFeed ticks (``feed.add_listener(table.update_tickers)``)
+    and from any REST ticker we fetch anyway, so pre-trade checks can
+    read a price from memory instead of making a round trip.
+    """
+
+    def __init__(self):
+        self._prices: Dict[str, Tuple[float, float]] = {}
+
+    def update(self, symbol: str, price: Optional[float], observed_at: Optional[float] = None) -> None:
+        if price:
+            self._prices[symbol] = (float(price), observed_at if observed_at is not None else time.time())
+
+    def update_tickers(self, tickers: Tickers) -> None:
+        now = time.time()
+        prices = self._prices
+        for symbol, ticker in tickers.items():
+            last = ticker.get("last") if ticker else None
+            if last:
+                prices[symbol] = (float(last), now)
+
+    def get(self, symbol: str, max_age: Optional[float] = None) -> Optional[float]:
+        """Last price, or None if unknown or older than ``max_age`` seconds"""
+        entry = self._prices.get(symbol)
+        if entry is None:
+            return None
+        if max_age is not None and time.time() - entry[1] > max_age:
+            return None
+        return entry[0]
+
+    def age(self, symbol: str) -> Optional[float]:
+        entry = self._prices.get(symbol)
+        return time.time() - entry[1] if entry is not None else None
+
+    def __len__(self) -> int:
+        return len(self._prices)
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._prices
+
+
+class MarketFeed:
+    """Single producer, many consumers ticker stream.
+
+    Each subscriber gets a conflating queue of size one: a slow
+    consumer skips straight to the newest tick instead of working
+    through a backlog of stale prices.
+    """
+
+    def __init__(self, exchange=None, interval: float = 2.0, symbols: Optional[List[str]] = None):
+        self.exchange = exchange
+        self.interval = interval
+        self.symbols = symbols
+        self.sequence = 0
+        self.last_tickers: Tickers = {}
+        self.last_tick_at: Optional[float] = None
+        self.is_running = False
+        self._subscribers: List[asyncio.Queue] = []
+        self._listeners: List[Callable[[Tickers], None]] = []
+
+    def subscribe(self) -> asyncio.Queue:
+        """Register a consumer and return its tick queue"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        self._subscribers.append(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Remove a consumer queue"""
+        if queue in self._subscribers:
+            self._subscribers.remove(queue)
+
+    def add_listener(self, callback: Callable[[Tickers], None]) -> None:
+        """Register a synchronous callback invoked on every tick
+
+        Listeners run inline in publish(), so they must be cheap
+        (e.g. updating an in-memory price table).
+        """
+        self._listeners.append(callback)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, tickers: Tickers) -> None:
+        """Fan a ticker snapshot out to all listeners and subscribers
+
+        Also used directly by replay/backtest drivers and websocket
+        adaptors that produce ticks without going through poll_once().
+        """
+        self.sequence += 1
+        self.last_tickers = tickers
+        self.last_tick_at = time.time()
+
+        for callback in self._listeners:
+            try:
+                callback(tickers)
+            except Exception as e:
+                logger.warning(f"⚠️ FEED: Listener failed - {e}")
+
+        for queue in self._subscribers:
+            if queue.full():
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+            queue.put_nowait(tickers)
+
+    async def poll_once(self) -> Tickers:
+        """Fetch one ticker snapshot from the exchange and publish it"""
+        if self.exchange is None:
+            raise Exception("Market feed has no exchange")
+        if self.symbols:
+            tickers = await self.exchange.fetch_tickers(self.symbols)
+        else:
+            tickers = await self.exchange.fetch_tickers()
+        self.publish(tickers or {})
+        return tickers
+
+    async def run(self) -> None:
+        """Poll the exchange every ``interval`` seconds until stopped"""
+        self.is_running = True
+        logger.info(f"📡 FEED: Streaming tickers every {self.interval}s")
+        while self.is_running:
+            started = time.monotonic()
+            try:
+                await self.poll_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"⚠️ FEED: Pulse drop - {e}")
+            elapsed = time.monotonic() - started
+            await asyncio.sleep(max(0.0, self.interval - elapsed))
+
+    def stop(self) -> None:
+        self.is_running = False
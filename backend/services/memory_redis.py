@@ -0,0 +1,704 @@
+# ================================================================
+# 🧠 MEMORY REDIS - Embedded Redis-Compatible Backend
+# ================================================================
+# Implements the subset of redis-py the cache layer uses (strings,
+# hashes, lists, streams + consumer groups, TTLs, pipelines) in
+# process memory. RedisCache and AsyncRedisCache fall back to it
+# when Redis is disabled or cannot be reached at startup, so
+# single-node deployments keep ticker caching, peak tracking and
+# trade history with zero network hops. Expired keys are dropped
+# lazily on access and by a background sweeper; the keyspace can
+# optionally be snapshotted to disk and reloaded on restart.
+# ================================================================
+
+import asyncio
+import base64
+import bisect
+import builtins
+import heapq
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.core.config import settings
+from backend.core.logging_config import setup_logging
+
+logger = setup_logging("memory_redis")
+
+SNAPSHOT_VERSION = 1
+_SEQ_MAX = 2 ** 64 - 1
+
+StreamId = Tuple[int, int]
+
+
+class ResponseError(Exception):
+    """Command error (same role as ``redis.ResponseError``)"""
+
+
+def _value(value: Any) -> Any:
+    """Store what Redis would: bytes/str as-is, numbers as text"""
+    if isinstance(value, (bytes, str)):
+        return value
+    if isinstance(value, bool) or value is None:
+        raise ResponseError(f"Invalid input of type {type(value).__name__}")
+    if isinstance(value, float):
+        return repr(value)
+    return str(value)
+
+
+def _key(key: Any) -> str:
+    return key.decode("utf-8") if isinstance(key, bytes) else str(key)
+
+
+def _format_id(stream_id: StreamId) -> str:
+    return f"{stream_id[0]}-{stream_id[1]}"
+
+
+def _parse_id(raw: Any, end: bool = False) -> Tuple[StreamId, bool]:
+    """Range bound -> ``(id, exclusive)``; a bare ms means the whole millisecond"""
+    raw = _key(raw)
+    exclusive = raw.startswith("(")
+    if exclusive:
+        raw = raw[1:]
+    if raw == "-":
+        return (0, 0), exclusive
+    if raw == "+":
+        return (_SEQ_MAX, _SEQ_MAX), exclusive
+    ms, sep, seq = raw.partition("-")
+    try:
+        return (int(ms), int(seq) if sep else (_SEQ_MAX if end else 0)), exclusive
+    except ValueError:
+        raise ResponseError(f"Invalid stream ID specified as stream command argument: {raw}")
+
+
+class _Stream:
+    """Append-only entry log with consumer groups"""
+
+    __slots__ = ("ids", "fields", "last_id", "groups")
+
+    def __init__(self):
+        self.ids: List[StreamId] = []
+        self.fields: List[Dict[Any, Any]] = []
+        self.last_id: StreamId = (0, 0)
+        self.groups: Dict[str, Dict[str, Any]] = {}
+
+    def trim_front(self, count: int) -> int:
+        if count <= 0:
+            return 0
+        del self.ids[:count]
+        del self.fields[:count]
+        return count
+
+
+class MemoryRedis:
+    """Thread-safe in-process keyspace with a redis-py compatible API
+
+    Args:
+        snapshot_path: File the keyspace is saved to / restored from ('' = off)
+        sweep_interval: Seconds between background expiry sweeps
+        snapshot_interval: Seconds between background snapshots
+    """
+
+    def __init__(self, snapshot_path: str = "", sweep_interval: float = 1.0,
+                 snapshot_interval: float = 60.0):
+        self.snapshot_path = snapshot_path
+        self.sweep_interval = sweep_interval
+        self.snapshot_interval = snapshot_interval
+        self._data: Dict[str, Any] = {}
+        self._expires: Dict[str, float] = {}
+        self._deadlines: List[Tuple[float, str]] = []
+        self._lock = threading.RLock()
+        self._appended = threading.Condition(self._lock)
+        self._task: Optional[asyncio.Task] = None
+        self._dirty = False
+        self.expired = 0
+        self.snapshots = 0
+        if snapshot_path:
+            self.load()
+
+    # ═══════════════════════════════════════════════════════════
+    # KEYSPACE
+    # ═══════════════════════════════════════════════════════════
+
+    def _alive(self, key: str) -> bool:
+        deadline = self._expires.get(key)
+        if deadline is not None and deadline <= time.time():
+            self._drop(key)
+            self.expired += 1
+            return False
+        return key in self._data
+
+    def _drop(self, key: str) -> None:
+        self._data.pop(key, None)
+        self._expires.pop(key, None)
+
+    def _get(self, key: Any, kind: type) -> Any:
+        key = _key(key)
+        if not self._alive(key):
+            return None
+        value = self._data[key]
+        if not isinstance(value, kind):
+            raise ResponseError("WRONGTYPE Operation against a key holding the wrong kind of value")
+        return value
+
+    def _get_or_create(self, key: Any, kind: type) -> Any:
+        value = self._get(key, kind)
+        if value is None:
+            value = self._data[_key(key)] = kind()
+        self._dirty = True
+        return value
+
+    def _set_expiry(self, key: str, seconds: float) -> None:
+        deadline = time.time() + seconds
+        self._expires[key] = deadline
+        heapq.heappush(self._deadlines, (deadline, key))
+
+    def sweep(self) -> int:
+        """Drop every key whose TTL has passed; returns keys removed"""
+        removed = 0
+        now = time.time()
+        with self._lock:
+            while self._deadlines and self._deadlines[0][0] <= now:
+                deadline, key = heapq.heappop(self._deadlines)
+                if self._expires.get(key) == deadline:  # else: TTL changed since
+                    self._drop(key)
+                    removed += 1
+            if removed:
+                self.expired += removed
+                self._dirty = True
+        return removed
+
+    def ping(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        pass
+
+    def publish(self, channel: Any, message: Any) -> int:
+        return 0  # single process: no other subscribers
+
+    def pipeline(self, transaction: bool = True) -> "MemoryPipeline":
+        return MemoryPipeline(self)
+
+    def dbsize(self) -> int:
+        with self._lock:
+            return sum(1 for key in list(self._data) if self._alive(key))
+
+    def flushall(self) -> bool:
+        with self._lock:
+            self._data.clear()
+            self._expires.clear()
+            self._deadlines.clear()
+            self._dirty = True
+        return True
+
+    # ═══════════════════════════════════════════════════════════
+    # GENERIC / STRINGS
+    # ═══════════════════════════════════════════════════════════
+
+    def exists(self, *keys: Any) -> int:
+        with self._lock:
+            return sum(1 for key in keys if self._alive(_key(key)))
+
+    def delete(self, *keys: Any) -> int:
+        with self._lock:
+            removed = 0
+            for key in map(_key, keys):
+                if self._alive(key):
+                    self._drop(key)
+                    removed += 1
+            self._dirty = self._dirty or bool(removed)
+            return removed
+
+    def expire(self, key: Any, seconds: float) -> bool:
+        with self._lock:
+            key = _key(key)
+            if not self._alive(key):
+                return False
+            self._set_expiry(key, float(seconds))
+            self._dirty = True
+            return True
+
+    def ttl(self, key: Any) -> int:
+        with self._lock:
+            key = _key(key)
+            if not self._alive(key):
+                return -2
+            deadline = self._expires.get(key)
+            return -1 if deadline is None else max(0, round(deadline - time.time()))
+
+    def get(self, key: Any) -> Any:
+        with self._lock:
+            return self._get(key, (str, bytes))
+
+    def set(self, key: Any, value: Any, ex: Optional[float] = None) -> bool:
+        with self._lock:
+            key = _key(key)
+            self._drop(key)
+            self._data[key] = _value(value)
+            if ex:
+                self._set_expiry(key, float(ex))
+            self._dirty = True
+            return True
+
+    def setex(self, key: Any, time_seconds: float, value: Any) -> bool:
+        return self.set(key, value, ex=time_seconds)
+
+    # ═══════════════════════════════════════════════════════════
+    # HASHES
+    # ═══════════════════════════════════════════════════════════
+
+    def hset(self, name: Any, key: Any = None, value: Any = None,
+             mapping: Optional[Dict[Any, Any]] = None) -> int:
+        items = dict(mapping or {})
+        if key is not None:
+            items[key] = value
+        if not items:
+            raise ResponseError("wrong number of arguments for 'hset' command")
+        with self._lock:
+            fields = self._get_or_create(name, dict)
+            added = 0
+            for field, item in items.items():
+                field = _key(field)
+                added += field not in fields
+                fields[field] = _value(item)
+            return added
+
+    def hget(self, name: Any, key: Any) -> Any:
+        with self._lock:
+            fields = self._get(name, dict)
+            return fields.get(_key(key)) if fields else None
+
+    def hgetall(self, name: Any) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._get(name, dict) or {})
+
+    def hdel(self, name: Any, *keys: Any) -> int:
+        with self._lock:
+            fields = self._get(name, dict)
+            if not fields:
+                return 0
+            removed = sum(1 for key in keys if fields.pop(_key(key), None) is not None)
+            if not fields:
+                self._drop(_key(name))
+            self._dirty = self._dirty or bool(removed)
+            return removed
+
+    # ═══════════════════════════════════════════════════════════
+    # LISTS
+    # ═══════════════════════════════════════════════════════════
+
+    def lpush(self, name: Any, *values: Any) -> int:
+        with self._lock:
+            items = self._get_or_create(name, list)
+            items[:0] = [_value(v) for v in reversed(values)]
+            return len(items)
+
+    @staticmethod
+    def _slice(length: int, start: int, end: int) -> slice:
+        start = max(length + start, 0) if start < 0 else start
+        end = length + end if end < 0 else end
+        return slice(start, end + 1)
+
+    def lrange(self, name: Any, start: int, end: int) -> List[Any]:
+        with self._lock:
+            items = self._get(name, list) or []
+            return items[self._slice(len(items), start, end)]
+
+    def ltrim(self, name: Any, start: int, end: int) -> bool:
+        with self._lock:
+            items = self._get(name, list)
+            if items is not None:
+                items[:] = items[self._slice(len(items), start, end)]
+                if not items:
+                    self._drop(_key(name))
+                self._dirty = True
+            return True
+
+    # ═══════════════════════════════════════════════════════════
+    # STREAMS
+    # ═══════════════════════════════════════════════════════════
+
+    def _trim(self, stream: _Stream, maxlen: Optional[int], minid: Any) -> int:
+        removed = 0
+        if maxlen is not None:
+            removed += stream.trim_front(len(stream.ids) - int(maxlen))
+        if minid is not None:
+            bound, _ = _parse_id(minid)
+            removed += stream.trim_front(bisect.bisect_left(stream.ids, bound))
+        return removed
+
+    def xadd(self, name: Any, fields: Dict[Any, Any], id: Any = "*", maxlen: Optional[int] = None,
+             approximate: bool = True, nomkstream: bool = False, minid: Any = None) -> Optional[str]:
+        with self._lock:
+            stream = self._get(name, _Stream)
+            if stream is None:
+                if nomkstream:
+                    return None
+                stream = self._get_or_create(name, _Stream)
+            if _key(id) == "*":
+                ms = int(time.time() * 1000)
+                last_ms, last_seq = stream.last_id
+                new_id = (last_ms, last_seq + 1) if ms <= last_ms else (ms, 0)
+            else:
+                new_id, _ = _parse_id(id)
+                if new_id <= stream.last_id:
+                    raise ResponseError("The ID specified in XADD is equal or smaller than the target stream top item")
+            stream.ids.append(new_id)
+            stream.fields.append({_key(k): _value(v) for k, v in fields.items()})
+            stream.last_id = new_id
+            self._trim(stream, maxlen, minid)
+            self._dirty = True
+            self._appended.notify_all()
+            return _format_id(new_id)
+
+    def xtrim(self, name: Any, maxlen: Optional[int] = None, approximate: bool = True,
+              minid: Any = None, limit: Optional[int] = None) -> int:
+        with self._lock:
+            stream = self._get(name, _Stream)
+            if stream is None:
+                return 0
+            removed = self._trim(stream, maxlen, minid)
+            self._dirty = self._dirty or bool(removed)
+            return removed
+
+    def xlen(self, name: Any) -> int:
+        with self._lock:
+            stream = self._get(name, _Stream)
+            return len(stream.ids) if stream else 0
+
+    @staticmethod
+    def _window(stream: _Stream, low: Any, high: Any) -> Tuple[int, int]:
+        (low_id, low_excl), (high_id, high_excl) = _parse_id(low), _parse_id(high, end=True)
+        lo = (bisect.bisect_right if low_excl else bisect.bisect_left)(stream.ids, low_id)
+        hi = (bisect.bisect_left if high_excl else bisect.bisect_right)(stream.ids, high_id)
+        return lo, hi
+
+    @staticmethod
+    def _entries(stream: _Stream, indexes) -> List[Tuple[str, Dict[str, Any]]]:
+        return [(_format_id(stream.ids[i]), dict(stream.fields[i])) for i in indexes]
+
+    def xrange(self, name: Any, min: Any = "-", max: Any = "+", count: Optional[int] = None):
+        with self._lock:
+            stream = self._get(name, _Stream)
+            if stream is None:
+                return []
+            lo, hi = self._window(stream, min, max)
+            if count is not None:
+                hi = builtins.min(hi, lo + count)
+            return self._entries(stream, range(lo, hi))
+
+    def xrevrange(self, name: Any, max: Any = "+", min: Any = "-", count: Optional[int] = None):
+        with self._lock:
+            stream = self._get(name, _Stream)
+            if stream is None:
+                return []
+            lo, hi = self._window(stream, min, max)
+            if count is not None:
+                lo = builtins.max(lo, hi - count)
+            return self._entries(stream, range(hi - 1, lo - 1, -1))
+
+    def xgroup_create(self, name: Any, groupname: Any, id: Any = "$", mkstream: bool = False) -> bool:
+        with self._lock:
+            stream = self._get(name, _Stream)
+            if stream is None:
+                if not mkstream:
+                    raise ResponseError("The XGROUP subcommand requires the key to exist")
+                stream = self._get_or_create(name, _Stream)
+            group = _key(groupname)
+            if group in stream.groups:
+                raise ResponseError("BUSYGROUP Consumer Group name already exists")
+            last = stream.last_id if _key(id) == "$" else _parse_id(id)[0]
+            stream.groups[group] = {"last": last, "pending": {}}
+            self._dirty = True
+            return True
+
+    def _read_group(self, group: str, consumer: str, streams: Dict[Any, Any],
+                    count: Optional[int], noack: bool) -> List[List[Any]]:
+        response = []
+        for name, offset in streams.items():
+            stream = self._get(name, _Stream)
+            state = stream.groups.get(group) if stream else None
+            if state is None:
+                raise ResponseError(f"NOGROUP No such key '{_key(name)}' or consumer group '{group}'")
+            if _key(offset) == ">":
+                lo = bisect.bisect_right(stream.ids, state["last"])
+                hi = len(stream.ids) if count is None else min(len(stream.ids), lo + count)
+                if hi > lo:
+                    state["last"] = stream.ids[hi - 1]
+                    if not noack:
+                        for i in range(lo, hi):
+                            state["pending"][stream.ids[i]] = consumer
+                entries = self._entries(stream, range(lo, hi))
+            else:
+                # Re-deliver this consumer's pending entries after ``offset``
+                after, _ = _parse_id(offset)
+                mine = sorted(i for i, owner in state["pending"].items() if owner == consumer and i > after)
+                index = {sid: n for n, sid in enumerate(stream.ids)}
+                entries = [(_format_id(sid), dict(stream.fields[index[sid]]) if sid in index else None)
+                           for sid in mine[:count]]
+            if entries or _key(offset) != ">":
+                response.append([name, entries])
+        return response
+
+    def xreadgroup(self, groupname: Any, consumername: Any, streams: Dict[Any, Any],
+                   count: Optional[int] = None, block: Optional[int] = None, noack: bool = False):
+        group, consumer = _key(groupname), _key(consumername)
+        deadline = None if block is None else time.time() + block / 1000
+        with self._lock:
+            while True:
+                response = self._read_group(group, consumer, streams, count, noack)
+                if response or deadline is None:
+                    self._dirty = self._dirty or bool(response)
+                    return response
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return []
+                self._appended.wait(remaining)
+
+    def xack(self, name: Any, groupname: Any, *ids: Any) -> int:
+        with self._lock:
+            stream = self._get(name, _Stream)
+            state = stream.groups.get(_key(groupname)) if stream else None
+            if state is None:
+                return 0
+            acked = sum(1 for i in ids if state["pending"].pop(_parse_id(i)[0], None) is not None)
+            self._dirty = self._dirty or bool(acked)
+            return acked
+
+    def xpending(self, name: Any, groupname: Any) -> Dict[str, Any]:
+        with self._lock:
+            stream = self._get(name, _Stream)
+            state = stream.groups.get(_key(groupname)) if stream else None
+            pending = sorted((state or {}).get("pending", {}))
+            consumers: Dict[str, int] = {}
+            for sid in pending:
+                owner = state["pending"][sid]
+                consumers[owner] = consumers.get(owner, 0) + 1
+            return {
+                "pending": len(pending),
+                "min": _format_id(pending[0]) if pending else None,
+                "max": _format_id(pending[-1]) if pending else None,
+                "consumers": [{"name": k, "pending": v} for k, v in consumers.items()],
+            }
+
+    # ═══════════════════════════════════════════════════════════
+    # SNAPSHOTS
+    # ═══════════════════════════════════════════════════════════
+
+    @staticmethod
+    def _dump(value: Any) -> Any:
+        if isinstance(value, bytes):
+            return {"b64": base64.b64encode(value).decode("ascii")}
+        return value
+
+    @staticmethod
+    def _load(value: Any) -> Any:
+        if isinstance(value, dict) and "b64" in value:
+            return base64.b64decode(value["b64"])
+        return value
+
+    def _serialize(self, value: Any) -> Dict[str, Any]:
+        if isinstance(value, (str, bytes)):
+            return {"type": "string", "value": self._dump(value)}
+        if isinstance(value, dict):
+            return {"type": "hash", "value": {k: self._dump(v) for k, v in value.items()}}
+        if isinstance(value, list):
+            return {"type": "list", "value": [self._dump(v) for v in value]}
+        return {
+            "type": "stream",
+            "last_id": list(value.last_id),
+            "entries": [[list(sid), {k: self._dump(v) for k, v in fields.items()}]
+                        for sid, fields in zip(value.ids, value.fields)],
+            "groups": {
+                name: {"last": list(state["last"]),
+                       "pending": [[list(sid), owner] for sid, owner in state["pending"].items()]}
+                for name, state in value.groups.items()
+            },
+        }
+
+    def _deserialize(self, item: Dict[str, Any]) -> Any:
+        kind = item["type"]
+        if kind == "string":
+            return self._load(item["value"])
+        if kind == "hash":
+            return {k: self._load(v) for k, v in item["value"].items()}
+        if kind == "list":
+            return [self._load(v) for v in item["value"]]
+        stream = _Stream()
+        stream.last_id = tuple(item["last_id"])
+        for sid, fields in item["entries"]:
+            stream.ids.append(tuple(sid))
+            stream.fields.append({k: self._load(v) for k, v in fields.items()})
+        for name, state in item["groups"].items():
+            stream.groups[name] = {
+                "last": tuple(state["last"]),
+                "pending": {tuple(sid): owner for sid, owner in state["pending"]},
+            }
+        return stream
+
+    def save(self, path: Optional[str] = None) -> bool:
+        """Write the live keyspace atomically (temp file + rename)"""
+        path = path or self.snapshot_path
+        if not path:
+            return False
+        with self._lock:
+            self.sweep()
+            keys = {key: self._serialize(value) for key, value in self._data.items()}
+            for key, deadline in self._expires.items():
+                keys[key]["expires_at"] = deadline
+            self._dirty = False
+        payload = {"version": SNAPSHOT_VERSION, "saved_at": time.time(), "keys": keys}
+        tmp = f"{path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            with open(tmp, "w") as f:
+                json.dump(payload, f)
+            os.replace(tmp, path)
+        except OSError as e:
+            self._dirty = True
+            logger.warning(f"⚠️ MEMORY REDIS: Snapshot to {path} failed - {e}")
+            return False
+        self.snapshots += 1
+        return True
+
+    def load(self, path: Optional[str] = None) -> int:
+        """Restore a snapshot (keys already expired are skipped)"""
+        path = path or self.snapshot_path
+        if not path or not os.path.exists(path):
+            return 0
+        try:
+            with open(path) as f:
+                payload = json.load(f)
+            if payload.get("version") != SNAPSHOT_VERSION:
+                raise ValueError(f"unsupported snapshot version {payload.get('version')}")
+            now = time.time()
+            restored = {}
+            for key, item in payload["keys"].items():
+                if item.get("expires_at") is not None and item["expires_at"] <= now:
+                    continue
+                restored[key] = (self._deserialize(item), item.get("expires_at"))
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"⚠️ MEMORY REDIS: Ignoring snapshot {path} - {e}")
+            return 0
+        with self._lock:
+            for key, (value, deadline) in restored.items():
+                self._data[key] = value
+                if deadline is not None:
+                    self._expires[key] = deadline
+                    heapq.heappush(self._deadlines, (deadline, key))
+        logger.info(f"🧠 MEMORY REDIS: Restored {len(restored)} keys from {path}")
+        return len(restored)
+
+    # ═══════════════════════════════════════════════════════════
+    # BACKGROUND SWEEP / SNAPSHOT
+    # ═══════════════════════════════════════════════════════════
+
+    async def run(self) -> None:
+        last_snapshot = time.monotonic()
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            self.sweep()
+            if (self.snapshot_path and self._dirty
+                    and time.monotonic() - last_snapshot >= self.snapshot_interval):
+                await asyncio.to_thread(self.save)
+                last_snapshot = time.monotonic()
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self.snapshot_path and self._dirty:
+            await asyncio.to_thread(self.save)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "keys": self.dbsize(),
+            "volatile_keys": len(self._expires),
+            "expired": self.expired,
+            "snapshots": self.snapshots,
+            "snapshot_path": self.snapshot_path or None,
+        }
+
+
+
+class MemoryPipeline:
+    """Buffers commands and runs them under one lock acquisition"""
+
+    def __init__(self, store: MemoryRedis):
+        self._store = store
+        self._commands: List[Tuple[str, tuple, dict]] = []
+
+    def __getattr__(self, name: str):
+        if not callable(getattr(self._store, name, None)) or name.startswith("_"):
+            raise AttributeError(name)
+
+        def queue(*args, **kwargs):
+            self._commands.append((name, args, kwargs))
+            return self
+        return queue
+
+    def execute(self, raise_on_error: bool = True) -> List[Any]:
+        commands, self._commands = self._commands, []
+        results = []
+        with self._store._lock:
+            for name, args, kwargs in commands:
+                try:
+                    results.append(getattr(self._store, name)(*args, **kwargs))
+                except ResponseError as e:
+                    if raise_on_error:
+                        raise
+                    results.append(e)
+        return results
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._commands = []
+
+
+class AsyncMemoryRedis:
+    """``redis.asyncio`` facade over a shared ``MemoryRedis``"""
+
+    def __init__(self, store: MemoryRedis):
+        self._store = store
+
+    def __getattr__(self, name: str):
+        command = getattr(self._store, name)
+        if not callable(command) or name.startswith("_"):
+            raise AttributeError(name)
+
+        async def call(*args, **kwargs):
+            if name == "xreadgroup" and kwargs.get("block"):
+                return await asyncio.to_thread(command, *args, **kwargs)
+            return command(*args, **kwargs)
+        return call
+
+    def pipeline(self, transaction: bool = True) -> "AsyncMemoryPipeline":
+        return AsyncMemoryPipeline(self._store)
+
+    async def aclose(self) -> None:
+        pass
+
+
+class AsyncMemoryPipeline(MemoryPipeline):
+    async def execute(self, raise_on_error: bool = True) -> List[Any]:
+        return MemoryPipeline.execute(self, raise_on_error)
+
+
+# Singleton instance (shared by the sync and asyncio caches)
+memory_redis = MemoryRedis(
+    snapshot_path=settings.MEMORY_CACHE_SNAPSHOT_PATH,
+    snapshot_interval=settings.MEMORY_CACHE_SNAPSHOT_SECONDS,
+)
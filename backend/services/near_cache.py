@@ -0,0 +1,171 @@
+# ================================================================
+# 🧊 NEAR CACHE - In-Process TTL/LRU Tier in Front of Redis
+# ================================================================
+# Hot reads (tickers, peak prices) are answered from a bounded
+# local map; Redis is only consulted on a miss. When any node
+# writes a key it publishes the key on a Redis channel and every
+# other node drops its local copy.
+# ================================================================
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from backend.core.logging_config import setup_logging
+
+logger = setup_logging("near_cache")
+
+INVALIDATION_CHANNEL = "vortex:near-cache:invalidate"
+_MISSING = object()
+
+
+class NearCache:
+    """Bounded TTL + LRU map with hit/miss/eviction counters
+
+    Thread-safe: the pub/sub listener invalidates from its own thread.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 1.0):
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Cached value, or ``default`` on a miss or expiry"""
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def lookup(self, key: str) -> Tuple[bool, Any]:
+        """``(hit, value)`` so cached ``None`` can be told from a miss"""
+        value = self.get(key, _MISSING)
+        return (False, None) if value is _MISSING else (True, value)
+
+    def put(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                if self._entries.pop(key, _MISSING) is not _MISSING:
+                    self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
+
+
+class NearCacheInvalidator:
+    """Cross-node invalidation over Redis pub/sub
+
+    Messages are ``"<node id>|<key>,<key>..."``; a node ignores its
+    own messages because it already updated its local copy.
+
+    Args:
+        cache: Local NearCache to invalidate
+        client_factory: Returns the (sync) Redis client
+        channel: Pub/sub channel shared by all nodes
+    """
+
+    def __init__(self, cache: NearCache, client_factory: Callable[[], Any],
+                 channel: str = INVALIDATION_CHANNEL):
+        self.cache = cache
+        self.client_factory = client_factory
+        self.channel = channel
+        self.node_id = f"{os.getpid()}-{os.urandom(3).hex()}"
+        self._pubsub = None
+        self._thread = None
+        self.published = 0
+        self.received = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def encode(self, keys: Iterable[str]) -> str:
+        return f"{self.node_id}|{','.join(keys)}"
+
+    def handle(self, message: Dict[str, Any]) -> None:
+        data = message.get("data")
+        if not isinstance(data, str) or "|" not in data:
+            return
+        node_id, _, keys = data.partition("|")
+        if node_id == self.node_id or not keys:
+            return
+        self.received += 1
+        self.cache.invalidate(*keys.split(","))
+
+    def publish(self, client, *keys: str) -> None:
+        """Tell the other nodes to drop ``keys`` (no-op until started)"""
+        if not self.running or not keys:
+            return
+        client.publish(self.channel, self.encode(keys))
+        self.published += 1
+
+    def start(self) -> bool:
+        if self.running:
+            return True
+        client = self.client_factory()
+        if client is None:
+            return False
+        try:
+            self._pubsub = client.pubsub(ignore_subscribe_messages=True)
+            self._pubsub.subscribe(**{self.channel: self.handle})
+            self._thread = self._pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+            logger.info(f"🧊 NEAR CACHE: Listening for invalidations on {self.channel}")
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ NEAR CACHE: Invalidation listener failed - {e}")
+            self._pubsub = self._thread = None
+            return False
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            try:
+                self._thread.stop()
+                self._pubsub.close()
+            except Exception:
+                pass
+        self._pubsub = self._thread = None
@@ -1,24 +1,38 @@
 from backend.core.config import settings
 from backend.services.exchange import ExchangeService
+from backend.services.flatten import Flattener
+from backend.services.market_feed import PriceTable
+from backend.services.order_pipeline import OrderPipeline
+from backend.services.pre_trade_risk import PreTradeRisk
 
 class OMS:
-    def __init__(self, exchange_service: ExchangeService):
+    def __init__(self, exchange_service: ExchangeService, risk: PreTradeRisk = None):
         self.exchange_service = exchange_service
+        # Prices come from the exchange service's local table (REST only as fallback)
+        prices = getattr(exchange_service, "prices", None)
+        self.risk = risk or PreTradeRisk(
+            exchange_service, prices if isinstance(prices, PriceTable) else None
+        )
+        # Concurrent submission (bounded window, acks matched by client order id)
+        self.pipeline = OrderPipeline(self.place_order, max_in_flight=settings.MAX_ORDERS_IN_FLIGHT)
+        # Emergency exits bypass the entry risk checks (they only reduce exposure)
+        self.flattener = Flattener(exchange_service, max_in_flight=settings.MAX_ORDERS_IN_FLIGHT)
 
-    async def place_order(self, symbol: str, side: str, amount: float, order_type: str = "market"):
-        # 1. Symbol Validation
-        if "/" not in symbol:
-            raise ValueError("Invalid symbol format. Must contain '/' (e.g. BTC/USDT)")
-
-        # 2. Fetch current price for risk calculation
-        ticker = await self.exchange_service.fetch_ticker(symbol)
-        current_price = ticker['last']
-        notional_value = amount * current_price
-
-        # 3. Risk Clamp
-        if notional_value > settings.MAX_ORDER_NOTIONAL:
-            raise ValueError(f"Order rejected: Notional value {notional_value} exceeds limit {settings.MAX_ORDER_NOTIONAL}")
+    async def place_order(self, symbol: str, side: str, amount: float, order_type: str = "market",
+                          client_order_id: str = None):
+        # 1-3. Symbol validation, capability gate and notional risk clamp
+        await self.risk.check(symbol, side, amount, order_type)
 
         # 4. Execute
         # The exchange service handles the PAPER/TESTNET/LIVE logic for the actual call
-        return await self.exchange_service.create_order(symbol, order_type, side, amount)
+        return await self.exchange_service.create_order(
+            symbol, order_type, side, amount, client_order_id=client_order_id
+        )
+
+    async def place_orders(self, orders):
+        """Submit many orders concurrently; returns acks/exceptions in input order"""
+        return await self.pipeline.submit_many(orders)
+
+    async def flatten_all(self, reason: str = "EMERGENCY STOP", whole_account: bool = False):
+        """Cancel every open order and market-exit every bot position concurrently"""
+        return await self.flattener.flatten_all(reason, whole_account=whole_account)
@@ -0,0 +1,152 @@
+# ================================================================
+# 🚀 ORDER PIPELINE - Concurrent Submission with Client Order IDs
+# ================================================================
+# Every order gets a unique client order id up front, is submitted
+# concurrently within a bounded in-flight window, and is resolved
+# when its acknowledgement arrives (REST response or a later
+# user-data event). Flattening N slots costs ~one round trip.
+# ================================================================
+
+import asyncio
+import itertools
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from backend.core.logging_config import setup_logging
+
+logger = setup_logging("order_pipeline")
+
+_sequence = itertools.count(1)
+_session = os.urandom(4).hex()
+
+
+def new_client_order_id(prefix: str = "pt") -> str:
+    """Unique, exchange-safe (<= 32 chars, alphanumeric) client order id"""
+    return f"{prefix}{_session}{int(time.time() * 1000):x}{next(_sequence):x}"
+
+
+class PendingOrder:
+    """An order that has been handed to the pipeline but not yet acknowledged"""
+
+    __slots__ = ("client_order_id", "symbol", "side", "amount", "order_type",
+                 "submitted_at", "future")
+
+    def __init__(self, client_order_id: str, symbol: str, side: str, amount: float,
+                 order_type: str, future: asyncio.Future):
+        self.client_order_id = client_order_id
+        self.symbol = symbol
+        self.side = side
+        self.amount = amount
+        self.order_type = order_type
+        self.submitted_at = time.time()
+        self.future = future
+
+
+class OrderPipeline:
+    """Bounded-concurrency order submitter with async ack correlation
+
+    Args:
+        submit: Coroutine ``(symbol, side, amount, order_type, client_order_id)``
+            that sends one order, e.g. ``OMS.place_order``
+        max_in_flight: Maximum orders awaiting an exchange response
+    """
+
+    def __init__(self, submit: Callable[..., Awaitable[Any]], max_in_flight: int = 10):
+        self._submit = submit
+        self.max_in_flight = max(1, max_in_flight)
+        self.pending: Dict[str, PendingOrder] = {}
+        self._window: Optional[asyncio.Semaphore] = None
+        self._window_loop = None
+        self.submitted = 0
+        self.acked = 0
+        self.rejected = 0
+        self.last_latency: Optional[float] = None
+
+    @property
+    def in_flight(self) -> int:
+        return len(self.pending)
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._window is None or self._window_loop is not loop:
+            self._window = asyncio.Semaphore(self.max_in_flight)
+            self._window_loop = loop
+        return self._window
+
+    # ═══════════════════════════════════════════════════════════
+    # SUBMISSION
+    # ═══════════════════════════════════════════════════════════
+
+    def submit(self, symbol: str, side: str, amount: float, order_type: str = "market",
+               client_order_id: Optional[str] = None) -> asyncio.Future:
+        """Queue one order; the returned future resolves with its ack"""
+        loop = asyncio.get_running_loop()
+        cid = client_order_id or new_client_order_id()
+        if cid in self.pending:
+            raise ValueError(f"Duplicate client order id: {cid}")
+        order = PendingOrder(cid, symbol, side, amount, order_type, loop.create_future())
+        self.pending[cid] = order
+        self.submitted += 1
+        loop.create_task(self._send(order))
+        return order.future
+
+    async def submit_many(self, orders: Iterable[Dict[str, Any]]) -> List[Any]:
+        """Submit a batch concurrently; returns acks (or exceptions) in order"""
+        futures = [
+            self.submit(o["symbol"], o["side"], o["amount"], o.get("type", "market"),
+                        o.get("client_order_id"))
+            for o in orders
+        ]
+        return await asyncio.gather(*futures, return_exceptions=True)
+
+    async def _send(self, order: PendingOrder) -> None:
+        async with self._semaphore():
+            try:
+                ack = await self._submit(order.symbol, order.side, order.amount,
+                                         order.order_type, order.client_order_id)
+            except Exception as e:
+                self.reject(order.client_order_id, e)
+                return
+        self.on_ack(ack if isinstance(ack, dict) else {"info": ack}, order.client_order_id)
+
+    # ═══════════════════════════════════════════════════════════
+    # ACK CORRELATION
+    # ═══════════════════════════════════════════════════════════
+
+    def on_ack(self, ack: Dict[str, Any], client_order_id: Optional[str] = None) -> bool:
+        """Resolve the pending order an acknowledgement belongs to
+
+        Acks are matched on ``clientOrderId`` so they may arrive from
+        the REST response or from a user-data stream, in any order.
+        Returns False for unknown or already-resolved ids.
+        """
+        cid = client_order_id or ack.get("clientOrderId")
+        order = self.pending.pop(cid, None) if cid else None
+        if order is None:
+            return False
+        self.acked += 1
+        self.last_latency = time.time() - order.submitted_at
+        if not order.future.done():
+            order.future.set_result(ack)
+        return True
+
+    def reject(self, client_order_id: str, error: Exception) -> bool:
+        order = self.pending.pop(client_order_id, None)
+        if order is None:
+            return False
+        self.rejected += 1
+        logger.warning(f"⚠️ PIPELINE: {order.symbol} {order.side} rejected ({client_order_id}) - {error}")
+        if not order.future.done():
+            order.future.set_exception(error)
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "submitted": self.submitted,
+            "acked": self.acked,
+            "rejected": self.rejected,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "last_latency_ms": None if self.last_latency is None else round(self.last_latency * 1000, 3),
+        }
@@ -0,0 +1,298 @@
+# ================================================================
+# 📋 ORDER TRACKER - Lifecycle State Machine + User-Data Stream
+# ================================================================
+# Orders move NEW → PARTIALLY_FILLED → FILLED / CANCELED /
+# REJECTED / EXPIRED, driven by pushed updates from the private
+# user-data websocket (ccxt.pro watch_orders). Open orders are
+# indexed by id, client id and symbol; REST is used only to
+# reconcile after the stream reconnects.
+# ================================================================
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from backend.core.logging_config import setup_logging
+
+logger = setup_logging("order_tracker")
+
+NEW = "new"
+PARTIALLY_FILLED = "partially_filled"
+FILLED = "filled"
+CANCELED = "canceled"
+REJECTED = "rejected"
+EXPIRED = "expired"
+TERMINAL_STATES = frozenset((FILLED, CANCELED, REJECTED, EXPIRED))
+
+# ccxt unified status -> terminal lifecycle state
+_CCXT_TERMINAL = {"closed": FILLED, "canceled": CANCELED, "cancelled": CANCELED,
+                  "rejected": REJECTED, "expired": EXPIRED}
+
+
+class TrackedOrder:
+    """Current state of one order"""
+
+    __slots__ = ("order_id", "client_order_id", "symbol", "side", "amount", "filled",
+                 "average", "state", "created_at", "updated_at", "raw")
+
+    def __init__(self, order_id: Optional[str], client_order_id: Optional[str], symbol: str,
+                 side: Optional[str], amount: Optional[float]):
+        self.order_id = order_id
+        self.client_order_id = client_order_id
+        self.symbol = symbol
+        self.side = side
+        self.amount = amount
+        self.filled = 0.0
+        self.average: Optional[float] = None
+        self.state = NEW
+        self.created_at = self.updated_at = time.time()
+        self.raw: Dict[str, Any] = {}
+
+    @property
+    def key(self) -> str:
+        return self.client_order_id or self.order_id
+
+    @property
+    def is_open(self) -> bool:
+        return self.state not in TERMINAL_STATES
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.order_id,
+            "clientOrderId": self.client_order_id,
+            "symbol": self.symbol,
+            "side": self.side,
+            "amount": self.amount,
+            "filled": self.filled,
+            "average": self.average,
+            "state": self.state,
+            "updated_at": self.updated_at,
+        }
+
+
+class OrderTracker:
+    """Order state machine with an indexed open-orders table
+
+    Updates are ccxt-shaped order dicts from any source (REST ack,
+    websocket push, paper engine). Terminal states are absorbing and
+    the filled quantity never goes backwards, so late or duplicated
+    updates are harmless.
+    """
+
+    def __init__(self, history: int = 1000):
+        self._orders: Dict[str, TrackedOrder] = {}   # key -> order
+        self._by_id: Dict[str, str] = {}              # exchange id -> key
+        self._open_by_symbol: Dict[str, Set[str]] = {}
+        self._closed: List[str] = []
+        self.history = history
+        self._listeners: List[Callable[[TrackedOrder, str], None]] = []
+        self._waiters: Dict[str, List[asyncio.Future]] = {}
+        # Net base quantity the bot's own fills have bought (sells subtract)
+        self.positions: Dict[str, float] = {}
+        self.updates = 0
+
+    def add_listener(self, callback: Callable[[TrackedOrder, str], None]) -> None:
+        """``callback(order, previous_state)`` on every state or fill change"""
+        self._listeners.append(callback)
+
+    # ═══════════════════════════════════════════════════════════
+    # LOOKUPS
+    # ═══════════════════════════════════════════════════════════
+
+    def get(self, order_id: Optional[str] = None, client_order_id: Optional[str] = None) -> Optional[TrackedOrder]:
+        if client_order_id and client_order_id in self._orders:
+            return self._orders[client_order_id]
+        key = self._by_id.get(order_id) if order_id else None
+        return self._orders.get(key) if key else None
+
+    def open_orders(self, symbol: Optional[str] = None) -> List[TrackedOrder]:
+        if symbol is not None:
+            return [self._orders[k] for k in self._open_by_symbol.get(symbol, ())]
+        return [self._orders[k] for keys in self._open_by_symbol.values() for k in keys]
+
+    def open_symbols(self) -> List[str]:
+        return [s for s, keys in self._open_by_symbol.items() if keys]
+
+    def position(self, symbol: str) -> float:
+        return max(0.0, self.positions.get(symbol, 0.0))
+
+    # ═══════════════════════════════════════════════════════════
+    # STATE MACHINE
+    # ═══════════════════════════════════════════════════════════
+
+    @staticmethod
+    def _next_state(status: Optional[str], filled: float, amount: Optional[float]) -> str:
+        terminal = _CCXT_TERMINAL.get(status or "")
+        if terminal is not None:
+            return terminal
+        if amount and filled >= amount - 1e-12:
+            return FILLED
+        return PARTIALLY_FILLED if filled > 0 else NEW
+
+    def apply_update(self, update: Dict[str, Any]) -> Optional[TrackedOrder]:
+        """Apply one ccxt-shaped order update; returns the tracked order"""
+        order_id = update.get("id")
+        cid = update.get("clientOrderId")
+        if not order_id and not cid:
+            return None
+        order = self.get(order_id, cid)
+        if order is None:
+            order = TrackedOrder(order_id, cid, update.get("symbol") or "", update.get("side"),
+                                 update.get("amount"))
+            self._orders[order.key] = order
+            self._open_by_symbol.setdefault(order.symbol, set()).add(order.key)
+        if order_id and order.order_id is None:
+            order.order_id = order_id
+        if order.order_id:
+            self._by_id[order.order_id] = order.key
+        if not order.is_open:
+            return order  # terminal states are absorbing
+
+        previous, previous_filled = order.state, order.filled
+        filled = float(update.get("filled") or 0.0)
+        if filled >= order.filled:
+            order.filled = filled
+            order.average = update.get("average") or order.average
+        order.amount = update.get("amount") or order.amount
+        state = self._next_state(update.get("status"), order.filled, order.amount)
+        if state == NEW and previous == PARTIALLY_FILLED:
+            state = PARTIALLY_FILLED
+        order.state = state
+        order.raw = update
+        order.updated_at = time.time()
+        self.updates += 1
+
+        if order.state == previous and order.filled == previous_filled:
+            return order
+        self._book_fill(order, order.filled - previous_filled)
+        if not order.is_open:
+            self._close(order)
+        for callback in self._listeners:
+            try:
+                callback(order, previous)
+            except Exception as e:
+                logger.warning(f"⚠️ ORDERS: Listener failed - {e}")
+        return order
+
+    def _book_fill(self, order: TrackedOrder, delta: float) -> None:
+        if delta <= 0 or order.side not in ("buy", "sell") or not order.symbol:
+            return
+        net = self.positions.get(order.symbol, 0.0) + (delta if order.side == "buy" else -delta)
+        if net > 1e-12:
+            self.positions[order.symbol] = net
+        else:
+            self.positions.pop(order.symbol, None)
+
+    def track(self, ack: Any) -> Optional[TrackedOrder]:
+        """Register an order from its create_order response"""
+        return self.apply_update(ack) if isinstance(ack, dict) else None
+
+    def _close(self, order: TrackedOrder) -> None:
+        keys = self._open_by_symbol.get(order.symbol)
+        if keys is not None:
+            keys.discard(order.key)
+            if not keys:
+                del self._open_by_symbol[order.symbol]
+        for future in self._waiters.pop(order.key, ()):
+            if not future.done():
+                future.set_result(order)
+        self._closed.append(order.key)
+        if len(self._closed) > self.history:
+            for key in self._closed[:-self.history]:
+                old = self._orders.pop(key, None)
+                if old is not None and old.order_id:
+                    self._by_id.pop(old.order_id, None)
+            del self._closed[:-self.history]
+
+    async def wait_closed(self, key: str, timeout: Optional[float] = None) -> TrackedOrder:
+        """Wait (without polling) until the order reaches a terminal state"""
+        order = self._orders.get(key) or self.get(order_id=key)
+        if order is not None and not order.is_open:
+            return order
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(order.key if order else key, []).append(future)
+        return await asyncio.wait_for(future, timeout)
+
+
+class UserDataStream:
+    """Feeds an OrderTracker from the exchange's private order stream
+
+    Args:
+        tracker: Tracker to update
+        ws_exchange: ccxt.pro exchange (``watch_orders``)
+        rest_exchange: ccxt exchange used for post-reconnect reconciliation
+    """
+
+    def __init__(self, tracker: OrderTracker, ws_exchange, rest_exchange,
+                 max_backoff: float = 30.0):
+        self.tracker = tracker
+        self.ws_exchange = ws_exchange
+        self.rest_exchange = rest_exchange
+        self.max_backoff = max_backoff
+        self.connected = False
+        self.reconnects = 0
+        self._task: Optional[asyncio.Task] = None
+
+    async def reconcile(self, symbols: Optional[Iterable[str]] = None) -> int:
+        """Re-sync open orders over REST (only called after a reconnect)"""
+        reconciled = 0
+        for symbol in list(symbols if symbols is not None else self.tracker.open_symbols()):
+            try:
+                still_open = await self.rest_exchange.fetch_open_orders(symbol)
+            except Exception as e:
+                logger.warning(f"⚠️ ORDERS: Reconcile failed for {symbol} - {e}")
+                continue
+            open_ids = set()
+            for update in still_open:
+                self.tracker.apply_update(update)
+                open_ids.add(update.get("id"))
+            # Orders that vanished from the open list finished while we were offline
+            for order in self.tracker.open_orders(symbol):
+                if order.order_id and order.order_id not in open_ids:
+                    try:
+                        self.tracker.apply_update(await self.rest_exchange.fetch_order(order.order_id, symbol))
+                    except Exception as e:
+                        logger.warning(f"⚠️ ORDERS: fetch_order {order.order_id} failed - {e}")
+            reconciled += 1
+        return reconciled
+
+    async def run(self) -> None:
+        backoff = 1.0
+        needs_reconcile = False
+        while True:
+            try:
+                if needs_reconcile:
+                    await self.reconcile()
+                    needs_reconcile = False
+                updates = await self.ws_exchange.watch_orders()
+                self.connected = True
+                backoff = 1.0
+                for update in updates:
+                    self.tracker.apply_update(update)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if self.connected:
+                    logger.warning(f"⚠️ ORDERS: User-data stream dropped - {e}")
+                self.connected = False
+                needs_reconcile = True
+                self.reconnects += 1
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, self.max_backoff)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            await self.ws_exchange.close()
+        except Exception:
+            pass
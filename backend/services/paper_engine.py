@@ -0,0 +1,453 @@
+# ================================================================
+# 🧪 PAPER ENGINE - Order-Book Matching Simulator
+# ================================================================
+# PAPER-mode orders are matched against the live (or replayed)
+# order book: market orders walk the levels with taker fees and
+# partial fills, limit orders fill what crosses and rest the
+# remainder (its funds reserved at the limit price). Every fresh
+# book - fetched for an order, pushed by a replay, or polled for
+# symbols with resting orders - is matched against those orders.
+# Fills settle into a paper ledger of cash/positions.
+# ================================================================
+
+import asyncio
+import inspect
+import time
+from collections import defaultdict, deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from backend.core.config import settings
+from backend.core.logging_config import setup_logging
+from backend.services.order_pipeline import new_client_order_id
+
+logger = setup_logging("paper_engine")
+
+PAPER_INFO = "Paper Trade - Simulated fill against order book"
+
+Levels = List[List[float]]
+
+
+def walk_levels(levels: Levels, amount: Optional[float] = None, quote: Optional[float] = None,
+                limit: Optional[float] = None, is_buy: bool = True,
+                consume: bool = False) -> Tuple[float, float, List[Tuple[float, float]]]:
+    """Fill against book levels (best first) up to ``amount`` base or ``quote`` cost
+
+    Args:
+        levels: [[price, qty], ...] asks (buys) or bids (sells), best first
+        amount: Base quantity to fill
+        quote: Quote budget to spend instead of a base quantity (market buys)
+        limit: Worst acceptable price (None for market orders)
+        consume: Remove the filled liquidity from ``levels`` in place
+
+    Returns:
+        (filled_base, cost_quote, [(price, qty), ...])
+    """
+    filled = cost = 0.0
+    fills: List[Tuple[float, float]] = []
+    emptied = 0
+    for level in levels:
+        price, available = level[0], level[1]
+        if limit is not None and (price > limit if is_buy else price < limit):
+            break
+        if quote is not None:
+            take = min(available, (quote - cost) / price)
+        else:
+            take = min(available, amount - filled)
+        if take <= 0:
+            break
+        filled += take
+        cost += take * price
+        fills.append((price, take))
+        if consume:
+            level[1] = available - take
+            if level[1] <= 1e-12:
+                emptied += 1
+        if (quote is not None and cost >= quote - 1e-9) or (quote is None and filled >= amount - 1e-12):
+            break
+    if consume and emptied:
+        del levels[:emptied]
+    return filled, cost, fills
+
+
+class PaperLedger:
+    """Paper cash and positions, with average-cost realized PnL
+
+    ``used`` holds funds reserved by resting orders; new orders can
+    only spend ``free`` (balance minus used).
+    """
+
+    def __init__(self, starting_balances: Optional[Dict[str, float]] = None):
+        self.balances: Dict[str, float] = defaultdict(float, starting_balances or {})
+        self.used: Dict[str, float] = defaultdict(float)
+        self.avg_cost: Dict[str, float] = {}
+        self.fees_paid: Dict[str, float] = defaultdict(float)
+        self.realized_pnl = 0.0
+        self.trades: Deque[Dict[str, Any]] = deque(maxlen=1000)
+
+    def free(self, currency: str) -> float:
+        return self.balances[currency] - self.used[currency]
+
+    def reserve(self, currency: str, amount: float) -> None:
+        self.used[currency] += amount
+
+    def release(self, currency: str, amount: float) -> None:
+        left = self.used[currency] - amount
+        if left <= 1e-9:
+            self.used.pop(currency, None)
+        else:
+            self.used[currency] = left
+
+    def settle(self, symbol: str, side: str, qty: float, cost: float, fee: float,
+               order_id: str) -> None:
+        """Book one fill
+
+        Raises:
+            ValueError: If a sell exceeds the held position
+        """
+        base, _, quote = symbol.partition("/")
+        held = self.balances[base]
+        if side == "sell" and qty > held + 1e-9:
+            raise ValueError(f"Paper oversell: {qty} {base} with {held} held")
+        if side == "buy":
+            self.balances[quote] -= cost + fee
+            self.avg_cost[base] = (self.avg_cost.get(base, 0.0) * held + cost) / (held + qty)
+            self.balances[base] = held + qty
+        else:
+            self.balances[quote] += cost - fee
+            self.realized_pnl += cost - self.avg_cost.get(base, 0.0) * qty - fee
+            self.balances[base] = held - qty
+            if self.balances[base] <= 1e-12:
+                self.balances[base] = 0.0
+                self.avg_cost.pop(base, None)
+        self.fees_paid[quote] += fee
+        self.trades.append({
+            "order_id": order_id, "symbol": symbol, "side": side, "qty": qty,
+            "cost": cost, "fee": fee, "timestamp": time.time(),
+        })
+
+    def to_balance(self) -> Dict[str, Any]:
+        """ccxt-shaped balance dict"""
+        total = {k: v for k, v in self.balances.items() if v}
+        used = {k: self.used.get(k, 0.0) for k in total}
+        free = {k: total[k] - used[k] for k in total}
+        balance: Dict[str, Any] = {"free": free, "used": used, "total": dict(total)}
+        for currency, amount in total.items():
+            balance[currency] = {"free": free[currency], "used": used[currency], "total": amount}
+        return balance
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "balances": {k: v for k, v in self.balances.items() if v},
+            "reserved": {k: v for k, v in self.used.items() if v},
+            "realized_pnl": self.realized_pnl,
+            "fees_paid": dict(self.fees_paid),
+            "trade_count": len(self.trades),
+        }
+
+
+class PaperMatchingEngine:
+    """In-process exchange simulator for PAPER mode
+
+    Args:
+        book_source: ``symbol -> order book`` (sync or async), e.g. the
+            ccxt ``fetch_order_book``; replayed books can be pushed with
+            ``set_book`` instead
+        price_source: ``symbol -> last price`` used when no book is
+            available (fills at that price with unlimited depth)
+        taker_fee / maker_fee: Fee rates charged in the quote currency
+        latency: Simulated order-entry latency in seconds
+        book_max_age: Reuse a fetched book for this long; fills consume
+            its liquidity so back-to-back orders see the impact
+        poll_interval: Seconds between book polls for symbols with
+            resting orders (``start()``)
+    """
+
+    def __init__(self, book_source: Optional[Callable[[str], Any]] = None,
+                 price_source: Optional[Callable[[str], Optional[float]]] = None,
+                 ledger: Optional[PaperLedger] = None, taker_fee: Optional[float] = None,
+                 maker_fee: Optional[float] = None, latency: Optional[float] = None,
+                 book_max_age: float = 1.0, poll_interval: Optional[float] = None):
+        self.book_source = book_source
+        self.price_source = price_source
+        self.ledger = ledger or PaperLedger({"USDT": settings.PAPER_STARTING_USDT})
+        self.taker_fee = settings.PAPER_TAKER_FEE if taker_fee is None else taker_fee
+        self.maker_fee = settings.PAPER_MAKER_FEE if maker_fee is None else maker_fee
+        self.latency = settings.PAPER_LATENCY_MS / 1000 if latency is None else latency
+        self.book_max_age = book_max_age
+        self.poll_interval = settings.PAPER_BOOK_POLL_SECONDS if poll_interval is None else poll_interval
+        self._books: Dict[str, Tuple[Dict[str, Levels], float]] = {}
+        self.open_orders: Dict[str, Dict[str, Any]] = {}
+        # order id -> (currency, amount) held back while the order rests
+        self._reserved: Dict[str, Tuple[str, float]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.orders_filled = 0
+        self.orders_rejected = 0
+        self._listeners: List[Callable[[Dict[str, Any]], None]] = []
+
+    def add_listener(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        """Called with the order dict when a resting order fills or is cancelled"""
+        self._listeners.append(callback)
+
+    def _notify(self, order: Dict[str, Any]) -> None:
+        for callback in self._listeners:
+            try:
+                callback(order)
+            except Exception as e:
+                logger.warning(f"⚠️ PAPER: Listener failed - {e}")
+
+    # ═══════════════════════════════════════════════════════════
+    # ORDER BOOKS
+    # ═══════════════════════════════════════════════════════════
+
+    @staticmethod
+    def _normalise(book: Any) -> Optional[Dict[str, Levels]]:
+        if not isinstance(book, dict):
+            return None
+        bids, asks = book.get("bids"), book.get("asks")
+        if not isinstance(bids, list) or not isinstance(asks, list):
+            return None
+        return {
+            "bids": [[float(p), float(q)] for p, q, *_ in bids],
+            "asks": [[float(p), float(q)] for p, q, *_ in asks],
+        }
+
+    def set_book(self, symbol: str, book: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Install a (live or replayed) book and match resting orders against it"""
+        normalised = self._normalise(book)
+        if normalised is None:
+            return []
+        self._books[symbol] = (normalised, time.time())
+        return self._match_resting(symbol, normalised)
+
+    async def _book(self, symbol: str) -> Optional[Dict[str, Levels]]:
+        cached = self._books.get(symbol)
+        if cached is not None and (self.book_source is None or time.time() - cached[1] <= self.book_max_age):
+            return cached[0]
+        if self.book_source is not None:
+            try:
+                book = self.book_source(symbol)
+                if inspect.isawaitable(book):
+                    book = await book
+            except Exception as e:
+                logger.warning(f"⚠️ PAPER: Order book unavailable for {symbol} - {e}")
+                book = None
+            normalised = self._normalise(book)
+            if normalised is not None and (normalised["bids"] or normalised["asks"]):
+                self._books[symbol] = (normalised, time.time())
+                self._match_resting(symbol, normalised)
+                return normalised
+        return None
+
+    async def poll_resting(self) -> int:
+        """Fetch fresh books for symbols with resting orders; returns symbols polled"""
+        symbols = {o["symbol"] for o in self.open_orders.values()}
+        for symbol in symbols:
+            cached = self._books.get(symbol)
+            if cached is None or time.time() - cached[1] > self.book_max_age:
+                self._books.pop(symbol, None)
+                await self._book(symbol)  # matches resting orders against the new book
+        return len(symbols)
+
+    def _reference_price(self, symbol: str, price: Optional[float]) -> Optional[float]:
+        if price:
+            return price
+        return self.price_source(symbol) if self.price_source else None
+
+    # ═══════════════════════════════════════════════════════════
+    # MATCHING
+    # ═══════════════════════════════════════════════════════════
+
+    def _affordable(self, symbol: str, side: str, amount: Optional[float], quote: Optional[float],
+                    price: float) -> bool:
+        """Free (unreserved) funds cover the order at ``price`` (the limit for limit orders)"""
+        base, _, quote_ccy = symbol.partition("/")
+        if side == "sell":
+            return self.ledger.free(base) >= (amount or 0) - 1e-12
+        spend = quote if quote is not None else (amount or 0) * price
+        return self.ledger.free(quote_ccy) >= spend * (1 + max(self.taker_fee, self.maker_fee)) - 1e-9
+
+    def _reserve(self, order: Dict[str, Any]) -> None:
+        """Hold back what the resting remainder can still spend"""
+        base, _, quote_ccy = order["symbol"].partition("/")
+        if order["side"] == "buy":
+            held = (quote_ccy, order["remaining"] * order["price"] * (1 + self.maker_fee))
+        else:
+            held = (base, order["remaining"])
+        self.ledger.reserve(*held)
+        self._reserved[order["id"]] = held
+
+    def _release(self, order: Dict[str, Any], filled: Optional[float] = None) -> None:
+        """Release the share reserved for ``filled`` base (all of it if None)"""
+        currency, held = self._reserved.get(order["id"], (None, 0.0))
+        if currency is None:
+            return
+        if filled is None or order["remaining"] <= 1e-12:
+            amount = held
+        elif order["side"] == "buy":
+            amount = min(held, filled * order["price"] * (1 + self.maker_fee))
+        else:
+            amount = min(held, filled)
+        self.ledger.release(currency, amount)
+        if amount >= held - 1e-12:
+            del self._reserved[order["id"]]
+        else:
+            self._reserved[order["id"]] = (currency, held - amount)
+
+    def _order(self, cid: str, symbol: str, order_type: str, side: str, amount: Optional[float],
+               price: Optional[float], status: str, **extra) -> Dict[str, Any]:
+        order = {
+            "id": f"paper_{cid}",
+            "clientOrderId": cid,
+            "symbol": symbol,
+            "type": order_type,
+            "side": side,
+            "amount": amount,
+            "price": price,
+            "status": status,
+            "filled": 0.0,
+            "remaining": amount,
+            "cost": 0.0,
+            "average": None,
+            "fee": {"cost": 0.0, "currency": symbol.partition("/")[2]},
+            "trades": [],
+            "timestamp": int(time.time() * 1000),
+            "info": PAPER_INFO,
+        }
+        order.update(extra)
+        return order
+
+    def _apply_fills(self, order: Dict[str, Any], filled: float, cost: float,
+                     fills: List[Tuple[float, float]], fee_rate: float) -> None:
+        if filled <= 0:
+            return
+        fee = cost * fee_rate
+        self.ledger.settle(order["symbol"], order["side"], filled, cost, fee, order["id"])
+        order["filled"] += filled
+        order["cost"] += cost
+        order["fee"]["cost"] += fee
+        order["average"] = order["cost"] / order["filled"]
+        order["trades"].extend({"price": p, "amount": q} for p, q in fills)
+
+    async def create_order(self, symbol: str, order_type: str, side: str, amount: Optional[float] = None,
+                           price: Optional[float] = None, quote_amount: Optional[float] = None,
+                           client_order_id: Optional[str] = None) -> Dict[str, Any]:
+        """Simulate one order; returns a ccxt-shaped order dict
+
+        Market buys may pass ``quote_amount`` (MEXC quoteOrderQty) instead of
+        a base ``amount``; ``amount`` in the result echoes the request.
+        """
+        cid = client_order_id or new_client_order_id()
+        requested = quote_amount if quote_amount is not None else amount
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+
+        is_buy = side == "buy"
+        limit = price if order_type == "limit" else None
+        book = await self._book(symbol)
+        if book is not None:
+            levels = book["asks"] if is_buy else book["bids"]
+            top = levels[0][0] if levels else None
+        else:
+            top = self._reference_price(symbol, price)
+            levels = [[top, float("inf")]] if top else []
+
+        if not requested or requested <= 0:
+            self.orders_rejected += 1
+            return self._order(cid, symbol, order_type, side, requested, price, "rejected",
+                               info=f"{PAPER_INFO} - rejected: invalid amount")
+        if top is None or not self._affordable(symbol, side, amount, quote_amount, limit or top):
+            self.orders_rejected += 1
+            reason = "no price available" if top is None else "insufficient paper balance"
+            return self._order(cid, symbol, order_type, side, requested, price, "rejected",
+                               info=f"{PAPER_INFO} - rejected: {reason}")
+
+        order = self._order(cid, symbol, order_type, side, requested, price, "open")
+        filled, cost, fills = walk_levels(levels, amount=amount, quote=quote_amount, limit=limit,
+                                          is_buy=is_buy, consume=book is not None)
+        self._apply_fills(order, filled, cost, fills, self.taker_fee)
+
+        if quote_amount is not None:
+            complete = order["cost"] >= quote_amount - 1e-9
+            order["remaining"] = max(0.0, quote_amount - order["cost"])
+        else:
+            complete = order["filled"] >= amount - 1e-12
+            order["remaining"] = max(0.0, amount - order["filled"])
+
+        if complete:
+            order["status"] = "closed"
+            self.orders_filled += 1
+        elif order_type == "limit":
+            self.open_orders[order["id"]] = order  # rest the remainder
+            self._reserve(order)
+        else:
+            # Market order exhausted the visible book: IOC semantics
+            order["status"] = "canceled" if order["filled"] == 0 else "closed"
+            if order["filled"]:
+                self.orders_filled += 1
+        return order
+
+    def _match_resting(self, symbol: str, book: Dict[str, Levels]) -> List[Dict[str, Any]]:
+        updated = []
+        for order_id, order in list(self.open_orders.items()):
+            if order["symbol"] != symbol:
+                continue
+            is_buy = order["side"] == "buy"
+            levels = book["asks"] if is_buy else book["bids"]
+            filled, cost, fills = walk_levels(levels, amount=order["remaining"], limit=order["price"],
+                                              is_buy=is_buy, consume=True)
+            if filled <= 0:
+                continue
+            self._release(order, filled)  # settle below spends the released funds
+            self._apply_fills(order, filled, cost, fills, self.maker_fee)
+            order["remaining"] = max(0.0, order["amount"] - order["filled"])
+            if order["remaining"] <= 1e-12:
+                self._release(order)
+                order["status"] = "closed"
+                self.orders_filled += 1
+                del self.open_orders[order_id]
+            updated.append(order)
+            self._notify(order)
+        return updated
+
+    def cancel_order(self, order_id: str) -> Optional[Dict[str, Any]]:
+        order = self.open_orders.pop(order_id, None)
+        if order is not None:
+            self._release(order)
+            order["status"] = "canceled"
+            self._notify(order)
+        return order
+
+    # ═══════════════════════════════════════════════════════════
+    # LIFECYCLE
+    # ═══════════════════════════════════════════════════════════
+
+    async def run(self) -> None:
+        """Poll books for resting orders until cancelled"""
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            if self.open_orders:
+                try:
+                    await self.poll_resting()
+                except Exception as e:
+                    logger.warning(f"⚠️ PAPER: Resting-order poll failed - {e}")
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "orders_filled": self.orders_filled,
+            "orders_rejected": self.orders_rejected,
+            "open_orders": len(self.open_orders),
+            "ledger": self.ledger.snapshot(),
+        }
@@ -0,0 +1,291 @@
+# ================================================================
+# 📒 POSITION TABLE - Columnar Open-Position Store
+# ================================================================
+# Open positions live in parallel NumPy columns with a
+# symbol -> row index, so per-tick mark-to-market, PnL and peak
+# updates are single vectorized operations across all slots.
+# The table still behaves like the old dict-of-dicts
+# (active_slots[symbol]['entry']) for callers and tests.
+# ================================================================
+
+import time
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, List, Mapping, Optional
+
+import numpy as np
+
+
+class PositionRecord(MutableMapping):
+    """Live dict-like view of one row; writes go straight to the columns"""
+
+    __slots__ = ("_table", "_symbol")
+
+    def __init__(self, table: "PositionTable", symbol: str):
+        self._table = table
+        self._symbol = symbol
+
+    def __getitem__(self, key: str) -> Any:
+        return self._table._get_field(self._symbol, key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._table._set_field(self._symbol, key, value)
+
+    def __delitem__(self, key: str) -> None:
+        extras = self._table._extras.get(self._symbol, {})
+        if key not in extras:
+            raise KeyError(key)
+        del extras[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._table.COLUMNS
+        yield from self._table._extras.get(self._symbol, {})
+
+    def __len__(self) -> int:
+        return len(self._table.COLUMNS) + len(self._table._extras.get(self._symbol, {}))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+    def __repr__(self) -> str:
+        return f"PositionRecord({self._symbol!r}, {self.to_dict()!r})"
+
+
+class PositionTable(MutableMapping):
+    """Columnar table of open positions keyed by symbol
+
+    Rows are packed: deleting a position moves the last row into
+    the freed slot, so ``column(name)`` is always a contiguous view
+    of the live rows in row order (matching ``symbols``).
+    """
+
+    FLOAT_COLUMNS = ("entry", "qty", "time", "peak_profit", "peak_price", "last_price")
+    COLUMNS = FLOAT_COLUMNS + ("slot", "wing")
+
+    def __init__(self, capacity: int = 32):
+        self._capacity = max(1, capacity)
+        self._size = 0
+        self._floats: Dict[str, np.ndarray] = {
+            name: np.zeros(self._capacity, dtype=np.float64) for name in self.FLOAT_COLUMNS
+        }
+        self._slot = np.zeros(self._capacity, dtype=np.int64)
+        self._wing = np.zeros(self._capacity, dtype=np.int16)
+        self._peak_dirty = np.zeros(self._capacity, dtype=bool)
+        self._symbols: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._extras: Dict[str, Dict[str, Any]] = {}
+        self._wing_codes: Dict[str, int] = {}
+        self._wing_names: List[str] = []
+
+    # ═══════════════════════════════════════════════════════════
+    # MAPPING PROTOCOL
+    # ═══════════════════════════════════════════════════════════
+
+    def __getitem__(self, symbol: str) -> PositionRecord:
+        if symbol not in self._index:
+            raise KeyError(symbol)
+        return PositionRecord(self, symbol)
+
+    def __setitem__(self, symbol: str, record: Mapping[str, Any]) -> None:
+        if symbol in self._index:
+            del self[symbol]
+        self._append(symbol)
+        entry = float(record.get("entry", 0.0) or 0.0)
+        row = self._index[symbol]
+        self._floats["time"][row] = time.time()
+        self._floats["peak_price"][row] = entry
+        self._floats["last_price"][row] = entry
+        for key, value in record.items():
+            self._set_field(symbol, key, value)
+
+    def __delitem__(self, symbol: str) -> None:
+        row = self._index.pop(symbol)
+        last = self._size - 1
+        if row != last:
+            moved = self._symbols[last]
+            for col in self._floats.values():
+                col[row] = col[last]
+            self._slot[row] = self._slot[last]
+            self._wing[row] = self._wing[last]
+            self._peak_dirty[row] = self._peak_dirty[last]
+            self._symbols[row] = moved
+            self._index[moved] = row
+        self._symbols.pop()
+        self._extras.pop(symbol, None)
+        self._size = last
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._symbols))
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._index
+
+    def __repr__(self) -> str:
+        return f"PositionTable({self.snapshot()!r})"
+
+    # ═══════════════════════════════════════════════════════════
+    # ROW STORAGE
+    # ═══════════════════════════════════════════════════════════
+
+    def _append(self, symbol: str) -> None:
+        if self._size == self._capacity:
+            self._grow()
+        row = self._size
+        for col in self._floats.values():
+            col[row] = 0.0
+        self._slot[row] = 0
+        self._wing[row] = self._wing_code("")
+        self._peak_dirty[row] = False
+        self._symbols.append(symbol)
+        self._index[symbol] = row
+        self._extras[symbol] = {}
+        self._size += 1
+
+    def _grow(self) -> None:
+        self._capacity *= 2
+        for name, col in self._floats.items():
+            self._floats[name] = np.resize(col, self._capacity)
+        self._slot = np.resize(self._slot, self._capacity)
+        self._wing = np.resize(self._wing, self._capacity)
+        self._peak_dirty = np.resize(self._peak_dirty, self._capacity)
+
+    def _wing_code(self, wing: str) -> int:
+        code = self._wing_codes.get(wing)
+        if code is None:
+            code = len(self._wing_names)
+            self._wing_codes[wing] = code
+            self._wing_names.append(wing)
+        return code
+
+    def _get_field(self, symbol: str, key: str) -> Any:
+        row = self._index[symbol]
+        if key in self._floats:
+            return float(self._floats[key][row])
+        if key == "slot":
+            return int(self._slot[row])
+        if key == "wing":
+            return self._wing_names[self._wing[row]]
+        return self._extras[symbol][key]
+
+    def _set_field(self, symbol: str, key: str, value: Any) -> None:
+        row = self._index[symbol]
+        if key in self._floats:
+            self._floats[key][row] = float(value) if value is not None else np.nan
+        elif key == "slot":
+            self._slot[row] = int(value)
+        elif key == "wing":
+            self._wing[row] = self._wing_code(str(value))
+        else:
+            self._extras[symbol][key] = value
+
+    # ═══════════════════════════════════════════════════════════
+    # COLUMN ACCESS
+    # ═══════════════════════════════════════════════════════════
+
+    @property
+    def symbols(self) -> List[str]:
+        """Symbols in row order (aligned with every column view)"""
+        return self._symbols
+
+    def row_of(self, symbol: str) -> Optional[int]:
+        return self._index.get(symbol)
+
+    def column(self, name: str) -> np.ndarray:
+        """Writable view of a numeric column over the live rows"""
+        if name in self._floats:
+            return self._floats[name][:self._size]
+        if name == "slot":
+            return self._slot[:self._size]
+        raise KeyError(name)
+
+    @property
+    def wing_names(self) -> List[str]:
+        """Wing name per code (index into ``wing_codes()``)"""
+        return self._wing_names
+
+    def wing_codes(self) -> np.ndarray:
+        return self._wing[:self._size]
+
+    def wing_column(self) -> List[str]:
+        return [self._wing_names[c] for c in self._wing[:self._size]]
+
+    def wing_mask(self, wing: str) -> np.ndarray:
+        code = self._wing_codes.get(wing)
+        if code is None:
+            return np.zeros(self._size, dtype=bool)
+        return self._wing[:self._size] == code
+
+    def price_vector(self, tickers: Mapping[str, Mapping[str, Any]]) -> np.ndarray:
+        """Last prices aligned to rows; NaN where the snapshot has none"""
+        prices = np.full(self._size, np.nan)
+        for row, symbol in enumerate(self._symbols):
+            ticker = tickers.get(symbol)
+            if ticker:
+                last = ticker.get("last")
+                if last:
+                    prices[row] = last
+        return prices
+
+    # ═══════════════════════════════════════════════════════════
+    # VECTORIZED UPDATES
+    # ═══════════════════════════════════════════════════════════
+
+    def mark_to_market(self, prices) -> np.ndarray:
+        """Apply a price snapshot to every row and refresh peaks
+
+        Args:
+            prices: Ticker mapping ({symbol: {'last': ...}}) or an array
+                aligned with ``symbols``. NaN/missing prices leave the
+                row's last price untouched.
+
+        Returns:
+            Fractional PnL per row (NaN for rows without an entry price)
+        """
+        if not isinstance(prices, np.ndarray):
+            prices = self.price_vector(prices)
+        last = self.column("last_price")
+        np.copyto(last, prices, where=~np.isnan(prices))
+
+        peak_price = self.column("peak_price")
+        self._peak_dirty[:self._size] |= last > peak_price
+        np.fmax(peak_price, last, out=peak_price)
+
+        pnl = self.pnl_pct()
+        peak_profit = self.column("peak_profit")
+        np.fmax(peak_profit, pnl, out=peak_profit)
+        return pnl
+
+    def drain_dirty_peaks(self) -> Dict[str, float]:
+        """Peak prices raised since the last drain, clearing the flags"""
+        dirty = self._peak_dirty[:self._size]
+        rows = np.flatnonzero(dirty)
+        peaks = self.column("peak_price")
+        result = {self._symbols[row]: float(peaks[row]) for row in rows}
+        dirty[:] = False
+        return result
+
+    def pnl_pct(self) -> np.ndarray:
+        entry = self.column("entry")
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pnl = self.column("last_price") / entry - 1.0
+        pnl[entry <= 0] = np.nan
+        return pnl
+
+    def unrealized_pnl(self) -> np.ndarray:
+        """Quote-currency unrealized PnL per row"""
+        return (self.column("last_price") - self.column("entry")) * self.column("qty")
+
+    def total_unrealized_pnl(self) -> float:
+        return float(np.nansum(self.unrealized_pnl()))
+
+    def market_value(self) -> float:
+        return float(np.nansum(self.column("last_price") * self.column("qty")))
+
+    def held_seconds(self, now: Optional[float] = None) -> np.ndarray:
+        return (now if now is not None else time.time()) - self.column("time")
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Plain dict-of-dicts copy (JSON friendly)"""
+        return {symbol: PositionRecord(self, symbol).to_dict() for symbol in self._symbols}
@@ -0,0 +1,112 @@
+# ================================================================
+# 🛡️ PRE-TRADE RISK - In-Process Order Checks
+# ================================================================
+# Symbol validity, capability gate and the MAX_ORDER_NOTIONAL
+# clamp, priced from the local last-price table. REST
+# fetch_ticker is only used when the local price is missing or
+# older than the staleness bound.
+# ================================================================
+
+from typing import NamedTuple, Optional, Tuple
+
+from backend.core.config import settings
+from backend.core.logging_config import setup_logging
+from backend.services.market_feed import PriceTable
+
+logger = setup_logging("pre_trade_risk")
+
+ORDER_SIDES = frozenset(("buy", "sell"))
+ORDER_TYPES = frozenset(("market", "limit"))
+
+
+class RiskCheck(NamedTuple):
+    symbol: str
+    side: str
+    amount: float
+    price: float
+    notional: float
+    price_source: str  # "local" or "rest"
+
+
+class PreTradeRisk:
+    """Pre-trade risk pipeline used by the OMS before every order
+
+    All checks except the REST fallback are plain dict lookups and
+    arithmetic. Every failed check raises ValueError, which the
+    trade router maps to HTTP 400.
+    """
+
+    def __init__(self, exchange_service, prices: Optional[PriceTable] = None,
+                 max_notional: Optional[float] = None, max_price_age: Optional[float] = None,
+                 capabilities=None, required_capability: str = "basic_trading"):
+        self.exchange_service = exchange_service
+        self.prices = prices if prices is not None else PriceTable()
+        self.max_notional = max_notional
+        self.max_price_age = max_price_age
+        self._capabilities = capabilities
+        self.required_capability = required_capability
+        self.rest_fallbacks = 0
+
+    @property
+    def capabilities(self):
+        if self._capabilities is None:
+            from backend.services.admiral_engine import admiral_engine
+            self._capabilities = admiral_engine
+        return self._capabilities
+
+    # ═══════════════════════════════════════════════════════════
+    # IN-PROCESS CHECKS
+    # ═══════════════════════════════════════════════════════════
+
+    def validate(self, symbol: str, side: str, amount: float, order_type: str = "market") -> None:
+        """Static order checks (no price needed)"""
+        if "/" not in symbol:
+            raise ValueError("Invalid symbol format. Must contain '/' (e.g. BTC/USDT)")
+        if side not in ORDER_SIDES:
+            raise ValueError(f"Invalid order side: {side}")
+        if order_type not in ORDER_TYPES:
+            raise ValueError(f"Invalid order type: {order_type}")
+        if not amount or amount <= 0:
+            raise ValueError("Order amount must be positive")
+
+        exchange = getattr(self.exchange_service, "exchange", None)
+        markets = getattr(exchange, "markets", None)
+        if isinstance(markets, dict) and markets:
+            market = markets.get(symbol)
+            if market is None:
+                raise ValueError(f"Unknown symbol: {symbol}")
+            if market.get("active") is False:
+                raise ValueError(f"Symbol not tradable: {symbol}")
+
+        if not self.capabilities.has_capability(self.required_capability):
+            raise ValueError(f"Order rejected: capability '{self.required_capability}' not enabled")
+
+    def clamp(self, symbol: str, side: str, amount: float, price: float, source: str) -> RiskCheck:
+        """Notional clamp against MAX_ORDER_NOTIONAL"""
+        limit = self.max_notional if self.max_notional is not None else settings.MAX_ORDER_NOTIONAL
+        notional_value = amount * price
+        if notional_value > limit:
+            raise ValueError(f"Order rejected: Notional value {notional_value} exceeds limit {limit}")
+        return RiskCheck(symbol, side, amount, price, notional_value, source)
+
+    # ═══════════════════════════════════════════════════════════
+    # PIPELINE
+    # ═══════════════════════════════════════════════════════════
+
+    async def price_for(self, symbol: str) -> Tuple[float, str]:
+        """(price, source): local table within the staleness bound, else REST"""
+        max_age = self.max_price_age if self.max_price_age is not None else settings.PRICE_MAX_AGE_SECONDS
+        price = self.prices.get(symbol, max_age)
+        if price is not None:
+            return price, "local"
+        self.rest_fallbacks += 1
+        ticker = await self.exchange_service.fetch_ticker(symbol)
+        price = ticker["last"]
+        self.prices.update(symbol, price)
+        return price, "rest"
+
+    async def check(self, symbol: str, side: str, amount: float, order_type: str = "market") -> RiskCheck:
+        """Run every pre-trade check; raises ValueError on rejection"""
+        self.validate(symbol, side, amount, order_type)
+        price, source = await self.price_for(symbol)
+        return self.clamp(symbol, side, amount, price, source)
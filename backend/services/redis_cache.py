@@ -2,11 +2,17 @@
 # 🔴 REDIS CACHE SERVICE - State Persistence Layer
 # ================================================================
 import os
-import json
+import asyncio
 import redis
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, List
 from datetime import datetime, timezone
+from backend.core.config import settings
 from backend.core.logging_config import setup_logging
+from backend.services.cache_codec import decode, decode_value, get_codec
+from backend.services.memory_redis import MemoryRedis, memory_redis
+from backend.services.near_cache import NearCache, NearCacheInvalidator
+from backend.services.redis_health import RedisHealth
+from backend.services.trade_stream import LEGACY_TRADE_LIST, TRADE_STREAM, TradeStream
 
 logger = setup_logging("redis_cache")
 
@@ -15,12 +21,26 @@ class RedisCache:
         self.redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
         self.enabled = os.getenv("REDIS_ENABLED", "True").lower() == "true"
         self.client: Optional[redis.Redis] = None
+        # Binary-safe client for values that may be codec-encoded
+        self.raw_client: Optional[redis.Redis] = None
+        # Embedded store standing in for Redis (None while a real server is used)
+        self.memory: Optional[MemoryRedis] = None
+        self.codec = get_codec(settings.CACHE_CODEC)
+        self.trades = TradeStream()
+        # Background up/down tracking: is_connected() never pings
+        self.health = RedisHealth(ping=self._ping)
+        # Near cache for hot reads; other nodes' writes invalidate it via pub/sub
+        self.near = NearCache(settings.NEAR_CACHE_MAX_ENTRIES, settings.NEAR_CACHE_TTL_SECONDS)
+        self.invalidator = NearCacheInvalidator(
+            self.near, lambda: self.client if self.is_connected() and self.memory is None else None
+        )
         self._connect()
 
     def _connect(self):
         """Initialize Redis connection"""
         if not self.enabled:
             logger.info("📴 REDIS: Disabled via REDIS_ENABLED=False")
+            self._use_memory()
             return
             
         try:
@@ -29,24 +49,58 @@ class RedisCache:
                 decode_responses=True,
                 socket_connect_timeout=5
             )
+            self.raw_client = redis.from_url(self.redis_url, socket_connect_timeout=5)
+        except Exception as e:
+            # Bad REDIS_URL: no store, and no silent switch to a per-process one
+            logger.error(f"❌ REDIS: Invalid connection settings - {e}")
+            self.client = self.raw_client = None
+            self.health.mark_down(e)
+            return
+        try:
             # Test connection
             self.client.ping()
             # Log connection without exposing full URL
             host_info = self.redis_url.split('@')[-1] if '@' in self.redis_url else 'localhost:6379'
             logger.info(f"🔴 REDIS: Connected to {host_info}")
         except Exception as e:
-            logger.warning(f"⚠️ REDIS: Connection failed - {e}. Running in memory-only mode.")
-            self.client = None
+            # Keep the client: the health monitor reconnects with backoff
+            # (the embedded store is only for an explicitly disabled Redis)
+            self.health.mark_down(e)
 
-    def is_connected(self) -> bool:
-        """Check if Redis is available"""
+    def _use_memory(self):
+        """Serve the cache from the embedded store (single-node deployments)"""
+        if not settings.MEMORY_CACHE_ENABLED:
+            return
+        self.memory = memory_redis
+        self.client = memory_redis
+        self.raw_client = None  # values come back exactly as written
+        logger.info("🧠 REDIS: Using the embedded in-process store")
+
+    def _ping(self):
+        """Health probe (runs off the event loop)"""
         if not self.client:
-            return False
+            raise ConnectionError("Redis disabled")
+        return asyncio.to_thread(self.client.ping)
+
+    def _reader(self):
+        """Client for reading encoded values (text client as a fallback)"""
+        return self.raw_client or self.client
+
+    def _on_error(self, error: Exception):
+        """Flip health to DOWN on connection-level failures"""
+        if isinstance(error, (redis.ConnectionError, redis.TimeoutError)):
+            self.health.mark_down(error)
+
+    def is_connected(self) -> bool:
+        """Check if Redis is available (background health state, no PING)"""
+        return self.client is not None and self.health.is_up
+
+    def _publish_invalidation(self, *keys: str):
+        """Drop ``keys`` from the other nodes' near caches"""
         try:
-            self.client.ping()
-            return True
-        except Exception:
-            return False
+            self.invalidator.publish(self.client, *keys)
+        except Exception as e:
+            self._on_error(e)
 
     # ═══════════════════════════════════════════════════════════
     # 💰 PORTFOLIO STATE
@@ -54,38 +108,34 @@ class RedisCache:
     
     def save_portfolio_state(self, state: Dict[str, Any]):
         """Persist portfolio state to Redis"""
-        if not self.client:
+        if not self.is_connected():
             return False
         try:
             state['last_updated'] = datetime.now(timezone.utc).isoformat()
             self.client.hset("vortex:portfolio", mapping={
-                k: json.dumps(v) if isinstance(v, (dict, list)) else str(v)
-                for k, v in state.items()
+                k: self.codec.encode_value(v) for k, v in state.items()
             })
             self.client.expire("vortex:portfolio", 3600)  # 1 hour TTL
             return True
         except Exception as e:
+            self._on_error(e)
             logger.warning(f"⚠️ REDIS: Failed to save portfolio - {e}")
             return False
 
     def get_portfolio_state(self) -> Optional[Dict[str, Any]]:
         """Retrieve portfolio state from Redis"""
-        if not self.client:
+        if not self.is_connected():
             return None
         try:
-            data = self.client.hgetall("vortex:portfolio")
+            data = self._reader().hgetall("vortex:portfolio")
             if not data:
                 return None
-            result = {}
-            for k, v in data.items():
-                try:
-                    # Try to parse as JSON
-                    result[k] = json.loads(v)
-                except (json.JSONDecodeError, ValueError):
-                    # Keep as string if not valid JSON
-                    result[k] = v
-            return result
+            return {
+                k.decode("utf-8") if isinstance(k, bytes) else k: decode_value(v)
+                for k, v in data.items()
+            }
         except Exception as e:
+            self._on_error(e)
             logger.warning(f"⚠️ REDIS: Failed to get portfolio - {e}")
             return None
 
@@ -95,41 +145,74 @@ class RedisCache:
     
     def set_peak_price(self, symbol: str, price: float):
         """Store peak price for trailing stop logic"""
-        if not self.client:
+        if not self.is_connected():
             return
         try:
             self.client.hset("vortex:peaks", symbol, str(price))
+            self.near.put(f"peak:{symbol}", float(price))
+            self._publish_invalidation(f"peak:{symbol}")
         except Exception as e:
+            self._on_error(e)
             logger.warning(f"⚠️ REDIS: Failed to set peak price - {e}")
             pass
 
+    def set_peak_prices(self, peaks: Dict[str, float], cleared: Optional[List[str]] = None) -> bool:
+        """Store many peak prices (and drop closed symbols) in one round trip"""
+        if not self.is_connected() or (not peaks and not cleared):
+            return False
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            if peaks:
+                pipe.hset("vortex:peaks", mapping={k: str(v) for k, v in peaks.items()})
+            if cleared:
+                pipe.hdel("vortex:peaks", *cleared)
+            keys = [f"peak:{sym}" for sym in list(peaks or ()) + list(cleared or ())]
+            self.invalidator.publish(pipe, *keys)
+            pipe.execute()
+            self.near.invalidate(*keys)
+            return True
+        except Exception as e:
+            self._on_error(e)
+            logger.warning(f"⚠️ REDIS: Failed to batch-save peak prices - {e}")
+            return False
+
     def get_peak_price(self, symbol: str) -> Optional[float]:
         """Get stored peak price"""
-        if not self.client:
+        hit, value = self.near.lookup(f"peak:{symbol}")
+        if hit:
+            return value
+        if not self.is_connected():
             return None
         try:
             val = self.client.hget("vortex:peaks", symbol)
-            return float(val) if val else None
-        except Exception:
+            value = float(val) if val else None
+            self.near.put(f"peak:{symbol}", value)
+            return value
+        except Exception as e:
+            self._on_error(e)
             return None
 
     def get_all_peaks(self) -> Dict[str, float]:
         """Get all peak prices"""
-        if not self.client:
+        if not self.is_connected():
             return {}
         try:
             data = self.client.hgetall("vortex:peaks")
             return {k: float(v) for k, v in data.items()}
-        except Exception:
+        except Exception as e:
+            self._on_error(e)
             return {}
 
     def clear_peak(self, symbol: str):
         """Clear peak price after sell"""
-        if not self.client:
+        if not self.is_connected():
             return
         try:
             self.client.hdel("vortex:peaks", symbol)
+            self.near.invalidate(f"peak:{symbol}")
+            self._publish_invalidation(f"peak:{symbol}")
         except Exception as e:
+            self._on_error(e)
             logger.warning(f"⚠️ REDIS: Failed to clear peak - {e}")
             pass
 
@@ -138,49 +221,121 @@ class RedisCache:
     # ═══════════════════════════════════════════════════════════
     
     def log_trade(self, trade: Dict[str, Any]):
-        """Append trade to history list"""
-        if not self.client:
+        """Append trade to the fleet and per-symbol history streams"""
+        if not self.is_connected():
             return
         try:
-            trade['timestamp'] = datetime.now(timezone.utc).isoformat()
-            self.client.lpush("vortex:trades", json.dumps(trade))
-            self.client.ltrim("vortex:trades", 0, 99)  # Keep last 100 trades
+            now = datetime.now(timezone.utc)
+            trade['timestamp'] = now.isoformat()
+            pipe = self.client.pipeline(transaction=False)
+            self.trades.append(pipe, [self.trades.entry(trade, self.codec)], int(now.timestamp() * 1000))
+            pipe.execute()
         except Exception as e:
+            self._on_error(e)
             logger.warning(f"⚠️ REDIS: Failed to log trade - {e}")
             pass
 
     def get_trade_history(self, limit: int = 20) -> list:
-        """Get recent trade history"""
-        if not self.client:
+        """Get recent trade history (newest first)"""
+        if not self.is_connected():
+            return []
+        try:
+            trades = TradeStream.parse(self._reader().xrevrange(TRADE_STREAM, count=limit))
+            if trades:
+                return trades
+            # Nothing streamed yet: serve history written before the upgrade
+            return [decode(t) for t in self._reader().lrange(LEGACY_TRADE_LIST, 0, limit - 1)]
+        except Exception as e:
+            self._on_error(e)
+            return []
+
+    def get_trades(self, start=None, end=None, symbol: Optional[str] = None,
+                   limit: Optional[int] = None) -> list:
+        """Trades between ``start`` and ``end`` (oldest first), optionally for one symbol
+
+        Bounds are datetimes, epoch milliseconds or raw stream IDs. With
+        ``limit`` the most recent ``limit`` trades in the range are returned.
+        """
+        if not self.is_connected():
+            return []
+        try:
+            key, low, high = self.trades.range_args(start, end, symbol)
+            if limit:
+                return TradeStream.parse(reversed(self._reader().xrevrange(key, high, low, count=limit)))
+            return TradeStream.parse(self._reader().xrange(key, low, high))
+        except Exception as e:
+            self._on_error(e)
+            return []
+
+    def create_trade_group(self, group: str, start_id: str = "$") -> bool:
+        """Create a consumer group on the fleet stream (idempotent)"""
+        if not self.is_connected():
+            return False
+        try:
+            self.client.xgroup_create(TRADE_STREAM, group, id=start_id, mkstream=True)
+            return True
+        except Exception as e:
+            if TradeStream.is_busy_group(e):
+                return True
+            self._on_error(e)
+            logger.warning(f"⚠️ REDIS: Failed to create trade group {group} - {e}")
+            return False
+
+    def read_trade_group(self, group: str, consumer: str, count: int = 10,
+                         block_ms: Optional[int] = None) -> list:
+        """Next undelivered trades for ``consumer``; XACK them when processed"""
+        if not self.is_connected():
             return []
         try:
-            trades = self.client.lrange("vortex:trades", 0, limit - 1)
-            return [json.loads(t) for t in trades]
-        except Exception:
+            response = self._reader().xreadgroup(
+                group, consumer, {TRADE_STREAM: ">"}, count=count, block=block_ms
+            )
+            return TradeStream.parse_read(response)
+        except Exception as e:
+            self._on_error(e)
             return []
 
+    def ack_trades(self, group: str, *stream_ids: str) -> int:
+        """Mark delivered trades as processed by ``group``"""
+        if not self.is_connected() or not stream_ids:
+            return 0
+        try:
+            return self.client.xack(TRADE_STREAM, group, *stream_ids)
+        except Exception as e:
+            self._on_error(e)
+            return 0
+
     # ═══════════════════════════════════════════════════════════
     # 🎯 TICKER CACHE (Reduce API calls)
     # ═══════════════════════════════════════════════════════════
     
     def cache_ticker(self, symbol: str, data: Dict[str, Any], ttl: int = 10):
         """Cache ticker data with short TTL"""
-        if not self.client:
+        if not self.is_connected():
             return
         try:
-            self.client.setex(f"ticker:{symbol}", ttl, json.dumps(data))
+            self.client.setex(f"ticker:{symbol}", ttl, self.codec.encode_ticker(data))
+            self.near.put(f"ticker:{symbol}", data, ttl=min(ttl, self.near.ttl))
+            self._publish_invalidation(f"ticker:{symbol}")
         except Exception as e:
+            self._on_error(e)
             logger.warning(f"⚠️ REDIS: Failed to cache ticker - {e}")
             pass
 
     def get_cached_ticker(self, symbol: str) -> Optional[Dict[str, Any]]:
         """Get cached ticker if available"""
-        if not self.client:
+        hit, value = self.near.lookup(f"ticker:{symbol}")
+        if hit:
+            return value
+        if not self.is_connected():
             return None
         try:
-            data = self.client.get(f"ticker:{symbol}")
-            return json.loads(data) if data else None
-        except Exception:
+            data = self._reader().get(f"ticker:{symbol}")
+            value = decode(data) if data else None
+            self.near.put(f"ticker:{symbol}", value)
+            return value
+        except Exception as e:
+            self._on_error(e)
             return None
 
 
@@ -0,0 +1,143 @@
+# ================================================================
+# 💓 REDIS HEALTH - Connection State Machine
+# ================================================================
+# Tracks whether Redis is UP or DOWN in the background so callers
+# read a boolean instead of paying a PING (or a 5s connect
+# timeout) before every operation. Failed operations flip the
+# state to DOWN immediately; the monitor then probes with
+# exponential backoff until Redis answers again.
+# ================================================================
+
+import asyncio
+import inspect
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from backend.core.logging_config import setup_logging
+
+logger = setup_logging("redis_health")
+
+UP = "UP"
+DOWN = "DOWN"
+
+
+class RedisHealth:
+    """Up/down state with backoff reconnection probes
+
+    Args:
+        ping: Sync or async callable that raises when Redis is unreachable
+        interval: Seconds between probes while UP
+        base_backoff / max_backoff: Probe delay bounds while DOWN
+    """
+
+    def __init__(self, ping: Optional[Callable[[], Any]] = None, interval: float = 10.0,
+                 base_backoff: float = 1.0, max_backoff: float = 30.0, up: bool = True):
+        self.ping = ping
+        self.interval = interval
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.state = UP if up else DOWN
+        self.changed_at = time.time()
+        self.last_error: Optional[str] = None
+        self.backoff = base_backoff
+        self.failures = 0
+        self.probes = 0
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._listeners: List[Callable[[str], None]] = []
+
+    def add_listener(self, callback: Callable[[str], None]) -> None:
+        """``callback(state)`` whenever the state flips between UP and DOWN"""
+        self._listeners.append(callback)
+
+    @property
+    def is_up(self) -> bool:
+        return self.state == UP
+
+    def _set(self, state: str) -> None:
+        if state != self.state:
+            self.state = state
+            self.changed_at = time.time()
+            if state == UP:
+                logger.info("🔴 REDIS: Connection restored")
+            else:
+                logger.warning(f"⚠️ REDIS: Connection lost - {self.last_error}. Running in memory-only mode.")
+            for callback in self._listeners:
+                try:
+                    callback(state)
+                except Exception as e:
+                    logger.warning(f"⚠️ REDIS: Health listener failed - {e}")
+
+    def mark_up(self) -> None:
+        self.backoff = self.base_backoff
+        self._set(UP)
+
+    def mark_down(self, error: Any = None) -> None:
+        """Report a failed operation; the monitor starts reconnect probes"""
+        self.failures += 1
+        self.last_error = str(error) if error is not None else self.last_error
+        was_up = self.is_up
+        self._set(DOWN)
+        if was_up and self._wake is not None:
+            self._wake.set()
+
+    # ═══════════════════════════════════════════════════════════
+    # PROBING
+    # ═══════════════════════════════════════════════════════════
+
+    async def probe(self) -> bool:
+        """One health check; updates the state and returns it"""
+        if self.ping is None:
+            return self.is_up
+        self.probes += 1
+        try:
+            result = self.ping()
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            self.last_error = str(e)
+            if self.is_up:
+                self.mark_down(e)
+            else:
+                self.backoff = min(self.backoff * 2, self.max_backoff)
+            return False
+        self.mark_up()
+        return True
+
+    async def run(self) -> None:
+        self._wake = asyncio.Event()
+        while True:
+            delay = self.interval if self.is_up else self.backoff
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+            if self._wake.is_set():
+                # Just went down: wait out the first backoff step before probing
+                self._wake.clear()
+                continue
+            await self.probe()
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self._wake = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "since": self.changed_at,
+            "failures": self.failures,
+            "probes": self.probes,
+            "next_probe_in": self.interval if self.is_up else self.backoff,
+            "last_error": self.last_error,
+        }
@@ -0,0 +1,298 @@
+# ================================================================
+# ✍️ REDIS WRITE-BEHIND - Coalesced, Pipelined State Writes
+# ================================================================
+# Hot paths queue state mutations in memory and return; a
+# background task flushes them as one pipelined round trip when
+# the batch fills up or the flush interval elapses. Hash writes
+# coalesce per key/field (only the latest peak price per symbol
+# goes out); list appends are batched into one LPUSH + LTRIM and
+# trades into XADDs on the history streams. Pub/sub messages go
+# last, so subscribers never hear about a write before it lands.
+# While Redis is DOWN the queue holds its writes (hashes still
+# coalesce); trade and message backlogs are capped, oldest first.
+# ================================================================
+import asyncio
+from typing import Any, Dict, List, Optional, Set, Tuple
+from datetime import datetime, timezone
+
+from backend.core.config import settings
+from backend.core.logging_config import setup_logging
+from backend.services.cache_codec import get_codec
+from backend.services.trade_stream import TradeStream
+
+logger = setup_logging("redis_write_behind")
+
+
+class RedisWriteBehind:
+    """Write-behind queue in front of ``AsyncRedisCache``
+
+    Enqueue methods return False when no event loop is running, so
+    sync callers (scripts, restore-at-import) can fall back to the
+    blocking client.
+
+    Args:
+        cache: ``AsyncRedisCache`` (defaults to the singleton)
+        max_batch: Pending mutations that trigger an immediate flush
+        interval: Maximum seconds a queued write waits
+        max_backlog: Trades / messages kept while Redis is unreachable
+            (the oldest are dropped and counted beyond that)
+    """
+
+    def __init__(self, cache=None, max_batch: int = 100, interval: float = 0.25,
+                 max_backlog: int = 10000):
+        self._cache = cache
+        self.codec = get_codec(settings.CACHE_CODEC)
+        self.stream = TradeStream()
+        self.max_batch = max(1, max_batch)
+        self.interval = interval
+        self.max_backlog = max(1, max_backlog)
+        self._hashes: Dict[str, Dict[str, Any]] = {}
+        self._deletes: Dict[str, Set[str]] = {}
+        self._ttls: Dict[str, int] = {}
+        self._lists: Dict[str, List[Any]] = {}
+        self._caps: Dict[str, int] = {}
+        self._trades: List[Dict[str, Any]] = []
+        self._messages: List[Tuple[str, str]] = []
+        self._task: Optional[asyncio.Task] = None
+        self._loop = None
+        self._wake: Optional[asyncio.Event] = None
+        self.queued = 0
+        self.coalesced = 0
+        self.flushes = 0
+        self.failures = 0
+        self.dropped = 0
+
+    @property
+    def cache(self):
+        if self._cache is None:
+            from backend.services.async_redis_cache import async_redis_cache
+            self._cache = async_redis_cache
+        return self._cache
+
+    @property
+    def pending(self) -> int:
+        return (sum(len(f) for f in self._hashes.values())
+                + sum(len(f) for f in self._deletes.values())
+                + sum(len(v) for v in self._lists.values())
+                + len(self._trades) + len(self._messages))
+
+    @staticmethod
+    def _loop_running() -> bool:
+        try:
+            asyncio.get_running_loop()
+            return True
+        except RuntimeError:
+            return False
+
+    def _cap(self, queue: List[Any]) -> None:
+        """Drop the oldest entries beyond ``max_backlog``"""
+        excess = len(queue) - self.max_backlog
+        if excess > 0:
+            del queue[:excess]
+            self.dropped += excess
+
+    def _kick(self) -> None:
+        """Make sure the flusher runs on this loop; flush now if the batch is full"""
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._loop is not loop:
+            self._loop = loop
+            self._wake = asyncio.Event()
+            self._task = loop.create_task(self.run())
+        if self.pending >= self.max_batch:
+            self._wake.set()
+
+    # ═══════════════════════════════════════════════════════════
+    # ENQUEUE (hot path: dict updates only)
+    # ═══════════════════════════════════════════════════════════
+
+    def hset(self, key: str, mapping: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        if not self._loop_running():
+            return False
+        fields = self._hashes.setdefault(key, {})
+        deletes = self._deletes.get(key)
+        for field, value in mapping.items():
+            if field in fields:
+                self.coalesced += 1
+            fields[field] = value if isinstance(value, (str, bytes)) else str(value)
+            if deletes:
+                deletes.discard(field)
+        if ttl:
+            self._ttls[key] = ttl
+        self.queued += len(mapping)
+        self._kick()
+        return True
+
+    def hdel(self, key: str, *fields: str) -> bool:
+        if not self._loop_running():
+            return False
+        pending = self._hashes.get(key)
+        for field in fields:
+            if pending:
+                pending.pop(field, None)
+            self._deletes.setdefault(key, set()).add(field)
+        self.queued += len(fields)
+        self._kick()
+        return True
+
+    def push(self, key: str, value: str, max_length: int = 100) -> bool:
+        """LPUSH + LTRIM to ``max_length`` (appends are never coalesced)"""
+        if not self._loop_running():
+            return False
+        values = self._lists.setdefault(key, [])
+        values.append(value)
+        if len(values) > max_length:
+            del values[:-max_length]  # older entries would be trimmed anyway
+        self._caps[key] = max_length
+        self.queued += 1
+        self._kick()
+        return True
+
+    def append_trade(self, entry: Dict[str, Any]) -> bool:
+        """XADD a trade-stream entry (appends are never coalesced)"""
+        if not self._loop_running():
+            return False
+        self._trades.append(entry)
+        self._cap(self._trades)
+        self.queued += 1
+        self._kick()
+        return True
+
+    def publish(self, channel: str, message: str) -> bool:
+        """PUBLISH after the rest of the batch (messages are never coalesced)"""
+        if not self._loop_running():
+            return False
+        self._messages.append((channel, message))
+        self._cap(self._messages)
+        self.queued += 1
+        self._kick()
+        return True
+
+    # ═══════════════════════════════════════════════════════════
+    # STATE HELPERS (same keys as RedisCache)
+    # ═══════════════════════════════════════════════════════════
+
+    def save_portfolio_state(self, state: Dict[str, Any]) -> bool:
+        state['last_updated'] = datetime.now(timezone.utc).isoformat()
+        return self.hset("vortex:portfolio", {
+            k: self.codec.encode_value(v) for k, v in state.items()
+        }, ttl=3600)
+
+    def log_trade(self, trade: Dict[str, Any]) -> bool:
+        trade['timestamp'] = datetime.now(timezone.utc).isoformat()
+        return self.append_trade(self.stream.entry(trade, self.codec))
+
+    def set_peak_price(self, symbol: str, price: float) -> bool:
+        return self.hset("vortex:peaks", {symbol: price})
+
+    def clear_peak(self, symbol: str) -> bool:
+        return self.hdel("vortex:peaks", symbol)
+
+    # ═══════════════════════════════════════════════════════════
+    # FLUSH
+    # ═══════════════════════════════════════════════════════════
+
+    def _requeue(self, hashes, deletes, ttls, lists, trades, messages=()) -> None:
+        """Put a failed batch back without clobbering newer writes"""
+        for key, fields in hashes.items():
+            pending = self._hashes.setdefault(key, {})
+            newer_deletes = self._deletes.get(key, ())
+            for field, value in fields.items():
+                if field not in newer_deletes:
+                    pending.setdefault(field, value)
+        for key, fields in deletes.items():
+            pending = self._hashes.get(key, {})
+            self._deletes.setdefault(key, set()).update(f for f in fields if f not in pending)
+        for key, ttl in ttls.items():
+            self._ttls.setdefault(key, ttl)
+        for key, values in lists.items():
+            merged = values + self._lists.get(key, [])
+            self._lists[key] = merged[-self._caps.get(key, len(merged)):]
+        self._trades[:0] = trades
+        self._messages[:0] = messages
+        self._cap(self._trades)
+        self._cap(self._messages)
+
+    async def flush(self) -> int:
+        """Send everything queued as one pipeline; returns mutations written"""
+        count = self.pending
+        if not count:
+            return 0
+        cache = self.cache
+        health = getattr(cache, "health", None)
+        if health is not None and not health.is_up and not cache.use_memory:
+            return 0  # Redis DOWN: hold the batch until the health monitor sees it back
+        client = cache._redis()
+        if client is None:
+            return 0  # no store to write to: keep the batch queued
+        hashes, self._hashes = self._hashes, {}
+        deletes, self._deletes = self._deletes, {}
+        ttls, self._ttls = self._ttls, {}
+        lists, self._lists = self._lists, {}
+        trades, self._trades = self._trades, []
+        messages, self._messages = self._messages, []
+
+        pipe = client.pipeline(transaction=False)
+        for key in set(hashes) | set(deletes):
+            if deletes.get(key):
+                pipe.hdel(key, *deletes[key])
+            if hashes.get(key):
+                pipe.hset(key, mapping=hashes[key])
+            if key in ttls:
+                pipe.expire(key, ttls[key])
+        for key, values in lists.items():
+            pipe.lpush(key, *values)
+            pipe.ltrim(key, 0, self._caps[key] - 1)
+        if trades:
+            self.stream.append(pipe, trades, int(datetime.now(timezone.utc).timestamp() * 1000))
+        for channel, message in messages:
+            pipe.publish(channel, message)
+        try:
+            await pipe.execute()
+        except asyncio.CancelledError:
+            self._requeue(hashes, deletes, ttls, lists, trades, messages)
+            raise
+        except Exception as e:
+            self.failures += 1
+            logger.warning(f"⚠️ REDIS: Write-behind flush of {count} failed - {e}")
+            self._requeue(hashes, deletes, ttls, lists, trades, messages)
+            return 0
+        self.flushes += 1
+        return count
+
+    async def run(self) -> None:
+        wake = self._wake
+        try:
+            while True:
+                try:
+                    await asyncio.wait_for(wake.wait(), self.interval)
+                except asyncio.TimeoutError:
+                    pass
+                wake.clear()
+                await self.flush()
+        except asyncio.CancelledError:
+            await self.flush()
+            raise
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "pending": self.pending,
+            "queued": self.queued,
+            "coalesced": self.coalesced,
+            "flushes": self.flushes,
+            "failures": self.failures,
+            "dropped": self.dropped,
+        }
+
+
+# Singleton instance
+redis_write_behind = RedisWriteBehind()
@@ -0,0 +1,156 @@
+# ================================================================
+# 📉 RISK WINDOW - Streaming Rolling-Window Posture Statistics
+# ================================================================
+# Maintains drawdown, equity volatility and slot utilisation over
+# the last N AEGIS snapshots without rescanning them:
+#   volatility   running sum / sum of squares of equity returns
+#   drawdown     monotonic deque holding the rolling equity peak
+#   utilisation  running slot sum + monotonic deque for the peak
+# Every update is O(1) (the deques are amortised O(1)); the running
+# sums are rebuilt once per window to shed float drift.
+# ================================================================
+
+import math
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+
+class _RollingMax:
+    """Sliding-window maximum over sequence numbers (monotonic deque)"""
+
+    __slots__ = ("_items",)
+
+    def __init__(self):
+        self._items: Deque[Tuple[int, float]] = deque()
+
+    def push(self, seq: int, value: float) -> None:
+        items = self._items
+        while items and items[-1][1] <= value:
+            items.pop()
+        items.append((seq, value))
+
+    def expire(self, oldest_seq: int) -> None:
+        items = self._items
+        while items and items[0][0] < oldest_seq:
+            items.popleft()
+
+    @property
+    def value(self) -> Optional[float]:
+        return self._items[0][1] if self._items else None
+
+
+class RollingRiskStats:
+    """Incremental risk statistics over the last ``window`` snapshots
+
+    Args:
+        window: Snapshots covered by the statistics
+        slot_capacity: Slots treated as 100% utilisation
+    """
+
+    def __init__(self, window: int = 3600, slot_capacity: int = 12):
+        self.window = max(2, window)
+        self.slot_capacity = max(1, slot_capacity)
+        # (equity, return vs previous snapshot in the window, slots)
+        self._samples: Deque[Tuple[float, Optional[float], float]] = deque()
+        self._seq = 0
+        self._ret_sum = 0.0
+        self._ret_sq = 0.0
+        self._ret_n = 0
+        self._slot_sum = 0.0
+        self._peak_equity = _RollingMax()
+        self._peak_slots = _RollingMax()
+        self.max_drawdown = 0.0
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def push(self, equity: float, active_slots: float) -> None:
+        """Fold one snapshot in (and the oldest one out once the window is full)"""
+        if len(self._samples) == self.window:
+            _, _, old_slots = self._samples.popleft()
+            self._slot_sum -= old_slots
+            # The new oldest snapshot's return pointed at the evicted one
+            first_equity, first_ret, first_slots = self._samples[0]
+            if first_ret is not None:
+                self._ret_sum -= first_ret
+                self._ret_sq -= first_ret * first_ret
+                self._ret_n -= 1
+                self._samples[0] = (first_equity, None, first_slots)
+
+        ret = None
+        if self._samples:
+            prev = self._samples[-1][0]
+            if prev > 0:
+                ret = equity / prev - 1.0
+                self._ret_sum += ret
+                self._ret_sq += ret * ret
+                self._ret_n += 1
+        self._samples.append((equity, ret, active_slots))
+        self._slot_sum += active_slots
+
+        seq = self._seq
+        self._seq += 1
+        if self._seq % self.window == 0:
+            self._resync()
+        oldest = seq - len(self._samples) + 1
+        self._peak_equity.push(seq, equity)
+        self._peak_equity.expire(oldest)
+        self._peak_slots.push(seq, active_slots)
+        self._peak_slots.expire(oldest)
+        self.max_drawdown = max(self.max_drawdown, self.drawdown)
+
+    def _resync(self) -> None:
+        """Recompute the running sums exactly (amortised O(1) per push)"""
+        returns = [r for _, r, _ in self._samples if r is not None]
+        self._ret_sum = math.fsum(returns)
+        self._ret_sq = math.fsum(r * r for r in returns)
+        self._ret_n = len(returns)
+        self._slot_sum = math.fsum(s for _, _, s in self._samples)
+
+    @property
+    def equity(self) -> Optional[float]:
+        return self._samples[-1][0] if self._samples else None
+
+    @property
+    def peak_equity(self) -> Optional[float]:
+        return self._peak_equity.value
+
+    @property
+    def drawdown(self) -> float:
+        """Fractional drop of the latest equity from the rolling peak"""
+        peak = self._peak_equity.value
+        if not peak or peak <= 0:
+            return 0.0
+        return max(0.0, 1.0 - self._samples[-1][0] / peak)
+
+    @property
+    def volatility(self) -> float:
+        """Sample standard deviation of snapshot-to-snapshot equity returns"""
+        n = self._ret_n
+        if n < 2:
+            return 0.0
+        variance = (self._ret_sq - self._ret_sum * self._ret_sum / n) / (n - 1)
+        return math.sqrt(variance) if variance > 0 else 0.0  # float drift can dip below 0
+
+    @property
+    def mean_slots(self) -> float:
+        return self._slot_sum / len(self._samples) if self._samples else 0.0
+
+    @property
+    def utilisation(self) -> float:
+        """Mean active slots over the window as a fraction of capacity"""
+        return self.mean_slots / self.slot_capacity
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "samples": len(self._samples),
+            "window": self.window,
+            "equity": self.equity,
+            "peak_equity": self.peak_equity,
+            "drawdown": round(self.drawdown, 6),
+            "max_drawdown": round(self.max_drawdown, 6),
+            "volatility": round(self.volatility, 6),
+            "mean_slots": round(self.mean_slots, 3),
+            "peak_slots": self._peak_slots.value,
+            "utilisation": round(self.utilisation, 4),
+        }
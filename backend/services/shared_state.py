@@ -0,0 +1,238 @@
+# ================================================================
+# 🔗 SHARED STATE - Cross-Worker State for the Cockpit Singletons
+# ================================================================
+# T.I.A., the Admiral authorization and the garage bay live in
+# module singletons, one copy per uvicorn worker. Each owner writes
+# its state to a Redis hash and announces it on a pub/sub channel
+# together with the new fields; the other workers apply the fields
+# to their own singleton. On startup every worker catches up from
+# the hashes, so a worker that was down misses nothing. Changes
+# arrive on the pub/sub thread and are applied on the server loop,
+# like every other mutation of those singletons. If Redis is not
+# reachable at startup (or the listener dies with the connection),
+# the listener is (re)started and the hashes re-read as soon as the
+# health monitor sees Redis come back.
+# ================================================================
+
+import asyncio
+import json
+import os
+from typing import Any, Callable, Dict, Optional
+
+from backend.core.logging_config import setup_logging
+from backend.services.redis_cache import redis_cache
+from backend.services.redis_health import UP
+from backend.services.redis_write_behind import redis_write_behind
+
+logger = setup_logging("shared_state")
+
+STATE_CHANNEL = "cockpit:state:changed"
+
+
+class SharedState:
+    """Redis hashes + change notifications for per-worker singletons
+
+    Messages are ``"<node id>|<key>|<json fields>"``; a node ignores
+    its own messages because it already holds the state. With the
+    embedded store (single process) there is nobody to notify, so
+    writes stay local and the listener is not started.
+
+    Args:
+        cache: ``RedisCache`` (sync client, connection state)
+        channel: Pub/sub channel shared by all workers
+    """
+
+    def __init__(self, cache, channel: str = STATE_CHANNEL):
+        self.cache = cache
+        self.channel = channel
+        self.node_id = f"{os.getpid()}-{os.urandom(3).hex()}"
+        self._handlers: Dict[str, Callable[[Dict[str, str]], None]] = {}
+        self._pubsub = None
+        self._thread = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._started = False
+        self._watching = False
+        self.published = 0
+        self.received = 0
+        self.failures = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _shared_client(self):
+        """Sync client when a real Redis is shared by the workers"""
+        cache = self.cache
+        return cache.client if cache.is_connected() and cache.memory is None else None
+
+    def register(self, key: str, apply: Callable[[Dict[str, str]], None]) -> None:
+        """Call ``apply(fields)`` whenever another worker writes ``key``"""
+        self._handlers[key] = apply
+
+    # ═══════════════════════════════════════════════════════════
+    # READ / WRITE
+    # ═══════════════════════════════════════════════════════════
+
+    def read(self, key: str) -> Dict[str, str]:
+        if not self.cache.is_connected():
+            return {}
+        try:
+            return self.cache.client.hgetall(key) or {}
+        except Exception as e:
+            self.cache._on_error(e)
+            logger.warning(f"⚠️ SHARED STATE: Failed to read {key} - {e}")
+            return {}
+
+    def write(self, key: str, fields: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """Store ``fields`` in ``key`` and notify the other workers
+
+        Inside the server loop the write and the notification are
+        queued on the write-behind pipeline (the notification goes out
+        after the write); outside it they are sent directly.
+        """
+        if not self.cache.is_connected():
+            return False
+        fields = {k: v if isinstance(v, str) else str(v) for k, v in fields.items()}
+        notify = self.cache.memory is None
+        message = f"{self.node_id}|{key}|{json.dumps(fields)}"
+        if redis_write_behind.hset(key, fields, ttl=ttl):
+            if notify and redis_write_behind.publish(self.channel, message):
+                self.published += 1
+            return True
+        try:
+            pipe = self.cache.client.pipeline(transaction=False)
+            pipe.hset(key, mapping=fields)
+            if ttl:
+                pipe.expire(key, ttl)
+            if notify:
+                pipe.publish(self.channel, message)
+            pipe.execute()
+        except Exception as e:
+            self.cache._on_error(e)
+            self.failures += 1
+            logger.warning(f"⚠️ SHARED STATE: Failed to write {key} - {e}")
+            return False
+        if notify:
+            self.published += 1
+        return True
+
+    # ═══════════════════════════════════════════════════════════
+    # NOTIFICATIONS
+    # ═══════════════════════════════════════════════════════════
+
+    def _apply(self, key: str, fields: Dict[str, str]) -> None:
+        apply = self._handlers.get(key)
+        if apply is None or not fields:
+            return
+        try:
+            apply(fields)
+        except Exception as e:
+            logger.warning(f"⚠️ SHARED STATE: Applying {key} failed - {e}")
+
+    def _dispatch(self, key: str, fields: Dict[str, str]) -> None:
+        """Run ``_apply`` on the server loop (messages arrive on the listener thread)"""
+        loop = self._loop
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if loop is not None and running is not loop and not loop.is_closed():
+            loop.call_soon_threadsafe(self._apply, key, fields)
+        else:
+            self._apply(key, fields)
+
+    def handle(self, message: Dict[str, Any]) -> None:
+        data = message.get("data")
+        if not isinstance(data, str) or data.count("|") < 2:
+            return
+        node_id, key, payload = data.split("|", 2)
+        if node_id == self.node_id:
+            return
+        try:
+            fields = json.loads(payload)
+        except ValueError:
+            return
+        self.received += 1
+        self._dispatch(key, fields)
+
+    def sync(self) -> None:
+        """Catch up on every registered key from Redis"""
+        for key in list(self._handlers):
+            self._apply(key, self.read(key))
+
+    def start(self) -> bool:
+        """Catch up, then listen for other workers' changes (real Redis only)
+
+        Returns False when sync is inactive. With a real Redis that is
+        down, it starts by itself once the health monitor sees Redis UP.
+        """
+        try:
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None  # no loop (scripts): apply on the listener thread
+        self._started = True
+        health = getattr(self.cache, "health", None)
+        if health is not None and not self._watching:
+            health.add_listener(self._on_health)
+            self._watching = True
+        if self._listen():
+            return True
+        if self.cache.memory is None:
+            logger.warning("⚠️ SHARED STATE: Redis unreachable - cross-worker sync inactive until it is back")
+        return False
+
+    def _on_health(self, state: str) -> None:
+        """Redis came back: re-read the hashes and make sure the listener runs"""
+        if state != UP or not self._started:
+            return
+        if self.running:
+            self.sync()  # changes published while Redis was down were missed
+        elif self._listen():
+            logger.info("🔗 SHARED STATE: Cross-worker sync resumed")
+
+    def _listen(self) -> bool:
+        if self.running:
+            return True
+        self._close_listener()
+        client = self._shared_client()
+        if client is None:
+            return False
+        self.sync()
+        try:
+            self._pubsub = client.pubsub(ignore_subscribe_messages=True)
+            self._pubsub.subscribe(**{self.channel: self.handle})
+            self._thread = self._pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+            logger.info(f"🔗 SHARED STATE: Listening for changes on {self.channel}")
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ SHARED STATE: Change listener failed - {e}")
+            self._pubsub = self._thread = None
+            return False
+
+    def _close_listener(self) -> None:
+        if self._thread is not None:
+            try:
+                self._thread.stop()
+                self._pubsub.close()
+            except Exception:
+                pass
+        self._pubsub = self._thread = None
+
+    def stop(self) -> None:
+        self._started = False
+        self._close_listener()
+        self._loop = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "node_id": self.node_id,
+            "listening": self.running,
+            "keys": sorted(self._handlers),
+            "published": self.published,
+            "received": self.received,
+            "failures": self.failures,
+        }
+
+
+# Singleton instance
+shared_state = SharedState(redis_cache)
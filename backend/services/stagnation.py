@@ -0,0 +1,186 @@
+# ================================================================
+# ⏳ STAGNATION MONITOR - Streaming Stagnation-Liquidation Filter
+# ================================================================
+# Keeps per-position hold time and a rolling recovery-momentum
+# window, updated in O(1) per price tick, and emits liquidation
+# candidates as events instead of rescanning candles on demand.
+# Rules match fleet_manifest.json "stagnation_filter".
+# ================================================================
+
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional, Tuple
+
+from backend.core.logging_config import setup_logging
+
+logger = setup_logging("stagnation")
+
+
+class StagnationEvent(NamedTuple):
+    symbol: str
+    reason: str
+    pnl: float
+    hold_hours: float
+
+
+class _PositionState:
+    """Rolling state for one tracked position"""
+
+    __slots__ = ("entry_price", "entry_time", "samples", "last_price", "flagged")
+
+    def __init__(self, entry_price: float, entry_time: float):
+        self.entry_price = entry_price
+        self.entry_time = entry_time
+        # (bucket, price) pairs; the head is the newest sample at or
+        # before the start of the momentum window.
+        self.samples: Deque[Tuple[int, float]] = deque()
+        self.last_price: Optional[float] = None
+        self.flagged = False
+
+
+class StagnationMonitor:
+    """Incremental stagnation filter over all open positions
+
+    Prices are sampled into fixed-width buckets (one minute by
+    default). Each update appends or overwrites the newest bucket
+    and drops samples that fell out of the window, which is
+    amortised O(1); momentum is then last / window-start - 1.
+
+    A candidate is emitted once when its rule starts firing and
+    re-armed if the position leaves the stagnant state.
+    """
+
+    def __init__(self, min_hold_hours: float = 4.0, loss_threshold: float = -0.008,
+                 breakeven_min: float = -0.003, breakeven_max: float = 0.003,
+                 breakeven_hours: float = 8.0, window_minutes: float = 30,
+                 bucket_seconds: float = 60.0):
+        self.min_hold_hours = min_hold_hours
+        self.loss_threshold = loss_threshold
+        self.breakeven_min = breakeven_min
+        self.breakeven_max = breakeven_max
+        self.breakeven_hours = breakeven_hours
+        self.bucket_seconds = bucket_seconds
+        self.window_buckets = max(1, int(round(window_minutes * 60 / bucket_seconds)))
+        self._positions: Dict[str, _PositionState] = {}
+        self._listeners: List[Callable[[StagnationEvent], None]] = []
+
+    # ═══════════════════════════════════════════════════════════
+    # SUBSCRIPTIONS / TRACKING
+    # ═══════════════════════════════════════════════════════════
+
+    def add_listener(self, callback: Callable[[StagnationEvent], None]) -> None:
+        self._listeners.append(callback)
+
+    def track(self, symbol: str, entry_price: float, entry_time: float) -> None:
+        self._positions[symbol] = _PositionState(entry_price, entry_time)
+
+    def untrack(self, symbol: str) -> None:
+        self._positions.pop(symbol, None)
+
+    def rearm(self, symbol: str) -> None:
+        """Allow a candidate to be emitted again (e.g. after a failed exit)"""
+        state = self._positions.get(symbol)
+        if state is not None:
+            state.flagged = False
+
+    def is_tracked(self, symbol: str) -> bool:
+        return symbol in self._positions
+
+    def sync(self, positions) -> None:
+        """Align tracking with an open-position mapping (symbol -> record)"""
+        for symbol in positions:
+            if symbol not in self._positions:
+                pos = positions[symbol]
+                self.track(symbol, pos["entry"], pos["time"])
+        if len(self._positions) != len(positions):
+            for symbol in [s for s in self._positions if s not in positions]:
+                self.untrack(symbol)
+
+    # ═══════════════════════════════════════════════════════════
+    # STREAMING UPDATES
+    # ═══════════════════════════════════════════════════════════
+
+    def _sample(self, state: _PositionState, price: float, now: float) -> None:
+        bucket = int(now // self.bucket_seconds)
+        samples = state.samples
+        if samples and samples[-1][0] == bucket:
+            samples[-1] = (bucket, price)
+        else:
+            samples.append((bucket, price))
+        start = bucket - self.window_buckets
+        while len(samples) > 1 and samples[1][0] <= start:
+            samples.popleft()
+        state.last_price = price
+
+    def momentum(self, symbol: str, now: Optional[float] = None) -> Optional[float]:
+        """Price change over the recovery window, None until a full window is seen"""
+        state = self._positions.get(symbol)
+        if state is None or not state.samples or state.last_price is None:
+            return None
+        now = now if now is not None else time.time()
+        head_bucket, head_price = state.samples[0]
+        if head_bucket > int(now // self.bucket_seconds) - self.window_buckets or not head_price:
+            return None
+        return state.last_price / head_price - 1.0
+
+    def evaluate(self, symbol: str, price: float, now: Optional[float] = None) -> Tuple[bool, str]:
+        """Apply the stagnation rules using streaming momentum"""
+        state = self._positions[symbol]
+        now = now if now is not None else time.time()
+        hold_hours = (now - state.entry_time) / 3600
+        if hold_hours < self.min_hold_hours:
+            return False, f"Held {hold_hours:.1f}h (< {self.min_hold_hours}h minimum)"
+        if not state.entry_price:
+            return False, "No entry price"
+
+        pnl = price / state.entry_price - 1.0
+        if pnl <= self.loss_threshold:
+            momentum = self.momentum(symbol, now)
+            if momentum is None:
+                return False, f"Loss {pnl:+.2%} but momentum window not filled - holding"
+            if momentum > 0:
+                return False, f"Loss {pnl:+.2%} but showing recovery - holding"
+            return True, f"Stagnation: Loss {pnl:+.2%} with no recovery ({hold_hours:.1f}h)"
+
+        if self.breakeven_min <= pnl <= self.breakeven_max and hold_hours >= self.breakeven_hours:
+            return True, f"Stagnation: Sideways {pnl:+.2%} for {hold_hours:.1f}h"
+
+        return False, f"Position developing ({pnl:+.2%}, {hold_hours:.1f}h)"
+
+    def on_price(self, symbol: str, price: float, now: Optional[float] = None) -> Optional[StagnationEvent]:
+        """Feed one price for a tracked position; emits an event on a new candidate"""
+        state = self._positions.get(symbol)
+        if state is None or not price:
+            return None
+        now = now if now is not None else time.time()
+        self._sample(state, price, now)
+
+        liquidate, reason = self.evaluate(symbol, price, now)
+        if not liquidate:
+            state.flagged = False
+            return None
+        if state.flagged:
+            return None
+        state.flagged = True
+        event = StagnationEvent(
+            symbol, reason, price / state.entry_price - 1.0, (now - state.entry_time) / 3600
+        )
+        for callback in self._listeners:
+            try:
+                callback(event)
+            except Exception as e:
+                logger.warning(f"⚠️ STAGNATION: Listener failed - {e}")
+        return event
+
+    def on_tick(self, tickers: Dict[str, Dict[str, Any]], now: Optional[float] = None) -> List[StagnationEvent]:
+        """Feed a ticker snapshot to every tracked position"""
+        now = now if now is not None else time.time()
+        events = []
+        for symbol in list(self._positions):
+            ticker = tickers.get(symbol)
+            if not ticker:
+                continue
+            event = self.on_price(symbol, ticker.get("last"), now)
+            if event is not None:
+                events.append(event)
+        return events
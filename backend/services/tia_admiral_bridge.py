@@ -5,11 +5,15 @@
 # The bridge controls the flow of permissions based on risk analysis
 # ================================================================
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone
 from backend.services.tia_agent import tia_agent, RiskLevel
 from backend.services.admiral_engine import admiral_engine
+from backend.services.cockpit_feed import cockpit_feed
 from backend.services.redis_cache import redis_cache
+from backend.services.redis_write_behind import redis_write_behind
+from backend.services.shared_state import shared_state
+from backend.services.status_snapshot import StatusSnapshot
 from backend.core.logging_config import setup_logging
 
 logger = setup_logging("tia_admiral_bridge")
@@ -35,6 +39,7 @@ class TIAAdmiralBridge:
     
     def __init__(self):
         self.authorization_history = []
+        self._authorization: Optional[StatusSnapshot] = None
         self._restore_state()
         logger.info("🌉 T.I.A.-ADMIRAL BRIDGE: Initialized")
     
@@ -48,34 +53,35 @@ class TIAAdmiralBridge:
             state = redis_cache.client.hgetall("bridge:authorization")
             if state and state.get("premium_authorized") == "true":
                 # Restore authorization if it was active
-                admiral_engine.premium_authorized = True
-                admiral_engine.authorization_timestamp = state.get("timestamp")
-                admiral_engine.authorized_by = state.get("authorized_by", "T.I.A.")
-                
-                # Re-enable premium capabilities
-                for cap in admiral_engine.capabilities.values():
-                    if cap.type.value == "PREMIUM":
-                        cap.enabled = True
-                
+                self.apply_shared_state(state)
                 logger.info("🔴 REDIS: Restored Admiral premium authorization")
         except Exception as e:
             logger.warning(f"⚠️ Failed to restore bridge state: {e}")
     
+    def apply_shared_state(self, state: Dict[str, str]) -> None:
+        """Mirror a grant or revoke made by another worker onto this Admiral"""
+        if state.get("premium_authorized") == "true":
+            if (not admiral_engine.premium_authorized
+                    or admiral_engine.authorization_timestamp != (state.get("timestamp") or None)):
+                admiral_engine.restore_premium_access(
+                    state.get("authorized_by") or "T.I.A.", state.get("timestamp") or None
+                )
+        elif admiral_engine.premium_authorized:
+            admiral_engine.revoke_premium_access()
+    
     def _persist_state(self):
         """Persist bridge state to Redis"""
         if not redis_cache.is_connected():
             return
             
-        try:
-            redis_cache.client.hset("bridge:authorization", mapping={
-                "premium_authorized": "true" if admiral_engine.premium_authorized else "false",
-                "timestamp": admiral_engine.authorization_timestamp or "",
-                "authorized_by": admiral_engine.authorized_by or "",
-                "updated_at": datetime.now(timezone.utc).isoformat()
-            })
-            redis_cache.client.expire("bridge:authorization", 3600)  # 1 hour TTL
-        except Exception as e:
-            logger.warning(f"⚠️ Failed to persist bridge state: {e}")
+        mapping = {
+            "premium_authorized": "true" if admiral_engine.premium_authorized else "false",
+            "timestamp": admiral_engine.authorization_timestamp or "",
+            "authorized_by": admiral_engine.authorized_by or "",
+            "updated_at": datetime.now(timezone.utc).isoformat()
+        }
+        # Shared with the other workers (1 hour TTL)
+        shared_state.write("bridge:authorization", mapping, ttl=3600)
     
     def _log_authorization_event(self, event_type: str, details: Dict[str, Any]):
         """Log authorization events to Redis and memory
@@ -94,15 +100,18 @@ class TIAAdmiralBridge:
         self.authorization_history.append(event)
         if len(self.authorization_history) > 50:
             self.authorization_history.pop(0)
+        cockpit_feed.publish("authorization", event)
         
         # Log to Redis
         if redis_cache.is_connected():
-            try:
-                import json
-                redis_cache.client.lpush("bridge:events", json.dumps(event))
-                redis_cache.client.ltrim("bridge:events", 0, 99)  # Keep last 100 events
-            except Exception as e:
-                logger.warning(f"⚠️ Failed to log event to Redis: {e}")
+            import json
+            payload = json.dumps(event)
+            if not redis_write_behind.push("bridge:events", payload, 100):
+                try:
+                    redis_cache.client.lpush("bridge:events", payload)
+                    redis_cache.client.ltrim("bridge:events", 0, 99)  # Keep last 100 events
+                except Exception as e:
+                    logger.warning(f"⚠️ Failed to log event to Redis: {e}")
         
         logger.info(f"📝 BRIDGE EVENT: {event_type} - {details}")
     
@@ -198,6 +207,17 @@ class TIAAdmiralBridge:
         Returns:
             Status dict with authorization state and details
         """
+        return dict(self.authorization_snapshot().data)
+    
+    def authorization_snapshot(self) -> StatusSnapshot:
+        """Authorization status, rebuilt only when T.I.A. or Admiral publish a change"""
+        version = (id(tia_agent), tia_agent.status_publisher.version,
+                   id(admiral_engine), admiral_engine.status_publisher.version)
+        if self._authorization is None or self._authorization.version != version:
+            self._authorization = StatusSnapshot(version, self._build_authorization_status())
+        return self._authorization
+    
+    def _build_authorization_status(self) -> Dict[str, Any]:
         tia_status = tia_agent.get_status()
         admiral_status = admiral_engine.get_capability_summary()
         
@@ -244,3 +264,4 @@ class TIAAdmiralBridge:
 
 # Singleton instance
 tia_admiral_bridge = TIAAdmiralBridge()
+shared_state.register("bridge:authorization", tia_admiral_bridge.apply_shared_state)
@@ -5,10 +5,16 @@
 # Pattern adapted from perimeter-scout architecture
 # ================================================================
 
+from collections import deque
+import time
 from enum import Enum
-from typing import Dict, Optional, Any
+from typing import Deque, Dict, Iterable, Optional, Any
 from datetime import datetime, timezone
+from backend.core.config import settings
 from backend.services.redis_cache import redis_cache
+from backend.services.shared_state import shared_state
+from backend.services.risk_window import RollingRiskStats
+from backend.services.status_snapshot import StatusPublisher
 from backend.core.logging_config import setup_logging
 
 logger = setup_logging("tia_agent")
@@ -28,11 +34,31 @@ class TIAAgent:
     to premium features based on system posture.
     """
     
-    def __init__(self):
+    # Rolling-window thresholds (applied once WINDOW_MIN_SAMPLES are buffered)
+    WINDOW_MIN_SAMPLES = 5
+    DRAWDOWN_HIGH = 0.15
+    DRAWDOWN_MEDIUM = 0.08
+    VOLATILITY_HIGH = 0.05
+    VOLATILITY_MEDIUM = 0.02
+    UTILISATION_HIGH = 0.9
+    # Re-persist an unchanged summary before the 1h tia:state TTL runs out
+    PERSIST_REFRESH_SECONDS = 1800
+
+    def __init__(self, window: Optional[int] = None):
         self.current_risk = RiskLevel.LOW
         self.confidence = 1.0  # 0.0 to 1.0
         self.last_assessment = None
-        self.aegis_snapshots = []
+        window = window or settings.TIA_WINDOW_SIZE
+        # Ring buffer: appending past capacity drops the oldest in O(1)
+        self.aegis_snapshots: Deque[Dict[str, Any]] = deque(maxlen=window)
+        self.window_stats = RollingRiskStats(window, settings.TIA_SLOT_CAPACITY)
+        # Bumped per consumed snapshot batch; the summary is memoized per generation
+        self.generation = 0
+        self._summary: Optional[Dict[str, Any]] = None
+        self._summary_generation = -1
+        self._persisted_at = 0.0
+        # Cockpit status, rebuilt only when an assessment changes it
+        self.status_publisher = StatusPublisher(self._build_status)
         
         # Restore state from Redis
         self._restore_state()
@@ -47,28 +73,42 @@ class TIAAgent:
         try:
             state = redis_cache.client.hgetall("tia:state")
             if state:
-                self.current_risk = RiskLevel(state.get("risk_level", "LOW"))
-                self.confidence = float(state.get("confidence", 1.0))
-                self.last_assessment = state.get("last_assessment")
+                self.apply_shared_state(state)
                 logger.info(f"🔴 REDIS: Restored T.I.A. state - Risk: {self.current_risk}")
         except Exception as e:
             logger.warning(f"⚠️ Failed to restore T.I.A. state: {e}")
     
+    def apply_shared_state(self, state: Dict[str, str]) -> None:
+        """Adopt an assessment written by another worker (older ones are ignored)
+        
+        The adopted verdict becomes the memoized summary for the current
+        generation, so every worker reports the same risk until one of
+        them assesses new snapshots.
+        """
+        assessed = state.get("last_assessment") or None
+        if assessed and self.last_assessment and assessed <= self.last_assessment:
+            return
+        self.current_risk = RiskLevel(state.get("risk_level", "LOW"))
+        self.confidence = float(state.get("confidence", 1.0))
+        self.last_assessment = assessed
+        self._summary = self._build_summary()
+        self._summary_generation = self.generation
+        self._persisted_at = time.monotonic()  # the writer keeps it alive
+        self.status_publisher.bump()
+    
     def _persist_state(self):
         """Persist T.I.A. state to Redis"""
         if not redis_cache.is_connected():
             return
             
-        try:
-            redis_cache.client.hset("tia:state", mapping={
-                "risk_level": self.current_risk.value,
-                "confidence": str(self.confidence),
-                "last_assessment": self.last_assessment or "",
-                "updated_at": datetime.now(timezone.utc).isoformat()
-            })
-            redis_cache.client.expire("tia:state", 3600)  # 1 hour TTL
-        except Exception as e:
-            logger.warning(f"⚠️ Failed to persist T.I.A. state: {e}")
+        mapping = {
+            "risk_level": self.current_risk.value,
+            "confidence": str(self.confidence),
+            "last_assessment": self.last_assessment or "",
+            "updated_at": datetime.now(timezone.utc).isoformat()
+        }
+        # Shared with the other workers (1 hour TTL)
+        shared_state.write("tia:state", mapping, ttl=3600)
     
     def consume_aegis(self, snapshot: Dict[str, Any]) -> None:
         """Consume security/posture snapshot from the system
@@ -81,15 +121,38 @@ class TIAAgent:
                 - recent_trades: Recent trade history
                 - market_volatility: Optional volatility indicator
         """
-        snapshot["timestamp"] = datetime.now(timezone.utc).isoformat()
-        self.aegis_snapshots.append(snapshot)
-        
-        # Keep last 10 snapshots
-        if len(self.aegis_snapshots) > 10:
-            self.aegis_snapshots.pop(0)
+        self._ingest(snapshot, datetime.now(timezone.utc).isoformat())
+        self.generation += 1
         
         logger.info(f"🦎 T.I.A.: Consumed AEGIS snapshot - {len(self.aegis_snapshots)} in buffer")
     
+    def consume_aegis_batch(self, snapshots: Iterable[Dict[str, Any]]) -> int:
+        """Consume many snapshots with one state update and one log line
+        
+        Snapshots that already carry a ``timestamp`` (e.g. replayed
+        history) keep it; the rest share the batch arrival time.
+        
+        Returns:
+            Number of snapshots consumed
+        """
+        stamp = datetime.now(timezone.utc).isoformat()
+        count = 0
+        for snapshot in snapshots:
+            self._ingest(snapshot, snapshot.get("timestamp") or stamp)
+            count += 1
+        if count:
+            self.generation += 1
+            logger.info(f"🦎 T.I.A.: Consumed {count} AEGIS snapshots - {len(self.aegis_snapshots)} in buffer")
+        return count
+    
+    def _ingest(self, snapshot: Dict[str, Any], timestamp: str) -> None:
+        snapshot["timestamp"] = timestamp
+        self.aegis_snapshots.append(snapshot)
+        self.window_stats.push(
+            float(snapshot.get("total_equity", 100.0)),
+            float(snapshot.get("active_slots", 0)),
+        )
+    
     def analyze_risk(self, snapshot: Optional[Dict[str, Any]] = None) -> RiskLevel:
         """Analyze current risk level based on system metrics
         
@@ -131,6 +194,10 @@ class TIAAgent:
         elif total_equity < starting_capital * 0.85:  # Down 15%+
             risk_score += 0.25
         
+        # Factors 4-6: trend over the buffered history (not for ad-hoc snapshots)
+        if snapshot is None:
+            risk_score += self._window_risk()
+        
         # Determine risk level from score
         if risk_score >= 0.6:
             return RiskLevel.HIGH
@@ -139,42 +206,89 @@ class TIAAgent:
         else:
             return RiskLevel.LOW
     
+    def _window_risk(self) -> float:
+        """Risk score contribution from the rolling drawdown/volatility/utilisation"""
+        stats = self.window_stats
+        if len(stats) < self.WINDOW_MIN_SAMPLES:
+            return 0.0
+        score = 0.0
+        if stats.drawdown >= self.DRAWDOWN_HIGH:
+            score += 0.3
+        elif stats.drawdown >= self.DRAWDOWN_MEDIUM:
+            score += 0.15
+        if stats.volatility >= self.VOLATILITY_HIGH:
+            score += 0.2
+        elif stats.volatility >= self.VOLATILITY_MEDIUM:
+            score += 0.1
+        if stats.utilisation >= self.UTILISATION_HIGH:
+            score += 0.15
+        return score
+
+    def invalidate(self) -> None:
+        """Force the next summary to re-analyze (call after changing thresholds)"""
+        self.generation += 1
+    
     def produce_summary(self) -> Dict[str, Any]:
         """Generate risk assessment summary
         
+        Memoized per snapshot generation: until a new snapshot arrives
+        (or ``invalidate()`` is called) the previous assessment is
+        returned without re-analyzing, persisting or logging. Without
+        local snapshots there is nothing to assess: the current verdict
+        (possibly adopted from another worker) is kept, and nothing is
+        persisted or broadcast.
+        
         Returns:
             Dict with risk level, confidence, and analysis details
         """
+        local = len(self.aegis_snapshots) > 0
+        if self._summary is not None and self._summary_generation == self.generation:
+            if local and time.monotonic() - self._persisted_at >= self.PERSIST_REFRESH_SECONDS:
+                self._persist_state()
+                self._persisted_at = time.monotonic()
+            return dict(self._summary)
+        
+        if not local:
+            if self.last_assessment is None:
+                self.current_risk = self.analyze_risk()
+                self.confidence = 0.5
+            self._summary = self._build_summary()
+            self._summary_generation = self.generation
+            self.status_publisher.bump()
+            return dict(self._summary)
+        
         # Analyze current risk
         new_risk = self.analyze_risk()
         
         # Update confidence based on data availability
-        if len(self.aegis_snapshots) >= 3:
-            self.confidence = 1.0
-        elif len(self.aegis_snapshots) >= 1:
-            self.confidence = 0.7
-        else:
-            self.confidence = 0.5
+        self.confidence = 1.0 if len(self.aegis_snapshots) >= 3 else 0.7
         
         # Update state
         self.current_risk = new_risk
         self.last_assessment = datetime.now(timezone.utc).isoformat()
+        self.status_publisher.bump()
         
         # Persist to Redis
         self._persist_state()
+        self._persisted_at = time.monotonic()
         
-        summary = {
+        logger.info(f"🦎 T.I.A. ASSESSMENT: Risk={self.current_risk} Confidence={self.confidence:.0%}")
+        
+        self._summary = self._build_summary()
+        self._summary_generation = self.generation
+        return dict(self._summary)
+    
+    def _build_summary(self) -> Dict[str, Any]:
+        return {
             "risk_level": self.current_risk.value,
             "confidence": self.confidence,
             "last_assessment": self.last_assessment,
             "snapshots_analyzed": len(self.aegis_snapshots),
+            "window": self.window_stats.get_stats(),
             "authorization_recommended": self.current_risk != RiskLevel.HIGH,
-            "message": self._get_risk_message()
+            "message": self._get_risk_message(),
+            "generation": self.generation
         }
-        
-        logger.info(f"🦎 T.I.A. ASSESSMENT: Risk={self.current_risk} Confidence={self.confidence:.0%}")
-        
-        return summary
     
     def _get_risk_message(self) -> str:
         """Get human-readable risk message"""
@@ -191,6 +305,9 @@ class TIAAgent:
         Returns:
             Current status including risk level and confidence
         """
+        return self.status_publisher.snapshot.copy()
+    
+    def _build_status(self) -> Dict[str, Any]:
         return {
             "risk_level": self.current_risk.value,
             "confidence": self.confidence,
@@ -210,3 +327,4 @@ class TIAAgent:
 
 # Singleton instance
 tia_agent = TIAAgent()
+shared_state.register("tia:state", tia_agent.apply_shared_state)
@@ -0,0 +1,111 @@
+# ================================================================
+# 🌊 TRADE STREAM - Time-Indexed Trade History on Redis Streams
+# ================================================================
+# Every trade is XADDed to a fleet-wide stream and to a per-symbol
+# stream. Entry IDs are server millisecond timestamps, so "trades
+# in the last 6 hours for BTC/USDT" is one XRANGE over that
+# symbol's stream. Streams are trimmed by length (MAXLEN ~) and by
+# age (MINID ~); downstream processors read through consumer
+# groups and XACK what they have handled.
+# ================================================================
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from backend.core.config import settings
+from backend.services.cache_codec import TRADE, decode
+
+TRADE_STREAM = "vortex:trades:stream"
+LEGACY_TRADE_LIST = "vortex:trades"
+
+Bound = Union[None, int, float, str, datetime]
+
+
+def symbol_stream(symbol: str) -> str:
+    return f"{TRADE_STREAM}:{symbol}"
+
+
+def _text(value) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+def to_stream_id(bound: Bound, default: str) -> str:
+    """Range bound -> stream ID
+
+    ``None`` is the open end (``-``/``+``), datetimes and numbers
+    (epoch milliseconds) become millisecond IDs, strings are raw IDs.
+    """
+    if bound is None:
+        return default
+    if isinstance(bound, datetime):
+        return str(int(bound.timestamp() * 1000))
+    if isinstance(bound, (int, float)):
+        return str(int(bound))
+    return bound
+
+
+class TradeStream:
+    """Key layout, trimming policy and entry parsing for trade streams
+
+    Commands are queued on a caller-supplied pipeline (sync or
+    asyncio), so RedisCache, AsyncRedisCache and the write-behind
+    queue share one on-wire format.
+
+    Args:
+        maxlen: Approximate entries kept per stream
+        retention_hours: Entries older than this are trimmed (0 = keep)
+    """
+
+    def __init__(self, maxlen: Optional[int] = None, retention_hours: Optional[float] = None):
+        self.maxlen = settings.TRADE_STREAM_MAXLEN if maxlen is None else maxlen
+        self.retention_hours = (settings.TRADE_STREAM_RETENTION_HOURS
+                                if retention_hours is None else retention_hours)
+
+    def entry(self, trade: Dict[str, Any], codec) -> Dict[str, Any]:
+        return {"symbol": str(trade.get("symbol") or ""), "trade": codec.encode_record(trade, TRADE)}
+
+    def append(self, pipe, entries: List[Dict[str, Any]], now_ms: Optional[int] = None) -> None:
+        """Queue XADDs on the fleet and symbol streams, then one age trim per stream"""
+        keys = {TRADE_STREAM: None}
+        for entry in entries:
+            targets = [TRADE_STREAM]
+            if entry.get("symbol"):
+                targets.append(symbol_stream(entry["symbol"]))
+                keys[targets[-1]] = None
+            for key in targets:
+                pipe.xadd(key, entry, maxlen=self.maxlen or None, approximate=True)
+        if self.retention_hours and now_ms is not None:
+            min_id = str(now_ms - int(self.retention_hours * 3_600_000))
+            for key in keys:
+                pipe.xtrim(key, minid=min_id, approximate=True)
+
+    def range_args(self, start: Bound = None, end: Bound = None,
+                   symbol: Optional[str] = None) -> Tuple[str, str, str]:
+        key = symbol_stream(symbol) if symbol else TRADE_STREAM
+        return key, to_stream_id(start, "-"), to_stream_id(end, "+")
+
+    @staticmethod
+    def parse(entries) -> List[Dict[str, Any]]:
+        """XRANGE/XREADGROUP entries -> trade dicts tagged with ``stream_id``"""
+        trades = []
+        for entry_id, fields in entries or ():
+            fields = {_text(k): v for k, v in (fields or {}).items()}
+            raw = fields.get("trade")
+            if raw is None:
+                continue
+            trade = decode(raw)
+            trade["stream_id"] = _text(entry_id)
+            trades.append(trade)
+        return trades
+
+    @classmethod
+    def parse_read(cls, response) -> List[Dict[str, Any]]:
+        """XREADGROUP reply (``[[stream, entries], ...]``) -> trades"""
+        trades = []
+        for _, entries in response or ():
+            trades.extend(cls.parse(entries))
+        return trades
+
+    @staticmethod
+    def is_busy_group(error: Exception) -> bool:
+        return "BUSYGROUP" in str(error)
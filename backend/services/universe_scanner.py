@@ -0,0 +1,183 @@
+# ================================================================
+# 🔭 UNIVERSE SCANNER - Incremental Top-K Entry Candidates
+# ================================================================
+# Keeps every USDT pair in a liquidity-tier index (HIGH / MID /
+# LOW per the MLOFI thresholds, INELIGIBLE below Piranha's
+# min_volume_24h) and the eligible pairs in a lazily invalidated
+# heap ordered by 24h change. Unchanged tickers cost one tuple
+# compare; only changed symbols are re-tiered and re-heaped, so
+# ranking costs O(changed * log n + K) instead of a full sort.
+# ================================================================
+
+import heapq
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
+
+from backend.core.logging_config import setup_logging
+
+logger = setup_logging("universe_scanner")
+
+HIGH = "high"
+MID = "mid"
+LOW = "low"
+INELIGIBLE = "ineligible"
+TIERS = (HIGH, MID, LOW, INELIGIBLE)
+
+
+class UniverseScanner:
+    """Liquidity-tiered, heap-backed ranking of the tradable universe
+
+    Heap entries are (-percentage, version, symbol); updating a symbol
+    bumps its version so older entries become stale and are dropped
+    when they surface. The heap is rebuilt when stale entries
+    outnumber live ones, keeping memory bounded.
+    """
+
+    def __init__(self, min_volume: float = 0.0, high_threshold: float = 50_000_000,
+                 mid_threshold: float = 10_000_000, top_k: int = 10,
+                 quote: str = "USDT", excluded: Optional[Set[str]] = None):
+        self.min_volume = min_volume
+        self.high_threshold = high_threshold
+        self.mid_threshold = mid_threshold
+        self.top_k = top_k
+        self.suffix = f"/{quote}"
+        # Shared with the caller (e.g. the Vortex blacklist); checked lazily
+        self.excluded: Set[str] = excluded if excluded is not None else set()
+
+        self._rows: Dict[str, Tuple[float, float, float]] = {}  # symbol -> (last, volume, pct)
+        self._tier_of: Dict[str, str] = {}
+        self._tiers: Dict[str, Set[str]] = {tier: set() for tier in TIERS}
+        self._version: Dict[str, int] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._clock = 0
+        self.last_changed = 0
+
+    # ═══════════════════════════════════════════════════════════
+    # TIER INDEX
+    # ═══════════════════════════════════════════════════════════
+
+    def classify(self, volume_24h: float) -> str:
+        """Liquidity tier for a 24h quote volume"""
+        if volume_24h >= self.high_threshold:
+            return HIGH
+        if volume_24h >= self.mid_threshold:
+            return MID
+        if volume_24h >= self.min_volume:
+            return LOW
+        return INELIGIBLE
+
+    def tier(self, symbol: str) -> Optional[str]:
+        return self._tier_of.get(symbol)
+
+    def symbols_in_tier(self, tier: str) -> Set[str]:
+        return self._tiers[tier]
+
+    def tier_counts(self) -> Dict[str, int]:
+        return {tier: len(members) for tier, members in self._tiers.items()}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._rows
+
+    # ═══════════════════════════════════════════════════════════
+    # UPDATES
+    # ═══════════════════════════════════════════════════════════
+
+    def update_symbol(self, symbol: str, ticker: Mapping[str, Any]) -> bool:
+        """Apply one ticker; returns True if the index changed"""
+        if not symbol.endswith(self.suffix):
+            return False
+        last = ticker.get("last")
+        percentage = ticker.get("percentage")
+        if not last or percentage is None:
+            return self.remove(symbol)
+        row = (float(last), float(ticker.get("quoteVolume") or 0), float(percentage))
+        if self._rows.get(symbol) == row:
+            return False
+
+        self._rows[symbol] = row
+        tier = self.classify(row[1])
+        previous = self._tier_of.get(symbol)
+        if previous != tier:
+            if previous is not None:
+                self._tiers[previous].discard(symbol)
+            self._tiers[tier].add(symbol)
+            self._tier_of[symbol] = tier
+
+        self._clock += 1
+        self._version[symbol] = self._clock
+        if tier != INELIGIBLE:
+            heapq.heappush(self._heap, (-row[2], self._clock, symbol))
+            self._maybe_compact()
+        return True
+
+    def remove(self, symbol: str) -> bool:
+        if symbol not in self._rows:
+            return False
+        del self._rows[symbol]
+        self._tiers[self._tier_of.pop(symbol)].discard(symbol)
+        self._version.pop(symbol, None)
+        return True
+
+    def update(self, tickers: Mapping[str, Mapping[str, Any]], complete: bool = False) -> int:
+        """Apply a ticker snapshot; returns the number of changed symbols
+
+        Args:
+            tickers: {symbol: ticker} (full snapshot or a delta)
+            complete: Treat ``tickers`` as the whole universe and drop
+                symbols missing from it (e.g. delisted pairs)
+        """
+        changed = 0
+        for symbol, ticker in tickers.items():
+            if ticker and self.update_symbol(symbol, ticker):
+                changed += 1
+        if complete:
+            for symbol in self._rows.keys() - tickers.keys():
+                changed += self.remove(symbol)
+        self.last_changed = changed
+        return changed
+
+    def _maybe_compact(self) -> None:
+        live = len(self._rows) - len(self._tiers[INELIGIBLE])
+        if len(self._heap) > 2 * live + 64:
+            self._heap = [
+                (-row[2], self._version[symbol], symbol)
+                for symbol, row in self._rows.items()
+                if self._tier_of[symbol] != INELIGIBLE
+            ]
+            heapq.heapify(self._heap)
+
+    # ═══════════════════════════════════════════════════════════
+    # RANKING
+    # ═══════════════════════════════════════════════════════════
+
+    def _is_live(self, entry: Tuple[float, int, str]) -> bool:
+        _, version, symbol = entry
+        return self._version.get(symbol) == version and self._tier_of.get(symbol) != INELIGIBLE
+
+    def top(self, k: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Top-K eligible, non-excluded candidates by 24h change (descending)"""
+        k = self.top_k if k is None else k
+        heap = self._heap
+        taken: List[Tuple[float, int, str]] = []
+        skipped: List[Tuple[float, int, str]] = []
+        while heap and len(taken) < k:
+            entry = heapq.heappop(heap)
+            if not self._is_live(entry):
+                continue  # stale version: drop for good
+            (skipped if entry[2] in self.excluded else taken).append(entry)
+        for entry in taken + skipped:
+            heapq.heappush(heap, entry)
+
+        result = []
+        for _, _, symbol in taken:
+            last, volume, percentage = self._rows[symbol]
+            result.append({
+                "symbol": symbol,
+                "last": last,
+                "quoteVolume": volume,
+                "percentage": percentage,
+                "tier": self._tier_of[symbol],
+            })
+        return result
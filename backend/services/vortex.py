@@ -1,6 +1,25 @@
 import ccxt.async_support as ccxt
 import asyncio
+import json
 import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from backend.core.logging_config import setup_logging
+from backend.services.balance_service import BalanceService
+from backend.services.exit_engine import ExitEngine, PeakWriteBehind
+from backend.services.market_feed import MarketFeed
+from backend.services.position_table import PositionTable
+from backend.services.stagnation import StagnationEvent, StagnationMonitor
+from backend.services.universe_scanner import HIGH, MID, UniverseScanner
+
+logger = setup_logging("vortex")
+
+FLEET_MANIFEST_PATH = Path(__file__).parent.parent.parent / "registry" / "fleet_manifest.json"
+
 
 class VortexOmega:
     def __init__(self):
@@ -11,15 +30,29 @@ class VortexOmega:
             'enableRateLimit': True,
             'options': {'defaultType': 'spot'}
         })
+        self.balances = BalanceService(lambda: self.exchange.fetch_balance())
         self.is_running = False
 
-    async def get_balance(self):
-        return await self.exchange.fetch_balance()
+    async def get_balance(self, max_age: Optional[float] = None):
+        """Account balance from the cache, refreshed if older than ``max_age``"""
+        return await self.balances.get(max_age)
+
+    def get_balance_status(self) -> Dict[str, Any]:
+        """Cached quote balance for the cockpit feed (no exchange calls)"""
+        balance = self.balances.balance or {}
+        total = (balance.get("total") or {}).get(VortexBerserker.QUOTE_CURRENCY)
+        return {
+            "is_running": self.is_running,
+            "quote_free": self.balances.free(VortexBerserker.QUOTE_CURRENCY),
+            "quote_total": float(total) if total is not None else None,
+            "balance_age": round(self.balances.age, 1) if self.balances.balance is not None else None,
+        }
 
     async def execute_trade(self, symbol, side, amount):
         try:
             target = symbol.replace("_", "/")
             order = await self.exchange.create_order(target, 'market', side, amount)
+            self.balances.apply_order(order, target, side, amount, None)
             print(f"STRIKE SUCCESS: {side} {amount} {target}")
             return order
         except Exception as e:
@@ -38,6 +71,604 @@ class VortexOmega:
 
     async def close(self):
         """Close the underlying exchange session."""
+        await self.balances.stop()
+        try:
+            await self.exchange.close()
+        except Exception:
+            pass
+
+
+def load_fleet_manifest(path: Optional[Path] = None) -> Dict[str, Any]:
+    """Load the fleet manifest, returning {} if it is missing or invalid"""
+    path = Path(path) if path else FLEET_MANIFEST_PATH
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"⚠️ VORTEX: Fleet manifest unavailable ({e}) - using built-in defaults")
+        return {}
+
+
+class VortexBerserker:
+    """Vortex Berserker - event-driven multi-wing slot engine
+
+    Every slot is driven from one shared MarketFeed: each tick runs
+    the exit checks for all open positions and, if a slot is free,
+    one entry hunt against the same ticker snapshot. The slot layout
+    comes from fleet_manifest.json, so growing the fleet from 10 to
+    30 slots is a manifest edit and costs no extra exchange polling.
+    """
+
+    # Fleet layout (overridden by fleet_manifest.json wings)
+    PIRANHA_SLOTS = [1, 2]
+    HARVESTER_SLOTS = [3, 4, 5]
+    BEAR_SLOTS = [6, 7]
+    CRAB_SLOTS = [8, 9]
+    BANKER_SLOT = 10
+
+    # Sync-Guard
+    POST_BUY_COOLDOWN = 5.0
+    DEFAULT_BLACKLIST = {"PENGUIN/USDT"}
+
+    # Stagnation Filter
+    MIN_HOLD_HOURS = 4.0
+    STAGNATION_LOSS_THRESHOLD = -0.008  # -0.8%
+    STAGNATION_BREAKEVEN_MIN = -0.003   # -0.3%
+    STAGNATION_BREAKEVEN_MAX = 0.003    # +0.3%
+    STAGNATION_BREAKEVEN_HOURS = 8.0
+    RECOVERY_WINDOW_MINUTES = 30
+
+    # MLOFI Gatekeeper
+    HIGH_LIQUIDITY_THRESHOLD = 50_000_000  # $50M
+    MID_LIQUIDITY_THRESHOLD = 10_000_000   # $10M
+    RSI_OVERSOLD_THRESHOLD = 25
+    RSI_HIGH_LIQUIDITY_THRESHOLD = 30
+
+    # Position Sizing
+    POSITION_SIZE_PCT = 0.04    # 4%
+    MIN_POSITION_SIZE = 5.0     # $5 USDT
+    MAX_POSITION_SIZE = 15.0    # $15 USDT
+
+    # Scanner / candles
+    MAX_SCAN_CANDIDATES = 10
+    CANDLE_TIMEFRAME = "5m"
+    CANDLE_LIMIT = 50
+    QUOTE_CURRENCY = "USDT"
+    DEFAULT_STOP_LOSS = 0.015
+
+    def __init__(self, manifest: Optional[Dict[str, Any]] = None, tick_interval: float = 2.0):
+        self.exchange = ccxt.mexc({
+            'apiKey': os.getenv("MEXC_API_KEY"),
+            'secret': os.getenv("MEXC_SECRET"),
+            'enableRateLimit': True,
+            'options': {'defaultType': 'spot'}
+        })
+        self.active_slots = PositionTable()
+        self.blacklisted_symbols = set(self.DEFAULT_BLACKLIST)
+        self.tick_interval = tick_interval
+        self.feed: Optional[MarketFeed] = None
+        self._tick_queue: Optional[asyncio.Queue] = None
+        self.is_running = False
+        self.last_buy_time = 0.0
+
+        self._apply_manifest(manifest if manifest is not None else load_fleet_manifest())
+        self.exit_engine = ExitEngine(self.wings, default_stop_loss=self.DEFAULT_STOP_LOSS)
+        self.peak_writer = PeakWriteBehind()
+        self.balances = BalanceService(lambda: self.exchange.fetch_balance())
+        self.scanner = UniverseScanner(
+            min_volume=self.MIN_VOLUME_24H,
+            high_threshold=self.HIGH_LIQUIDITY_THRESHOLD,
+            mid_threshold=self.MID_LIQUIDITY_THRESHOLD,
+            top_k=self.MAX_SCAN_CANDIDATES,
+            quote=self.QUOTE_CURRENCY,
+            excluded=self.blacklisted_symbols,
+        )
+        self.stagnation = StagnationMonitor(
+            min_hold_hours=self.MIN_HOLD_HOURS,
+            loss_threshold=self.STAGNATION_LOSS_THRESHOLD,
+            breakeven_min=self.STAGNATION_BREAKEVEN_MIN,
+            breakeven_max=self.STAGNATION_BREAKEVEN_MAX,
+            breakeven_hours=self.STAGNATION_BREAKEVEN_HOURS,
+            window_minutes=self.RECOVERY_WINDOW_MINUTES,
+        )
+        self._stagnant: Dict[str, str] = {}
+        self.stagnation.add_listener(self._on_stagnant)
+
+        logger.info(f"🌊 {self.fleet_banner()}")
+
+    # ═══════════════════════════════════════════════════════════
+    # ⚙️ FLEET CONFIGURATION
+    # ═══════════════════════════════════════════════════════════
+
+    def _apply_manifest(self, manifest: Dict[str, Any]):
+        """Derive wings, slot plan and thresholds from the fleet manifest"""
+        wings = manifest.get("wings") or {
+            "Piranha": {"enabled": True, "params": {"target": 0.004, "stop_loss": 0.015, "min_volume_24h": 500000}, "slots": self.PIRANHA_SLOTS},
+            "Harvester": {"enabled": True, "params": {"trail_start": 0.005, "trail_distance": 0.015, "pullback_exit": 0.015}, "slots": self.HARVESTER_SLOTS},
+            "Bear": {"enabled": True, "params": {"target": 0.008, "stop_loss": 0.015}, "slots": self.BEAR_SLOTS},
+            "Crab": {"enabled": True, "params": {"range_pct": 0.006, "stop_loss": 0.015}, "slots": self.CRAB_SLOTS},
+            "Banker": {"enabled": False, "params": {"target": 0.020, "stop_loss": 0.015}, "slots": [self.BANKER_SLOT]},
+        }
+        self.wings: Dict[str, Dict[str, Any]] = {
+            name.lower(): {
+                "enabled": bool(spec.get("enabled", True)),
+                "params": dict(spec.get("params") or {}),
+                "slots": [int(s) for s in spec.get("slots") or []],
+            }
+            for name, spec in wings.items()
+        }
+        self.slot_plan: List[Tuple[str, int]] = sorted(
+            ((wing, slot) for wing, spec in self.wings.items() for slot in spec["slots"]),
+            key=lambda ws: ws[1],
+        )
+
+        self.PIRANHA_SLOTS = self._wing_slots("piranha")
+        self.HARVESTER_SLOTS = self._wing_slots("harvester")
+        self.BEAR_SLOTS = self._wing_slots("bear")
+        self.CRAB_SLOTS = self._wing_slots("crab")
+        banker_slots = self._wing_slots("banker")
+        self.BANKER_SLOT = banker_slots[0] if banker_slots else None
+
+        self.MIN_POSITION_SIZE = float(manifest.get("min_stake_usdt", self.MIN_POSITION_SIZE))
+        self.MAX_POSITION_SIZE = float(manifest.get("max_stake_usdt", self.MAX_POSITION_SIZE))
+        self.POSITION_SIZE_PCT = float(manifest.get("max_stake_pct", self.POSITION_SIZE_PCT))
+
+        stagnation = manifest.get("stagnation_filter") or {}
+        if stagnation:
+            self.MIN_HOLD_HOURS = float(stagnation.get("min_hold_hours", self.MIN_HOLD_HOURS))
+            if "loss_threshold_pct" in stagnation:
+                self.STAGNATION_LOSS_THRESHOLD = float(stagnation["loss_threshold_pct"]) / 100
+            breakeven = stagnation.get("breakeven_range") or {}
+            if "min_pct" in breakeven:
+                self.STAGNATION_BREAKEVEN_MIN = float(breakeven["min_pct"]) / 100
+            if "max_pct" in breakeven:
+                self.STAGNATION_BREAKEVEN_MAX = float(breakeven["max_pct"]) / 100
+            self.STAGNATION_BREAKEVEN_HOURS = float(breakeven.get("max_hours", self.STAGNATION_BREAKEVEN_HOURS))
+            self.RECOVERY_WINDOW_MINUTES = int(stagnation.get(
+                "recovery_momentum_window_minutes", self.RECOVERY_WINDOW_MINUTES
+            ))
+
+        mlofi = manifest.get("mlofi_gatekeeper") or {}
+        self.HIGH_LIQUIDITY_THRESHOLD = mlofi.get("high_liquidity_threshold_usd", self.HIGH_LIQUIDITY_THRESHOLD)
+        self.MID_LIQUIDITY_THRESHOLD = mlofi.get("mid_liquidity_threshold_usd", self.MID_LIQUIDITY_THRESHOLD)
+        self.RSI_OVERSOLD_THRESHOLD = mlofi.get("rsi_oversold_threshold", self.RSI_OVERSOLD_THRESHOLD)
+
+        risk = manifest.get("risk_management") or {}
+        self.POST_BUY_COOLDOWN = float(risk.get("post_buy_cooldown_seconds", self.POST_BUY_COOLDOWN))
+        self.MAX_SCAN_CANDIDATES = int(risk.get("max_scan_candidates", self.MAX_SCAN_CANDIDATES))
+        self.CANDLE_TIMEFRAME = risk.get("candle_timeframe", self.CANDLE_TIMEFRAME)
+        self.CANDLE_LIMIT = int(risk.get("candle_limit", self.CANDLE_LIMIT))
+
+        self.MIN_VOLUME_24H = float(self.wing_params("piranha").get("min_volume_24h", 0))
+
+    def _wing_slots(self, wing: str) -> List[int]:
+        spec = self.wings.get(wing)
+        return list(spec["slots"]) if spec else []
+
+    def wing_params(self, wing: str) -> Dict[str, Any]:
+        spec = self.wings.get(wing)
+        return spec["params"] if spec else {}
+
+    def is_wing_enabled(self, wing: str) -> bool:
+        spec = self.wings.get(wing)
+        return bool(spec and spec["enabled"])
+
+    @property
+    def total_slots(self) -> int:
+        return len(self.slot_plan)
+
+    def fleet_banner(self) -> str:
+        """Startup banner, e.g. '10-SLOT ARK FLEET SYNCHRONIZED: 2 PIRANHAS // ...'"""
+        parts = [
+            f"{len(spec['slots'])} {wing.upper()}{'S' if len(spec['slots']) != 1 else ''}"
+            for wing, spec in self.wings.items()
+        ]
+        return f"{self.total_slots}-SLOT ARK FLEET SYNCHRONIZED: {' // '.join(parts)}"
+
+    def get_available_slot_type(self, enabled_only: bool = False) -> Tuple[Optional[str], Optional[int]]:
+        """Return (wing, slot) of the lowest free slot, or (None, None) when full
+
+        Args:
+            enabled_only: Skip slots belonging to disabled wings
+        """
+        occupied = {pos.get("slot") for pos in self.active_slots.values()}
+        for wing, slot in self.slot_plan:
+            if slot in occupied:
+                continue
+            if enabled_only and not self.is_wing_enabled(wing):
+                continue
+            return wing, slot
+        return None, None
+
+    # ═══════════════════════════════════════════════════════════
+    # 💰 POSITION SIZING (4% Rule)
+    # ═══════════════════════════════════════════════════════════
+
+    def calculate_position_size(self, total_equity: float) -> float:
+        stake = total_equity * self.POSITION_SIZE_PCT
+        return max(self.MIN_POSITION_SIZE, min(stake, self.MAX_POSITION_SIZE))
+
+    async def get_total_equity(self) -> Optional[float]:
+        """Total quote-currency equity, or None if the balance is unavailable"""
+        return await self.balances.equity(self.QUOTE_CURRENCY)
+
+    # ═══════════════════════════════════════════════════════════
+    # 📊 MARKET DATA
+    # ═══════════════════════════════════════════════════════════
+
+    @staticmethod
+    def _has_error_code(error: Exception, code: str) -> bool:
+        return code in str(error)
+
+    def blacklist(self, symbol: str, reason: str = ""):
+        if symbol not in self.blacklisted_symbols:
+            self.blacklisted_symbols.add(symbol)
+            logger.warning(f"🚫 {symbol}: Blacklisted {reason}".rstrip())
+
+    async def get_candle_data(self, symbol: str, timeframe: Optional[str] = None,
+                              limit: Optional[int] = None) -> Optional[List[List[float]]]:
+        """Fetch OHLCV candles; blacklists the symbol on MEXC error 10007"""
+        try:
+            return await self.exchange.fetch_ohlcv(
+                symbol, timeframe or self.CANDLE_TIMEFRAME, limit=limit or self.CANDLE_LIMIT
+            )
+        except Exception as e:
+            if self._has_error_code(e, "10007"):
+                self.blacklist(symbol, "(error 10007: invalid symbol)")
+            else:
+                logger.warning(f"⚠️ {symbol}: Candle fetch failed - {e}")
+            return None
+
+    def _rank_candidates(self, tickers: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Filter a ticker snapshot down to the top-N entry candidates"""
+        # The blacklist set may have been replaced wholesale; keep sharing it
+        self.scanner.excluded = self.blacklisted_symbols
+        self.scanner.update(tickers, complete=True)
+        return self.scanner.top(self.MAX_SCAN_CANDIDATES)
+
+    async def fetch_global_market(self) -> List[Dict[str, Any]]:
+        """Scan all tickers and return ranked, blacklist-filtered candidates"""
+        try:
+            tickers = await self.exchange.fetch_tickers()
+        except Exception as e:
+            logger.warning(f"⚠️ VORTEX: Market scan failed - {e}")
+            return []
+        return self._rank_candidates(tickers or {})
+
+    # ═══════════════════════════════════════════════════════════
+    # 📈 INDICATORS
+    # ═══════════════════════════════════════════════════════════
+
+    def _calculate_rsi(self, prices: List[float], period: int = 14) -> Optional[float]:
+        """RSI over the last ``period`` price changes, None if too few prices"""
+        if not prices or len(prices) < period + 1:
+            return None
+        gains = 0.0
+        losses = 0.0
+        for i in range(len(prices) - period, len(prices)):
+            delta = prices[i] - prices[i - 1]
+            if delta > 0:
+                gains += delta
+            else:
+                losses -= delta
+        if losses == 0:
+            return 100.0 if gains > 0 else 50.0
+        rs = gains / losses
+        return 100.0 - (100.0 / (1.0 + rs))
+
+    def _bars_for_minutes(self, minutes: float) -> int:
+        unit = self.CANDLE_TIMEFRAME[-1]
+        size = int(self.CANDLE_TIMEFRAME[:-1] or 1)
+        tf_minutes = size * {"m": 1, "h": 60, "d": 1440}.get(unit, 1)
+        return max(1, int(round(minutes / tf_minutes)))
+
+    def _close_n_bars_ago(self, candles: List[List[float]], bars: int) -> Optional[float]:
+        if not candles or len(candles) <= bars:
+            return None
+        return candles[-1 - bars][4]
+
+    def _get_price_30min_ago(self, candles: List[List[float]]) -> Optional[float]:
+        return self._close_n_bars_ago(candles, self._bars_for_minutes(self.RECOVERY_WINDOW_MINUTES))
+
+    def _showing_recovery_momentum(self, candles: List[List[float]]) -> Optional[bool]:
+        """True if price rose over the recovery window, None without data"""
+        past = self._get_price_30min_ago(candles)
+        if past is None:
+            return None
+        return candles[-1][4] > past
+
+    def _get_price_momentum(self, candles: List[List[float]]) -> Tuple[Optional[float], Optional[float]]:
+        """(1h, 4h) fractional price change from candle closes"""
+        if not candles:
+            return None, None
+        last = candles[-1][4]
+        momentum = []
+        for hours in (1, 4):
+            past = self._close_n_bars_ago(candles, self._bars_for_minutes(hours * 60))
+            momentum.append((last - past) / past if past else None)
+        return momentum[0], momentum[1]
+
+    def _check_price_momentum_positive(self, candles: List[List[float]]) -> bool:
+        mom_1h, mom_4h = self._get_price_momentum(candles)
+        return mom_1h is not None and mom_4h is not None and mom_1h > 0 and mom_4h > 0
+
+    # ═══════════════════════════════════════════════════════════
+    # 🛡️ MLOFI GATEKEEPER
+    # ═══════════════════════════════════════════════════════════
+
+    async def is_buy_allowed(self, symbol: str, volume_24h: float,
+                             candles: Optional[List[List[float]]] = None) -> Tuple[bool, str]:
+        """Liquidity-aware entry filter (RSI/momentum proxy for MLOFI)"""
+        if candles is None:
+            candles = await self.get_candle_data(symbol)
+        if not candles:
+            return False, "No candle data"
+
+        tier = self.scanner.classify(volume_24h)
+        if tier == HIGH:
+            rsi = self._calculate_rsi([c[4] for c in candles])
+            if rsi is not None and rsi < self.RSI_HIGH_LIQUIDITY_THRESHOLD:
+                return True, f"High liquidity, RSI {rsi:.1f} (oversold)"
+            return False, f"High liquidity, RSI {rsi if rsi is None else round(rsi, 1)} - not oversold"
+
+        if tier == MID:
+            rsi = self._calculate_rsi([c[4] for c in candles])
+            if rsi is not None and rsi < self.RSI_OVERSOLD_THRESHOLD:
+                return True, f"Mid liquidity, RSI {rsi:.1f} (extreme oversold)"
+            return False, f"Mid liquidity, RSI {rsi if rsi is None else round(rsi, 1)} - not extreme oversold"
+
+        if self._check_price_momentum_positive(candles):
+            return True, "Low liquidity with positive momentum"
+        return False, "Low liquidity without positive momentum"
+
+    # ═══════════════════════════════════════════════════════════
+    # ⏳ STAGNATION FILTER
+    # ═══════════════════════════════════════════════════════════
+
+    async def should_liquidate_stagnant(self, symbol: str, entry_time: float,
+                                        entry_price: float, current_price: float) -> Tuple[bool, str]:
+        hold_hours = (time.time() - entry_time) / 3600
+        if hold_hours < self.MIN_HOLD_HOURS:
+            return False, f"Held {hold_hours:.1f}h (< {self.MIN_HOLD_HOURS}h minimum)"
+
+        pnl = (current_price - entry_price) / entry_price
+
+        if pnl <= self.STAGNATION_LOSS_THRESHOLD:
+            # Prefer the streaming window; fall back to candles when the
+            # position is untracked or the window has not filled yet.
+            momentum = self.stagnation.momentum(symbol)
+            if momentum is not None:
+                recovering = momentum > 0
+            else:
+                candles = await self.get_candle_data(symbol)
+                recovering = self._showing_recovery_momentum(candles)
+            if recovering is None:
+                return False, f"Loss {pnl:+.2%} but no candle data - holding"
+            if recovering:
+                return False, f"Loss {pnl:+.2%} but showing recovery - holding"
+            return True, f"Stagnation: Loss {pnl:+.2%} with no recovery ({hold_hours:.1f}h)"
+
+        if (self.STAGNATION_BREAKEVEN_MIN <= pnl <= self.STAGNATION_BREAKEVEN_MAX
+                and hold_hours >= self.STAGNATION_BREAKEVEN_HOURS):
+            return True, f"Stagnation: Sideways {pnl:+.2%} for {hold_hours:.1f}h"
+
+        return False, f"Position developing ({pnl:+.2%}, {hold_hours:.1f}h)"
+
+    def _on_stagnant(self, event: StagnationEvent):
+        logger.info(f"🚨 {event.symbol}: {event.reason}")
+        self._stagnant[event.symbol] = event.reason
+
+    # ═══════════════════════════════════════════════════════════
+    # 🎯 EXIT LOGIC
+    # ═══════════════════════════════════════════════════════════
+
+    def check_wing_exit(self, wing: str, pnl: float, peak_profit: float) -> Optional[str]:
+        """Return an exit reason if the wing's take-profit/stop rules fire"""
+        return self.exit_engine.check_one(wing, pnl, peak_profit)
+
+    async def pulse_monitor(self, tickers: Optional[Dict[str, Dict[str, Any]]] = None):
+        """Evaluate exits for every open position against one ticker snapshot"""
+        if not self.active_slots:
+            return
+        if tickers is None:
+            try:
+                tickers = await self.exchange.fetch_tickers(list(self.active_slots))
+            except Exception as e:
+                logger.warning(f"⚠️ VORTEX: Pulse drop - {e}")
+                return
+
+        table = self.active_slots
+        now = time.time()
+        prices = table.price_vector(tickers)
+        pnl = table.mark_to_market(prices)
+        held = table.held_seconds(now)
+        # Sync-Guard: let the exchange settle the buy before we try to sell
+        ready = ~np.isnan(pnl) & (held >= self.POST_BUY_COOLDOWN)
+
+        exits = {sig.symbol: sig.reason for sig in self.exit_engine.evaluate(table, pnl, ready)}
+        self.peak_writer.collect(table)
+
+        # Stagnation candidates arrive as events from the streaming
+        # monitor; wing-rule exits take precedence.
+        self.stagnation.sync(table)
+        self.stagnation.on_tick(tickers, now)
+        for symbol, reason in list(self._stagnant.items()):
+            row = table.row_of(symbol)
+            if row is None:
+                del self._stagnant[symbol]
+            elif ready[row]:
+                del self._stagnant[symbol]
+                exits.setdefault(symbol, reason)
+
+        for symbol, reason in exits.items():
+            if symbol in table:
+                await self.execute_exit(symbol, table[symbol]["qty"], reason)
+                if symbol in table:
+                    # Exit failed: let the monitor emit it again next tick
+                    self.stagnation.rearm(symbol)
+
+    # ═══════════════════════════════════════════════════════════
+    # ⚔️ ORDER EXECUTION
+    # ═══════════════════════════════════════════════════════════
+
+    async def execute_order(self, symbol: str, price: float, wing: str, slot: int):
+        """Open a position in ``slot`` sized by the 4% rule"""
+        if symbol in self.blacklisted_symbols:
+            return None
+
+        equity = await self.get_total_equity()
+        stake = self.calculate_position_size(equity) if equity is not None else self.MIN_POSITION_SIZE
+        logger.info(f"💰 Position sizing: Equity=${equity or 0:.2f} → Stake=${stake:.2f} (4% rule)")
+        qty = stake / price
+
+        try:
+            order = await self.exchange.create_market_buy_order(symbol, qty)
+        except Exception as e:
+            if self._has_error_code(e, "10007"):
+                self.blacklist(symbol, "(error 10007: symbol not supported by API)")
+            else:
+                logger.error(f"❌ {symbol}: Buy failed - {e}")
+            return None
+
+        fill_price = price
+        fill_qty = qty
+        if isinstance(order, dict):
+            fill_price = order.get("average") or order.get("price") or price
+            fill_qty = order.get("filled") or qty
+
+        self.balances.apply_order(order, symbol, "buy", qty, price)
+        opened_at = time.time()
+        self.active_slots[symbol] = {
+            "entry": fill_price,
+            "qty": fill_qty,
+            "time": opened_at,
+            "wing": wing,
+            "slot": slot,
+            "peak_profit": 0.0,
+        }
+        self.stagnation.track(symbol, fill_price, opened_at)
+        self.last_buy_time = time.time()
+        logger.info(f"🟢 {symbol}: {wing.upper()} slot {slot} opened @ {fill_price}")
+        return order
+
+    async def _fetch_free_balance(self, symbol: str) -> float:
+        try:
+            balance = await self.balances.refresh()  # authoritative, not cached
+            entry = balance.get(symbol.split("/")[0]) or {}
+            return float(entry.get("free") or 0)
+        except Exception as e:
+            logger.warning(f"⚠️ {symbol}: Balance check failed - {e}")
+            return 0.0
+
+    async def force_exit(self, symbol: str, qty: float):
+        """Sell whatever the exchange says we actually hold"""
+        try:
+            return await self.exchange.create_market_sell_order(symbol, qty)
+        except Exception as e:
+            logger.error(f"❌ {symbol}: Force exit failed - {e}")
+            return None
+
+    def _clear_slot(self, symbol: str):
+        self.peak_writer.discard(symbol)
+        self.stagnation.untrack(symbol)
+        self._stagnant.pop(symbol, None)
+        pos = self.active_slots.pop(symbol, None)
+        if pos is not None:
+            logger.info(f"🧹 {symbol}: Slot {pos.get('slot')} cleared")
+
+    async def execute_exit(self, symbol: str, qty: float, reason: str):
+        """Close a position, handling MEXC sync errors 30005 / 10007"""
+        try:
+            order = await self.exchange.create_market_sell_order(symbol, qty)
+        except Exception as e:
+            if self._has_error_code(e, "30005"):
+                # Sync-Guard: our qty is out of sync with the exchange balance
+                logger.warning(f"⚠️ {symbol}: Error 30005 (oversold) - verifying balance")
+                free = await self._fetch_free_balance(symbol)
+                if free > 0:
+                    await self.force_exit(symbol, free)
+                self._clear_slot(symbol)
+            elif self._has_error_code(e, "10007"):
+                self.blacklist(symbol, "(error 10007 on exit)")
+                self._clear_slot(symbol)
+            else:
+                logger.error(f"❌ {symbol}: Exit failed ({reason}) - {e}")
+            return None
+
+        logger.info(f"🔴 {symbol}: Exit - {reason}")
+        pos = self.active_slots.get(symbol)
+        if pos is not None:
+            self.balances.apply_order(order, symbol, "sell", qty, pos["last_price"])
+        self._clear_slot(symbol)
+        return order
+
+    # ═══════════════════════════════════════════════════════════
+    # 🌀 EVENT LOOP
+    # ═══════════════════════════════════════════════════════════
+
+    async def hunt(self, tickers: Dict[str, Dict[str, Any]]):
+        """Fill at most one free slot from the current ticker snapshot"""
+        wing, slot = self.get_available_slot_type(enabled_only=True)
+        if wing is None:
+            return None
+        if time.time() - self.last_buy_time < self.POST_BUY_COOLDOWN:
+            return None
+
+        for candidate in self._rank_candidates(tickers):
+            symbol = candidate["symbol"]
+            if symbol in self.active_slots:
+                continue
+            allowed, reason = await self.is_buy_allowed(symbol, candidate["quoteVolume"])
+            if not allowed:
+                continue
+            logger.info(f"💎 {symbol}: {reason} - ALLOWED")
+            return await self.execute_order(symbol, candidate["last"], wing, slot)
+        return None
+
+    async def on_tick(self, tickers: Dict[str, Dict[str, Any]]):
+        """Run exits for all slots, then one entry hunt, on a single snapshot"""
+        await self.pulse_monitor(tickers)
+        await self.hunt(tickers)
+
+    async def start(self):
+        """Subscribe to the shared feed and process ticks until stopped"""
+        self.feed = MarketFeed(self.exchange, interval=self.tick_interval)
+        queue = self._tick_queue = self.feed.subscribe()
+        feed_task = asyncio.create_task(self.feed.run())
+        self.peak_writer.start()
+        self.balances.start()
+        self.is_running = True
+        logger.info(f"🌊 VORTEX BERSERKER: Engaged - {self.total_slots} slots on one feed")
+        try:
+            while self.is_running:
+                tickers = await queue.get()
+                if tickers is None:
+                    break
+                try:
+                    await self.on_tick(tickers)
+                except Exception as e:
+                    logger.error(f"❌ VORTEX: Tick failed - {e}")
+        finally:
+            self.feed.stop()
+            feed_task.cancel()
+            self.feed.unsubscribe(queue)
+            await self.peak_writer.stop()
+            await self.balances.stop()
+            self._tick_queue = None
+
+    def stop(self):
+        self.is_running = False
+        if self.feed:
+            self.feed.stop()
+        if self._tick_queue is not None:
+            # Wake start() if it is parked waiting for the next tick
+            while not self._tick_queue.empty():
+                self._tick_queue.get_nowait()
+            self._tick_queue.put_nowait(None)
+
+    async def close(self):
+        """Close the underlying exchange session."""
+        self.stop()
         try:
             await self.exchange.close()
         except Exception:
@@ -16,3 +16,12 @@ os.environ.setdefault("ADMIN_PASSWORD", "test-admin-password")
 
 # Disable Redis by default in the test environment; no Redis server is running.
 os.environ.setdefault("REDIS_ENABLED", "False")
+
+# Script-style suites: they run their checks at import time and finish with
+# sys.exit(), which would abort pytest collection. test_vortex_suites.py runs
+# them in a subprocess and asserts on the exit code instead.
+collect_ignore = [
+    "test_fleet_reconfig.py",
+    "test_sync_guard.py",
+    "test_vortex_v310.py",
+]
@@ -125,6 +125,29 @@ class TestAdmiralEngineUnit(unittest.TestCase):
         engine.revoke_premium_access()
         self.assertIsNone(engine.authorization_timestamp)
 
+    # -- capability mask -----------------------------------------------------
+    def test_masks_cover_every_capability_once(self):
+        self.assertEqual(AdmiralEngine.BASE_MASK & AdmiralEngine.PREMIUM_MASK, 0)
+        self.assertEqual(bin(AdmiralEngine.FULL_MASK).count("1"), len(AdmiralEngine.CAPABILITY_BITS))
+
+    def test_has_all_with_precomputed_mask(self):
+        engine = self._make_engine()
+        order_mask = AdmiralEngine.mask_for("basic_trading", "sniper_execution", "slot_scaling")
+        self.assertFalse(engine.has_all(order_mask))
+        engine.grant_premium_access("T.I.A.")
+        self.assertTrue(engine.has_all(order_mask))
+        self.assertTrue(engine.has_all(AdmiralEngine.mask_for("basic_trading")))
+        with self.assertRaises(ValueError):
+            AdmiralEngine.mask_for("does_not_exist")
+
+    def test_restore_keeps_original_timestamp(self):
+        engine = self._make_engine()
+        engine.restore_premium_access("T.I.A.", "2026-01-01T00:00:00+00:00")
+        self.assertTrue(engine.premium_authorized)
+        self.assertTrue(engine.capabilities["airgapped_sync"].enabled)
+        self.assertEqual(engine.authorization_timestamp, "2026-01-01T00:00:00+00:00")
+        self.assertTrue(engine.get_status()["premium_authorized"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,139 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+import json
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+from backend.services.async_redis_cache import AsyncRedisCache
+from backend.services.redis_health import RedisHealth
+
+
+def _cache(client=None, enabled=True):
+    cache = AsyncRedisCache(max_connections=4, pool_timeout=0.1)
+    cache.enabled = enabled
+    cache.use_memory = False
+    cache.client = client
+    return cache
+
+
+def _client():
+    client = AsyncMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[])
+    client.pipeline = MagicMock(return_value=pipe)
+    return client, pipe
+
+
+class TestAsyncRedisCache(unittest.TestCase):
+    """Tests for the asyncio Redis backend."""
+
+    def test_disabled_cache_is_inert(self):
+        cache = _cache(enabled=False)
+
+        async def run():
+            return (await cache.is_connected(), await cache.get_portfolio_state(),
+                    await cache.get_all_peaks(), await cache.save_portfolio_state({"a": 1}))
+
+        self.assertEqual(asyncio.run(run()), (False, None, {}, False))
+
+    def test_pool_is_bounded(self):
+        cache = _cache()
+
+        async def run():
+            return cache._redis()
+
+        client = asyncio.run(run())
+        self.assertEqual(client.connection_pool.max_connections, 4)
+
+    def test_is_connected_reads_shared_health(self):
+        client, _ = _client()
+        cache = _cache(client)
+        cache.health = RedisHealth(up=False)
+        cache._client_loop = None
+
+        async def run():
+            down = await cache.is_connected()
+            cache.health.mark_up()
+            return down, await cache.is_connected()
+
+        self.assertEqual(asyncio.run(run()), (False, True))
+        client.ping.assert_not_awaited()
+
+    def test_loop_change_closes_previous_pool(self):
+        cache = _cache()
+
+        async def first():
+            return cache._redis()
+
+        async def second():
+            client = cache._redis()
+            await asyncio.gather(*list(cache._tasks))
+            return client
+
+        old = asyncio.run(first())
+        old.aclose = AsyncMock()
+        self.assertIsNot(asyncio.run(second()), old)
+        old.aclose.assert_awaited_once()
+
+    def test_save_portfolio_state_pipelines_hset_and_expire(self):
+        client, pipe = _client()
+        cache = _cache(client)
+        self.assertTrue(asyncio.run(cache.save_portfolio_state({"balance": 100, "positions": ["BTC"]})))
+        mapping = pipe.hset.call_args.kwargs["mapping"]
+        self.assertEqual(mapping["positions"], json.dumps(["BTC"]))
+        pipe.expire.assert_called_once_with("vortex:portfolio", 3600)
+        pipe.execute.assert_awaited_once()
+
+    def test_log_trade_pipelines_xadd_and_trim(self):
+        client, pipe = _client()
+        asyncio.run(_cache(client).log_trade({"symbol": "BTC/USDT"}))
+        self.assertEqual(pipe.xadd.call_count, 2)  # fleet + symbol stream
+        self.assertEqual(pipe.xtrim.call_count, 2)
+        pipe.execute.assert_awaited_once()
+
+    def test_reads_are_awaited(self):
+        client, _ = _client()
+        client.hget.return_value = "50000.0"
+        client.get.return_value = json.dumps({"last": 1.0})
+        cache = _cache(client)
+
+        async def run():
+            return await cache.get_peak_price("BTC/USDT"), await cache.get_cached_ticker("BTC/USDT")
+
+        self.assertEqual(asyncio.run(run()), (50000.0, {"last": 1.0}))
+
+    def test_trade_limit_keeps_the_newest(self):
+        client, _ = _client()
+        client.xrevrange.return_value = [(f"{i}-0", {"trade": json.dumps({"symbol": "BTC/USDT"})}) for i in (9, 8)]
+        trades = asyncio.run(_cache(client).get_trades(limit=2))
+        self.assertEqual(client.xrevrange.await_args.kwargs, {"count": 2})
+        self.assertEqual([t["stream_id"] for t in trades], ["8-0", "9-0"])
+
+    def test_errors_are_swallowed(self):
+        client, _ = _client()
+        client.hgetall.side_effect = ConnectionError("down")
+        self.assertEqual(asyncio.run(_cache(client).get_all_peaks()), {})
+
+    def test_spawn_runs_in_background(self):
+        client, pipe = _client()
+        cache = _cache(client)
+
+        async def run():
+            spawned = cache.spawn(cache.push_capped("bridge:events", "{}", 100))
+            await cache.close()
+            return spawned
+
+        self.assertTrue(asyncio.run(run()))
+        pipe.ltrim.assert_called_once_with("bridge:events", 0, 99)
+
+    def test_spawn_without_loop_falls_back(self):
+        client, pipe = _client()
+        cache = _cache(client)
+        self.assertFalse(cache.spawn(cache.push_capped("bridge:events", "{}")))
+        pipe.execute.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+from backend.services.balance_service import BalanceService
+from backend.services.vortex import VortexBerserker
+
+
+def _balance(usdt=100.0, btc=0.0):
+    return {
+        "USDT": {"free": usdt, "used": 0.0, "total": usdt},
+        "BTC": {"free": btc, "used": 0.0, "total": btc},
+        "free": {"USDT": usdt, "BTC": btc},
+        "total": {"USDT": usdt, "BTC": btc},
+    }
+
+
+class TestBalanceService(unittest.TestCase):
+    """Tests for the cached balance service."""
+
+    def test_get_reuses_fresh_balance(self):
+        fetch = AsyncMock(return_value=_balance())
+        service = BalanceService(fetch, max_age=60)
+
+        async def run():
+            await service.get()
+            await service.get()
+            return await service.equity("USDT")
+
+        self.assertEqual(asyncio.run(run()), 100.0)
+        self.assertEqual(fetch.await_count, 1)
+
+    def test_stale_balance_is_refreshed(self):
+        fetch = AsyncMock(return_value=_balance())
+        service = BalanceService(fetch)
+
+        async def run():
+            await service.get()
+            await service.get(max_age=0)
+
+        asyncio.run(run())
+        self.assertEqual(fetch.await_count, 2)
+
+    def test_concurrent_refreshes_share_one_request(self):
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return _balance()
+
+        service = BalanceService(fetch)
+
+        async def run():
+            await asyncio.gather(*(service.refresh() for _ in range(5)))
+
+        asyncio.run(run())
+        self.assertEqual(calls, 1)
+
+    def test_sync_fetch_is_supported(self):
+        service = BalanceService(Mock(return_value=_balance(usdt=7.0)))
+        self.assertEqual(asyncio.run(service.equity()), 7.0)
+
+    def test_equity_none_on_failure(self):
+        service = BalanceService(AsyncMock(side_effect=RuntimeError("down")))
+        self.assertIsNone(asyncio.run(service.equity()))
+
+    def test_apply_fill_patches_both_shapes(self):
+        service = BalanceService(AsyncMock(return_value=_balance(usdt=100.0)))
+        asyncio.run(service.get())
+        service.apply_fill("BTC/USDT", "buy", 0.001, 10_000.0,
+                           fee={"cost": 0.01, "currency": "USDT"})
+        self.assertAlmostEqual(service.balance["total"]["USDT"], 89.99)
+        self.assertAlmostEqual(service.balance["USDT"]["free"], 89.99)
+        self.assertAlmostEqual(service.balance["total"]["BTC"], 0.001)
+
+    def test_apply_order_prefers_reported_fill(self):
+        service = BalanceService(AsyncMock(return_value=_balance(usdt=100.0)))
+        asyncio.run(service.get())
+        service.apply_order({"filled": 2.0, "average": 5.0}, "SOL/USDT", "buy", 1.0, 1.0)
+        self.assertAlmostEqual(service.balance["total"]["USDT"], 90.0)
+        self.assertAlmostEqual(service.balance["total"]["SOL"], 2.0)
+
+    def test_apply_order_without_price_invalidates(self):
+        service = BalanceService(AsyncMock(return_value=_balance(usdt=100.0)))
+        asyncio.run(service.get())
+        service.apply_order({"filled": 2.0, "cost": 10.0}, "SOL/USDT", "buy", 1.0, None)
+        self.assertAlmostEqual(service.balance["total"]["USDT"], 90.0)  # price from cost
+        service.apply_order({"id": "1"}, "SOL/USDT", "buy", 1.0, None)
+        self.assertFalse(service.is_fresh())
+
+    def test_unfilled_order_is_not_applied(self):
+        service = BalanceService(AsyncMock(return_value=_balance(usdt=100.0)))
+        asyncio.run(service.get())
+        service.apply_order({"filled": 0.0, "price": 5.0, "status": "canceled"}, "SOL/USDT", "buy", 1.0, 5.0)
+        self.assertAlmostEqual(service.balance["total"]["USDT"], 100.0)
+        self.assertTrue(service.is_fresh())
+
+    def test_tracked_fills_patch_increments(self):
+        from backend.services.order_tracker import OrderTracker
+        service = BalanceService(AsyncMock(return_value=_balance(usdt=100.0)))
+        asyncio.run(service.get())
+        tracker = OrderTracker()
+        tracker.add_listener(service.on_order_update)
+        update = {"id": "1", "clientOrderId": "c1", "symbol": "SOL/USDT", "side": "buy",
+                  "amount": 2.0, "average": 5.0}
+        tracker.apply_update({**update, "filled": 0.0, "status": "open"})
+        tracker.apply_update({**update, "filled": 1.0, "status": "open"})
+        tracker.apply_update({**update, "filled": 2.0, "status": "closed"})
+        tracker.apply_update({**update, "filled": 2.0, "status": "closed"})  # duplicate push
+        self.assertAlmostEqual(service.balance["total"]["USDT"], 90.0)
+        self.assertAlmostEqual(service.balance["total"]["SOL"], 2.0)
+        self.assertEqual(service._filled, {})
+
+
+class TestVortexBalanceCache(unittest.TestCase):
+    """Tests for the Berserker's use of the cached balance."""
+
+    def test_consecutive_buys_fetch_balance_once(self):
+        async def run():
+            vortex = VortexBerserker()
+            vortex.exchange = Mock()
+            vortex.exchange.fetch_balance = AsyncMock(return_value=_balance(usdt=200.0))
+            vortex.exchange.create_market_buy_order = AsyncMock(return_value={})
+            await vortex.execute_order("SOL/USDT", 10.0, "piranha", 1)
+            await vortex.execute_order("ETH/USDT", 10.0, "piranha", 2)
+            return vortex
+
+        vortex = asyncio.run(run())
+        self.assertEqual(vortex.exchange.fetch_balance.await_count, 1)
+        # 8.00 stake, then 4% of the patched 192.00
+        self.assertAlmostEqual(vortex.balances.balance["total"]["USDT"], 184.32)
+
+
+if __name__ == "__main__":
+    unittest.main()
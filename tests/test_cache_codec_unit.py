@@ -0,0 +1,95 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import json
+import math
+import unittest
+from unittest.mock import Mock, patch
+
+from backend.services.cache_codec import (
+    MAGIC, TRADE, BinaryCodec, JsonCodec, decode, decode_value, get_codec,
+)
+
+
+TICKER = {
+    "symbol": "BTC/USDT", "timestamp": 1700000000123, "datetime": "2023-11-14T22:13:20.123Z",
+    "high": 51000.0, "low": 49000.0, "bid": 50000.0, "ask": 50001.0, "last": 50000.5,
+    "baseVolume": 1234.5, "quoteVolume": 61725000.0, "percentage": 2.5, "vwap": None,
+    "info": {"raw": "exchange payload"},
+}
+
+
+class TestCacheCodec(unittest.TestCase):
+    """Tests for the versioned binary cache codec."""
+
+    def test_ticker_round_trip(self):
+        blob = BinaryCodec().encode_ticker(TICKER)
+        self.assertEqual(blob[0], MAGIC)
+        ticker = decode(blob)
+        for key in ("symbol", "timestamp", "datetime", "high", "bid", "last", "quoteVolume"):
+            self.assertEqual(ticker[key], TICKER[key])
+        self.assertIsNone(ticker["vwap"])
+        self.assertNotIn("info", ticker)  # raw exchange payload is not cached
+        self.assertLess(len(blob), len(json.dumps(TICKER)))
+
+    def test_nonstandard_ticker_stays_lossless(self):
+        data = {"last": 1.0, "note": "custom"}
+        self.assertEqual(decode(BinaryCodec().encode_ticker(data)), data)
+
+    def test_trade_record_round_trip(self):
+        trade = {"symbol": "ETH/USDT", "side": "sell", "amount": 0.5, "price": 3000.0,
+                 "timestamp": "2024-01-01T00:00:00+00:00", "wing": "piranha",
+                 "meta": {"slots": [1, 2], "forced": False, "pnl": None}}
+        blob = BinaryCodec().encode_record(trade, TRADE)
+        self.assertEqual(decode(blob), trade)
+        self.assertLess(len(blob), len(json.dumps(trade)))
+
+    def test_legacy_json_still_decodes(self):
+        legacy = json.dumps({"symbol": "BTC/USDT", "side": "buy"})
+        self.assertEqual(decode(legacy), {"symbol": "BTC/USDT", "side": "buy"})
+        self.assertEqual(decode(legacy.encode()), {"symbol": "BTC/USDT", "side": "buy"})
+
+    def test_portfolio_values(self):
+        codec = BinaryCodec()
+        self.assertEqual(decode_value(codec.encode_value(["BTC"])), ["BTC"])
+        self.assertTrue(math.isclose(decode_value(codec.encode_value(94.5)), 94.5))
+        # Legacy text fields: JSON where possible, else the raw string
+        self.assertEqual(decode_value("100"), 100)
+        self.assertEqual(decode_value(b"2024-01-01T00:00:00"), "2024-01-01T00:00:00")
+
+    def test_newer_format_is_rejected(self):
+        blob = bytearray(BinaryCodec().encode_value(1))
+        blob[1] = 99
+        with self.assertRaises(ValueError):
+            decode(bytes(blob))
+
+    def test_get_codec(self):
+        self.assertIsInstance(get_codec("json"), JsonCodec)
+        self.assertIsInstance(get_codec("BINARY"), BinaryCodec)
+        with self.assertRaises(ValueError):
+            get_codec("xml")
+
+
+class TestRedisCacheCodec(unittest.TestCase):
+    """Tests for RedisCache writing with the binary codec."""
+
+    def test_binary_ticker_written_and_read(self):
+        from backend.services.redis_cache import RedisCache
+        with patch.object(RedisCache, '_connect'):
+            cache = RedisCache()
+        cache.client = Mock()
+        cache.codec = BinaryCodec()
+        cache.cache_ticker("BTC/USDT", TICKER, ttl=10)
+        blob = cache.client.setex.call_args.args[2]
+        self.assertIsInstance(blob, bytes)
+
+        reader = RedisCache.__new__(RedisCache)
+        reader.__dict__.update(cache.__dict__)
+        reader.near = type(cache.near)()
+        reader.client = Mock()
+        reader.client.get.return_value = blob
+        self.assertEqual(reader.get_cached_ticker("BTC/USDT")["last"], 50000.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -62,6 +62,20 @@ class TestCockpitStatus(unittest.TestCase):
         data = response.json()
         self.assertIn("authorization", data)
 
+    def test_status_conditional_request_returns_304(self):
+        etag = client.get("/cockpit/status").headers["etag"]
+        response = client.get("/cockpit/status", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers["etag"], etag)
+
+    def test_status_etag_changes_after_authorization(self):
+        from backend.services.admiral_engine import admiral_engine
+        etag = client.get("/cockpit/status").headers["etag"]
+        admiral_engine.status_publisher.bump()
+        response = client.get("/cockpit/status", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["etag"], etag)
+
 
 class TestCockpitCapabilities(unittest.TestCase):
     """Tests for GET /cockpit/capabilities."""
@@ -109,6 +123,58 @@ class TestCockpitTIAConsume(unittest.TestCase):
         self.assertIn("snapshots_in_buffer", data)
 
 
+class TestCockpitTIABulkConsume(unittest.TestCase):
+    """Tests for POST /cockpit/tia/consume/batch and /cockpit/tia/consume/stream."""
+
+    SNAPSHOT = {"wallet_balance": 50.0, "total_equity": 100.0, "active_slots": 2}
+
+    def setUp(self):
+        from backend.services.tia_agent import TIAAgent
+        with patch("backend.services.tia_agent.redis_cache") as mock_redis:
+            mock_redis.is_connected.return_value = False
+            self.agent = TIAAgent(window=100)
+        patcher = patch("backend.routers.cockpit.tia_agent", self.agent)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_batch_consumes_all_at_once(self):
+        with patch.object(self.agent, "consume_aegis", wraps=self.agent.consume_aegis) as single:
+            response = client.post("/cockpit/tia/consume/batch", json={"snapshots": [self.SNAPSHOT] * 3})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["consumed"], 3)
+        self.assertEqual(len(self.agent.window_stats), 3)
+        single.assert_not_called()
+
+    def test_batch_rejects_whole_body_on_bad_item(self):
+        response = client.post("/cockpit/tia/consume/batch",
+                               json={"snapshots": [self.SNAPSHOT, {"wallet_balance": "x"}]})
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(len(self.agent.aegis_snapshots), 0)
+
+    def test_ndjson_stream_skips_bad_lines(self):
+        import json
+        lines = [json.dumps(self.SNAPSHOT), "not json", json.dumps({"wallet_balance": 1.0}), "",
+                 json.dumps({**self.SNAPSHOT, "timestamp": "2024-01-01T00:00:00+00:00"})]
+
+        def body():
+            for line in lines:  # arrives in pieces, split mid-line
+                yield (line + "\n")[:5].encode()
+                yield (line + "\n")[5:].encode()
+
+        with patch("backend.routers.cockpit.settings.TIA_INGEST_CHUNK", 2):
+            response = client.post("/cockpit/tia/consume/stream", content=body(),
+                                   headers={"Content-Type": "application/x-ndjson"})
+        data = response.json()
+        self.assertEqual((data["consumed"], data["rejected"]), (2, 2))
+        self.assertEqual([e["line"] for e in data["errors"]], [2, 3])
+        self.assertEqual(self.agent.aegis_snapshots[-1]["timestamp"], "2024-01-01T00:00:00+00:00")
+
+    def test_ndjson_overlong_line_is_refused(self):
+        with patch("backend.routers.cockpit.settings.TIA_INGEST_MAX_LINE_BYTES", 16):
+            response = client.post("/cockpit/tia/consume/stream", content=b"{" + b" " * 64)
+        self.assertEqual(response.status_code, 413)
+
+
 class TestCockpitAuthorize(unittest.TestCase):
     """Tests for POST /cockpit/authorize."""
 
@@ -0,0 +1,132 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+import unittest
+from unittest.mock import Mock
+
+from backend.services.cockpit_feed import CockpitFeed, diff
+
+
+class TestCockpitFeed(unittest.TestCase):
+    """Tests for the cockpit delta fan-out hub."""
+
+    def test_diff(self):
+        self.assertEqual(diff(None, {"a": 1}), {"a": 1})
+        self.assertEqual(diff({"a": 1, "b": 2}, {"a": 1, "b": 3, "c": None}), {"b": 3, "c": None})
+        self.assertEqual(diff({"a": 1, "gone": 2}, {"a": 1}), {"gone": None})
+
+    def test_snapshot_then_changed_fields_only(self):
+        async def run():
+            feed = CockpitFeed()
+            state = {"risk": "LOW", "confidence": 1.0}
+            feed.register("tia", lambda: dict(state))
+            sub = await feed.subscribe()
+            first = await sub.next(1)
+            self.assertEqual(await feed.sample(), 0)  # nothing changed: nothing sent
+            state["risk"] = "HIGH"
+            await feed.sample()
+            return first, await sub.next(1)
+
+        first, delta = asyncio.run(run())
+        self.assertEqual(first["type"], "snapshot")
+        self.assertEqual(first["state"]["tia"]["risk"], "LOW")
+        self.assertEqual((delta["topic"], delta["changes"]), ("tia", {"risk": "HIGH"}))
+
+    def test_topic_filter_and_events(self):
+        async def run():
+            feed = CockpitFeed()
+            sub = await feed.subscribe(["authorization"])
+            await sub.next(1)
+            feed.update("vortex", {"open_positions": 1})
+            feed.publish("authorization", {"action": "GRANT"})
+            return await sub.next(1)
+
+        message = asyncio.run(run())
+        self.assertEqual((message["type"], message["event"]), ("event", {"action": "GRANT"}))
+
+    def test_slow_subscriber_is_resynced(self):
+        async def run():
+            feed = CockpitFeed(max_queue=3)
+            sub = await feed.subscribe()
+            for i in range(10):
+                feed.update("vortex", {"open_positions": i})
+            return sub, await sub.next(1)
+
+        sub, message = asyncio.run(run())
+        self.assertEqual(message["type"], "snapshot")
+        self.assertEqual(message["state"]["vortex"], {"open_positions": 9})
+        self.assertGreater(sub.dropped, 0)
+
+    def test_resume_from_last_event_id(self):
+        async def run():
+            feed = CockpitFeed()
+            for i in range(3):
+                feed.update("vortex", {"open_positions": i})
+            sub = await feed.subscribe(last_id=1)
+            first = await sub.next(1)
+            stale = await feed.subscribe(last_id=10_000)
+            return first, await stale.next(1)
+
+        first, stale = asyncio.run(run())
+        self.assertEqual((first["id"], first["changes"]), (2, {"open_positions": 1}))
+        self.assertEqual(stale["type"], "snapshot")
+
+    def test_no_sampling_without_subscribers(self):
+        async def run():
+            feed = CockpitFeed(interval=0.01)
+            source = Mock(return_value={"a": 1})
+            feed.register("tia", source)
+            feed.start()
+            await asyncio.sleep(0.05)
+            idle_calls = source.call_count
+            sub = await feed.subscribe()
+            await asyncio.sleep(0.05)
+            sub.close()
+            await feed.stop()
+            return idle_calls, source.call_count
+
+        idle_calls, total = asyncio.run(run())
+        self.assertEqual(idle_calls, 0)
+        self.assertGreater(total, 1)
+
+    def test_heartbeat_on_timeout(self):
+        async def run():
+            feed = CockpitFeed()
+            sub = await feed.subscribe()
+            await sub.next(1)
+            return await sub.next(0.01)
+
+        self.assertIsNone(asyncio.run(run()))
+
+
+class TestCockpitWebSocket(unittest.TestCase):
+    """Test the /cockpit/ws push endpoint."""
+
+    def test_websocket_sends_snapshot(self):
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from backend.routers import cockpit
+
+        app = FastAPI()
+        app.include_router(cockpit.router)
+        with TestClient(app).websocket_connect("/cockpit/ws?topics=garage") as ws:
+            message = ws.receive_json()
+        self.assertEqual(message["type"], "snapshot")
+        self.assertEqual(set(message["state"]), {"garage"})
+        self.assertIn("current_bay", message["state"]["garage"])
+
+    def test_tia_topic_does_not_assess(self):
+        from unittest.mock import patch
+        from backend.routers import cockpit
+
+        with patch.object(cockpit.tia_agent, "produce_summary") as produce, \
+                patch.object(cockpit.tia_agent, "_persist_state") as persist:
+            state = cockpit.cockpit_feed._sources["tia"]()
+        produce.assert_not_called()
+        persist.assert_not_called()
+        self.assertIn("risk_level", state)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -32,9 +32,13 @@ class TestExchangeServiceUnit(unittest.TestCase):
         self.assertIsNone(service.exchange)
 
     # -- PAPER mode create_order ---------------------------------------------
+    def _book(self):
+        return {"bids": [[99.0, 10.0]], "asks": [[100.0, 10.0]]}
+
     def test_create_order_paper_returns_paper_trade(self):
         service = self._make_service("PAPER")
         service.exchange = MagicMock()  # simulate initialized
+        service.exchange.fetch_order_book = AsyncMock(return_value=self._book())
         service.mode = "PAPER"
         result = self._run(service.create_order("BTC/USDT", "market", "buy", 10.0))
         self.assertEqual(result["status"], "closed")
@@ -53,6 +57,7 @@ class TestExchangeServiceUnit(unittest.TestCase):
     def test_create_market_buy_paper_returns_paper_trade(self):
         service = self._make_service("PAPER")
         service.exchange = MagicMock()
+        service.exchange.fetch_order_book = AsyncMock(return_value=self._book())
         service.mode = "PAPER"
         result = self._run(service.create_market_buy("BTC/USDT", 50.0))
         self.assertEqual(result["status"], "closed")
@@ -86,6 +91,21 @@ class TestExchangeServiceUnit(unittest.TestCase):
             with self.assertRaises(ValueError):
                 self._run(service.initialize())
 
+    # -- Price feed ----------------------------------------------------------
+    def test_price_feed_fills_price_table(self):
+        service = self._make_service()
+        service.exchange = MagicMock()
+        service.exchange.fetch_tickers = AsyncMock(return_value={"BTC/USDT": {"last": 100.0}})
+
+        async def run():
+            service.start_price_feed(interval=0.01)
+            await asyncio.sleep(0.05)
+            await service.stop_price_feed()
+
+        self._run(run())
+        self.assertEqual(service.prices.get("BTC/USDT", max_age=5), 100.0)
+        self.assertIsNone(service._price_feed_task)
+
 
 if __name__ == "__main__":
     unittest.main()
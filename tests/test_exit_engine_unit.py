@@ -0,0 +1,102 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+import unittest
+from unittest.mock import Mock
+
+from backend.services.exit_engine import ExitEngine, PeakWriteBehind
+from backend.services.position_table import PositionTable
+
+WINGS = {
+    "piranha": {"params": {"target": 0.004, "stop_loss": 0.015}},
+    "harvester": {"params": {"trail_start": 0.005, "trail_distance": 0.015, "pullback_exit": 0.015}},
+    "crab": {"params": {"range_pct": 0.006, "stop_loss": 0.015}},
+}
+
+
+def _table(rows):
+    table = PositionTable()
+    for symbol, wing, entry in rows:
+        table[symbol] = {"entry": entry, "qty": 1.0, "time": 0.0, "wing": wing, "slot": len(table) + 1}
+    return table
+
+
+class TestExitEngine(unittest.TestCase):
+    """One array pass covers every wing's exit rules."""
+
+    def setUp(self):
+        self.engine = ExitEngine(WINGS)
+
+    def test_target_and_stop_per_wing(self):
+        table = _table([("A/USDT", "piranha", 100.0), ("B/USDT", "piranha", 100.0),
+                        ("C/USDT", "crab", 100.0), ("D/USDT", "crab", 100.0)])
+        pnl = table.mark_to_market({"A/USDT": {"last": 100.5}, "B/USDT": {"last": 98.0},
+                                    "C/USDT": {"last": 100.3}, "D/USDT": {"last": 100.7}})
+        signals = {s.symbol: s.reason for s in self.engine.evaluate(table, pnl)}
+        self.assertIn("target", signals["A/USDT"])
+        self.assertIn("stop loss", signals["B/USDT"])
+        self.assertNotIn("C/USDT", signals)
+        self.assertIn("target", signals["D/USDT"])
+
+    def test_harvester_trails_only_after_trail_start(self):
+        table = _table([("H/USDT", "harvester", 100.0)])
+        pnl = table.mark_to_market({"H/USDT": {"last": 103.0}})
+        self.assertEqual(self.engine.evaluate(table, pnl), [])
+        pnl = table.mark_to_market({"H/USDT": {"last": 101.4}})
+        signals = self.engine.evaluate(table, pnl)
+        self.assertEqual(len(signals), 1)
+        self.assertIn("trail", signals[0].reason)
+
+    def test_harvester_pullback_before_arming(self):
+        table = _table([("H/USDT", "harvester", 100.0)])
+        pnl = table.mark_to_market({"H/USDT": {"last": 98.4}})
+        signals = self.engine.evaluate(table, pnl)
+        self.assertIn("pullback", signals[0].reason)
+
+    def test_eligible_mask_suppresses_rows(self):
+        table = _table([("A/USDT", "piranha", 100.0)])
+        pnl = table.mark_to_market({"A/USDT": {"last": 110.0}})
+        self.assertEqual(self.engine.evaluate(table, pnl, eligible=pnl < 0), [])
+
+    def test_check_one_matches_array_rules(self):
+        self.assertIsNotNone(self.engine.check_one("piranha", 0.01, 0.01))
+        self.assertIsNone(self.engine.check_one("harvester", 0.02, 0.02))
+
+
+class TestPeakWriteBehind(unittest.TestCase):
+    """Peaks are queued in memory and flushed as one batch."""
+
+    def test_flush_sends_one_batch_with_latest_peaks(self):
+        cache = Mock()
+        cache.set_peak_prices.return_value = True
+        writer = PeakWriteBehind(cache=cache)
+        table = _table([("A/USDT", "piranha", 100.0), ("B/USDT", "piranha", 10.0)])
+        table.mark_to_market({"A/USDT": {"last": 101.0}, "B/USDT": {"last": 11.0}})
+        writer.collect(table)
+        table.mark_to_market({"A/USDT": {"last": 102.0}})
+        writer.collect(table)
+        writer.discard("B/USDT")
+        asyncio.run(writer.flush())
+        cache.set_peak_prices.assert_called_once_with({"A/USDT": 102.0}, ["B/USDT"])
+        self.assertEqual(writer.pending, 0)
+
+    def test_failed_flush_is_retried(self):
+        cache = Mock()
+        cache.set_peak_prices.return_value = False
+        writer = PeakWriteBehind(cache=cache)
+        table = _table([("A/USDT", "piranha", 100.0)])
+        table.mark_to_market({"A/USDT": {"last": 101.0}})
+        writer.collect(table)
+        asyncio.run(writer.flush())
+        self.assertEqual(writer.pending, 1)
+
+    def test_flush_without_changes_skips_redis(self):
+        cache = Mock()
+        writer = PeakWriteBehind(cache=cache)
+        asyncio.run(writer.flush())
+        cache.set_peak_prices.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
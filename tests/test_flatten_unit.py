@@ -0,0 +1,118 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+from backend.services.flatten import Flattener
+from backend.services.order_tracker import OrderTracker
+
+
+def _balance(**free):
+    return {"free": dict(free), "total": dict(free)}
+
+
+def _exchange_service(balance, markets=None):
+    service = Mock()
+    service.exchange = Mock()
+    service.exchange.markets = markets if markets is not None else {}
+    service.orders = OrderTracker()
+    service.fetch_trading_balance = AsyncMock(return_value=balance)
+    service.cancel_order = AsyncMock(return_value={})
+    service.create_order = AsyncMock(return_value={"id": "x", "status": "closed"})
+    return service
+
+
+def _bought(service, **amounts):
+    """Record filled bot buys so the tracker knows the bot's positions"""
+    for i, (currency, amount) in enumerate(amounts.items()):
+        service.orders.track({"id": f"b{i}", "clientOrderId": f"buy-{currency}", "symbol": f"{currency}/USDT",
+                              "side": "buy", "amount": amount, "filled": amount, "status": "closed"})
+
+
+class TestFlattener(unittest.TestCase):
+    """Tests for the concurrent emergency flatten-all."""
+
+    def test_cancels_orders_and_exits_every_holding(self):
+        service = _exchange_service(_balance(USDT=50.0, BTC=0.1, ETH=2.0))
+        _bought(service, BTC=0.1, ETH=2.0)
+        service.orders.track({"id": "7", "clientOrderId": "a", "symbol": "SOL/USDT",
+                              "amount": 1.0, "filled": 0.0, "status": "open"})
+
+        report = asyncio.run(Flattener(service).flatten_all())
+
+        service.cancel_order.assert_awaited_once_with("7", "SOL/USDT")
+        sold = sorted(call.args for call in service.create_order.await_args_list)
+        self.assertEqual(sold, [("BTC/USDT", "market", "sell", 0.1), ("ETH/USDT", "market", "sell", 2.0)])
+        self.assertEqual((report["canceled"], report["closed"], report["failed"]), (1, 2, 0))
+        self.assertGreaterEqual(report["latency_ms"], 0)
+
+    def test_exits_run_concurrently(self):
+        service = _exchange_service(_balance(BTC=1.0, ETH=1.0, SOL=1.0))
+        in_flight = peak = 0
+
+        async def create_order(*args):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {}
+
+        service.create_order.side_effect = create_order
+        asyncio.run(Flattener(service, max_in_flight=10).flatten_all(whole_account=True))
+        self.assertEqual(peak, 3)
+
+    def test_oversold_retries_with_free_balance(self):
+        service = _exchange_service(_balance(BTC=0.5))
+        service.fetch_trading_balance.side_effect = [_balance(BTC=0.5), _balance(BTC=0.4)]
+        _bought(service, BTC=0.5)
+        service.create_order.side_effect = [Exception("mexc {\"code\":30005}"), {"id": "2"}]
+
+        report = asyncio.run(Flattener(service).flatten_all())
+
+        position = report["positions"][0]
+        self.assertEqual((position["status"], position["amount"]), ("closed", 0.4))
+        self.assertEqual(service.create_order.await_args_list[1].args[3], 0.4)
+
+    def test_unsupported_symbol_does_not_block_others(self):
+        service = _exchange_service(_balance(BAD=3.0, BTC=0.1))
+
+        async def create_order(symbol, *args):
+            if symbol == "BAD/USDT":
+                raise Exception("mexc {\"code\":10007}")
+            return {}
+
+        service.create_order.side_effect = create_order
+        report = asyncio.run(Flattener(service).flatten_all(whole_account=True))
+        statuses = {p["symbol"]: p["status"] for p in report["positions"]}
+        self.assertEqual(statuses, {"BAD/USDT": "unsupported", "BTC/USDT": "closed"})
+
+    def test_skips_unlisted_and_dust(self):
+        markets = {"BTC/USDT": {"limits": {"amount": {"min": 0.001}}}, "ETH/USDT": {}}
+        flattener = Flattener(_exchange_service({}, markets))
+        holdings = flattener.holdings(_balance(USDT=9.0, BTC=0.0001, ETH=1.0, XYZ=5.0), whole_account=True)
+        self.assertEqual(holdings, {"ETH/USDT": 1.0})
+
+    def test_sells_only_what_the_bot_bought(self):
+        service = _exchange_service(_balance(USDT=50.0, BTC=0.3, ETH=2.0))
+        _bought(service, BTC=0.1)
+
+        report = asyncio.run(Flattener(service).flatten_all())
+
+        service.create_order.assert_awaited_once_with("BTC/USDT", "market", "sell", 0.1)
+        self.assertEqual((report["closed"], report["whole_account"]), (1, False))
+
+    def test_unacknowledged_cancel_counts_as_failed(self):
+        service = _exchange_service(_balance())
+        service.cancel_order.return_value = None
+        service.orders.track({"id": "7", "clientOrderId": "a", "symbol": "SOL/USDT",
+                              "amount": 1.0, "filled": 0.0, "status": "open"})
+
+        report = asyncio.run(Flattener(service).flatten_all())
+        self.assertEqual((report["canceled"], report["cancel_failed"]), (0, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+import tempfile
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from backend.services.cache_codec import BinaryCodec
+from backend.services.memory_redis import AsyncMemoryRedis, MemoryRedis, ResponseError
+
+
+class TestMemoryRedis(unittest.TestCase):
+    """Tests for the embedded Redis-compatible store."""
+
+    def test_hashes_and_lists(self):
+        r = MemoryRedis()
+        self.assertEqual(r.hset("h", mapping={"a": 1.5, "b": "x"}), 2)
+        self.assertEqual(r.hget("h", "a"), "1.5")
+        r.hdel("h", "a", "b")
+        self.assertEqual(r.hgetall("h"), {})
+        self.assertEqual(r.exists("h"), 0)  # empty hash removes the key
+
+        r.lpush("l", "a", "b", "c")
+        r.ltrim("l", 0, 1)
+        self.assertEqual(r.lrange("l", 0, -1), ["c", "b"])
+
+    def test_wrong_type(self):
+        r = MemoryRedis()
+        r.set("k", "v")
+        with self.assertRaises(ResponseError):
+            r.hget("k", "f")
+
+    def test_ttl_lazy_and_swept(self):
+        r = MemoryRedis()
+        r.setex("lazy", 0.01, "v")
+        r.setex("swept", 0.01, "v")
+        r.set("kept", "v")
+        time.sleep(0.02)
+        self.assertIsNone(r.get("lazy"))
+        self.assertEqual(r.sweep(), 1)
+        self.assertEqual(r.dbsize(), 1)
+        self.assertEqual(r.expired, 2)
+
+    def test_rewrite_clears_ttl(self):
+        r = MemoryRedis()
+        r.setex("k", 0.01, "old")
+        r.set("k", "new")
+        time.sleep(0.02)
+        r.sweep()
+        self.assertEqual(r.get("k"), "new")
+
+    def test_pipeline(self):
+        r = MemoryRedis()
+        pipe = r.pipeline(transaction=False)
+        pipe.hset("h", mapping={"a": "1"})
+        pipe.expire("h", 60)
+        self.assertEqual(pipe.execute(), [1, True])
+        self.assertGreater(r.ttl("h"), 0)
+
+
+class TestMemoryRedisStreams(unittest.TestCase):
+    """Tests for stream commands and consumer groups."""
+
+    def test_ids_range_and_trim(self):
+        r = MemoryRedis()
+        with patch("backend.services.memory_redis.time.time", return_value=1.0):
+            ids = [r.xadd("s", {"n": i}) for i in range(3)]
+        self.assertEqual(ids, ["1000-0", "1000-1", "1000-2"])
+        self.assertEqual([e[0] for e in r.xrange("s", "(1000-0", "+")], ids[1:])
+        self.assertEqual([e[0] for e in r.xrevrange("s", count=2)], ["1000-2", "1000-1"])
+        self.assertEqual(len(r.xrange("s", "1000", "1000")), 3)  # whole millisecond
+        r.xadd("s", {"n": 3}, maxlen=2)
+        self.assertEqual(r.xlen("s"), 2)
+        self.assertEqual(r.xtrim("s", minid="9999999999999"), 2)
+
+    def test_consumer_group_delivery_and_ack(self):
+        r = MemoryRedis()
+        r.xgroup_create("s", "g", id="0", mkstream=True)
+        with self.assertRaises(ResponseError):
+            r.xgroup_create("s", "g")
+        first = r.xadd("s", {"n": "1"})
+        r.xadd("s", {"n": "2"})
+
+        (name, entries), = r.xreadgroup("g", "c1", {"s": ">"}, count=1)
+        self.assertEqual(entries[0][0], first)
+        self.assertEqual(len(r.xreadgroup("g", "c2", {"s": ">"})[0][1]), 1)
+        self.assertEqual(r.xreadgroup("g", "c2", {"s": ">"}), [])
+        self.assertEqual(r.xpending("s", "g")["pending"], 2)
+        self.assertEqual(r.xack("s", "g", first), 1)
+        self.assertEqual(r.xpending("s", "g")["pending"], 1)
+
+    def test_redis_cache_trade_history(self):
+        from backend.services.redis_cache import RedisCache
+        with patch.object(RedisCache, '_connect'):
+            cache = RedisCache()
+        cache.client = cache.memory = MemoryRedis()
+        cache.codec = BinaryCodec()
+        cache.log_trade({"symbol": "BTC/USDT", "side": "buy"})
+        cache.log_trade({"symbol": "ETH/USDT", "side": "sell"})
+        self.assertEqual([t["symbol"] for t in cache.get_trade_history()], ["ETH/USDT", "BTC/USDT"])
+        self.assertEqual(len(cache.get_trades(symbol="BTC/USDT")), 1)
+        cache.log_trade({"symbol": "SOL/USDT", "side": "buy"})
+        self.assertEqual([t["symbol"] for t in cache.get_trades(limit=2)], ["ETH/USDT", "SOL/USDT"])
+
+
+class TestMemoryRedisFallback(unittest.TestCase):
+    """Tests for when the caches switch to the embedded store."""
+
+    def _cache(self, memory_enabled=True):
+        from backend.services import redis_cache as module
+        unreachable = Mock()
+        unreachable.ping.side_effect = ConnectionError("refused")
+        with patch.dict(os.environ, {"REDIS_ENABLED": "True"}), \
+                patch.object(module.redis, "from_url", return_value=unreachable), \
+                patch.object(module.settings, "MEMORY_CACHE_ENABLED", memory_enabled):
+            return module.RedisCache()
+
+    def test_unreachable_at_startup_keeps_redis(self):
+        for memory_enabled in (True, False):
+            cache = self._cache(memory_enabled)
+            self.assertIsNone(cache.memory)
+            self.assertIsNotNone(cache.client)  # the health monitor reconnects
+            self.assertFalse(cache.is_connected())
+
+    def test_disabled_redis_uses_the_embedded_store(self):
+        from backend.services import redis_cache as module
+        from backend.services.memory_redis import memory_redis
+        with patch.dict(os.environ, {"REDIS_ENABLED": "False"}):
+            cache = module.RedisCache()
+        self.assertIs(cache.memory, memory_redis)
+        self.assertTrue(cache.is_connected())
+
+    def test_async_cache_follows_the_sync_choice(self):
+        from backend.services.async_redis_cache import AsyncRedisCache
+        with patch.dict(os.environ, {"REDIS_ENABLED": "True"}):
+            self.assertTrue(AsyncRedisCache(embedded=True).use_memory)
+            self.assertFalse(AsyncRedisCache().use_memory)
+
+
+class TestMemoryRedisSnapshot(unittest.TestCase):
+    """Tests for disk snapshots and the asyncio facade."""
+
+    def test_snapshot_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "cache.json")
+            r = MemoryRedis(snapshot_path=path)
+            r.hset("h", "f", b"\x00binary")
+            r.setex("gone", 0.01, "v")
+            r.setex("ticker", 60, "{}")
+            r.xgroup_create("s", "g", mkstream=True)
+            r.xadd("s", {"n": "1"})
+            time.sleep(0.02)
+            self.assertTrue(r.save())
+
+            restored = MemoryRedis(snapshot_path=path)
+            self.assertEqual(restored.hget("h", "f"), b"\x00binary")
+            self.assertIsNone(restored.get("gone"))
+            self.assertGreater(restored.ttl("ticker"), 0)
+            self.assertEqual(len(restored.xreadgroup("g", "c", {"s": ">"})[0][1]), 1)
+
+    def test_async_facade_shares_the_store(self):
+        store = MemoryRedis()
+        client = AsyncMemoryRedis(store)
+
+        async def run():
+            pipe = client.pipeline(transaction=False)
+            pipe.hset("vortex:peaks", mapping={"BTC/USDT": "1.0"})
+            await pipe.execute()
+            return await client.hget("vortex:peaks", "BTC/USDT")
+
+        self.assertEqual(asyncio.run(run()), "1.0")
+        self.assertEqual(store.hgetall("vortex:peaks"), {"BTC/USDT": "1.0"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import json
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from backend.services.near_cache import NearCache, NearCacheInvalidator
+
+
+class TestNearCache(unittest.TestCase):
+    """Tests for the in-process TTL/LRU tier."""
+
+    def test_hit_and_miss_counters(self):
+        cache = NearCache(max_entries=4, ttl=60)
+        self.assertIsNone(cache.get("a"))
+        cache.put("a", 1)
+        self.assertEqual(cache.get("a"), 1)
+        stats = cache.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["hit_rate"]), (1, 1, 0.5))
+
+    def test_lru_eviction(self):
+        cache = NearCache(max_entries=2, ttl=60)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")  # a is now most recently used
+        cache.put("c", 3)
+        self.assertEqual(cache.lookup("b"), (False, None))
+        self.assertEqual(cache.lookup("a"), (True, 1))
+        self.assertEqual(cache.evictions, 1)
+
+    def test_ttl_expiry(self):
+        cache = NearCache(ttl=0.01)
+        cache.put("a", 1)
+        time.sleep(0.02)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.expirations, 1)
+
+    def test_cached_none_is_a_hit(self):
+        cache = NearCache(ttl=60)
+        cache.put("a", None)
+        self.assertEqual(cache.lookup("a"), (True, None))
+
+
+class TestNearCacheInvalidator(unittest.TestCase):
+    """Tests for cross-node invalidation messages."""
+
+    def test_other_nodes_messages_invalidate(self):
+        cache = NearCache(ttl=60)
+        cache.put("peak:BTC/USDT", 1.0)
+        local = NearCacheInvalidator(cache, Mock())
+        remote = NearCacheInvalidator(NearCache(), Mock())
+
+        local.handle({"data": local.encode(["peak:BTC/USDT"])})
+        self.assertEqual(len(cache), 1)  # own message ignored
+        local.handle({"data": remote.encode(["peak:BTC/USDT"])})
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.invalidations, 1)
+
+    def test_publish_is_noop_until_started(self):
+        client = Mock()
+        invalidator = NearCacheInvalidator(NearCache(), lambda: client)
+        invalidator.publish(client, "ticker:BTC/USDT")
+        client.publish.assert_not_called()
+
+
+class TestRedisCacheNearTier(unittest.TestCase):
+    """Tests for RedisCache reads served by the near cache."""
+
+    def _cache(self):
+        from backend.services.redis_cache import RedisCache
+        with patch.object(RedisCache, '_connect'):
+            cache = RedisCache()
+        cache.client = Mock()
+        return cache
+
+    def test_repeated_peak_reads_hit_redis_once(self):
+        cache = self._cache()
+        cache.client.hget.return_value = "50000.0"
+        for _ in range(5):
+            self.assertEqual(cache.get_peak_price("BTC/USDT"), 50000.0)
+        cache.client.hget.assert_called_once()
+
+    def test_local_write_updates_near_cache(self):
+        cache = self._cache()
+        cache.set_peak_price("BTC/USDT", 123.0)
+        self.assertEqual(cache.get_peak_price("BTC/USDT"), 123.0)
+        cache.client.hget.assert_not_called()
+
+    def test_ticker_reads_are_cached(self):
+        cache = self._cache()
+        cache.client.get.return_value = json.dumps({"last": 1.5})
+        cache.get_cached_ticker("ETH/USDT")
+        self.assertEqual(cache.get_cached_ticker("ETH/USDT"), {"last": 1.5})
+        cache.client.get.assert_called_once()
+
+    def test_started_invalidator_publishes_writes(self):
+        cache = self._cache()
+        cache.invalidator._thread = Mock()  # pretend the listener is running
+        cache.clear_peak("BTC/USDT")
+        channel, message = cache.client.publish.call_args.args
+        self.assertEqual(channel, cache.invalidator.channel)
+        self.assertTrue(message.endswith("|peak:BTC/USDT"))
+
+
+if __name__ == "__main__":
+    unittest.main()
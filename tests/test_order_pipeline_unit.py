@@ -0,0 +1,122 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+import unittest
+from unittest.mock import MagicMock
+
+from backend.services.exchange import ExchangeService
+from backend.services.order_pipeline import OrderPipeline, new_client_order_id
+
+
+class TestClientOrderIds(unittest.TestCase):
+    """Tests for client order id generation."""
+
+    def test_ids_are_unique_and_short(self):
+        ids = {new_client_order_id() for _ in range(10_000)}
+        self.assertEqual(len(ids), 10_000)
+        self.assertTrue(all(len(i) <= 32 and i.isalnum() for i in ids))
+
+    def test_paper_orders_on_same_pair_do_not_collide(self):
+        service = ExchangeService()
+        service.exchange = MagicMock()
+        service.mode = "PAPER"
+
+        async def run():
+            a = await service.create_order("BTC/USDT", "market", "buy", 1.0)
+            b = await service.create_order("BTC/USDT", "market", "buy", 1.0)
+            c = await service.create_market_buy("BTC/USDT", 5.0, client_order_id="fixed1")
+            return a, b, c
+
+        a, b, c = asyncio.run(run())
+        self.assertNotEqual(a["id"], b["id"])
+        self.assertEqual(c["clientOrderId"], "fixed1")
+
+
+class TestOrderPipeline(unittest.TestCase):
+    """Tests for concurrent submission and ack correlation."""
+
+    def test_batch_runs_concurrently_within_window(self):
+        active = 0
+        peak = 0
+
+        async def submit(symbol, side, amount, order_type, cid):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+            return {"id": cid, "clientOrderId": cid, "symbol": symbol}
+
+        pipeline = OrderPipeline(submit, max_in_flight=4)
+        orders = [{"symbol": f"C{i}/USDT", "side": "sell", "amount": 1.0} for i in range(12)]
+
+        async def run():
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            results = await pipeline.submit_many(orders)
+            return results, loop.time() - started
+
+        results, elapsed = asyncio.run(run())
+        self.assertEqual([r["symbol"] for r in results], [o["symbol"] for o in orders])
+        self.assertEqual(peak, 4)
+        self.assertLess(elapsed, 12 * 0.02)
+        self.assertEqual(pipeline.get_stats()["acked"], 12)
+        self.assertEqual(pipeline.in_flight, 0)
+
+    def test_rejection_is_isolated(self):
+        async def submit(symbol, side, amount, order_type, cid):
+            if symbol == "BAD/USDT":
+                raise ValueError("rejected")
+            return {"clientOrderId": cid}
+
+        pipeline = OrderPipeline(submit)
+        results = asyncio.run(pipeline.submit_many([
+            {"symbol": "BAD/USDT", "side": "buy", "amount": 1.0},
+            {"symbol": "OK/USDT", "side": "buy", "amount": 1.0},
+        ]))
+        self.assertIsInstance(results[0], ValueError)
+        self.assertIn("clientOrderId", results[1])
+        self.assertEqual(pipeline.rejected, 1)
+
+    def test_external_ack_resolves_by_client_order_id(self):
+        release = None
+
+        async def submit(symbol, side, amount, order_type, cid):
+            await release.wait()
+            return {"clientOrderId": cid, "status": "late"}
+
+        pipeline = OrderPipeline(submit)
+
+        async def run():
+            nonlocal release
+            release = asyncio.Event()
+            future = pipeline.submit("BTC/USDT", "buy", 1.0, client_order_id="abc1")
+            await asyncio.sleep(0)
+            self.assertTrue(pipeline.on_ack({"clientOrderId": "abc1", "status": "filled"}))
+            result = await future
+            release.set()
+            await asyncio.sleep(0.01)
+            return result
+
+        self.assertEqual(asyncio.run(run())["status"], "filled")
+        self.assertEqual(pipeline.acked, 1)
+
+    def test_duplicate_client_order_id_rejected(self):
+        async def submit(*args):
+            await asyncio.sleep(0.01)
+            return {}
+
+        pipeline = OrderPipeline(submit)
+
+        async def run():
+            pipeline.submit("A/USDT", "buy", 1.0, client_order_id="dup")
+            with self.assertRaises(ValueError):
+                pipeline.submit("A/USDT", "buy", 1.0, client_order_id="dup")
+            await asyncio.sleep(0.02)
+
+        asyncio.run(run())
+
+
+if __name__ == "__main__":
+    unittest.main()
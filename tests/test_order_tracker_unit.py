@@ -0,0 +1,126 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock
+
+from backend.services.order_tracker import (
+    CANCELED, FILLED, NEW, PARTIALLY_FILLED, OrderTracker, UserDataStream,
+)
+
+
+def _update(status="open", filled=0.0, amount=1.0, order_id="1", cid="c1", symbol="BTC/USDT"):
+    return {"id": order_id, "clientOrderId": cid, "symbol": symbol, "side": "buy",
+            "amount": amount, "filled": filled, "status": status}
+
+
+class TestOrderTracker(unittest.TestCase):
+    """Tests for the order lifecycle state machine."""
+
+    def test_lifecycle_transitions(self):
+        tracker = OrderTracker()
+        seen = []
+        tracker.add_listener(lambda order, previous: seen.append((previous, order.state)))
+
+        self.assertEqual(tracker.track(_update()).state, NEW)
+        self.assertEqual(tracker.apply_update(_update(filled=0.4)).state, PARTIALLY_FILLED)
+        self.assertEqual(tracker.apply_update(_update(filled=1.0)).state, FILLED)
+        self.assertEqual(seen, [(NEW, PARTIALLY_FILLED), (PARTIALLY_FILLED, FILLED)])
+
+    def test_terminal_state_is_absorbing(self):
+        tracker = OrderTracker()
+        tracker.apply_update(_update(status="canceled", filled=0.2))
+        order = tracker.apply_update(_update(status="open", filled=0.5))
+        self.assertEqual(order.state, CANCELED)
+        self.assertEqual(order.filled, 0.2)
+
+    def test_filled_never_goes_backwards(self):
+        tracker = OrderTracker()
+        tracker.apply_update(_update(filled=0.6))
+        order = tracker.apply_update(_update(filled=0.3))
+        self.assertEqual(order.filled, 0.6)
+        self.assertEqual(order.state, PARTIALLY_FILLED)
+
+    def test_open_orders_index(self):
+        tracker = OrderTracker()
+        tracker.apply_update(_update(order_id="1", cid="a"))
+        tracker.apply_update(_update(order_id="2", cid="b", symbol="ETH/USDT"))
+        tracker.apply_update(_update(order_id="3", cid="c", status="closed", filled=1.0))
+
+        self.assertEqual([o.order_id for o in tracker.open_orders("BTC/USDT")], ["1"])
+        self.assertEqual(sorted(tracker.open_symbols()), ["BTC/USDT", "ETH/USDT"])
+        # Updates carrying only the exchange id resolve to the same order
+        tracker.apply_update({"id": "2", "status": "canceled"})
+        self.assertEqual(tracker.open_symbols(), ["BTC/USDT"])
+        self.assertEqual(tracker.get(client_order_id="b").state, CANCELED)
+
+    def test_positions_net_fills_by_side(self):
+        tracker = OrderTracker()
+        tracker.apply_update(_update(filled=0.4))
+        tracker.apply_update(_update(status="closed", filled=1.0))
+        tracker.apply_update(_update(status="closed", filled=1.0))  # duplicate push
+        sell = dict(_update(order_id="2", cid="c2", status="closed", filled=0.25), side="sell")
+        tracker.apply_update(sell)
+
+        self.assertAlmostEqual(tracker.position("BTC/USDT"), 0.75)
+        self.assertEqual(tracker.position("ETH/USDT"), 0.0)
+
+    def test_wait_closed_resolves_on_update(self):
+        tracker = OrderTracker()
+        tracker.track(_update())
+
+        async def run():
+            waiter = asyncio.create_task(tracker.wait_closed("c1", timeout=1))
+            await asyncio.sleep(0)
+            tracker.apply_update(_update(status="closed", filled=1.0))
+            return await waiter
+
+        self.assertEqual(asyncio.run(run()).state, FILLED)
+
+
+class TestUserDataStream(unittest.TestCase):
+    """Tests for the websocket feed and post-reconnect reconciliation."""
+
+    def test_reconciles_only_after_disconnect(self):
+        tracker = OrderTracker()
+        tracker.track(_update(order_id="1", cid="a"))
+        tracker.track(_update(order_id="2", cid="b"))
+
+        ws = AsyncMock()
+        rest = AsyncMock()
+        rest.fetch_open_orders.return_value = [_update(order_id="1", cid="a", filled=0.5)]
+        rest.fetch_order.return_value = _update(order_id="2", cid="b", status="closed", filled=1.0)
+        stream = UserDataStream(tracker, ws, rest, max_backoff=0)
+
+        calls = 0
+
+        async def watch_orders():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                return [_update(order_id="1", cid="a", filled=0.2)]
+            if calls == 2:
+                raise ConnectionError("socket closed")
+            if calls == 3:
+                return []
+            raise asyncio.CancelledError()
+
+        ws.watch_orders.side_effect = watch_orders
+
+        async def run():
+            with self.assertRaises(asyncio.CancelledError):
+                await stream.run()
+
+        asyncio.run(run())
+
+        rest.fetch_open_orders.assert_awaited_once_with("BTC/USDT")
+        rest.fetch_order.assert_awaited_once_with("2", "BTC/USDT")
+        self.assertEqual(stream.reconnects, 1)
+        self.assertEqual(tracker.get(client_order_id="a").filled, 0.5)
+        self.assertEqual(tracker.get(client_order_id="b").state, FILLED)
+        self.assertEqual([o.key for o in tracker.open_orders()], ["a"])
+
+
+if __name__ == "__main__":
+    unittest.main()
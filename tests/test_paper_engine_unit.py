@@ -0,0 +1,186 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+import time
+import unittest
+
+from backend.services.paper_engine import PaperLedger, PaperMatchingEngine, walk_levels
+
+
+def _book():
+    return {
+        "bids": [[99.0, 1.0], [98.0, 2.0]],
+        "asks": [[100.0, 1.0], [101.0, 2.0], [102.0, 5.0]],
+    }
+
+
+def _engine(**kwargs):
+    kwargs.setdefault("ledger", PaperLedger({"USDT": 1000.0}))
+    kwargs.setdefault("taker_fee", 0.001)
+    kwargs.setdefault("maker_fee", 0.0)
+    kwargs.setdefault("latency", 0.0)
+    engine = PaperMatchingEngine(**kwargs)
+    engine.set_book("BTC/USDT", _book())
+    return engine
+
+
+class TestWalkLevels(unittest.TestCase):
+    """Tests for the book-walking primitive."""
+
+    def test_walks_multiple_levels(self):
+        filled, cost, fills = walk_levels([[100.0, 1.0], [101.0, 2.0]], amount=2.0)
+        self.assertEqual((filled, cost), (2.0, 201.0))
+        self.assertEqual(fills, [(100.0, 1.0), (101.0, 1.0)])
+
+    def test_limit_stops_walk(self):
+        filled, _, _ = walk_levels([[100.0, 1.0], [101.0, 2.0]], amount=2.0, limit=100.5)
+        self.assertEqual(filled, 1.0)
+
+    def test_quote_budget(self):
+        filled, cost, _ = walk_levels([[100.0, 1.0], [200.0, 1.0]], quote=150.0)
+        self.assertAlmostEqual(filled, 1.25)
+        self.assertAlmostEqual(cost, 150.0)
+
+    def test_consume_removes_liquidity(self):
+        levels = [[100.0, 1.0], [101.0, 2.0]]
+        walk_levels(levels, amount=1.5, consume=True)
+        self.assertEqual(levels, [[101.0, 1.5]])
+
+
+class TestPaperMatchingEngine(unittest.TestCase):
+    """Tests for simulated PAPER fills and the ledger."""
+
+    def test_market_buy_walks_book_with_fees(self):
+        engine = _engine()
+        order = asyncio.run(engine.create_order("BTC/USDT", "market", "buy", amount=2.0))
+        self.assertEqual(order["status"], "closed")
+        self.assertAlmostEqual(order["average"], 100.5)
+        self.assertAlmostEqual(order["fee"]["cost"], 0.201)
+        self.assertAlmostEqual(engine.ledger.balances["USDT"], 1000.0 - 201.0 - 0.201)
+        self.assertAlmostEqual(engine.ledger.balances["BTC"], 2.0)
+
+    def test_fills_consume_cached_liquidity(self):
+        engine = _engine()
+
+        async def run():
+            first = await engine.create_order("BTC/USDT", "market", "buy", amount=1.0)
+            second = await engine.create_order("BTC/USDT", "market", "buy", amount=1.0)
+            return first, second
+
+        first, second = asyncio.run(run())
+        self.assertEqual(first["average"], 100.0)
+        self.assertEqual(second["average"], 101.0)
+
+    def test_quote_sized_market_buy(self):
+        engine = _engine()
+        order = asyncio.run(engine.create_order("BTC/USDT", "market", "buy", quote_amount=50.0))
+        self.assertEqual(order["amount"], 50.0)
+        self.assertAlmostEqual(order["filled"], 0.5)
+
+    def test_market_order_partially_fills_thin_book(self):
+        engine = _engine(ledger=PaperLedger({"USDT": 10_000.0}))
+        order = asyncio.run(engine.create_order("BTC/USDT", "market", "buy", amount=10.0))
+        self.assertEqual(order["status"], "closed")
+        self.assertAlmostEqual(order["filled"], 8.0)
+        self.assertAlmostEqual(order["remaining"], 2.0)
+
+    def test_limit_remainder_rests_then_fills_as_maker(self):
+        engine = _engine()
+        order = asyncio.run(engine.create_order("BTC/USDT", "limit", "buy", amount=2.0, price=100.0))
+        self.assertEqual(order["status"], "open")
+        self.assertEqual(order["filled"], 1.0)
+        updated = engine.set_book("BTC/USDT", {"bids": [], "asks": [[99.5, 5.0]]})
+        self.assertEqual(updated[0]["status"], "closed")
+        self.assertAlmostEqual(updated[0]["fee"]["cost"], 0.1)  # taker on first fill only
+        self.assertEqual(engine.open_orders, {})
+
+    def test_sell_requires_position_and_realizes_pnl(self):
+        engine = _engine()
+
+        async def run():
+            rejected = await engine.create_order("BTC/USDT", "market", "sell", amount=1.0)
+            await engine.create_order("BTC/USDT", "market", "buy", amount=1.0)
+            sold = await engine.create_order("BTC/USDT", "market", "sell", amount=1.0)
+            return rejected, sold
+
+        rejected, sold = asyncio.run(run())
+        self.assertEqual(rejected["status"], "rejected")
+        self.assertEqual(sold["average"], 99.0)
+        self.assertAlmostEqual(engine.ledger.realized_pnl, -1.0 - 0.099)
+
+    def test_falls_back_to_reference_price_without_book(self):
+        engine = PaperMatchingEngine(price_source=lambda s: 10.0, ledger=PaperLedger({"USDT": 100.0}),
+                                     taker_fee=0.0, latency=0.0)
+        order = asyncio.run(engine.create_order("ETH/USDT", "market", "buy", amount=2.0))
+        self.assertEqual((order["status"], order["average"]), ("closed", 10.0))
+
+    def test_fetched_books_fill_resting_orders(self):
+        books = [{"bids": [[99.0, 1.0]], "asks": [[101.0, 5.0]]}]
+        engine = PaperMatchingEngine(book_source=lambda s: books[-1], ledger=PaperLedger({"USDT": 1000.0}),
+                                     taker_fee=0.0, maker_fee=0.0, latency=0.0, book_max_age=0.0)
+
+        async def run():
+            resting = await engine.create_order("BTC/USDT", "limit", "buy", amount=2.0, price=100.0)
+            books.append({"bids": [[99.0, 1.0]], "asks": [[99.5, 1.0]]})
+            await engine.create_order("ETH/USDT", "market", "buy", amount=0.1)  # other symbol: no match
+            self.assertEqual(resting["filled"], 0.0)
+            await engine.create_order("BTC/USDT", "limit", "buy", amount=0.1, price=90.0)
+            self.assertEqual(resting["filled"], 1.0)  # matched when _book fetched the new book
+            books.append({"bids": [[99.0, 1.0]], "asks": [[98.0, 5.0]]})
+            await engine.poll_resting()
+            return resting
+
+        resting = asyncio.run(run())
+        self.assertEqual(resting["status"], "closed")
+        self.assertAlmostEqual(resting["average"], (99.5 + 98.0) / 2)
+
+    def test_resting_orders_reserve_funds(self):
+        engine = _engine(maker_fee=0.0)
+        engine.set_book("BTC/USDT", {"bids": [[90.0, 10.0]], "asks": [[110.0, 10.0]]})
+
+        async def run():
+            orders = [await engine.create_order("BTC/USDT", "limit", "buy", amount=4.0, price=100.0)
+                      for _ in range(3)]
+            self.assertEqual([o["status"] for o in orders], ["open", "open", "rejected"])
+            self.assertAlmostEqual(engine.ledger.to_balance()["free"]["USDT"], 200.0)
+            engine.cancel_order(orders[1]["id"])
+            self.assertAlmostEqual(engine.ledger.free("USDT"), 600.0)
+            engine.set_book("BTC/USDT", {"bids": [], "asks": [[95.0, 10.0]]})
+
+        asyncio.run(run())
+        self.assertAlmostEqual(engine.ledger.balances["USDT"], 1000.0 - 380.0)
+        self.assertEqual(dict(engine.ledger.used), {})
+
+    def test_resting_sell_reserves_position(self):
+        engine = _engine()
+
+        async def run():
+            await engine.create_order("BTC/USDT", "market", "buy", amount=1.0)
+            await engine.create_order("BTC/USDT", "limit", "sell", amount=1.0, price=200.0)
+            return await engine.create_order("BTC/USDT", "market", "sell", amount=1.0)
+
+        self.assertEqual(asyncio.run(run())["status"], "rejected")
+
+    def test_settle_rejects_oversell(self):
+        ledger = PaperLedger({"USDT": 100.0, "BTC": 1.0})
+        with self.assertRaises(ValueError):
+            ledger.settle("BTC/USDT", "sell", 2.0, 200.0, 0.0, "paper_1")
+        self.assertEqual((ledger.balances["BTC"], ledger.balances["USDT"]), (1.0, 100.0))
+
+    def test_thousands_of_orders_per_second(self):
+        engine = _engine(ledger=PaperLedger({"USDT": 1e12}))
+        engine.set_book("BTC/USDT", {"bids": [[99.0, 1e9]], "asks": [[100.0, 1e9]]})
+
+        async def run():
+            started = time.perf_counter()
+            for _ in range(2000):
+                await engine.create_order("BTC/USDT", "market", "buy", amount=0.01)
+            return time.perf_counter() - started
+
+        self.assertLess(asyncio.run(run()), 1.0)
+        self.assertEqual(engine.orders_filled, 2000)
+
+
+if __name__ == "__main__":
+    unittest.main()
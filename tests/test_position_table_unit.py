@@ -0,0 +1,116 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import math
+import unittest
+
+import numpy as np
+
+from backend.services.position_table import PositionTable
+
+
+def _position(entry, qty=1.0, slot=1, wing="piranha", t=1000.0):
+    return {"entry": entry, "qty": qty, "time": t, "wing": wing, "slot": slot, "peak_profit": 0.0}
+
+
+class TestPositionTableMapping(unittest.TestCase):
+    """The table must stay a drop-in for the old dict-of-dicts."""
+
+    def test_set_get_and_contains(self):
+        table = PositionTable()
+        table["BTC/USDT"] = _position(50000.0, qty=0.001)
+        self.assertIn("BTC/USDT", table)
+        self.assertEqual(table["BTC/USDT"]["entry"], 50000.0)
+        self.assertEqual(table["BTC/USDT"]["wing"], "piranha")
+        self.assertEqual(table["BTC/USDT"]["slot"], 1)
+
+    def test_record_writes_through_to_columns(self):
+        table = PositionTable()
+        table["BTC/USDT"] = _position(100.0)
+        table["BTC/USDT"]["time"] = 42.0
+        self.assertEqual(table.column("time")[0], 42.0)
+
+    def test_delete_packs_rows_and_keeps_index(self):
+        table = PositionTable()
+        for i, sym in enumerate(["A/USDT", "B/USDT", "C/USDT"]):
+            table[sym] = _position(10.0 * (i + 1), slot=i + 1)
+        del table["A/USDT"]
+        self.assertEqual(len(table), 2)
+        self.assertEqual(table["C/USDT"]["entry"], 30.0)
+        self.assertEqual(table["C/USDT"]["slot"], 3)
+        self.assertEqual(sorted(table.symbols), ["B/USDT", "C/USDT"])
+        self.assertIsNotNone(table.pop("B/USDT", None))
+        self.assertEqual(table.symbols, ["C/USDT"])
+
+    def test_partial_record_gets_defaults(self):
+        table = PositionTable()
+        table["ETH/USDT"] = {"slot": 2, "wing": "piranha"}
+        self.assertEqual(table["ETH/USDT"]["entry"], 0.0)
+        self.assertEqual(table["ETH/USDT"]["slot"], 2)
+
+    def test_extra_fields_are_kept(self):
+        table = PositionTable()
+        table["ETH/USDT"] = dict(_position(1.0), order_id="abc")
+        self.assertEqual(table["ETH/USDT"]["order_id"], "abc")
+
+    def test_grows_past_initial_capacity(self):
+        table = PositionTable(capacity=2)
+        for i in range(30):
+            table[f"S{i}/USDT"] = _position(1.0 + i, slot=i + 1)
+        self.assertEqual(len(table), 30)
+        self.assertEqual(table["S29/USDT"]["entry"], 30.0)
+
+    def test_equality_with_plain_dict(self):
+        table = PositionTable()
+        self.assertEqual(table, {})
+
+
+class TestPositionTableVectorized(unittest.TestCase):
+    """Per-tick updates across all rows."""
+
+    def _table(self):
+        table = PositionTable()
+        table["A/USDT"] = _position(100.0, qty=2.0)
+        table["B/USDT"] = _position(50.0, qty=1.0, slot=2)
+        return table
+
+    def test_mark_to_market_updates_pnl_and_peaks(self):
+        table = self._table()
+        pnl = table.mark_to_market({"A/USDT": {"last": 110.0}, "B/USDT": {"last": 45.0}})
+        np.testing.assert_allclose(pnl, [0.10, -0.10])
+        self.assertAlmostEqual(table["A/USDT"]["peak_profit"], 0.10)
+        self.assertAlmostEqual(table["B/USDT"]["peak_profit"], 0.0)
+        self.assertEqual(table["A/USDT"]["peak_price"], 110.0)
+
+    def test_peak_does_not_fall_back(self):
+        table = self._table()
+        table.mark_to_market({"A/USDT": {"last": 120.0}})
+        table.mark_to_market({"A/USDT": {"last": 105.0}})
+        self.assertAlmostEqual(table["A/USDT"]["peak_profit"], 0.20)
+        self.assertEqual(table["A/USDT"]["last_price"], 105.0)
+
+    def test_missing_price_keeps_last(self):
+        table = self._table()
+        table.mark_to_market({"A/USDT": {"last": 110.0}})
+        table.mark_to_market({})
+        self.assertEqual(table["A/USDT"]["last_price"], 110.0)
+
+    def test_unrealized_pnl(self):
+        table = self._table()
+        table.mark_to_market({"A/USDT": {"last": 110.0}, "B/USDT": {"last": 45.0}})
+        self.assertAlmostEqual(table.total_unrealized_pnl(), 20.0 - 5.0)
+
+    def test_pnl_nan_without_entry(self):
+        table = PositionTable()
+        table["X/USDT"] = {"slot": 1, "wing": "crab"}
+        pnl = table.mark_to_market({"X/USDT": {"last": 1.0}})
+        self.assertTrue(math.isnan(pnl[0]))
+
+    def test_wing_mask(self):
+        table = self._table()
+        table["C/USDT"] = _position(1.0, wing="harvester", slot=3)
+        self.assertEqual(table.wing_mask("harvester").tolist(), [False, False, True])
+
+
+if __name__ == "__main__":
+    unittest.main()
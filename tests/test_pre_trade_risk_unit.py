@@ -0,0 +1,111 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+import time
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+from backend.services.market_feed import MarketFeed, PriceTable
+from backend.services.oms import OMS
+from backend.services.pre_trade_risk import PreTradeRisk
+
+
+def _exchange_service(markets=None, last=100.0):
+    service = Mock()
+    service.exchange = Mock()
+    service.exchange.markets = markets or {}
+    service.fetch_ticker = AsyncMock(return_value={"last": last})
+    service.create_order = AsyncMock(return_value={"id": "1"})
+    return service
+
+
+def _capabilities(enabled=True):
+    caps = Mock()
+    caps.has_capability = Mock(return_value=enabled)
+    return caps
+
+
+class TestPriceTable(unittest.TestCase):
+    """Tests for the local last-price table."""
+
+    def test_staleness_bound(self):
+        table = PriceTable()
+        table.update("BTC/USDT", 10.0, observed_at=time.time() - 30)
+        self.assertEqual(table.get("BTC/USDT"), 10.0)
+        self.assertIsNone(table.get("BTC/USDT", max_age=5))
+
+    def test_fed_by_market_feed_listener(self):
+        table = PriceTable()
+        feed = MarketFeed()
+        feed.add_listener(table.update_tickers)
+        feed.publish({"ETH/USDT": {"last": 3.0}, "BAD/USDT": {"last": None}})
+        self.assertEqual(table.get("ETH/USDT", max_age=5), 3.0)
+        self.assertNotIn("BAD/USDT", table)
+
+
+class TestPreTradeRisk(unittest.TestCase):
+    """Tests for the in-process pre-trade pipeline."""
+
+    def _risk(self, service=None, prices=None, enabled=True):
+        return PreTradeRisk(service or _exchange_service(), prices or PriceTable(),
+                            max_notional=50.0, max_price_age=5.0,
+                            capabilities=_capabilities(enabled))
+
+    def test_fresh_local_price_skips_rest(self):
+        prices = PriceTable()
+        prices.update("BTC/USDT", 10.0)
+        service = _exchange_service()
+        check = asyncio.run(self._risk(service, prices).check("BTC/USDT", "buy", 2.0))
+        self.assertEqual((check.price, check.notional, check.price_source), (10.0, 20.0, "local"))
+        service.fetch_ticker.assert_not_called()
+
+    def test_stale_price_falls_back_to_rest_and_caches(self):
+        prices = PriceTable()
+        prices.update("BTC/USDT", 10.0, observed_at=time.time() - 60)
+        risk = self._risk(prices=prices)
+        check = asyncio.run(risk.check("BTC/USDT", "buy", 0.1))
+        self.assertEqual(check.price_source, "rest")
+        self.assertEqual(prices.get("BTC/USDT", max_age=5), 100.0)
+        self.assertEqual(risk.rest_fallbacks, 1)
+
+    def test_notional_clamp(self):
+        prices = PriceTable()
+        prices.update("BTC/USDT", 100.0)
+        with self.assertRaises(ValueError):
+            asyncio.run(self._risk(prices=prices).check("BTC/USDT", "buy", 1.0))
+
+    def test_symbol_checks(self):
+        risk = self._risk(_exchange_service(markets={"BTC/USDT": {"active": True},
+                                                     "OLD/USDT": {"active": False}}))
+        with self.assertRaises(ValueError):
+            risk.validate("BTCUSDT", "buy", 1.0)
+        with self.assertRaises(ValueError):
+            risk.validate("NOPE/USDT", "buy", 1.0)
+        with self.assertRaises(ValueError):
+            risk.validate("OLD/USDT", "buy", 1.0)
+        risk.validate("BTC/USDT", "buy", 1.0)
+
+    def test_capability_gate(self):
+        with self.assertRaises(ValueError):
+            self._risk(enabled=False).validate("BTC/USDT", "buy", 1.0)
+
+
+class TestOMSRisk(unittest.TestCase):
+    """Tests for OMS.place_order using the risk pipeline."""
+
+    def test_place_order_uses_local_price(self):
+        service = _exchange_service()
+        prices = PriceTable()
+        prices.update("BTC/USDT", 10.0)
+        risk = PreTradeRisk(service, prices, max_notional=50.0, capabilities=_capabilities())
+        oms = OMS(service, risk=risk)
+        asyncio.run(oms.place_order("BTC/USDT", "buy", 1.0))
+        service.fetch_ticker.assert_not_called()
+        service.create_order.assert_awaited_once_with(
+            "BTC/USDT", "market", "buy", 1.0, client_order_id=None
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
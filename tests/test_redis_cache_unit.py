@@ -75,15 +75,20 @@ class TestRedisCacheConnectedMode(unittest.TestCase):
         cache.client = Mock()
         return cache
 
-    def test_is_connected_returns_true_when_ping_succeeds(self):
+    def test_is_connected_reads_health_without_ping(self):
         cache = self._make_cache_with_mock()
-        cache.client.ping.return_value = True
         self.assertTrue(cache.is_connected())
+        cache.client.ping.assert_not_called()
 
-    def test_is_connected_returns_false_when_ping_raises(self):
+    def test_is_connected_false_after_connection_error(self):
+        import redis
         cache = self._make_cache_with_mock()
-        cache.client.ping.side_effect = Exception("Connection refused")
+        cache.client.hget.side_effect = redis.ConnectionError("Connection refused")
+        self.assertIsNone(cache.get_peak_price("BTC/USDT"))
         self.assertFalse(cache.is_connected())
+        # While down, operations are skipped instead of waiting on timeouts
+        cache.get_peak_price("BTC/USDT")
+        self.assertEqual(cache.client.hget.call_count, 1)
 
     def test_save_portfolio_state_calls_hset(self):
         cache = self._make_cache_with_mock()
@@ -137,18 +142,34 @@ class TestRedisCacheConnectedMode(unittest.TestCase):
         cache.clear_peak("BTC/USDT")
         cache.client.hdel.assert_called_once_with("vortex:peaks", "BTC/USDT")
 
-    def test_log_trade_calls_lpush(self):
+    def test_set_peak_prices_uses_one_pipeline(self):
+        cache = self._make_cache_with_mock()
+        pipe = cache.client.pipeline.return_value
+        result = cache.set_peak_prices({"BTC/USDT": 50000.0}, ["ETH/USDT"])
+        self.assertTrue(result)
+        pipe.hset.assert_called_once_with("vortex:peaks", mapping={"BTC/USDT": "50000.0"})
+        pipe.hdel.assert_called_once_with("vortex:peaks", "ETH/USDT")
+        pipe.execute.assert_called_once()
+
+    def test_set_peak_prices_noop_when_empty(self):
+        cache = self._make_cache_with_mock()
+        self.assertFalse(cache.set_peak_prices({}, []))
+        cache.client.pipeline.assert_not_called()
+
+    def test_log_trade_xadds_to_fleet_and_symbol_streams(self):
         cache = self._make_cache_with_mock()
+        pipe = cache.client.pipeline.return_value
         trade = {"symbol": "BTC/USDT", "side": "buy", "amount": 0.001}
         cache.log_trade(trade)
-        cache.client.lpush.assert_called_once()
-        cache.client.ltrim.assert_called_once_with("vortex:trades", 0, 99)
+        keys = [c.args[0] for c in pipe.xadd.call_args_list]
+        self.assertEqual(keys, ["vortex:trades:stream", "vortex:trades:stream:BTC/USDT"])
+        pipe.execute.assert_called_once()
 
     def test_get_trade_history_returns_parsed_json_list(self):
         cache = self._make_cache_with_mock()
         trade1 = json.dumps({"symbol": "BTC/USDT", "side": "buy"})
         trade2 = json.dumps({"symbol": "ETH/USDT", "side": "sell"})
-        cache.client.lrange.return_value = [trade1, trade2]
+        cache.client.xrevrange.return_value = [("2-0", {"trade": trade1}), ("1-0", {"trade": trade2})]
         result = cache.get_trade_history(limit=10)
         self.assertEqual(len(result), 2)
         self.assertEqual(result[0]["symbol"], "BTC/USDT")
@@ -156,7 +177,7 @@ class TestRedisCacheConnectedMode(unittest.TestCase):
 
     def test_get_trade_history_returns_empty_on_exception(self):
         cache = self._make_cache_with_mock()
-        cache.client.lrange.side_effect = Exception("error")
+        cache.client.xrevrange.side_effect = Exception("error")
         result = cache.get_trade_history()
         self.assertEqual(result, [])
 
@@ -0,0 +1,81 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+from backend.services.redis_health import DOWN, UP, RedisHealth
+
+
+class TestRedisHealth(unittest.TestCase):
+    """Tests for the Redis connection state machine."""
+
+    def test_mark_down_then_probe_recovers(self):
+        health = RedisHealth(ping=AsyncMock(return_value=True))
+        health.mark_down(ConnectionError("refused"))
+        self.assertEqual(health.state, DOWN)
+        self.assertTrue(asyncio.run(health.probe()))
+        self.assertEqual(health.state, UP)
+
+    def test_listeners_hear_transitions_only(self):
+        health = RedisHealth()
+        states = []
+        health.add_listener(states.append)
+        health.mark_up()
+        health.mark_down("refused")
+        health.mark_down("refused")
+        health.mark_up()
+        self.assertEqual(states, [DOWN, UP])
+
+    def test_failed_probes_back_off(self):
+        health = RedisHealth(ping=Mock(side_effect=ConnectionError("refused")),
+                             base_backoff=1.0, max_backoff=4.0)
+
+        async def run():
+            for _ in range(5):
+                await health.probe()
+
+        asyncio.run(run())
+        self.assertFalse(health.is_up)
+        self.assertEqual(health.backoff, 4.0)
+        self.assertEqual(health.probes, 5)
+
+    def test_recovery_resets_backoff(self):
+        ping = Mock(side_effect=[ConnectionError("refused"), ConnectionError("refused"), True])
+        health = RedisHealth(ping=ping)
+
+        async def run():
+            for _ in range(3):
+                await health.probe()
+
+        asyncio.run(run())
+        self.assertTrue(health.is_up)
+        self.assertEqual(health.backoff, health.base_backoff)
+
+    def test_monitor_reconnects_in_background(self):
+        calls = 0
+
+        def ping():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise ConnectionError("refused")
+            return True
+
+        health = RedisHealth(ping=ping, interval=0.01, base_backoff=0.01)
+
+        async def run():
+            health.start()
+            await asyncio.sleep(0)
+            health.mark_down(ConnectionError("refused"))
+            await asyncio.sleep(0.1)
+            await health.stop()
+
+        asyncio.run(run())
+        self.assertTrue(health.is_up)
+        self.assertGreaterEqual(calls, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
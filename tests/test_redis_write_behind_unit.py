@@ -0,0 +1,169 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+from backend.services.redis_health import RedisHealth
+from backend.services.redis_write_behind import RedisWriteBehind
+
+
+def _cache():
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[])
+    client = Mock()
+    client.pipeline = Mock(return_value=pipe)
+    cache = Mock()
+    cache._redis = Mock(return_value=client)
+    cache.health = RedisHealth()
+    cache.use_memory = False
+    return cache, client, pipe
+
+
+class TestRedisWriteBehind(unittest.TestCase):
+    """Tests for the coalescing write-behind layer."""
+
+    def test_enqueue_without_loop_falls_back(self):
+        writer = RedisWriteBehind(_cache()[0])
+        self.assertFalse(writer.set_peak_price("BTC/USDT", 1.0))
+        self.assertEqual(writer.pending, 0)
+
+    def test_peaks_coalesce_per_symbol(self):
+        cache, client, pipe = _cache()
+        writer = RedisWriteBehind(cache, interval=60)
+
+        async def run():
+            for price in (1.0, 2.0, 3.0):
+                writer.set_peak_price("BTC/USDT", price)
+            writer.set_peak_price("ETH/USDT", 9.0)
+            await writer.stop()
+
+        asyncio.run(run())
+        pipe.hset.assert_called_once_with("vortex:peaks", mapping={"BTC/USDT": "3.0", "ETH/USDT": "9.0"})
+        pipe.execute.assert_awaited_once()
+        self.assertEqual(writer.coalesced, 2)
+
+    def test_one_pipeline_for_mixed_writes(self):
+        cache, client, pipe = _cache()
+        writer = RedisWriteBehind(cache, interval=60)
+
+        async def run():
+            writer.save_portfolio_state({"balance": 100})
+            writer.log_trade({"symbol": "BTC/USDT"})
+            writer.log_trade({"symbol": "ETH/USDT"})
+            writer.clear_peak("SOL/USDT")
+            return await writer.flush()
+
+        self.assertEqual(asyncio.run(run()), 5)
+        client.pipeline.assert_called_once()
+        pipe.expire.assert_called_once_with("vortex:portfolio", 3600)
+        self.assertEqual(pipe.xadd.call_count, 4)  # fleet + symbol stream per trade
+        self.assertEqual(pipe.xtrim.call_count, 3)  # one age trim per stream
+        pipe.hdel.assert_called_once_with("vortex:peaks", "SOL/USDT")
+
+    def test_delete_cancels_pending_set(self):
+        cache, client, pipe = _cache()
+        writer = RedisWriteBehind(cache, interval=60)
+
+        async def run():
+            writer.set_peak_price("BTC/USDT", 5.0)
+            writer.clear_peak("BTC/USDT")
+            await writer.flush()
+
+        asyncio.run(run())
+        pipe.hset.assert_not_called()
+        pipe.hdel.assert_called_once_with("vortex:peaks", "BTC/USDT")
+
+    def test_full_batch_flushes_without_waiting(self):
+        cache, client, pipe = _cache()
+        writer = RedisWriteBehind(cache, max_batch=3, interval=60)
+
+        async def run():
+            for i in range(3):
+                writer.push("bridge:events", str(i))
+            await asyncio.sleep(0.01)
+            flushed = pipe.execute.await_count
+            await writer.stop()
+            return flushed
+
+        self.assertEqual(asyncio.run(run()), 1)
+
+    def test_publish_goes_out_after_the_writes(self):
+        cache, client, pipe = _cache()
+        writer = RedisWriteBehind(cache, interval=60)
+
+        async def run():
+            writer.publish("chan", "changed")
+            writer.hset("tia:state", {"risk_level": "HIGH"})
+            return await writer.flush()
+
+        self.assertEqual(asyncio.run(run()), 2)
+        calls = [name for name, _, _ in pipe.mock_calls if name in ("hset", "publish")]
+        self.assertEqual(calls, ["hset", "publish"])
+
+    def test_failed_flush_is_requeued_under_newer_writes(self):
+        cache, client, pipe = _cache()
+        pipe.execute.side_effect = ConnectionError("down")
+        writer = RedisWriteBehind(cache, interval=60)
+
+        async def run():
+            writer.set_peak_price("BTC/USDT", 1.0)
+            writer.push("vortex:trades", "a")
+            await writer.flush()
+            writer.set_peak_price("BTC/USDT", 2.0)
+            writer.push("vortex:trades", "b")
+            return writer.failures, dict(writer._hashes["vortex:peaks"]), list(writer._lists["vortex:trades"])
+
+        failures, peaks, trades = asyncio.run(run())
+        self.assertEqual(failures, 1)
+        self.assertEqual(peaks, {"BTC/USDT": "2.0"})
+        self.assertEqual(trades, ["a", "b"])
+
+    def test_holds_writes_while_redis_is_down(self):
+        cache, client, pipe = _cache()
+        cache.health.mark_down("refused")
+        writer = RedisWriteBehind(cache, interval=60)
+
+        async def run():
+            writer.set_peak_price("BTC/USDT", 1.0)
+            held = await writer.flush()
+            cache.health.mark_up()
+            return held, await writer.flush()
+
+        self.assertEqual(asyncio.run(run()), (0, 1))
+        pipe.execute.assert_awaited_once()
+
+    def test_backlog_drops_oldest(self):
+        cache, client, pipe = _cache()
+        cache.health.mark_down("refused")
+        writer = RedisWriteBehind(cache, interval=60, max_backlog=2)
+
+        async def run():
+            for i in range(5):
+                writer.append_trade({"n": str(i)})
+                writer.publish("chan", str(i))
+            await writer.flush()
+
+        asyncio.run(run())
+        self.assertEqual([t["n"] for t in writer._trades], ["3", "4"])
+        self.assertEqual([m for _, m in writer._messages], ["3", "4"])
+        self.assertEqual(writer.get_stats()["dropped"], 6)
+
+    def test_no_client_keeps_the_batch(self):
+        cache, client, pipe = _cache()
+        cache._redis.return_value = None
+        writer = RedisWriteBehind(cache, interval=60)
+
+        async def run():
+            writer.set_peak_price("BTC/USDT", 1.0)
+            writer.append_trade({"n": "1"})
+            return await writer.flush()
+
+        self.assertEqual(asyncio.run(run()), 0)
+        self.assertEqual(writer.pending, 2)
+        self.assertEqual(writer._hashes["vortex:peaks"], {"BTC/USDT": "1.0"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import random
+import statistics
+import unittest
+
+from backend.services.risk_window import RollingRiskStats
+
+
+class TestRollingRiskStats(unittest.TestCase):
+    """Tests for the incremental rolling-window risk statistics."""
+
+    def test_matches_full_rescan(self):
+        rng = random.Random(7)
+        stats = RollingRiskStats(window=25, slot_capacity=10)
+        history = []
+        equity = 100.0
+        for _ in range(200):
+            equity *= 1 + rng.uniform(-0.03, 0.03)
+            slots = rng.randint(0, 12)
+            stats.push(equity, slots)
+            history.append((equity, slots))
+
+            window = history[-25:]
+            equities = [e for e, _ in window]
+            returns = [b / a - 1 for a, b in zip(equities, equities[1:])]
+            self.assertAlmostEqual(stats.peak_equity, max(equities))
+            self.assertAlmostEqual(stats.drawdown, 1 - equities[-1] / max(equities))
+            self.assertAlmostEqual(stats.mean_slots, statistics.mean(s for _, s in window))
+            self.assertEqual(stats.get_stats()["peak_slots"], max(s for _, s in window))
+            if len(returns) >= 2:
+                self.assertAlmostEqual(stats.volatility, statistics.stdev(returns), places=9)
+
+    def test_max_drawdown_is_sticky(self):
+        stats = RollingRiskStats(window=3)
+        for equity in (100, 50, 60, 60, 60):
+            stats.push(equity, 0)
+        self.assertEqual(stats.drawdown, 0.0)  # 100 has left the window
+        self.assertAlmostEqual(stats.max_drawdown, 0.5)
+
+    def test_empty_and_flat(self):
+        stats = RollingRiskStats()
+        self.assertEqual((stats.drawdown, stats.volatility, stats.utilisation), (0.0, 0.0, 0.0))
+        for _ in range(5):
+            stats.push(100, 12)
+        self.assertEqual(stats.volatility, 0.0)
+        self.assertEqual(stats.utilisation, 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
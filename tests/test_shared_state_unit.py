@@ -0,0 +1,153 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+import threading
+import unittest
+from unittest.mock import MagicMock, Mock, patch
+
+from backend.services.shared_state import SharedState
+
+
+def _worker():
+    """SharedState over a mocked, connected Redis (no event loop)"""
+    cache = Mock(memory=None)
+    cache.is_connected.return_value = True
+    pipe = MagicMock()
+    cache.client.pipeline.return_value = pipe
+    return SharedState(cache), pipe
+
+
+def _sent(pipe):
+    """The pub/sub message a worker published, as a listener receives it"""
+    channel, data = pipe.publish.call_args[0]
+    return {"channel": channel, "data": data}
+
+
+class TestSharedState(unittest.TestCase):
+    """Tests for cross-worker state sync."""
+
+    def test_write_stores_then_notifies(self):
+        state, pipe = _worker()
+        self.assertTrue(state.write("tia:state", {"risk_level": "HIGH", "confidence": 1.0}, ttl=60))
+        pipe.hset.assert_called_once_with("tia:state", mapping={"risk_level": "HIGH", "confidence": "1.0"})
+        pipe.expire.assert_called_once_with("tia:state", 60)
+        self.assertEqual(state.published, 1)
+
+    def test_other_worker_applies_change(self):
+        writer, pipe = _worker()
+        reader, _ = _worker()
+        applied = Mock()
+        writer.register("garage:state", Mock())
+        reader.register("garage:state", applied)
+        writer.write("garage:state", {"current_bay": "01_ELITE"})
+
+        writer.handle(_sent(pipe))  # own message: ignored
+        reader.handle(_sent(pipe))
+        applied.assert_called_once_with({"current_bay": "01_ELITE"})
+        self.assertEqual((writer.received, reader.received), (0, 1))
+
+    def test_embedded_store_writes_without_notifying(self):
+        state, pipe = _worker()
+        state.cache.memory = object()
+        self.assertTrue(state.write("tia:state", {"risk_level": "LOW"}))
+        pipe.publish.assert_not_called()
+        self.assertFalse(state.start())
+
+    def test_sync_applies_stored_state(self):
+        state, _ = _worker()
+        state.cache.client.hgetall.return_value = {"premium_authorized": "true"}
+        applied = Mock()
+        state.register("bridge:authorization", applied)
+        state.sync()
+        applied.assert_called_once_with({"premium_authorized": "true"})
+
+    def test_changes_are_applied_on_the_server_loop(self):
+        writer, pipe = _worker()
+        reader, _ = _worker()
+        reader.cache.client.hgetall.return_value = {}
+        reader.cache.client.pubsub.return_value.run_in_thread.return_value = Mock()
+        threads = []
+        reader.register("garage:state", lambda fields: threads.append(threading.get_ident()))
+        writer.write("garage:state", {"current_bay": "01_ELITE"})
+
+        async def run():
+            reader.start()
+            listener = threading.Thread(target=reader.handle, args=(_sent(pipe),))
+            listener.start()
+            listener.join()
+            self.assertEqual(threads, [])  # not applied on the listener thread
+            await asyncio.sleep(0)
+            reader.stop()
+
+        asyncio.run(run())
+        self.assertEqual(threads, [threading.get_ident()])
+
+    def test_listener_starts_when_redis_comes_back(self):
+        from backend.services.redis_health import RedisHealth
+        state, _ = _worker()
+        state.cache.health = RedisHealth(up=False)
+        state.cache.is_connected.side_effect = lambda: state.cache.health.is_up
+        state.cache.client.hgetall.return_value = {"risk_level": "HIGH"}
+        applied = Mock()
+        state.register("tia:state", applied)
+
+        with self.assertLogs("shared_state", level="WARNING"):
+            self.assertFalse(state.start())
+        state.cache.health.mark_up()
+        self.assertTrue(state.running)
+        applied.assert_called_once_with({"risk_level": "HIGH"})
+
+        # The listener thread died with the connection: restarted on the next UP
+        state._thread.is_alive.return_value = False
+        state.cache.health.mark_down("refused")
+        state.cache.health.mark_up()
+        self.assertEqual(state.cache.client.pubsub.call_count, 2)
+        state.stop()
+
+
+class TestSharedStateServices(unittest.TestCase):
+    """Tests for the services applying another worker's state."""
+
+    def test_tia_adopts_newer_assessment_only(self):
+        with patch("backend.services.tia_agent.redis_cache") as mock_redis:
+            mock_redis.is_connected.return_value = False
+            from backend.services.tia_agent import TIAAgent, RiskLevel
+            agent = TIAAgent()
+            agent.produce_summary()
+            agent.apply_shared_state({"risk_level": "HIGH", "confidence": "0.7",
+                                      "last_assessment": "2999-01-01T00:00:00+00:00"})
+            self.assertEqual(agent.current_risk, RiskLevel.HIGH)
+            self.assertEqual(agent.produce_summary()["risk_level"], "HIGH")
+            self.assertEqual(agent.get_status()["risk_level"], "HIGH")
+
+            agent.apply_shared_state({"risk_level": "LOW", "last_assessment": "2000-01-01T00:00:00+00:00"})
+            self.assertEqual(agent.current_risk, RiskLevel.HIGH)
+
+    def test_bridge_mirrors_grant_and_revoke(self):
+        from backend.services.admiral_engine import AdmiralEngine
+        from backend.services.tia_admiral_bridge import tia_admiral_bridge
+        engine = AdmiralEngine()
+        with patch("backend.services.tia_admiral_bridge.admiral_engine", engine):
+            tia_admiral_bridge.apply_shared_state({"premium_authorized": "true", "authorized_by": "T.I.A.",
+                                                   "timestamp": "2026-01-01T00:00:00+00:00"})
+            self.assertTrue(engine.premium_authorized)
+            self.assertEqual(engine.authorization_timestamp, "2026-01-01T00:00:00+00:00")
+            tia_admiral_bridge.apply_shared_state({"premium_authorized": "false"})
+            self.assertFalse(engine.premium_authorized)
+
+    def test_garage_follows_shared_bay(self):
+        from backend.services.garage_manager import GarageBay, GarageManager
+        garage = GarageManager()
+        engine = Mock()
+        with patch.object(garage, "_load_engine", return_value=engine) as load:
+            garage.apply_shared_state({"current_bay": "03_CLOCKWORK"})
+            garage.apply_shared_state({"current_bay": "03_CLOCKWORK"})
+        load.assert_called_once_with(GarageBay.CLOCKWORK)
+        self.assertIs(garage.current_engine, engine)
+        garage.apply_shared_state({"current_bay": ""})
+        self.assertIsNone(garage.current_bay)
+
+
+if __name__ == "__main__":
+    unittest.main()
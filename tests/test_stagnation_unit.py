@@ -0,0 +1,131 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+import time
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+from backend.services.stagnation import StagnationMonitor
+from backend.services.vortex import VortexBerserker
+
+HOUR = 3600.0
+
+
+class TestStagnationMonitor(unittest.TestCase):
+    """Tests for the streaming stagnation filter."""
+
+    def setUp(self):
+        self.monitor = StagnationMonitor()
+        self.t0 = 1_000_000.0
+
+    def _feed(self, symbol, prices, start, step=60.0):
+        events = []
+        for i, price in enumerate(prices):
+            event = self.monitor.on_price(symbol, price, start + i * step)
+            if event is not None:
+                events.append(event)
+        return events
+
+    def test_momentum_needs_full_window(self):
+        self.monitor.track("BTC/USDT", 100.0, self.t0)
+        self._feed("BTC/USDT", [100.0] * 10, self.t0)
+        self.assertIsNone(self.monitor.momentum("BTC/USDT", self.t0 + 9 * 60))
+
+    def test_momentum_over_window(self):
+        self.monitor.track("BTC/USDT", 100.0, self.t0)
+        prices = [100.0 + i for i in range(40)]
+        self._feed("BTC/USDT", prices, self.t0)
+        now = self.t0 + 39 * 60
+        # 30 one-minute buckets back from 139 is 109
+        self.assertAlmostEqual(self.monitor.momentum("BTC/USDT", now), 139.0 / 109.0 - 1.0)
+
+    def test_samples_stay_bounded(self):
+        self.monitor.track("BTC/USDT", 100.0, self.t0)
+        self._feed("BTC/USDT", [100.0] * 500, self.t0)
+        self.assertLessEqual(len(self.monitor._positions["BTC/USDT"].samples), 32)
+
+    def test_holds_before_min_hold(self):
+        self.monitor.track("BTC/USDT", 100.0, self.t0)
+        events = self._feed("BTC/USDT", [98.0] * 60, self.t0)
+        self.assertEqual(events, [])
+
+    def test_emits_loss_without_recovery_once(self):
+        entry_time = self.t0 - 5 * HOUR
+        self.monitor.track("BTC/USDT", 100.0, entry_time)
+        listener = Mock()
+        self.monitor.add_listener(listener)
+        events = self._feed("BTC/USDT", [99.0 - 0.01 * i for i in range(45)], self.t0)
+        self.assertEqual(len(events), 1)
+        self.assertIn("no recovery", events[0].reason)
+        listener.assert_called_once_with(events[0])
+
+    def test_recovering_loss_is_held(self):
+        self.monitor.track("BTC/USDT", 100.0, self.t0 - 5 * HOUR)
+        events = self._feed("BTC/USDT", [98.0 + 0.01 * i for i in range(45)], self.t0)
+        self.assertEqual(events, [])
+
+    def test_sideways_after_breakeven_hours(self):
+        self.monitor.track("BTC/USDT", 100.0, self.t0 - 9 * HOUR)
+        event = self.monitor.on_price("BTC/USDT", 100.1, self.t0)
+        self.assertIsNotNone(event)
+        self.assertIn("Sideways", event.reason)
+
+    def test_rearms_after_leaving_stagnant_state(self):
+        self.monitor.track("BTC/USDT", 100.0, self.t0 - 9 * HOUR)
+        self.assertIsNotNone(self.monitor.on_price("BTC/USDT", 100.1, self.t0))
+        self.assertIsNone(self.monitor.on_price("BTC/USDT", 100.1, self.t0 + 60))
+        self.assertIsNone(self.monitor.on_price("BTC/USDT", 101.0, self.t0 + 120))
+        self.assertIsNotNone(self.monitor.on_price("BTC/USDT", 100.0, self.t0 + 180))
+
+    def test_sync_tracks_and_untracks(self):
+        self.monitor.track("OLD/USDT", 1.0, self.t0)
+        self.monitor.sync({"NEW/USDT": {"entry": 2.0, "time": self.t0}})
+        self.assertTrue(self.monitor.is_tracked("NEW/USDT"))
+        self.assertFalse(self.monitor.is_tracked("OLD/USDT"))
+
+
+class TestVortexStagnationEvents(unittest.TestCase):
+    """Tests for stagnation events driving exits in the tick loop."""
+
+    def test_pulse_monitor_exits_on_event_without_candles(self):
+        async def run():
+            vortex = VortexBerserker()
+            vortex.exchange = Mock()
+            vortex.exchange.create_market_sell_order = AsyncMock(return_value={})
+            vortex.get_candle_data = AsyncMock()
+            vortex.active_slots["ETH/USDT"] = {
+                "entry": 100.0, "qty": 1.0, "time": time.time() - 9 * HOUR,
+                "wing": "harvester", "slot": 3, "peak_profit": 0.0,
+            }
+            await vortex.pulse_monitor({"ETH/USDT": {"last": 100.1}})
+            return vortex
+
+        vortex = asyncio.run(run())
+        self.assertNotIn("ETH/USDT", vortex.active_slots)
+        vortex.exchange.create_market_sell_order.assert_awaited_once()
+        vortex.get_candle_data.assert_not_called()
+
+    def test_failed_exit_is_retried_next_tick(self):
+        async def run():
+            vortex = VortexBerserker()
+            vortex.exchange = Mock()
+            vortex.exchange.create_market_sell_order = AsyncMock(
+                side_effect=[RuntimeError("timeout"), {}]
+            )
+            vortex.active_slots["ETH/USDT"] = {
+                "entry": 100.0, "qty": 1.0, "time": time.time() - 9 * HOUR,
+                "wing": "harvester", "slot": 3, "peak_profit": 0.0,
+            }
+            tickers = {"ETH/USDT": {"last": 100.1}}
+            await vortex.pulse_monitor(tickers)
+            await vortex.pulse_monitor(tickers)
+            return vortex
+
+        vortex = asyncio.run(run())
+        self.assertEqual(vortex.exchange.create_market_sell_order.await_count, 2)
+        self.assertNotIn("ETH/USDT", vortex.active_slots)
+
+
+if __name__ == "__main__":
+    unittest.main()
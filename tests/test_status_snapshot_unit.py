@@ -0,0 +1,62 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import json
+import unittest
+from unittest.mock import Mock
+
+from backend.services.admiral_engine import AdmiralEngine
+from backend.services.status_snapshot import CompositeStatus, StatusPublisher, etag_matches
+
+
+class TestStatusSnapshot(unittest.TestCase):
+    """Tests for versioned, pre-serialized status snapshots."""
+
+    def test_publisher_rebuilds_only_after_bump(self):
+        build = Mock(return_value={"risk": "LOW"})
+        publisher = StatusPublisher(build)
+        first = publisher.snapshot
+        self.assertIs(publisher.snapshot, first)
+        publisher.bump()
+        self.assertIsNot(publisher.snapshot, first)
+        self.assertEqual(build.call_count, 2)
+        self.assertEqual(json.loads(first.body), {"risk": "LOW"})
+
+    def test_composite_etag_changes_with_parts(self):
+        publisher = StatusPublisher(lambda: {"n": publisher.version})
+        composite = CompositeStatus()
+        body, etag = composite.render({"a": publisher.snapshot, "b": {"x": 1}})
+        self.assertEqual(json.loads(body), {"a": {"n": 0}, "b": {"x": 1}})
+        self.assertEqual(composite.render({"a": publisher.snapshot, "b": {"x": 1}})[1], etag)
+
+        publisher.bump()
+        body, changed = composite.render({"a": publisher.snapshot, "b": {"x": 1}})
+        self.assertNotEqual(changed, etag)
+        self.assertEqual(json.loads(body)["a"], {"n": 1})
+        self.assertNotEqual(composite.render({"a": publisher.snapshot, "b": {"x": 2}})[1], changed)
+
+    def test_etag_matches(self):
+        self.assertTrue(etag_matches('"x", W/"abc"', '"abc"'))
+        self.assertTrue(etag_matches("*", '"abc"'))
+        self.assertFalse(etag_matches('"abd"', '"abc"'))
+        self.assertFalse(etag_matches(None, '"abc"'))
+
+    def test_admiral_status_republished_on_grant(self):
+        engine = AdmiralEngine()
+        before = engine.status_publisher.snapshot
+        self.assertIs(engine.status_publisher.snapshot, before)
+        engine.grant_premium_access("T.I.A.")
+        status = engine.get_status()
+        self.assertTrue(status["premium_authorized"])
+        self.assertEqual(status["enabled_capabilities"], status["total_capabilities"])
+
+
+    def test_status_copies_do_not_share_nested_state(self):
+        engine = AdmiralEngine()
+        engine.get_status()["capabilities"].clear()
+        self.assertTrue(engine.status_publisher.snapshot.data["capabilities"])
+        self.assertEqual(engine.get_status()["capabilities"], engine.status_publisher.snapshot.data["capabilities"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,11 +8,11 @@ from unittest.mock import patch, Mock, MagicMock, PropertyMock
 class TestTIAAgentUnit(unittest.TestCase):
     """Unit tests for TIAAgent risk analysis engine."""
 
-    def _make_agent(self):
+    def _make_agent(self, window=None):
         with patch("backend.services.tia_agent.redis_cache") as mock_redis:
             mock_redis.is_connected.return_value = False
             from backend.services.tia_agent import TIAAgent
-            agent = TIAAgent()
+            agent = TIAAgent(window=window)
         return agent
 
     # -- Initial state -------------------------------------------------------
@@ -28,11 +28,24 @@ class TestTIAAgentUnit(unittest.TestCase):
         agent.consume_aegis({"wallet_balance": 100})
         self.assertEqual(len(agent.aegis_snapshots), 1)
 
-    def test_consume_aegis_keeps_max_10(self):
-        agent = self._make_agent()
+    def test_consume_aegis_keeps_window(self):
+        agent = self._make_agent(window=10)
         for i in range(15):
             agent.consume_aegis({"wallet_balance": i})
         self.assertEqual(len(agent.aegis_snapshots), 10)
+        self.assertEqual(agent.aegis_snapshots[0]["wallet_balance"], 5)
+        self.assertEqual(len(agent.window_stats), 10)
+
+    def test_window_drawdown_raises_risk(self):
+        agent = self._make_agent(window=50)
+        from backend.services.tia_agent import RiskLevel
+        for equity in (100, 100, 100, 100, 80):  # 20% off the rolling peak
+            agent.consume_aegis({"wallet_balance": 100, "total_equity": equity,
+                                 "active_slots": 2, "starting_capital": 80})
+        self.assertEqual(agent.analyze_risk(), RiskLevel.MEDIUM)
+        # An ad-hoc snapshot is judged on its own
+        self.assertEqual(agent.analyze_risk({"wallet_balance": 100, "total_equity": 80,
+                                             "active_slots": 2, "starting_capital": 80}), RiskLevel.LOW)
 
     # -- analyze_risk --------------------------------------------------------
     def test_analyze_risk_low_for_healthy_metrics(self):
@@ -91,6 +104,55 @@ class TestTIAAgentUnit(unittest.TestCase):
             agent.produce_summary()
         self.assertEqual(agent.confidence, 1.0)
 
+    def test_produce_summary_memoized_until_new_snapshot(self):
+        agent = self._make_agent()
+        agent.consume_aegis({"wallet_balance": 100})
+        with patch.object(agent, "analyze_risk", wraps=agent.analyze_risk) as analyze, \
+                patch.object(agent, "_persist_state") as persist:
+            first = agent.produce_summary()
+            second = agent.produce_summary()
+            self.assertEqual(first, second)
+            self.assertEqual((analyze.call_count, persist.call_count), (1, 1))
+
+            agent.consume_aegis({"wallet_balance": 5})
+            third = agent.produce_summary()
+            self.assertEqual(third["generation"], first["generation"] + 1)
+            agent.invalidate()
+            agent.produce_summary()
+            self.assertEqual((analyze.call_count, persist.call_count), (3, 3))
+
+    def test_memoized_summary_refreshes_persisted_state(self):
+        agent = self._make_agent()
+        agent.consume_aegis({"wallet_balance": 100})
+        with patch.object(agent, "_persist_state") as persist:
+            agent.produce_summary()
+            agent._persisted_at -= agent.PERSIST_REFRESH_SECONDS
+            agent.produce_summary()
+        self.assertEqual(persist.call_count, 2)
+
+    def test_no_local_snapshots_is_never_persisted(self):
+        agent = self._make_agent()
+        with patch.object(agent, "_persist_state") as persist:
+            agent.produce_summary()
+            agent.invalidate()
+            agent.produce_summary()
+        persist.assert_not_called()
+        self.assertIsNone(agent.last_assessment)
+
+    def test_adopted_verdict_survives_first_summary(self):
+        from backend.services.tia_agent import RiskLevel
+        agent = self._make_agent()
+        agent.apply_shared_state({"risk_level": "HIGH", "confidence": "1.0",
+                                  "last_assessment": "2026-01-01T00:00:00+00:00"})
+        with patch.object(agent, "_persist_state") as persist:
+            summary = agent.produce_summary()
+            agent.invalidate()
+            agent.produce_summary()
+        persist.assert_not_called()
+        self.assertEqual(summary["risk_level"], "HIGH")
+        self.assertEqual(agent.current_risk, RiskLevel.HIGH)
+        self.assertFalse(agent.should_authorize_admiral())
+
     # -- should_authorize_admiral --------------------------------------------
     def test_should_authorize_admiral_true_for_low(self):
         agent = self._make_agent()
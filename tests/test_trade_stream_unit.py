@@ -0,0 +1,98 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import json
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, Mock, patch
+
+from backend.services.cache_codec import BinaryCodec, JsonCodec
+from backend.services.trade_stream import TRADE_STREAM, TradeStream, symbol_stream, to_stream_id
+
+
+class TestTradeStream(unittest.TestCase):
+    """Tests for the trade-stream layout and trimming policy."""
+
+    def test_append_trims_each_stream_once(self):
+        stream = TradeStream(maxlen=500, retention_hours=1)
+        pipe = MagicMock()
+        entries = [stream.entry({"symbol": s}, JsonCodec()) for s in ("BTC/USDT", "BTC/USDT", "ETH/USDT")]
+        stream.append(pipe, entries, now_ms=10_000_000)
+        self.assertEqual(pipe.xadd.call_count, 6)
+        self.assertEqual(pipe.xadd.call_args.kwargs, {"maxlen": 500, "approximate": True})
+        trimmed = sorted(c.args[0] for c in pipe.xtrim.call_args_list)
+        self.assertEqual(trimmed, sorted([TRADE_STREAM, symbol_stream("BTC/USDT"), symbol_stream("ETH/USDT")]))
+        self.assertEqual(pipe.xtrim.call_args.kwargs["minid"], str(10_000_000 - 3_600_000))
+
+    def test_no_age_trim_when_retention_disabled(self):
+        pipe = MagicMock()
+        TradeStream(retention_hours=0).append(pipe, [{"symbol": "", "trade": "{}"}], now_ms=1)
+        pipe.xadd.assert_called_once()
+        pipe.xtrim.assert_not_called()
+
+    def test_range_bounds(self):
+        since = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        key, low, high = TradeStream().range_args(since, None, "BTC/USDT")
+        self.assertEqual((key, low, high), (symbol_stream("BTC/USDT"), "1704067200000", "+"))
+        self.assertEqual(to_stream_id("(1-0", "-"), "(1-0")
+
+    def test_parse_binary_entries(self):
+        blob = TradeStream().entry({"symbol": "BTC/USDT", "side": "buy"}, BinaryCodec())["trade"]
+        trades = TradeStream.parse_read([[b"vortex:trades:stream", [(b"5-0", {b"symbol": b"BTC/USDT", b"trade": blob})]]])
+        self.assertEqual(trades, [{"symbol": "BTC/USDT", "side": "buy", "stream_id": "5-0"}])
+
+
+class TestRedisCacheTradeStream(unittest.TestCase):
+    """Tests for RedisCache range reads and consumer groups."""
+
+    def _cache(self):
+        from backend.services.redis_cache import RedisCache
+        with patch.object(RedisCache, '_connect'):
+            cache = RedisCache()
+        cache.client = Mock()
+        return cache
+
+    def test_symbol_window_is_one_xrange(self):
+        cache = self._cache()
+        cache.client.xrange.return_value = [("1-0", {"trade": json.dumps({"symbol": "BTC/USDT"})})]
+        trades = cache.get_trades(start=1000, symbol="BTC/USDT")
+        cache.client.xrange.assert_called_once_with(symbol_stream("BTC/USDT"), "1000", "+")
+        self.assertEqual(trades[0]["stream_id"], "1-0")
+
+    def test_limit_keeps_the_newest_trades(self):
+        cache = self._cache()
+        cache.client.xrevrange.return_value = [
+            (f"{i}-0", {"trade": json.dumps({"symbol": "BTC/USDT"})}) for i in (9, 8)
+        ]
+        trades = cache.get_trades(start=1000, symbol="BTC/USDT", limit=2)
+        cache.client.xrevrange.assert_called_once_with(symbol_stream("BTC/USDT"), "+", "1000", count=2)
+        self.assertEqual([t["stream_id"] for t in trades], ["8-0", "9-0"])
+
+    def test_history_falls_back_to_legacy_list(self):
+        cache = self._cache()
+        cache.client.xrevrange.return_value = []
+        cache.client.lrange.return_value = [json.dumps({"symbol": "OLD/USDT"})]
+        self.assertEqual(cache.get_trade_history(5), [{"symbol": "OLD/USDT"}])
+        cache.client.lrange.assert_called_once_with("vortex:trades", 0, 4)
+
+    def test_existing_group_is_not_an_error(self):
+        cache = self._cache()
+        cache.client.xgroup_create.side_effect = Exception("BUSYGROUP Consumer Group name already exists")
+        self.assertTrue(cache.create_trade_group("analytics"))
+
+    def test_group_read_and_ack(self):
+        cache = self._cache()
+        cache.client.xreadgroup.return_value = [
+            [TRADE_STREAM, [("7-0", {"trade": json.dumps({"symbol": "ETH/USDT"})})]]
+        ]
+        cache.client.xack.return_value = 1
+        trades = cache.read_trade_group("analytics", "worker-1", count=5)
+        cache.client.xreadgroup.assert_called_once_with(
+            "analytics", "worker-1", {TRADE_STREAM: ">"}, count=5, block=None
+        )
+        self.assertEqual(cache.ack_trades("analytics", trades[0]["stream_id"]), 1)
+        cache.client.xack.assert_called_once_with(TRADE_STREAM, "analytics", "7-0")
+
+
+if __name__ == "__main__":
+    unittest.main()
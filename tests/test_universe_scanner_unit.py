@@ -0,0 +1,86 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import random
+import unittest
+
+from backend.services.universe_scanner import (
+    HIGH, INELIGIBLE, LOW, MID, UniverseScanner,
+)
+
+
+def _ticker(pct, volume=1_000_000, last=1.0):
+    return {"last": last, "quoteVolume": volume, "percentage": pct}
+
+
+class TestUniverseScanner(unittest.TestCase):
+    """Tests for the tiered top-K scanner."""
+
+    def setUp(self):
+        self.scanner = UniverseScanner(min_volume=500_000, top_k=3)
+
+    def test_classify_tiers(self):
+        self.assertEqual(self.scanner.classify(60_000_000), HIGH)
+        self.assertEqual(self.scanner.classify(10_000_000), MID)
+        self.assertEqual(self.scanner.classify(500_000), LOW)
+        self.assertEqual(self.scanner.classify(499_999), INELIGIBLE)
+
+    def test_top_k_matches_full_sort(self):
+        rng = random.Random(7)
+        tickers = {
+            f"C{i}/USDT": _ticker(rng.uniform(-10, 10), rng.choice([1e5, 1e6, 2e7, 9e7]))
+            for i in range(300)
+        }
+        self.scanner.update(tickers)
+        expected = sorted(
+            (s for s, t in tickers.items() if t["quoteVolume"] >= 500_000),
+            key=lambda s: tickers[s]["percentage"], reverse=True,
+        )[:3]
+        self.assertEqual([c["symbol"] for c in self.scanner.top()], expected)
+
+    def test_prunes_ineligible_and_non_quote_pairs(self):
+        self.scanner.update({
+            "LOW/USDT": _ticker(50.0, volume=10_000),
+            "BTC/ETH": _ticker(40.0),
+            "OK/USDT": _ticker(1.0),
+        })
+        self.assertEqual([c["symbol"] for c in self.scanner.top()], ["OK/USDT"])
+        self.assertIn("LOW/USDT", self.scanner.symbols_in_tier(INELIGIBLE))
+        self.assertNotIn("BTC/ETH", self.scanner)
+
+    def test_unchanged_snapshot_touches_nothing(self):
+        tickers = {f"C{i}/USDT": _ticker(i) for i in range(20)}
+        self.assertEqual(self.scanner.update(tickers), 20)
+        heap_size = len(self.scanner._heap)
+        self.assertEqual(self.scanner.update(tickers), 0)
+        self.assertEqual(len(self.scanner._heap), heap_size)
+
+    def test_update_reorders_and_moves_tier(self):
+        self.scanner.update({"A/USDT": _ticker(5.0), "B/USDT": _ticker(1.0)})
+        self.scanner.update({"B/USDT": _ticker(9.0, volume=60_000_000)})
+        top = self.scanner.top()
+        self.assertEqual([c["symbol"] for c in top], ["B/USDT", "A/USDT"])
+        self.assertEqual(top[0]["tier"], HIGH)
+        self.assertNotIn("B/USDT", self.scanner.symbols_in_tier(LOW))
+
+    def test_excluded_symbols_do_not_take_top_places(self):
+        excluded = set()
+        scanner = UniverseScanner(min_volume=0, top_k=2, excluded=excluded)
+        scanner.update({"A/USDT": _ticker(3.0), "B/USDT": _ticker(2.0), "C/USDT": _ticker(1.0)})
+        excluded.add("A/USDT")
+        self.assertEqual([c["symbol"] for c in scanner.top()], ["B/USDT", "C/USDT"])
+
+    def test_complete_snapshot_drops_missing_symbols(self):
+        self.scanner.update({"A/USDT": _ticker(3.0), "B/USDT": _ticker(2.0)})
+        self.scanner.update({"B/USDT": _ticker(2.0)}, complete=True)
+        self.assertEqual([c["symbol"] for c in self.scanner.top()], ["B/USDT"])
+        self.assertNotIn("A/USDT", self.scanner)
+
+    def test_heap_stays_bounded_under_churn(self):
+        for step in range(200):
+            self.scanner.update({f"C{i}/USDT": _ticker(step + i) for i in range(10)})
+        self.assertLessEqual(len(self.scanner._heap), 2 * 10 + 64 + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+import time
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+from backend.services.market_feed import MarketFeed
+from backend.services.vortex import VortexBerserker, load_fleet_manifest
+
+
+class TestMarketFeed(unittest.TestCase):
+    """Tests for the shared ticker stream."""
+
+    def test_publish_fans_out_to_all_subscribers(self):
+        async def run():
+            feed = MarketFeed()
+            queues = [feed.subscribe() for _ in range(3)]
+            feed.publish({"BTC/USDT": {"last": 1.0}})
+            return [q.get_nowait() for q in queues]
+
+        results = asyncio.run(run())
+        self.assertEqual(len(results), 3)
+        self.assertTrue(all(r["BTC/USDT"]["last"] == 1.0 for r in results))
+
+    def test_slow_subscriber_gets_latest_tick_only(self):
+        async def run():
+            feed = MarketFeed()
+            queue = feed.subscribe()
+            feed.publish({"BTC/USDT": {"last": 1.0}})
+            feed.publish({"BTC/USDT": {"last": 2.0}})
+            return queue.qsize(), queue.get_nowait()
+
+        size, tick = asyncio.run(run())
+        self.assertEqual(size, 1)
+        self.assertEqual(tick["BTC/USDT"]["last"], 2.0)
+
+    def test_poll_once_makes_one_exchange_call_for_all_subscribers(self):
+        async def run():
+            exchange = Mock()
+            exchange.fetch_tickers = AsyncMock(return_value={"ETH/USDT": {"last": 3.0}})
+            feed = MarketFeed(exchange)
+            for _ in range(30):
+                feed.subscribe()
+            await feed.poll_once()
+            return exchange.fetch_tickers.await_count, feed.sequence
+
+        calls, sequence = asyncio.run(run())
+        self.assertEqual(calls, 1)
+        self.assertEqual(sequence, 1)
+
+    def test_listener_failure_does_not_break_publish(self):
+        feed = MarketFeed()
+        feed.add_listener(Mock(side_effect=RuntimeError("boom")))
+        good = Mock()
+        feed.add_listener(good)
+        feed.publish({})
+        good.assert_called_once()
+
+
+class TestVortexBerserkerFleet(unittest.TestCase):
+    """Tests for manifest-driven slot layout and the tick handler."""
+
+    def test_manifest_defines_ten_slots(self):
+        vortex = VortexBerserker()
+        self.assertEqual(vortex.total_slots, 10)
+        self.assertIn("10-SLOT ARK FLEET SYNCHRONIZED", vortex.fleet_banner())
+
+    def test_manifest_can_scale_to_thirty_slots(self):
+        manifest = load_fleet_manifest()
+        manifest["wings"]["Piranha"]["slots"] = list(range(1, 11))
+        manifest["wings"]["Harvester"]["slots"] = list(range(11, 21))
+        manifest["wings"]["Crab"]["slots"] = list(range(21, 31))
+        manifest["wings"]["Bear"]["slots"] = []
+        manifest["wings"]["Banker"]["slots"] = []
+        vortex = VortexBerserker(manifest=manifest)
+        self.assertEqual(vortex.total_slots, 30)
+        self.assertEqual(vortex.get_available_slot_type(), ("piranha", 1))
+
+    def test_enabled_only_skips_disabled_wing(self):
+        vortex = VortexBerserker()
+        for slot in range(1, 10):
+            vortex.active_slots[f"S{slot}/USDT"] = {"slot": slot, "wing": "x"}
+        self.assertEqual(vortex.get_available_slot_type(), ("banker", 10))
+        self.assertEqual(vortex.get_available_slot_type(enabled_only=True), (None, None))
+
+    def test_on_tick_exits_every_position_from_one_snapshot(self):
+        async def run():
+            vortex = VortexBerserker()
+            vortex.exchange = Mock()
+            vortex.exchange.create_market_sell_order = AsyncMock(return_value={})
+            vortex.exchange.fetch_tickers = AsyncMock()
+            vortex.last_buy_time = time.time()  # suppress entries for this test
+            for slot, symbol in ((1, "BTC/USDT"), (2, "ETH/USDT")):
+                vortex.active_slots[symbol] = {
+                    "entry": 100.0, "qty": 1.0, "time": time.time() - 60,
+                    "wing": "piranha", "slot": slot, "peak_profit": 0.0,
+                }
+            tickers = {"BTC/USDT": {"last": 101.0}, "ETH/USDT": {"last": 101.0}}
+            await vortex.on_tick(tickers)
+            return vortex
+
+        vortex = asyncio.run(run())
+        self.assertEqual(vortex.active_slots, {})
+        self.assertEqual(vortex.exchange.create_market_sell_order.await_count, 2)
+        vortex.exchange.fetch_tickers.assert_not_called()
+
+    def test_harvester_trails_from_peak(self):
+        vortex = VortexBerserker()
+        self.assertIsNone(vortex.check_wing_exit("harvester", 0.02, 0.02))
+        self.assertIsNotNone(vortex.check_wing_exit("harvester", 0.004, 0.02))
+        self.assertIsNotNone(vortex.check_wing_exit("harvester", -0.016, 0.0))
+
+    def test_hunt_opens_free_slot_from_snapshot(self):
+        async def run():
+            vortex = VortexBerserker()
+            vortex.exchange = Mock()
+            vortex.exchange.fetch_balance = AsyncMock(return_value={"total": {"USDT": 200.0}})
+            vortex.exchange.create_market_buy_order = AsyncMock(return_value={})
+            vortex.is_buy_allowed = AsyncMock(return_value=(True, "ok"))
+            tickers = {"SOL/USDT": {"last": 10.0, "quoteVolume": 1_000_000, "percentage": 4.0}}
+            await vortex.hunt(tickers)
+            return vortex
+
+        vortex = asyncio.run(run())
+        pos = vortex.active_slots["SOL/USDT"]
+        self.assertEqual((pos["wing"], pos["slot"]), ("piranha", 1))
+        self.assertAlmostEqual(pos["qty"], 0.8)
+
+    def test_stop_wakes_start_loop(self):
+        async def run():
+            vortex = VortexBerserker(tick_interval=60)
+            vortex.exchange = Mock()
+            vortex.exchange.fetch_tickers = AsyncMock(return_value={})
+            task = asyncio.create_task(vortex.start())
+            await asyncio.sleep(0.05)
+            vortex.stop()
+            await asyncio.wait_for(task, timeout=1)
+            return vortex
+
+        vortex = asyncio.run(run())
+        self.assertFalse(vortex.is_running)
+
+
+if __name__ == "__main__":
+    unittest.main()
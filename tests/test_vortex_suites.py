@@ -0,0 +1,29 @@
+"""
+Runs the script-style VortexBerserker suites (fleet reconfig, sync-guard,
+V3.1.0) in a subprocess. Each script prints its own report and exits
+non-zero if any check fails.
+"""
+import sys, os
+import subprocess
+
+import pytest
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+SCRIPT_SUITES = [
+    "test_fleet_reconfig.py",
+    "test_sync_guard.py",
+    "test_vortex_v310.py",
+]
+
+
+@pytest.mark.parametrize("script", SCRIPT_SUITES)
+def test_script_suite_passes(script):
+    result = subprocess.run(
+        [sys.executable, os.path.join(TESTS_DIR, script)],
+        capture_output=True,
+        text=True,
+        timeout=120,
+        env=os.environ.copy(),
+    )
+    assert result.returncode == 0, result.stdout[-4000:] + result.stderr[-4000:]
@@ -3,6 +3,8 @@ import asyncio
 import os
 import pandas as pd
 
+from backend.services.balance_service import BalanceService
+
 class VortexOmega:
     def __init__(self):
         # Establish MEXC Bridge via Environment Variables
@@ -16,10 +18,12 @@ class VortexOmega:
         self.POSITION_SIZE_PCT = 0.04  # 4% Rule
         self.MIN_POS = 5.0             # $5 USDT Min
         self.MAX_POS = 15.0            # $15 USDT Max
+        # Cached balance: sizing reads memory, refreshed on a timer / after fills
+        self.balances = BalanceService(lambda: asyncio.to_thread(self.exchange.fetch_balance))
         self.is_running = False
 
     async def get_total_equity(self):
-        balance = await self.exchange.fetch_balance()
+        balance = await self.balances.get()
         return balance['total'].get('USDT', 0)
 
     def calculate_position_size(self, total_equity):
@@ -34,6 +38,7 @@ class VortexOmega:
             
             print(f"💰 Position sizing: Equity=${equity:.2f} -> Stake=${stake:.2f} (4% rule)")
             order = self.exchange.create_order(target, 'market', side, stake)
+            self.balances.apply_order(order, target, side, stake, None)
             return order
         except Exception as e:
             print(f"STRIKE ERROR: {e}")